@@ -0,0 +1,285 @@
+######################################################################################################################
+# Copyright (C) 2017-2022 Spine project consortium
+# Copyright Spine Items contributors
+# This file is part of Spine Items.
+# Spine Items is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+
+"""Times Exporter's do_work() on a synthetic Spine database for each output format and mapping type."""
+from argparse import ArgumentParser
+from pathlib import Path
+from tempfile import TemporaryDirectory
+import time
+import tracemalloc
+from unittest.mock import MagicMock
+from spinedb_api import (
+    DatabaseMapping,
+    import_alternatives,
+    import_entities,
+    import_entity_classes,
+    import_parameter_definitions,
+    import_parameter_values,
+    import_scenario_alternatives,
+    import_scenarios,
+)
+from spinedb_api.export_mapping import (
+    alternative_export,
+    entity_export,
+    entity_parameter_default_value_export,
+    entity_parameter_value_export,
+    scenario_alternative_export,
+    scenario_export,
+)
+from spinedb_api.export_mapping.export_mapping import FixedValueMapping
+from spinedb_api.export_mapping.group_functions import NoGroup
+from spinedb_api.mapping import Position
+from spinedb_api.parameter_value import TimeSeriesFixedResolution
+from spinedb_api.spine_io.exporters.writer import Writer, write
+from spine_items.exporter.do_work import do_work
+from spine_items.exporter.specification import MappingSpecification, MappingType, OutputFormat, Specification
+
+
+def _mapping_factories(time_series_length):
+    """Returns functions that build root mappings for each benchmarked mapping type.
+
+    Args:
+        time_series_length (int): length of generated time series; 0 if values are scalars
+
+    Returns:
+        dict: mapping from MappingType to mapping factory
+    """
+    index_name_positions = [Position.hidden] if time_series_length > 0 else None
+    index_positions = [4] if time_series_length > 0 else None
+    value_position = 5 if time_series_length > 0 else 4
+    return {
+        MappingType.alternatives: lambda: alternative_export(0),
+        MappingType.entities: lambda: entity_export(0, 1),
+        MappingType.entity_parameter_default_values: lambda: entity_parameter_default_value_export(
+            0, 1, Position.hidden, 2, None, None
+        ),
+        MappingType.entity_parameter_values: lambda: entity_parameter_value_export(
+            0,
+            2,
+            Position.hidden,
+            1,
+            None,
+            None,
+            3,
+            Position.hidden,
+            value_position,
+            index_name_positions,
+            index_positions,
+        ),
+        MappingType.scenario_alternatives: lambda: scenario_alternative_export(0, 1),
+        MappingType.scenarios: lambda: scenario_export(0, 1),
+    }
+
+
+def build_database(url, class_count, entity_count, parameter_count, alternative_count, time_series_length):
+    """Creates a synthetic Spine database.
+
+    Args:
+        url (str): database URL
+        class_count (int): number of entity classes
+        entity_count (int): number of entities per class
+        parameter_count (int): number of parameter definitions per class
+        alternative_count (int): number of alternatives in addition to Base; each gets its own scenario
+        time_series_length (int): length of parameter value time series; 0 to generate scalar values
+    """
+    class_names = [f"class_{i}" for i in range(class_count)]
+    parameter_names = [f"parameter_{i}" for i in range(parameter_count)]
+    alternative_names = ["Base"] + [f"alternative_{i}" for i in range(alternative_count)]
+    with DatabaseMapping(url, create=True) as db_map:
+        import_alternatives(db_map, alternative_names[1:])
+        import_scenarios(db_map, [(f"scenario_{name}", False) for name in alternative_names[1:]])
+        import_scenario_alternatives(db_map, [(f"scenario_{name}", name) for name in alternative_names[1:]])
+        import_entity_classes(db_map, [(name, ()) for name in class_names])
+        import_parameter_definitions(
+            db_map, [(class_name, name, 0.0) for class_name in class_names for name in parameter_names]
+        )
+        import_entities(
+            db_map,
+            [(class_name, f"{class_name}_entity_{i}") for class_name in class_names for i in range(entity_count)],
+        )
+        values = []
+        for class_name in class_names:
+            for entity_index in range(entity_count):
+                entity_name = f"{class_name}_entity_{entity_index}"
+                for parameter_index, parameter_name in enumerate(parameter_names):
+                    for alternative_index, alternative_name in enumerate(alternative_names):
+                        seed = entity_index + parameter_index + alternative_index
+                        if time_series_length > 0:
+                            value = TimeSeriesFixedResolution(
+                                "2020-01-01T00:00",
+                                "1h",
+                                [float(seed + step) for step in range(time_series_length)],
+                                False,
+                                False,
+                            )
+                        else:
+                            value = float(seed)
+                        values.append((class_name, entity_name, parameter_name, value, alternative_name))
+        import_parameter_values(db_map, values)
+        db_map.commit_session("Add synthetic benchmark data.")
+
+
+def _make_root_mapping(factory):
+    """Builds a root mapping with a fixed table name and column headers so it suits all output formats.
+
+    Args:
+        factory (Callable): function that returns a mapping
+
+    Returns:
+        ExportMapping: root mapping
+    """
+    root_mapping = FixedValueMapping(Position.table_name, "benchmark")
+    root_mapping.child = factory()
+    for mapping in root_mapping.flatten():
+        if isinstance(mapping.position, int) and mapping.position >= 0:
+            mapping.header = f"column_{mapping.position}"
+    return root_mapping
+
+
+class _RowCounter(Writer):
+    """Writer that only counts rows."""
+
+    def __init__(self):
+        self.row_count = 0
+
+    def start_table(self, table_name, title_key):
+        return True
+
+    def write_row(self, row):
+        self.row_count += 1
+        return True
+
+
+def _count_rows(url, mapping):
+    """Counts rows that given mapping produces from the database.
+
+    Args:
+        url (str): database URL
+        mapping (ExportMapping): root mapping
+
+    Returns:
+        int: number of rows
+    """
+    counter = _RowCounter()
+    with DatabaseMapping(url) as db_map:
+        write(db_map, counter, mapping)
+    return counter.row_count
+
+
+def _export(url, specification_dict, out_dir):
+    """Runs do_work() for a single database.
+
+    Args:
+        url (str): database URL
+        specification_dict (dict): serialized export specification
+        out_dir (str): output directory
+
+    Returns:
+        bool: True if export succeeded
+    """
+    Path(out_dir).mkdir(parents=True, exist_ok=True)
+    logger = MagicMock()
+    out_urls = {}
+    if specification_dict["output_format"] == OutputFormat.SQL.value:
+        out_urls[url] = {"dialect": "sqlite", "database": str(Path(out_dir, "out.sqlite"))}
+    success, _, _ = do_work(
+        None, specification_dict, False, False, "", out_dir, {url: "benchmark"}, out_urls, "", "", logger
+    )
+    return success
+
+
+def run(output_formats, mapping_types, database_options, measure_memory):
+    """Runs the benchmark and prints the results.
+
+    Args:
+        output_formats (list of OutputFormat): formats to benchmark
+        mapping_types (list of MappingType): mapping types to benchmark
+        database_options (dict): keyword arguments for :func:`build_database`
+        measure_memory (bool): if True, measures peak memory in a separate run
+    """
+    factories = _mapping_factories(database_options["time_series_length"])
+    with TemporaryDirectory() as temp_dir:
+        url = "sqlite:///" + str(Path(temp_dir, "source.sqlite"))
+        start = time.perf_counter()
+        build_database(url, **database_options)
+        print(f"Built synthetic database in {time.perf_counter() - start:.1f} s")
+        header = f"{'format':>10} {'mapping type':>32} {'rows':>10} {'time (s)':>10} {'rows/s':>12}"
+        if measure_memory:
+            header += f" {'peak (MiB)':>11}"
+        print(header)
+        for mapping_type in mapping_types:
+            row_count = _count_rows(url, _make_root_mapping(factories[mapping_type]))
+            for output_format in output_formats:
+                mapping_specification = MappingSpecification(
+                    mapping_type, True, True, NoGroup.NAME, False, _make_root_mapping(factories[mapping_type])
+                )
+                specification_dict = Specification(
+                    "benchmark", "", {"mapping": mapping_specification}, output_format
+                ).to_dict()
+                out_dir = str(Path(temp_dir, output_format.name, mapping_type.value))
+                start = time.perf_counter()
+                success = _export(url, specification_dict, out_dir)
+                duration = time.perf_counter() - start
+                line = f"{output_format.name:>10} {mapping_type.value:>32} {row_count:>10} "
+                if not success:
+                    print(line + f"{'failed':>10}")
+                    continue
+                line += f"{duration:10.3f} {row_count / duration:12.0f}"
+                if measure_memory:
+                    tracemalloc.start()
+                    _export(url, specification_dict, out_dir)
+                    _, peak = tracemalloc.get_traced_memory()
+                    tracemalloc.stop()
+                    line += f" {peak / 2**20:11.1f}"
+                print(line)
+
+
+def main():
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--classes", type=int, default=4, help="number of entity classes")
+    parser.add_argument("--entities", type=int, default=250, help="number of entities per class")
+    parser.add_argument("--parameters", type=int, default=4, help="number of parameters per class")
+    parser.add_argument("--alternatives", type=int, default=1, help="number of alternatives in addition to Base")
+    parser.add_argument("--time-series-length", type=int, default=24, help="time series length, 0 for scalar values")
+    parser.add_argument(
+        "--formats",
+        nargs="+",
+        choices=[f.name for f in OutputFormat],
+        default=[f.name for f in OutputFormat if f != OutputFormat.GDX],
+        help="output formats to benchmark",
+    )
+    parser.add_argument(
+        "--mapping-types",
+        nargs="+",
+        choices=[t.value for t in _mapping_factories(0)],
+        default=[t.value for t in _mapping_factories(0)],
+        help="mapping types to benchmark",
+    )
+    parser.add_argument("--no-memory", action="store_true", help="skip measuring peak memory")
+    args = parser.parse_args()
+    database_options = {
+        "class_count": args.classes,
+        "entity_count": args.entities,
+        "parameter_count": args.parameters,
+        "alternative_count": args.alternatives,
+        "time_series_length": args.time_series_length,
+    }
+    run(
+        [OutputFormat[name] for name in args.formats],
+        [MappingType(value) for value in args.mapping_types],
+        database_options,
+        not args.no_memory,
+    )
+
+
+if __name__ == "__main__":
+    main()
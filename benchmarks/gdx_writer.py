@@ -0,0 +1,140 @@
+######################################################################################################################
+# Copyright (C) 2017-2022 Spine project consortium
+# Copyright Spine Items contributors
+# This file is part of Spine Items.
+# Spine Items is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+
+"""Compares Exporter's .gdx writers by writing synthetic parameters.
+
+If GAMS cannot be found, the GDX library's functions are replaced by stubs that do nothing.
+The benchmark then measures the writers' own overhead only;
+the library's label lookups and the bindings' string conversions are left out.
+"""
+from argparse import ArgumentParser
+from contextlib import nullcontext
+import math
+from pathlib import Path
+from tempfile import TemporaryDirectory
+import time
+import tracemalloc
+from unittest import mock
+import gdxcc
+from spinedb_api.spine_io import gdx_utils
+from spinedb_api.spine_io.exporters.gdx_writer import GdxWriter
+from spine_items.exporter.writers.gdx_writer import BatchedGdxWriter
+
+
+def _stub_gdx_library():
+    """Replaces the GDX library calls by functions that accept everything and do nothing.
+
+    SWIG arrays that hold record keys and values are still filled.
+
+    Returns:
+        ContextManager: context where the library is stubbed
+    """
+
+    def succeed(*args):
+        return 1
+
+    def succeed_with_error_info(*args):
+        return 1, ""
+
+    return mock.patch.multiple(
+        gdxcc,
+        gdxCreate=succeed_with_error_info,
+        gdxCreateD=succeed_with_error_info,
+        gdxOpenWrite=lambda *args: (1, 0),
+        gdxFindSymbol=lambda *args: (0, 0),
+        gdxSymbolSetDomainX=succeed,
+        gdxUELRegisterRawStart=succeed,
+        gdxUELRegisterRaw=succeed,
+        gdxUELRegisterDone=succeed,
+        gdxDataWriteStrStart=succeed,
+        gdxDataWriteStr=succeed,
+        gdxDataWriteRawStart=succeed,
+        gdxDataWriteRaw=succeed,
+        gdxDataWriteDone=succeed,
+        gdxClose=succeed,
+        gdxFree=succeed,
+    )
+
+
+def _write_parameters(writer, symbol_count, record_count, dimension_count):
+    """Writes synthetic parameters using given writer.
+
+    Args:
+        writer (Writer): writer
+        symbol_count (int): number of parameters
+        record_count (int): number of records per parameter
+        dimension_count (int): number of dimensions per parameter
+    """
+    base = math.ceil(record_count ** (1 / dimension_count))
+    writer.start()
+    try:
+        for symbol_index in range(symbol_count):
+            writer.start_table(f"parameter_{symbol_index}", {})
+            writer.write_row([f"set_{i}" for i in range(dimension_count)] + [""])
+            for record_index in range(record_count):
+                labels = [f"element_{record_index // base**i % base}" for i in range(dimension_count)]
+                writer.write_row(labels + [1.5 * record_index])
+            writer.finish_table()
+    finally:
+        writer.finish()
+
+
+def run(symbol_count, record_count, dimension_count, measure_memory):
+    """Runs the benchmark and prints the results.
+
+    Args:
+        symbol_count (int): number of parameters
+        record_count (int): number of records per parameter
+        dimension_count (int): number of dimensions per parameter
+        measure_memory (bool): if True, measures peak memory in a separate run
+    """
+    gams_directory = gdx_utils.find_gams_directory()
+    if gams_directory is None:
+        print("GAMS not found, using a stub GDX library")
+        library_context = _stub_gdx_library
+    else:
+        library_context = nullcontext
+    writers = {
+        "GdxWriter": lambda path: GdxWriter(path, gams_directory),
+        "BatchedGdxWriter": lambda path: BatchedGdxWriter(path, gams_directory),
+    }
+    total_records = symbol_count * record_count
+    print(f"Writing {symbol_count} parameter(s) with {record_count} {dimension_count}-dimensional records each")
+    with TemporaryDirectory() as temp_dir:
+        for name, make_writer in writers.items():
+            path = str(Path(temp_dir, name + ".gdx"))
+            with library_context():
+                start = time.perf_counter()
+                _write_parameters(make_writer(path), symbol_count, record_count, dimension_count)
+                duration = time.perf_counter() - start
+                line = f"{name:>18}: {duration:8.3f} s, {total_records / duration:12.0f} records/s"
+                if measure_memory:
+                    tracemalloc.start()
+                    _write_parameters(make_writer(path), symbol_count, record_count, dimension_count)
+                    _, peak = tracemalloc.get_traced_memory()
+                    tracemalloc.stop()
+                    line += f", peak {peak / 2**20:.1f} MiB"
+            print(line)
+
+
+def main():
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--symbols", type=int, default=10, help="number of parameters")
+    parser.add_argument("--records", type=int, default=50000, help="number of records per parameter")
+    parser.add_argument("--dimensions", type=int, default=2, help="number of dimensions per parameter")
+    parser.add_argument("--no-memory", action="store_true", help="skip measuring peak memory")
+    args = parser.parse_args()
+    run(args.symbols, args.records, args.dimensions, not args.no_memory)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+######################################################################################################################
+# Copyright (C) 2017-2022 Spine project consortium
+# Copyright Spine Items contributors
+# This file is part of Spine Items.
+# Spine Items is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+
+"""Times type conversion of textual float and datetime columns when mapping a source table.
+
+Compares per-cell conversion by import mappings
+with converting the typed columns once column by column before mapping.
+"""
+from argparse import ArgumentParser
+import random
+import time
+from spinedb_api.import_mapping.generator import get_mapped_data
+from spinedb_api.import_mapping.type_conversion import value_to_convert_spec
+from spinedb_api.parameter_value import to_database
+from spine_items.importer.column_conversion import convert_columns
+
+COLUMN_TYPES = {0: "string", 1: "float", 2: "datetime"}
+
+
+def build_rows(row_count, invalid_share):
+    """Creates textual rows of an entity name, a float and a datetime.
+
+    Args:
+        row_count (int): number of rows
+        invalid_share (float): share of float cells that are not numbers
+
+    Returns:
+        list of list: rows
+    """
+    random.seed(23)
+    return [
+        [
+            f"entity_{row}",
+            "n/a" if random.random() < invalid_share else str(random.random()),
+            f"2020-01-{row % 28 + 1:02}T{row % 24:02}:00",
+        ]
+        for row in range(row_count)
+    ]
+
+
+def build_mappings(mapping_count):
+    """Creates parameter value mappings that alternate between the float and datetime columns.
+
+    Args:
+        mapping_count (int): number of mappings
+
+    Returns:
+        list of list: mappings
+    """
+    return [
+        [
+            {"map_type": "EntityClass", "position": "hidden", "value": "unit"},
+            {"map_type": "Entity", "position": 0},
+            {"map_type": "ParameterDefinition", "position": "hidden", "value": f"p{i}"},
+            {"map_type": "Alternative", "position": "hidden", "value": "Base"},
+            {"map_type": "ParameterValue", "position": 1 + i % 2},
+        ]
+        for i in range(mapping_count)
+    ]
+
+
+def _map(rows, mappings, column_convert_specs):
+    """Applies mappings one at a time the same way as Importer's do_work().
+
+    Args:
+        rows (list of list): table rows
+        mappings (list of list): mappings
+        column_convert_specs (dict): column convert specs
+
+    Returns:
+        list: mapped data and errors of each mapping
+    """
+    return [
+        get_mapped_data(iter(rows), [mapping], None, "table", column_convert_specs, None, None, to_database)
+        for mapping in mappings
+    ]
+
+
+def run(row_count, mapping_counts, invalid_share):
+    """Runs the benchmark and prints the results.
+
+    Args:
+        row_count (int): number of rows in the table
+        mapping_counts (list of int): numbers of mappings to benchmark
+        invalid_share (float): share of float cells that are not numbers
+    """
+    column_convert_specs = {column: value_to_convert_spec(type_) for column, type_ in COLUMN_TYPES.items()}
+    print(f"{'mappings':>10} {'per-cell (s)':>13} {'column-wise (s)':>16} {'same result':>12}")
+    for mapping_count in mapping_counts:
+        mappings = build_mappings(mapping_count)
+        rows = build_rows(row_count, invalid_share)
+        start = time.perf_counter()
+        per_cell_result = _map(rows, mappings, column_convert_specs)
+        per_cell_time = time.perf_counter() - start
+        rows = build_rows(row_count, invalid_share)
+        start = time.perf_counter()
+        remaining_specs = dict(column_convert_specs)
+        for column in convert_columns(rows, column_convert_specs, 0):
+            del remaining_specs[column]
+        column_wise_result = _map(rows, mappings, remaining_specs)
+        column_wise_time = time.perf_counter() - start
+        same = per_cell_result == column_wise_result
+        print(f"{mapping_count:>10} {per_cell_time:13.2f} {column_wise_time:16.2f} {str(same):>12}")
+
+
+def main():
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100000, help="number of rows in the table")
+    parser.add_argument("--mappings", type=int, nargs="+", default=[1, 4], help="numbers of mappings")
+    parser.add_argument("--invalid", type=float, default=0.0, help="share of float cells that are not numbers")
+    args = parser.parse_args()
+    run(args.rows, args.mappings, args.invalid)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+######################################################################################################################
+# Copyright (C) 2017-2022 Spine project consortium
+# Copyright Spine Items contributors
+# This file is part of Spine Items.
+# Spine Items is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+
+"""Counts and times source table reads when many import mappings are applied to a wide Excel sheet.
+
+Compares applying every mapping to a freshly read sheet
+with reading the sheet once for all mappings.
+"""
+from argparse import ArgumentParser
+from pathlib import Path
+from tempfile import TemporaryDirectory
+import time
+from openpyxl import Workbook
+from spinedb_api.parameter_value import to_database
+from spinedb_api.spine_io.importers.excel_reader import ExcelConnector
+from spine_items.importer.do_work import read_tables_once
+
+SHEET_NAME = "wide"
+
+
+class _CountingExcelConnector(ExcelConnector):
+    """Excel connector that counts how many times tables are read."""
+
+    def __init__(self, settings):
+        super().__init__(settings)
+        self.read_count = 0
+
+    def get_data_iterator(self, table, options, max_rows=-1):
+        self.read_count += 1
+        return super().get_data_iterator(table, options, max_rows)
+
+
+def write_wide_sheet(path, row_count, parameter_count):
+    """Writes an Excel file with an entity column followed by a value column for each parameter.
+
+    Args:
+        path (Path): output file path
+        row_count (int): number of entities
+        parameter_count (int): number of parameter columns
+    """
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet(SHEET_NAME)
+    sheet.append(["entity"] + [f"p{i}" for i in range(parameter_count)])
+    for row in range(row_count):
+        sheet.append([f"entity_{row}"] + [float(row * parameter_count + i) for i in range(parameter_count)])
+    workbook.save(path)
+
+
+def build_mappings(parameter_count):
+    """Creates one named parameter value mapping per parameter column.
+
+    Args:
+        parameter_count (int): number of parameter columns
+
+    Returns:
+        list of dict: named mapping specifications
+    """
+    return [
+        {
+            f"p{i}": {
+                "map_type": "ObjectClass",
+                "name": {"map_type": "constant", "reference": "unit"},
+                "objects": {"map_type": "column", "reference": 0},
+                "parameters": {
+                    "map_type": "ParameterValue",
+                    "name": {"map_type": "constant", "reference": f"p{i}"},
+                    "value": {"map_type": "column", "reference": i + 1},
+                },
+                "skip_columns": [],
+                "read_start_row": 1,
+            }
+        }
+        for i in range(parameter_count)
+    ]
+
+
+def _apply_mappings(connector, mappings):
+    """Applies mappings one at a time the same way as Importer's do_work().
+
+    Args:
+        connector (SourceConnection): connected source connector
+        mappings (list of dict): named mapping specifications
+    """
+    for spec in mappings:
+        connector.get_mapped_data({SHEET_NAME: [spec]}, {}, {}, {}, {}, unparse_value=to_database)
+
+
+def run(row_count, parameter_counts):
+    """Runs the benchmark and prints the results.
+
+    Args:
+        row_count (int): number of rows in the sheet
+        parameter_counts (list of int): numbers of parameter columns and mappings to benchmark
+    """
+    print(f"{'mappings':>10} {'reads before':>13} {'time (s)':>9} {'reads after':>12} {'time (s)':>9}")
+    with TemporaryDirectory() as temp_dir:
+        for parameter_count in parameter_counts:
+            path = Path(temp_dir, f"wide_{parameter_count}.xlsx")
+            write_wide_sheet(path, row_count, parameter_count)
+            mappings = build_mappings(parameter_count)
+            connector = _CountingExcelConnector(None)
+            connector.connect_to_source(str(path))
+            start = time.perf_counter()
+            _apply_mappings(connector, mappings)
+            per_mapping_time = time.perf_counter() - start
+            per_mapping_reads = connector.read_count
+            connector.read_count = 0
+            start = time.perf_counter()
+            with read_tables_once(connector):
+                _apply_mappings(connector, mappings)
+            single_read_time = time.perf_counter() - start
+            single_reads = connector.read_count
+            connector.disconnect()
+            print(
+                f"{parameter_count:>10} {per_mapping_reads:>13} {per_mapping_time:9.2f} "
+                f"{single_reads:>12} {single_read_time:9.2f}"
+            )
+
+
+def main():
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10000, help="number of rows in the sheet")
+    parser.add_argument(
+        "--mappings", type=int, nargs="+", default=[2, 8, 32], help="numbers of parameter columns and mappings"
+    )
+    args = parser.parse_args()
+    run(args.rows, args.mappings)
+
+
+if __name__ == "__main__":
+    main()
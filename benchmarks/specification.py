@@ -0,0 +1,121 @@
+######################################################################################################################
+# Copyright (C) 2017-2022 Spine project consortium
+# Copyright Spine Items contributors
+# This file is part of Spine Items.
+# Spine Items is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+
+"""Times how long it takes to hand an export specification to an exporter process.
+
+Compares the dictionary round trip that every execution used to do
+with compiling the specification, fetching it from the compile cache
+and pickling it for a process that is spawned instead of forked.
+"""
+from argparse import ArgumentParser
+import pickle
+import time
+from spinedb_api.export_mapping import entity_parameter_value_export
+from spinedb_api.export_mapping.group_functions import NoGroup
+from spinedb_api.mapping import Position
+from spine_items.exporter.specification import (
+    compile_specification,
+    MappingSpecification,
+    MappingType,
+    Specification,
+)
+
+
+def build_specification(mapping_count):
+    """Creates a specification with given number of parameter value mappings.
+
+    Args:
+        mapping_count (int): number of mappings
+
+    Returns:
+        Specification: specification
+    """
+    mapping_specifications = {
+        f"mapping_{i}": MappingSpecification(
+            MappingType.entity_parameter_values,
+            True,
+            True,
+            NoGroup.NAME,
+            False,
+            entity_parameter_value_export(
+                0, 2, Position.hidden, 1, None, None, 3, Position.hidden, 5, [Position.hidden], [4]
+            ),
+        )
+        for i in range(mapping_count)
+    }
+    return Specification("benchmark", "", mapping_specifications)
+
+
+def _new_revision(specification, revision):
+    """Changes specification's description so that it does not hit the compile cache.
+
+    Args:
+        specification (Specification): specification to modify
+        revision (int): revision number
+
+    Returns:
+        Specification: the modified specification
+    """
+    specification.set_description(f"revision {revision}")
+    return specification
+
+
+def _time(function, repeats):
+    """Returns the average duration of a function call.
+
+    Args:
+        function (Callable): function to time
+        repeats (int): number of calls
+
+    Returns:
+        float: average duration in seconds
+    """
+    start = time.perf_counter()
+    for _ in range(repeats):
+        function()
+    return (time.perf_counter() - start) / repeats
+
+
+def run(mapping_counts, repeats):
+    """Runs the benchmark and prints the results.
+
+    Args:
+        mapping_counts (list of int): numbers of mappings to benchmark
+        repeats (int): number of repeats per measurement
+    """
+    print(f"{'mappings':>10} {'round trip (ms)':>16} {'compile (ms)':>13} {'cache hit (ms)':>15} {'unpickle (ms)':>14}")
+    for mapping_count in mapping_counts:
+        specification = build_specification(mapping_count)
+        round_trip = _time(lambda: Specification.from_dict(specification.to_dict()), repeats)
+        revisions = iter(range(repeats))
+        compile_time = _time(lambda: compile_specification(_new_revision(specification, next(revisions))), repeats)
+        cache_hit = _time(lambda: compile_specification(specification), repeats)
+        pickled = pickle.dumps(compile_specification(specification))
+        unpickle = _time(lambda: pickle.loads(pickled), repeats)
+        print(
+            f"{mapping_count:>10} {round_trip * 1000:16.2f} {compile_time * 1000:13.2f} "
+            f"{cache_hit * 1000:15.2f} {unpickle * 1000:14.2f}"
+        )
+
+
+def main():
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--mappings", type=int, nargs="+", default=[10, 100, 1000], help="numbers of mappings in specification"
+    )
+    parser.add_argument("--repeats", type=int, default=10, help="number of repeats per measurement")
+    args = parser.parse_args()
+    run(args.mappings, args.repeats)
+
+
+if __name__ == "__main__":
+    main()
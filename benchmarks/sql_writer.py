@@ -0,0 +1,75 @@
+######################################################################################################################
+# Copyright (C) 2017-2022 Spine project consortium
+# Copyright Spine Items contributors
+# This file is part of Spine Items.
+# Spine Items is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+
+"""Compares Exporter's SQL writers by writing synthetic tables into a local SQLite database."""
+from argparse import ArgumentParser
+from pathlib import Path
+from tempfile import TemporaryDirectory
+import time
+from spinedb_api.spine_io.exporters.sql_writer import SqlWriter
+from spine_items.exporter.writers.sql_writer import BatchedSqlWriter, BulkSqlWriter, DEFAULT_INSERT_BATCH_SIZE
+
+
+def _write_rows(writer, table_count, row_count):
+    """Writes synthetic tables using given writer.
+
+    Args:
+        writer (SqlWriter): writer
+        table_count (int): number of tables to write
+        row_count (int): number of rows per table
+    """
+    writer.start()
+    try:
+        for table_index in range(table_count):
+            writer.start_table(f"table_{table_index}", {})
+            writer.write_row(["entity_class", "entity", "index", "value"])
+            for row_index in range(row_count):
+                writer.write_row(["unit", f"unit_{row_index % 100}", row_index, 2.3 * row_index])
+            writer.finish_table()
+    finally:
+        writer.finish()
+
+
+def run(row_count, table_count, batch_size):
+    """Runs the benchmark and prints the results.
+
+    Args:
+        row_count (int): number of rows per table
+        table_count (int): number of tables
+        batch_size (int): batch size for the bulk writers
+    """
+    writers = {
+        "SqlWriter": lambda path: SqlWriter(path, overwrite_existing=True),
+        "BulkSqlWriter": lambda path: BulkSqlWriter(path, True, batch_size),
+        "BatchedSqlWriter": lambda path: BatchedSqlWriter(path, True, batch_size),
+    }
+    print(f"Writing {table_count} table(s) with {row_count} rows each, batch size {batch_size}")
+    with TemporaryDirectory() as temp_dir:
+        for name, make_writer in writers.items():
+            path = str(Path(temp_dir, name + ".sqlite"))
+            start = time.perf_counter()
+            _write_rows(make_writer(path), table_count, row_count)
+            duration = time.perf_counter() - start
+            print(f"{name:>18}: {duration:8.3f} s, {table_count * row_count / duration:12.0f} rows/s")
+
+
+def main():
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=20000, help="number of rows per table")
+    parser.add_argument("--tables", type=int, default=2, help="number of tables")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_INSERT_BATCH_SIZE, help="bulk insert batch size")
+    args = parser.parse_args()
+    run(args.rows, args.tables, args.batch_size)
+
+
+if __name__ == "__main__":
+    main()
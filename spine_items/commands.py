@@ -138,3 +138,131 @@ class UpdateGroupIdCommand(SpineToolboxCommand):
     def undo(self):
         item = self._project.get_item(self._item_name)
         item.do_set_group_id(self._undo_group_id)
+
+
+class UpdateImportProcessCountCommand(SpineToolboxCommand):
+    def __init__(self, item_name, count, project):
+        """Command to update Importer's number of parallel source reading processes.
+
+        Args:
+            item_name (str): item's name
+            count (int): new process count
+            project (SpineToolboxProject): project
+        """
+        super().__init__()
+        self._item_name = item_name
+        self._redo_count = count
+        item = project.get_item(item_name)
+        self._undo_count = item.import_process_count
+        self._project = project
+        self.setText(f"change parallel reads setting of {item_name}")
+
+    def redo(self):
+        item = self._project.get_item(self._item_name)
+        item.set_import_process_count(self._redo_count)
+
+    def undo(self):
+        item = self._project.get_item(self._item_name)
+        item.set_import_process_count(self._undo_count)
+
+
+class UpdateImportBatchSizeCommand(SpineToolboxCommand):
+    def __init__(self, item_name, batch_size, project):
+        """Command to update Importer's import batch size.
+
+        Args:
+            item_name (str): item's name
+            batch_size (int): new batch size
+            project (SpineToolboxProject): project
+        """
+        super().__init__()
+        self._item_name = item_name
+        self._redo_batch_size = batch_size
+        item = project.get_item(item_name)
+        self._undo_batch_size = item.import_batch_size
+        self._project = project
+        self.setText(f"change import batch size of {item_name}")
+
+    def redo(self):
+        item = self._project.get_item(self._item_name)
+        item.set_import_batch_size(self._redo_batch_size)
+
+    def undo(self):
+        item = self._project.get_item(self._item_name)
+        item.set_import_batch_size(self._undo_batch_size)
+
+
+class UpdateCommitEachBatchCommand(SpineToolboxCommand):
+    def __init__(self, item_name, commit_each_batch, project):
+        """Command to update Importer's commit after each batch setting.
+
+        Args:
+            item_name (str): item's name
+            commit_each_batch (bool): new setting
+            project (SpineToolboxProject): project
+        """
+        super().__init__()
+        self._item_name = item_name
+        self._redo_commit_each_batch = commit_each_batch
+        self._undo_commit_each_batch = not commit_each_batch
+        self._project = project
+        self.setText(f"change {item_name} commit after each batch setting")
+
+    def redo(self):
+        item = self._project.get_item(self._item_name)
+        item.set_commit_each_batch(self._redo_commit_each_batch)
+
+    def undo(self):
+        item = self._project.get_item(self._item_name)
+        item.set_commit_each_batch(self._undo_commit_each_batch)
+
+
+class UpdateMemoryLimitCommand(SpineToolboxCommand):
+    def __init__(self, item_name, memory_limit, project):
+        """Command to update Importer's memory limit.
+
+        Args:
+            item_name (str): item's name
+            memory_limit (int): new memory limit in megabytes
+            project (SpineToolboxProject): project
+        """
+        super().__init__()
+        self._item_name = item_name
+        self._redo_memory_limit = memory_limit
+        item = project.get_item(item_name)
+        self._undo_memory_limit = item.memory_limit
+        self._project = project
+        self.setText(f"change memory limit of {item_name}")
+
+    def redo(self):
+        item = self._project.get_item(self._item_name)
+        item.set_memory_limit(self._redo_memory_limit)
+
+    def undo(self):
+        item = self._project.get_item(self._item_name)
+        item.set_memory_limit(self._undo_memory_limit)
+
+
+class UpdateSkipUnchangedCommand(SpineToolboxCommand):
+    def __init__(self, item_name, skip_unchanged, project):
+        """Command to update Importer's skip unchanged files setting.
+
+        Args:
+            item_name (str): item's name
+            skip_unchanged (bool): new setting
+            project (SpineToolboxProject): project
+        """
+        super().__init__()
+        self._item_name = item_name
+        self._redo_skip_unchanged = skip_unchanged
+        self._undo_skip_unchanged = not skip_unchanged
+        self._project = project
+        self.setText(f"change {item_name} skip unchanged files setting")
+
+    def redo(self):
+        item = self._project.get_item(self._item_name)
+        item.set_skip_unchanged(self._redo_skip_unchanged)
+
+    def undo(self):
+        item = self._project.get_item(self._item_name)
+        item.set_skip_unchanged(self._undo_skip_unchanged)
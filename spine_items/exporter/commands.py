@@ -563,23 +563,106 @@ class CompactMapping(QUndoCommand):
 
 
 class SetExportFormat(QUndoCommand):
-    def __init__(self, editor, export_format, previous_format):
+    def __init__(self, editor, export_format, previous_format, previous_compression):
         """
         Args:
             editor (SpecificationEditor): specification editor window
             export_format (OutputFormat): new format
             previous_format (OutputFormat): previous format
+            previous_compression (str, optional): compression before format change
         """
         super().__init__("change export format")
         self._specification_editor = editor
         self._format = export_format
         self._previous_format = previous_format
+        self._previous_compression = previous_compression
 
     def redo(self):
         self._specification_editor.set_export_format_silently(self._format)
 
     def undo(self):
         self._specification_editor.set_export_format_silently(self._previous_format)
+        self._specification_editor.set_compression_silently(self._previous_compression)
+
+
+class SetCompression(QUndoCommand):
+    def __init__(self, editor, compression, previous_compression):
+        """
+        Args:
+            editor (SpecificationEditor): specification editor window
+            compression (str, optional): new compression codec
+            previous_compression (str, optional): previous compression codec
+        """
+        super().__init__("change compression")
+        self._specification_editor = editor
+        self._compression = compression
+        self._previous_compression = previous_compression
+
+    def redo(self):
+        self._specification_editor.set_compression_silently(self._compression)
+
+    def undo(self):
+        self._specification_editor.set_compression_silently(self._previous_compression)
+
+
+class SetExcelMode(QUndoCommand):
+    def __init__(self, editor, excel_mode, previous_excel_mode):
+        """
+        Args:
+            editor (SpecificationEditor): specification editor window
+            excel_mode (ExcelMode): new Excel mode
+            previous_excel_mode (ExcelMode): previous Excel mode
+        """
+        super().__init__("change Excel mode")
+        self._specification_editor = editor
+        self._excel_mode = excel_mode
+        self._previous_excel_mode = previous_excel_mode
+
+    def redo(self):
+        self._specification_editor.set_excel_mode_silently(self._excel_mode)
+
+    def undo(self):
+        self._specification_editor.set_excel_mode_silently(self._previous_excel_mode)
+
+
+class SetGdxMode(QUndoCommand):
+    def __init__(self, editor, gdx_mode, previous_gdx_mode):
+        """
+        Args:
+            editor (SpecificationEditor): specification editor window
+            gdx_mode (GdxMode): new GDX mode
+            previous_gdx_mode (GdxMode): previous GDX mode
+        """
+        super().__init__("change GDX mode")
+        self._specification_editor = editor
+        self._gdx_mode = gdx_mode
+        self._previous_gdx_mode = previous_gdx_mode
+
+    def redo(self):
+        self._specification_editor.set_gdx_mode_silently(self._gdx_mode)
+
+    def undo(self):
+        self._specification_editor.set_gdx_mode_silently(self._previous_gdx_mode)
+
+
+class SetRowBatchSize(QUndoCommand):
+    def __init__(self, editor, batch_size, previous_batch_size):
+        """
+        Args:
+            editor (SpecificationEditor): specification editor window
+            batch_size (int): new row batch size
+            previous_batch_size (int): previous row batch size
+        """
+        super().__init__("change row batch size")
+        self._specification_editor = editor
+        self._batch_size = batch_size
+        self._previous_batch_size = previous_batch_size
+
+    def redo(self):
+        self._specification_editor.set_row_batch_size_silently(self._batch_size)
+
+    def undo(self):
+        self._specification_editor.set_row_batch_size_silently(self._previous_batch_size)
 
 
 class UpdateOutputTimeStampsFlag(SpineToolboxCommand):
@@ -605,3 +688,84 @@ class UpdateOutputTimeStampsFlag(SpineToolboxCommand):
     def undo(self):
         exporter = self._project.get_item(self._exporter_name)
         exporter.set_output_time_stamps_flag(not self._value)
+
+
+class UpdateExportProcessCount(SpineToolboxCommand):
+    """Command to set the number of exporter's parallel export processes."""
+
+    def __init__(self, exporter_name, count, previous_count, project):
+        """
+        Args:
+            exporter_name (str): exporter's name
+            count (int): new process count
+            previous_count (int): previous process count
+            project (SpineToolboxProject): project
+        """
+        super().__init__()
+        self.setText(f"change parallel exports setting of {exporter_name}")
+        self._exporter_name = exporter_name
+        self._count = count
+        self._previous_count = previous_count
+        self._project = project
+
+    def redo(self):
+        exporter = self._project.get_item(self._exporter_name)
+        exporter.set_export_process_count(self._count)
+
+    def undo(self):
+        exporter = self._project.get_item(self._exporter_name)
+        exporter.set_export_process_count(self._previous_count)
+
+
+class UpdateQueryCacheSize(SpineToolboxCommand):
+    """Command to set the size of exporter's query cache."""
+
+    def __init__(self, exporter_name, size, previous_size, project):
+        """
+        Args:
+            exporter_name (str): exporter's name
+            size (int): new cache size in megabytes
+            previous_size (int): previous cache size in megabytes
+            project (SpineToolboxProject): project
+        """
+        super().__init__()
+        self.setText(f"change query cache setting of {exporter_name}")
+        self._exporter_name = exporter_name
+        self._size = size
+        self._previous_size = previous_size
+        self._project = project
+
+    def redo(self):
+        exporter = self._project.get_item(self._exporter_name)
+        exporter.set_query_cache_size(self._size)
+
+    def undo(self):
+        exporter = self._project.get_item(self._exporter_name)
+        exporter.set_query_cache_size(self._previous_size)
+
+
+class UpdateTableWriterCount(SpineToolboxCommand):
+    """Command to set exporter's concurrent table writer count."""
+
+    def __init__(self, exporter_name, count, previous_count, project):
+        """
+        Args:
+            exporter_name (str): exporter's name
+            count (int): new writer count
+            previous_count (int): previous writer count
+            project (SpineToolboxProject): project
+        """
+        super().__init__()
+        self.setText(f"change parallel table setting of {exporter_name}")
+        self._exporter_name = exporter_name
+        self._count = count
+        self._previous_count = previous_count
+        self._project = project
+
+    def redo(self):
+        exporter = self._project.get_item(self._exporter_name)
+        exporter.set_table_writer_count(self._count)
+
+    def undo(self):
+        exporter = self._project.get_item(self._exporter_name)
+        exporter.set_table_writer_count(self._previous_count)
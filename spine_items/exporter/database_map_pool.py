@@ -0,0 +1,151 @@
+######################################################################################################################
+# Copyright (C) 2017-2022 Spine project consortium
+# Copyright Spine Items contributors
+# This file is part of Spine Items.
+# Spine Items is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+
+"""Contains a pool of reusable database maps for export previews."""
+import os
+from threading import Lock
+from sqlalchemy.engine.url import make_url
+from sqlalchemy.exc import ArgumentError
+from spinedb_api import DatabaseMapping
+from ..utils import database_revision
+
+DEFAULT_MAX_IDLE_MAPS = 2
+"""Default maximum number of idle database maps kept per URL."""
+
+
+class DatabaseMapPool:
+    """Thread-safe pool of long-lived database maps that are borrowed for reading.
+
+    Opening a database map involves connecting to the database, checking its schema version
+    and reflecting its tables. The pool keeps maps open between uses to avoid that cost.
+    Idle maps of an SQLite database are discarded when the database file changes on disk.
+    Idle maps of other databases are discarded when the database has received new commits.
+    """
+
+    def __init__(self, max_idle_maps=DEFAULT_MAX_IDLE_MAPS):
+        """
+        Args:
+            max_idle_maps (int): maximum number of idle maps kept per URL
+        """
+        self._max_idle_maps = max_idle_maps
+        self._idle_maps = {}
+        self._file_signatures = {}
+        self._borrowed = {}
+        self._closed = False
+        self._lock = Lock()
+
+    def acquire(self, url):
+        """Borrows a database map from the pool opening a new one if needed.
+
+        Borrowed maps must be given back with :meth:`release`.
+
+        Args:
+            url (str): database URL
+
+        Returns:
+            DatabaseMapping: database map
+
+        Raises:
+            SpineDBAPIError: raised if database map could not be opened
+        """
+        signature = _file_signature(url)
+        with self._lock:
+            if self._file_signatures.get(url) != signature:
+                self._close_idle_maps(url)
+                self._file_signatures[url] = signature
+            idle_maps = self._idle_maps.get(url)
+            idle_map = idle_maps.pop() if idle_maps else None
+        db_map = None
+        if idle_map is not None:
+            db_map, revision = idle_map
+            if signature is None and database_revision(db_map) != revision:
+                _close(db_map)
+                db_map = None
+        if db_map is None:
+            db_map = DatabaseMapping(url)
+        with self._lock:
+            self._borrowed[id(db_map)] = (url, signature)
+        return db_map
+
+    def release(self, db_map, reusable=True):
+        """Gives a borrowed database map back to the pool.
+
+        Args:
+            db_map (DatabaseMapping): borrowed database map
+            reusable (bool): False if the map should be closed instead of reused, e.g. after an error
+        """
+        with self._lock:
+            url, signature = self._borrowed.pop(id(db_map))
+        revision = database_revision(db_map) if reusable and signature is None else None
+        with self._lock:
+            idle_maps = self._idle_maps.setdefault(url, [])
+            if (
+                reusable
+                and not self._closed
+                and self._file_signatures.get(url) == signature
+                and len(idle_maps) < self._max_idle_maps
+            ):
+                idle_maps.append((db_map, revision))
+                return
+        _close(db_map)
+
+    def close(self):
+        """Closes all idle database maps.
+
+        Maps that are currently borrowed are closed when they are released.
+        """
+        with self._lock:
+            self._closed = True
+            for url in list(self._idle_maps):
+                self._close_idle_maps(url)
+            self._file_signatures.clear()
+
+    def _close_idle_maps(self, url):
+        """Closes idle database maps of given URL.
+
+        Args:
+            url (str): database URL
+        """
+        for db_map, _ in self._idle_maps.pop(url, []):
+            _close(db_map)
+
+
+def _close(db_map):
+    """Closes database map and releases its connections.
+
+    Args:
+        db_map (DatabaseMapping): database map
+    """
+    db_map.close()
+    db_map.engine.dispose()
+
+
+def _file_signature(url):
+    """Identifies the state of an SQLite database file on disk.
+
+    Args:
+        url (str): database URL
+
+    Returns:
+        tuple: file's inode, modification time and size, or None if URL does not point to a database file
+    """
+    try:
+        sa_url = make_url(url)
+    except ArgumentError:
+        return None
+    if sa_url.get_backend_name() != "sqlite" or not sa_url.database:
+        return None
+    try:
+        stat = os.stat(sa_url.database)
+    except OSError:
+        return None
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
@@ -12,18 +12,36 @@
 
 """Exporter's execute kernel (do_work), as target for a multiprocess.Process"""
 import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
+from functools import partial
 from pathlib import Path
 from time import time
-from spinedb_api.spine_io.exporters.writer import write, WriterException
+from spinedb_api.spine_io.exporters.writer import WriterException
 from spinedb_api.spine_io.exporters.csv_writer import CsvWriter
 from spinedb_api.spine_io.exporters.excel_writer import ExcelWriter
 from spinedb_api.spine_io.exporters.gdx_writer import GdxWriter
-from spinedb_api.spine_io.exporters.sql_writer import SqlWriter
 from spinedb_api import DatabaseMapping, SpineDBAPIError
+from spinedb_api.filters.alternative_filter import ALTERNATIVE_FILTER_TYPE
+from spinedb_api.filters.renamer import ENTITY_CLASS_RENAMER_TYPE, PARAMETER_RENAMER_TYPE
+from spinedb_api.filters.scenario_filter import SCENARIO_FILTER_TYPE
+from spinedb_api.filters.tools import apply_filter_stack, clear_filter_configs, filter_configs, load_filters
+from spinedb_api.filters.value_transformer import VALUE_TRANSFORMER_TYPE
 from spine_engine.utils.helpers import write_filter_id_file
-from .specification import Specification, OutputFormat
-from ..utils import convert_to_sqlalchemy_url, split_url_credentials
+from .metrics import metrics_summary, write_with_metrics
+from .query_cache import DEFAULT_QUERY_CACHE_SIZE, QueryCachingDatabaseMapping
+from .specification import ExcelMode, GdxMode, OutputFormat, restore_specification
+from .writers.concurrent_writer import ConcurrentTableWriter
+from .writers.csv_writer import CompressedCsvWriter
+from .writers.excel_writer import StreamingExcelWriter
+from .writers.sql_writer import BatchedSqlWriter, BulkSqlWriter
+from ..utils import (
+    convert_to_sqlalchemy_url,
+    RecordingLogger,
+    replay_messages,
+    split_url_credentials,
+    strip_compression_suffix,
+)
 
 
 def do_work(
@@ -38,13 +56,16 @@ def do_work(
     filter_id,
     filter_subdirectory,
     logger,
+    process_count=1,
+    query_cache_size=DEFAULT_QUERY_CACHE_SIZE,
+    table_writer_count=1,
 ):
     """
     Exports databases using given specification as export mapping.
 
     Args:
         process (Process): unused
-        specification (dict): export specification dictionary
+        specification (CompiledSpecification or dict): compiled or serialized export specification
         output_time_stamps (bool): if True, puts output files into time stamped subdirectories
         cancel_on_error (bool): if True, bails out on non-fatal errors
         gams_path (str): path to GAMS installation
@@ -54,49 +75,459 @@ def do_work(
         filter_id (str): filter id
         filter_subdirectory (str): name of extra subdirectory used when filters have been applied
         logger (LoggerInterface): a logger
+        process_count (int): maximum number of processes to export databases in parallel
+        query_cache_size (int): maximum size of cached query results in megabytes; 0 disables caching
+        table_writer_count (int): maximum number of threads writing CSV tables concurrently
 
     Returns:
-        tuple: boolean success flag, dictionary of output files
+        tuple: boolean success flag, dictionary of output files and dictionary of per-mapping metrics
     """
-    specification = Specification.from_dict(specification)
+    database_groups = _group_filtered_databases(databases)
+    if process_count > 1:
+        database_groups = _split_database_groups(database_groups, process_count)
+    if process_count > 1 and len(database_groups) > 1:
+        return _export_in_parallel(
+            specification,
+            output_time_stamps,
+            cancel_on_error,
+            gams_path,
+            out_dir,
+            database_groups,
+            out_urls,
+            filter_id,
+            filter_subdirectory,
+            logger,
+            process_count,
+            query_cache_size,
+            table_writer_count,
+        )
+    specification = restore_specification(specification)
     successes = list()
     written_files = dict()
+    export_metrics = dict()
+    for group in database_groups:
+        successful = _export_database_group(
+            group,
+            specification,
+            output_time_stamps,
+            successes,
+            written_files,
+            export_metrics,
+            cancel_on_error,
+            gams_path,
+            out_dir,
+            out_urls,
+            filter_id,
+            filter_subdirectory,
+            logger,
+            table_writer_count,
+            query_cache_size,
+        )
+        if not successful:
+            return False, written_files, export_metrics
+    return all(successes), written_files, export_metrics
+
+
+def _group_filtered_databases(databases):
+    """Groups database URLs that differ only by their filter configurations.
+
+    Args:
+        databases (dict): mapping from database URL to output label
+
+    Returns:
+        list of dict: mappings from database URL to output label, one per underlying database
+    """
+    groups = dict()
     for url, output_label in databases.items():
-        try:
-            database_map = DatabaseMapping(url)
-        except SpineDBAPIError as error:
+        groups.setdefault(clear_filter_configs(url), dict())[url] = output_label
+    return list(groups.values())
+
+
+def _split_database_groups(database_groups, worker_count):
+    """Splits the largest database groups in halves until there is a group for every worker.
+
+    Views in the same group share a database connection,
+    so groups are split only as much as is needed to keep all workers busy.
+
+    Args:
+        database_groups (list of dict): databases grouped by underlying database
+        worker_count (int): number of workers
+
+    Returns:
+        list of dict: database groups
+    """
+    groups = list(database_groups)
+    while len(groups) < worker_count:
+        largest = max(groups, key=len, default=None)
+        if largest is None or len(largest) < 2:
+            break
+        index = groups.index(largest)
+        items = list(largest.items())
+        middle = len(items) // 2
+        groups[index : index + 1] = [dict(items[:middle]), dict(items[middle:])]
+    return groups
+
+
+def _export_in_parallel(
+    specification,
+    output_time_stamps,
+    cancel_on_error,
+    gams_path,
+    out_dir,
+    database_groups,
+    out_urls,
+    filter_id,
+    filter_subdirectory,
+    logger,
+    process_count,
+    query_cache_size,
+    table_writer_count,
+):
+    """Exports database groups simultaneously in a pool of worker processes.
+
+    Messages logged by the workers are relayed to ``logger`` in the order the groups were given.
+
+    Args:
+        specification (CompiledSpecification or dict): compiled or serialized export specification
+        output_time_stamps (bool): if True, puts output files into time stamped subdirectories
+        cancel_on_error (bool): if True, bails out on non-fatal errors
+        gams_path (str): path to GAMS installation
+        out_dir (str): base output directory
+        database_groups (list of dict): databases to export grouped by underlying database
+        out_urls (dict): output URLs
+        filter_id (str): filter id
+        filter_subdirectory (str): name of extra subdirectory used when filters have been applied
+        logger (LoggerInterface): a logger
+        process_count (int): maximum number of worker processes
+        query_cache_size (int): maximum size of cached query results in megabytes
+        table_writer_count (int): maximum number of threads writing CSV tables concurrently in each worker
+
+    Returns:
+        tuple: boolean success flag, dictionary of output files and dictionary of per-mapping metrics
+    """
+    successes = list()
+    written_files = dict()
+    export_metrics = dict()
+    with ProcessPoolExecutor(max_workers=min(process_count, len(database_groups))) as executor:
+        futures = [
+            executor.submit(
+                _export_database_group_in_worker,
+                group,
+                specification,
+                output_time_stamps,
+                cancel_on_error,
+                gams_path,
+                out_dir,
+                {url: out_urls[url] for url in group if url in out_urls},
+                filter_id,
+                filter_subdirectory,
+                query_cache_size,
+                table_writer_count,
+            )
+            for group in database_groups
+        ]
+        for future in futures:
+            successful, worker_successes, worker_files, worker_metrics, messages = future.result()
+            replay_messages(messages, logger)
+            successes += worker_successes
+            written_files.update(worker_files)
+            export_metrics.update(worker_metrics)
+            if not successful:
+                for pending in futures:
+                    pending.cancel()
+                return False, written_files, export_metrics
+    return all(successes), written_files, export_metrics
+
+
+def _export_database_group_in_worker(
+    group,
+    specification,
+    output_time_stamps,
+    cancel_on_error,
+    gams_path,
+    out_dir,
+    out_urls,
+    filter_id,
+    filter_subdirectory,
+    query_cache_size,
+    table_writer_count,
+):
+    """Exports a group of filtered views to a single database in a worker process.
+
+    Args:
+        group (dict): mapping from source database URL to output label
+        specification (CompiledSpecification or dict): compiled or serialized export specification
+        output_time_stamps (bool): if True, puts output files into time stamped subdirectories
+        cancel_on_error (bool): if True, bails out on non-fatal errors
+        gams_path (str): path to GAMS installation
+        out_dir (str): base output directory
+        out_urls (dict): output URLs
+        filter_id (str): filter id
+        filter_subdirectory (str): name of extra subdirectory used when filters have been applied
+        query_cache_size (int): maximum size of cached query results in megabytes
+        table_writer_count (int): maximum number of threads writing CSV tables concurrently
+
+    Returns:
+        tuple: continuation flag, success history, dictionary of output files, dictionary of per-mapping metrics
+            and recorded log messages
+    """
+    specification = restore_specification(specification)
+    successes = list()
+    written_files = dict()
+    export_metrics = dict()
+    logger = RecordingLogger()
+    successful = _export_database_group(
+        group,
+        specification,
+        output_time_stamps,
+        successes,
+        written_files,
+        export_metrics,
+        cancel_on_error,
+        gams_path,
+        out_dir,
+        out_urls,
+        filter_id,
+        filter_subdirectory,
+        logger,
+        table_writer_count,
+        query_cache_size,
+    )
+    return successful, successes, written_files, export_metrics, logger.messages
+
+
+def _export_database_group(
+    group,
+    specification,
+    output_time_stamps,
+    successes,
+    written_files,
+    export_metrics,
+    cancel_on_error,
+    gams_path,
+    out_dir,
+    out_urls,
+    filter_id,
+    filter_subdirectory,
+    logger,
+    table_writer_count=1,
+    query_cache_size=DEFAULT_QUERY_CACHE_SIZE,
+):
+    """Exports filtered views to a single database into file(s) or output database.
+
+    The database is opened only once. Filters, e.g. scenarios, are switched in-process between exports
+    and query results that do not depend on the filters are shared by all views.
+
+    Args:
+        group (dict): mapping from source database URL to output label
+        specification (Specification): export specification
+        output_time_stamps (bool): if True, puts output files into time stamped subdirectories
+        successes (list of bool): history of success statuses
+        written_files (dict): mapping from output label to completed output files
+        export_metrics (dict): mapping from output label to list of serialized :class:`MappingMetrics`
+        cancel_on_error (bool): if True, bails out on non-fatal errors
+        gams_path (str): path to GAMS installation
+        out_dir (str): base output directory
+        out_urls (dict): output URLs
+        filter_id (str): filter id
+        filter_subdirectory (str): name of extra subdirectory used when filters have been applied
+        logger (LoggerInterface): a logger
+        table_writer_count (int): maximum number of threads writing CSV tables concurrently
+        query_cache_size (int): maximum size of cached query results in megabytes
+
+    Returns:
+        bool: True if operation was successful, False otherwise
+    """
+    urls = list(group)
+    try:
+        database_map = DatabaseMapping(urls[0], apply_filters=len(urls) == 1)
+    except SpineDBAPIError as error:
+        for url in urls:
             sanitized_url, _ = split_url_credentials(url)
             logger.msg_error.emit(f"Failed to export <b>{sanitized_url}</b>: {error}")
             if cancel_on_error:
-                return False, written_files
+                return False
             successes.append(False)
-            continue
-        try:
-            out_url = out_urls.get(url)
-            if specification.output_format == OutputFormat.SQL and out_url is not None:
-                successful = _export_to_database(
-                    database_map, specification, out_url, successes, cancel_on_error, logger
-                )
-            else:
-                successful = _export_to_file(
-                    database_map,
-                    specification,
-                    output_label,
-                    output_time_stamps,
-                    successes,
-                    written_files,
-                    cancel_on_error,
-                    gams_path,
-                    out_dir,
-                    filter_id,
-                    filter_subdirectory,
-                    logger,
-                )
+        return True
+    try:
+        # Mappings often read the same data; share fetched rows between them.
+        caching_database_map = QueryCachingDatabaseMapping(database_map, query_cache_size * 1024 * 1024)
+        for url, output_label in group.items():
+            if len(urls) > 1:
+                try:
+                    _switch_filters(database_map, url)
+                except SpineDBAPIError as error:
+                    sanitized_url, _ = split_url_credentials(url)
+                    logger.msg_error.emit(f"Failed to export <b>{sanitized_url}</b>: {error}")
+                    if cancel_on_error:
+                        return False
+                    successes.append(False)
+                    continue
+                caching_database_map.prune()
+            successful = _export_database(
+                caching_database_map,
+                output_label,
+                specification,
+                output_time_stamps,
+                successes,
+                written_files,
+                export_metrics,
+                cancel_on_error,
+                gams_path,
+                out_dir,
+                out_urls.get(url),
+                filter_id,
+                filter_subdirectory,
+                logger,
+                table_writer_count,
+            )
             if not successful:
-                return False, written_files
-        finally:
-            database_map.close()
-    return all(successes), written_files
+                return False
+        return True
+    finally:
+        database_map.close()
+
+
+def _switch_filters(database_map, url):
+    """Replaces the filters applied to database map by the ones in given URL.
+
+    Subqueries overridden by the filters of the previous view are restored
+    and the filter configurations are cleared before the new filters are applied,
+    so filters of previous views do not leak into the new one.
+
+    Args:
+        database_map (DatabaseMapping): database map
+        url (str): database URL with filter configurations
+    """
+    applied_configs = database_map.get_filter_configs()
+    for filter_type in {config["type"] for config in applied_configs}:
+        restore = _FILTER_RESTORERS.get(filter_type)
+        if restore is not None:
+            restore(database_map)
+    applied_configs.clear()
+    apply_filter_stack(database_map, load_filters(filter_configs(url)))
+
+
+def _restore_scenario_filtered_subqueries(database_map):
+    """Restores the subqueries that scenario and alternative filters override.
+
+    Args:
+        database_map (DatabaseMapping): database map
+    """
+    database_map.restore_entity_element_sq_maker()
+    database_map.restore_entity_sq_maker()
+    database_map.restore_entity_group_sq_maker()
+    database_map.restore_entity_location_sq_maker()
+    database_map.restore_entity_alternative_sq_maker()
+    database_map.restore_parameter_value_sq_maker()
+    database_map.restore_alternative_sq_maker()
+    database_map.restore_scenario_sq_maker()
+    database_map.restore_scenario_alternative_sq_maker()
+
+
+def _restore_entity_class_sq(database_map):
+    """Restores the subquery that entity class renamer overrides.
+
+    Args:
+        database_map (DatabaseMapping): database map
+    """
+    database_map.restore_entity_class_sq_maker()
+
+
+def _restore_parameter_definition_sq(database_map):
+    """Restores the subquery that parameter renamer overrides.
+
+    Args:
+        database_map (DatabaseMapping): database map
+    """
+    database_map.restore_parameter_definition_sq_maker()
+
+
+def _restore_parameter_value_sq(database_map):
+    """Restores the subquery that value transformer overrides.
+
+    Args:
+        database_map (DatabaseMapping): database map
+    """
+    database_map.restore_parameter_value_sq_maker()
+
+
+_FILTER_RESTORERS = {
+    SCENARIO_FILTER_TYPE: _restore_scenario_filtered_subqueries,
+    ALTERNATIVE_FILTER_TYPE: _restore_scenario_filtered_subqueries,
+    ENTITY_CLASS_RENAMER_TYPE: _restore_entity_class_sq,
+    PARAMETER_RENAMER_TYPE: _restore_parameter_definition_sq,
+    VALUE_TRANSFORMER_TYPE: _restore_parameter_value_sq,
+}
+"""Mapping from filter type to function that undoes the filter's subquery overrides."""
+
+
+def _export_database(
+    database_map,
+    output_label,
+    specification,
+    output_time_stamps,
+    successes,
+    written_files,
+    export_metrics,
+    cancel_on_error,
+    gams_path,
+    out_dir,
+    out_url,
+    filter_id,
+    filter_subdirectory,
+    logger,
+    table_writer_count=1,
+):
+    """Exports a single database into file(s) or output database.
+
+    Args:
+        database_map (QueryCachingDatabaseMapping): source database map
+        output_label (str): output label
+        specification (Specification): export specification
+        output_time_stamps (bool): if True, puts output files into time stamped subdirectories
+        successes (list of bool): history of success statuses
+        written_files (dict): mapping from output label to completed output files
+        export_metrics (dict): mapping from output label to list of serialized :class:`MappingMetrics`
+        cancel_on_error (bool): if True, bails out on non-fatal errors
+        gams_path (str): path to GAMS installation
+        out_dir (str): base output directory
+        out_url (dict, optional): output URL
+        filter_id (str): filter id
+        filter_subdirectory (str): name of extra subdirectory used when filters have been applied
+        logger (LoggerInterface): a logger
+        table_writer_count (int): maximum number of threads writing CSV tables concurrently
+
+    Returns:
+        bool: True if operation was successful, False otherwise
+    """
+    if specification.output_format == OutputFormat.SQL and out_url is not None:
+        return _export_to_database(
+            database_map,
+            specification,
+            output_label,
+            out_url,
+            successes,
+            export_metrics,
+            cancel_on_error,
+            logger,
+        )
+    return _export_to_file(
+        database_map,
+        specification,
+        output_label,
+        output_time_stamps,
+        successes,
+        written_files,
+        export_metrics,
+        cancel_on_error,
+        gams_path,
+        out_dir,
+        filter_id,
+        filter_subdirectory,
+        logger,
+        table_writer_count,
+    )
 
 
 def _export_to_file(
@@ -106,12 +537,14 @@ def _export_to_file(
     output_time_stamps,
     successes,
     written_files,
+    export_metrics,
     cancel_on_error,
     gams_path,
     out_dir,
     filter_id,
     filter_subdirectory,
     logger,
+    table_writer_count=1,
 ):
     """Exports into file(s) including a new SQLite file.
 
@@ -122,40 +555,57 @@ def _export_to_file(
         output_time_stamps (bool): if True, puts output files into time stamped subdirectories
         successes (list of bool): history of success statuses
         written_files (dict): mapping from output label to completed output files
+        export_metrics (dict): mapping from output label to list of serialized :class:`MappingMetrics`
         cancel_on_error (bool): if True, bails out on non-fatal errors
         gams_path (str): path to GAMS installation
         out_dir (str): base output directory
         filter_id (str): filter id
         filter_subdirectory (str): name of extra subdirectory used when filters have been applied
         logger (LoggerInterface): a logger
+        table_writer_count (int): maximum number of threads writing CSV tables concurrently
 
     Returns:
         bool: True if operation was successful, False otherwise
     """
-    output_file_name = _add_extension(output_label, specification.output_format)
+    output_file_name = _add_extension(output_label, specification.output_format, specification.compression)
     out_path = _subdirectory_for_fork(output_file_name, out_dir, output_time_stamps, filter_subdirectory)
     try:
         file = Path(out_path)
         file.parent.mkdir(parents=True, exist_ok=True)
         if file.exists():
             file.unlink()
-        writer = make_writer(specification.output_format, out_path, gams_path)
-        specifications = specification.enabled_specifications().values()
-        mappings = (m.root for m in specifications)
-        header_always = (m.always_export_header for m in specifications)
-        group_fns = (m.group_fn for m in specifications)
-        write(database_map, writer, *mappings, empty_data_header=header_always, group_fns=group_fns)
+        if table_writer_count > 1 and specification.output_format == OutputFormat.CSV:
+            with ThreadPoolExecutor(max_workers=table_writer_count) as executor:
+                writer = ConcurrentTableWriter(
+                    partial(_make_part_writer, specification.output_format, file.name, specification.compression),
+                    str(file.parent),
+                    executor,
+                    table_writer_count,
+                )
+                metrics = write_with_metrics(database_map, writer, specification.enabled_specifications())
+        else:
+            writer = make_writer(
+                specification.output_format,
+                out_path,
+                gams_path,
+                specification.row_batch_size,
+                specification.compression,
+                specification.excel_mode,
+                specification.gdx_mode,
+            )
+            metrics = write_with_metrics(database_map, writer, specification.enabled_specifications())
     except (FileNotFoundError, PermissionError, WriterException) as e:
         logger.msg_error.emit(str(e))
         if cancel_on_error:
             return False
         successes.append(False)
     else:
-        if isinstance(writer, CsvWriter):
+        if specification.output_format.is_multi_file_capable():
             files = writer.output_files()
         else:
             files = {out_path}
         written_files[output_label] = files
+        export_metrics[output_label] = [m.to_dict() for m in metrics]
         if len(files) > 1:
             anchors = list()
             for path in (Path(f) for f in files):
@@ -167,20 +617,25 @@ def _export_to_file(
                 f"<a style='color:#BB99FF;' title='{only_file}' href='file:///{only_file}'>{only_file.name}</a>"
             )
             logger.msg_success.emit(f"Wrote {file_anchor}")
+        logger.msg.emit(metrics_summary(f"Mapping statistics for <b>{output_label}</b>:", metrics))
         if filter_id:
             write_filter_id_file(filter_id, Path(out_path).parent)
         successes.append(True)
     return True
 
 
-def _export_to_database(database_map, specification, out_url, successes, cancel_on_error, logger):
+def _export_to_database(
+    database_map, specification, output_label, out_url, successes, export_metrics, cancel_on_error, logger
+):
     """Exports into fixed output database.
 
     Args:
         database_map (DatabaseMapping): source database map
         specification (Specification): export specification dictionary
+        output_label (str): output label
         out_url (dict): output URL
         successes (list of bool): history of success statuses
+        export_metrics (dict): mapping from output label to list of serialized :class:`MappingMetrics`
         cancel_on_error (bool): if True, bails out on non-fatal errors
         logger (LoggerInterface): a logger
 
@@ -191,12 +646,8 @@ def _export_to_database(database_map, specification, out_url, successes, cancel_
     if url is None:
         return True
     try:
-        writer = SqlWriter(str(url), overwrite_existing=False)
-        specifications = specification.enabled_specifications().values()
-        mappings = (m.root for m in specifications)
-        header_always = (m.always_export_header for m in specifications)
-        group_fns = (m.group_fn for m in specifications)
-        write(database_map, writer, *mappings, empty_data_header=header_always, group_fns=group_fns)
+        writer = _make_sql_writer(str(url), False, specification.row_batch_size)
+        metrics = write_with_metrics(database_map, writer, specification.enabled_specifications())
     except WriterException as e:
         logger.msg_error.emit(str(e))
         if cancel_on_error:
@@ -204,11 +655,21 @@ def _export_to_database(database_map, specification, out_url, successes, cancel_
         successes.append(False)
     else:
         logger.msg_success.emit(f"Wrote to database.")
+        logger.msg.emit(metrics_summary(f"Mapping statistics for <b>{output_label}</b>:", metrics))
+        export_metrics[output_label] = [m.to_dict() for m in metrics]
         successes.append(True)
     return True
 
 
-def make_writer(output_format, out_path, gams_path):
+def make_writer(
+    output_format,
+    out_path,
+    gams_path,
+    row_batch_size=0,
+    compression=None,
+    excel_mode=ExcelMode.STANDARD,
+    gdx_mode=GdxMode.STANDARD,
+):
     """
     Constructs a writer.
 
@@ -216,30 +677,116 @@ def make_writer(output_format, out_path, gams_path):
         output_format (OutputFormat): output format
         out_path (str): path to output file
         gams_path (str): path to GAMS installation
+        row_batch_size (int): number of rows per batch; 0 disables batching; ignored by CSV, Excel and .gdx writers
+        compression (str, optional): compression codec name
+        excel_mode (ExcelMode): how Excel workbooks are written
+        gdx_mode (GdxMode): how .gdx files are written
 
     Returns:
         Writer: a writer
     """
     if output_format == OutputFormat.CSV:
         path = Path(out_path)
+        if compression is not None:
+            return CompressedCsvWriter(path.parent, path.name, compression)
         return CsvWriter(path.parent, path.name)
     elif output_format == OutputFormat.EXCEL:
+        if excel_mode.is_streaming():
+            return StreamingExcelWriter(out_path, split_sheets=excel_mode == ExcelMode.STREAMING_SPLIT_SHEETS)
         return ExcelWriter(out_path)
     elif output_format == OutputFormat.SQL:
-        return SqlWriter(out_path, overwrite_existing=True)
+        return _make_sql_writer(out_path, True, row_batch_size)
+    elif output_format in (OutputFormat.PARQUET, OutputFormat.ARROW):
+        return _make_columnar_writer(output_format, out_path, row_batch_size, compression)
+    if gdx_mode == GdxMode.BATCHED:
+        return _make_batched_gdx_writer(out_path, gams_path)
     return GdxWriter(out_path, gams_path)
 
 
-def _add_extension(label, file_format):
+def _make_part_writer(output_format, file_name, compression, directory):
+    """Constructs a writer for a part of concurrently written output.
+
+    Args:
+        output_format (OutputFormat): output format
+        file_name (str): output file name
+        compression (str, optional): compression codec name
+        directory (str): directory where the part is written
+
+    Returns:
+        Writer: a writer
+    """
+    return make_writer(output_format, os.path.join(directory, file_name), "", compression=compression)
+
+
+def _make_columnar_writer(output_format, out_path, row_batch_size, compression):
+    """Constructs a Parquet or Arrow IPC writer.
+
+    Args:
+        output_format (OutputFormat): output format
+        out_path (str): path to output file
+        row_batch_size (int): number of rows per record batch; 0 uses the default size
+        compression (str, optional): compression codec name
+
+    Returns:
+        Writer: a writer
+    """
+    try:
+        from .writers.arrow_writer import ArrowWriter, DEFAULT_RECORD_BATCH_SIZE, ParquetWriter
+    except ImportError as error:
+        raise WriterException(f"{output_format.value} export requires pyarrow: {error}")
+    writer_class = ParquetWriter if output_format == OutputFormat.PARQUET else ArrowWriter
+    path = Path(out_path)
+    batch_size = row_batch_size if row_batch_size > 0 else DEFAULT_RECORD_BATCH_SIZE
+    return writer_class(path.parent, path.name, compression, batch_size)
+
+
+def _make_batched_gdx_writer(out_path, gams_path):
+    """Constructs a batched .gdx writer.
+
+    Args:
+        out_path (str): path to output file
+        gams_path (str): path to GAMS installation
+
+    Returns:
+        Writer: a writer
+    """
+    try:
+        from .writers.gdx_writer import BatchedGdxWriter
+    except ImportError as error:
+        raise WriterException(f"Batched .gdx export requires gdxcc: {error}")
+    return BatchedGdxWriter(out_path, gams_path)
+
+
+def _make_sql_writer(database, overwrite_existing, row_batch_size):
+    """Constructs an SQL writer.
+
+    Args:
+        database (str): URL or path to output .sqlite file
+        overwrite_existing (bool): if True, overwrites tables in existing database, otherwise appends to the tables
+        row_batch_size (int): number of rows per insert and commit; 0 commits once per table
+
+    Returns:
+        SqlWriter: a writer
+    """
+    if row_batch_size > 0:
+        return BatchedSqlWriter(database, overwrite_existing, row_batch_size)
+    return BulkSqlWriter(database, overwrite_existing)
+
+
+def _add_extension(label, file_format, compression=None):
     """Adds file format dependent extension to ``label`` if it is missing one.
 
     Args:
         label (str): label to add the extension to
         file_format (OutputFormat): file format
+        compression (str, optional): compression codec
 
     Returns:
         str: file name
     """
+    suffix = file_format.compressed_file_suffix(compression)
+    if suffix is not None:
+        return _add_extension(strip_compression_suffix(label), file_format) + "." + suffix
     name, _, label_extension = label.rpartition(".")
     if name and file_format.is_compatible_file_extension(label_extension):
         return label
@@ -0,0 +1,108 @@
+######################################################################################################################
+# Copyright (C) 2017-2022 Spine project consortium
+# Copyright Spine Items contributors
+# This file is part of Spine Items.
+# Spine Items is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+
+"""Contains tools to estimate the output of an export without writing anything."""
+from dataclasses import asdict, dataclass
+import time
+from spinedb_api.spine_io.exporters.writer import Writer, write
+from .metrics import cell_size
+
+
+@dataclass
+class TableEstimate:
+    """Estimated size of a single output table."""
+
+    mapping: str
+    """Name of the mapping that produces the table."""
+    table: str
+    """Table's name; None if the table is unnamed."""
+    rows: int = 0
+    """Number of rows including headers."""
+    bytes: int = 0
+    """Approximate size of the table in output in bytes."""
+
+    def to_dict(self):
+        """Serializes estimate to dictionary.
+
+        Returns:
+            dict: serialized estimate
+        """
+        return asdict(self)
+
+
+def dry_run(database_map, specification):
+    """Runs the enabled mappings of a specification without formatting or writing the output.
+
+    Args:
+        database_map (DatabaseMapping): database map
+        specification (Specification): export specification
+
+    Returns:
+        tuple: list of :class:`TableEstimate` and duration of the dry run in seconds
+    """
+    writer = _EstimatingWriter()
+    start = time.perf_counter()
+    for name, mapping_specification in specification.enabled_specifications().items():
+        writer.mapping_name = name
+        write(
+            database_map,
+            writer,
+            mapping_specification.root,
+            empty_data_header=mapping_specification.always_export_header,
+            group_fns=mapping_specification.group_fn,
+        )
+    return writer.estimates, time.perf_counter() - start
+
+
+def estimates_summary(title, estimates, duration):
+    """Formats table estimates into an HTML table.
+
+    Args:
+        title (str): table's title
+        estimates (list of TableEstimate): table estimates
+        duration (float): duration of the dry run in seconds
+
+    Returns:
+        str: summary
+    """
+    header = "".join(f"<th>{name}</th>" for name in ("mapping", "table", "rows", "bytes"))
+    rows = [
+        f"<tr><td>{e.mapping}</td><td>{e.table if e.table is not None else ''}</td>"
+        f"<td>{e.rows}</td><td>{e.bytes}</td></tr>"
+        for e in estimates
+    ]
+    total_rows = sum(e.rows for e in estimates)
+    total_bytes = sum(e.bytes for e in estimates)
+    rows.append(
+        f"<tr><td><b>total</b></td><td>{len(estimates)} tables</td><td>{total_rows}</td><td>{total_bytes}</td></tr>"
+    )
+    return f"{title}<table><tr>{header}</tr>{''.join(rows)}</table>Dry run took {duration:.3f} s."
+
+
+class _EstimatingWriter(Writer):
+    """Writer that only counts the rows and bytes of each table."""
+
+    def __init__(self):
+        self.mapping_name = None
+        self.estimates = []
+        self._current = None
+
+    def start_table(self, table_name, title_key):
+        self._current = TableEstimate(self.mapping_name, table_name)
+        self.estimates.append(self._current)
+        return True
+
+    def write_row(self, row):
+        self._current.rows += 1
+        # Every cell is followed by a separator or a line break.
+        self._current.bytes += sum(cell_size(cell) for cell in row) + len(row)
+        return True
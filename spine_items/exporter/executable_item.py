@@ -11,6 +11,7 @@
 ######################################################################################################################
 
 """Contains Exporter's executable item as well as support utilities."""
+from datetime import datetime
 import json
 import os
 from json import dump
@@ -20,20 +21,40 @@ from spine_engine.project_item.project_item_resource import file_resource_in_pac
 from spine_engine.utils.returning_process import ReturningProcess
 from spine_engine.utils.serialization import deserialize_path
 from spine_engine.spine_engine import ItemExecutionFinishState
-from spinedb_api import clear_filter_configs
-from ..utils import generate_filter_subdirectory_name
-from .utils import Database, output_database_resources
+from spinedb_api import clear_filter_configs, DatabaseMapping, SpineDBAPIError
 from spinedb_api.spine_io import gdx_utils
-from .utils import EXPORTER_EXECUTION_MANIFEST_FILE_PREFIX
+from ..utils import generate_filter_subdirectory_name
+from .utils import (
+    Database,
+    EXPORTER_FINGERPRINT_FILE_PREFIX,
+    EXPORTER_METRICS_FILE_PREFIX,
+    export_fingerprint,
+    MAX_METRICS_HISTORY,
+    output_database_resources,
+)
 from .do_work import do_work
+from .dry_run import dry_run, estimates_summary
+from .export_manifest import read_manifest_index, update_manifest_index
 from .output_channel import OutputChannel
+from .query_cache import DEFAULT_QUERY_CACHE_SIZE, QueryCachingDatabaseMapping
 from .item_info import ItemInfo
-from .specification import OutputFormat
+from .specification import compile_specification, OutputFormat
 
 
 class ExecutableItem(ExecutableItemBase):
     def __init__(
-        self, name, specification, output_channels, output_time_stamps, cancel_on_error, gams_path, project_dir, logger
+        self,
+        name,
+        specification,
+        output_channels,
+        output_time_stamps,
+        cancel_on_error,
+        gams_path,
+        project_dir,
+        logger,
+        export_process_count=1,
+        query_cache_size=DEFAULT_QUERY_CACHE_SIZE,
+        table_writer_count=1,
     ):
         """
         Args:
@@ -45,6 +66,9 @@ class ExecutableItem(ExecutableItemBase):
             gams_path (str): GAMS path from Toolbox settings
             project_dir (str): absolute path to project directory
             logger (LoggerInterface): a logger
+            export_process_count (int): maximum number of processes exporting databases in parallel
+            query_cache_size (int): maximum size of cached query results in megabytes; 0 disables caching
+            table_writer_count (int): maximum number of threads writing CSV tables concurrently
         """
         super().__init__(name, project_dir, logger)
         self._output_time_stamps = output_time_stamps
@@ -55,6 +79,9 @@ class ExecutableItem(ExecutableItemBase):
         self._process = None
         self._specification = specification
         self._output_channels = output_channels
+        self._export_process_count = export_process_count
+        self._query_cache_size = query_cache_size
+        self._table_writer_count = table_writer_count
 
     @staticmethod
     def item_type():
@@ -152,11 +179,18 @@ class ExecutableItem(ExecutableItemBase):
             if gams_system_directory is None:
                 self._logger.msg_error.emit(f"<b>{self.name}</b>: Cannot proceed. No GAMS installation found.")
                 return ItemExecutionFinishState.FAILURE
+        compiled_specification = compile_specification(self._specification)
+        specification_dict = compiled_specification.specification_dict
+        fingerprints, reused_files = self._skip_unchanged_databases(databases, out_urls, specification_dict)
+        if not databases:
+            self._result_files = reused_files
+            self._write_manifests(fingerprints)
+            return ItemExecutionFinishState.SUCCESS
         out_dir = Path(self._data_dir, "output")
         self._process = ReturningProcess(
             target=do_work,
             args=(
-                self._specification.to_dict(),
+                compiled_specification,
                 self._output_time_stamps,
                 self._cancel_on_error,
                 gams_system_directory,
@@ -166,35 +200,173 @@ class ExecutableItem(ExecutableItemBase):
                 self._filter_id,
                 generate_filter_subdirectory_name(forward_resources, self.hash_filter_id()),
                 self._logger,
+                self._export_process_count,
+                self._query_cache_size,
+                self._table_writer_count,
             ),
         )
         result = self._process.run_until_complete()
         if len(result) > 1:
-            self._result_files = result[1]
-            file_name = (
-                EXPORTER_EXECUTION_MANIFEST_FILE_PREFIX + (f"-{self.hash_filter_id()}" if self.filter_id else "")
-            ) + ".json"
-            with open(Path(self._data_dir, file_name), "w") as manifest:
-                dump(
-                    {
-                        label: list(str(Path(file).relative_to(Path(self._data_dir))) for file in files)
-                        for label, files in self._result_files.items()
-                    },
-                    manifest,
-                )
+            self._result_files = {
+                label: {str(Path(file).relative_to(Path(self._data_dir))) for file in files}
+                for label, files in result[1].items()
+            }
+            self._result_files.update(reused_files)
+            self._write_manifests(fingerprints)
+            if len(result) > 2 and result[2]:
+                self._write_metrics(result[2])
         self._process = None
         return ItemExecutionFinishState.SUCCESS if result[0] else ItemExecutionFinishState.FAILURE
 
+    def dry_run(self, forward_resources):
+        """Estimates the output of an export without writing anything.
+
+        Mappings are run against the databases but rows are only counted, not formatted or written.
+
+        Args:
+            forward_resources (list of ProjectItemResource): resources from predecessor items
+
+        Returns:
+            dict: mapping from output label to list of :class:`TableEstimate`
+        """
+        if self._specification is None:
+            self._logger.msg_warning.emit(f"<b>{self.name}</b>: No export settings configured.")
+            return {}
+        database_resources = tuple(r for r in forward_resources if r.type_ == "database")
+        estimates = {}
+        for url, output_label in self._database_out_labels(database_resources).items():
+            try:
+                database_map = DatabaseMapping(url)
+            except SpineDBAPIError as error:
+                self._logger.msg_error.emit(f"<b>{self.name}</b>: Failed to open database: {error}")
+                continue
+            try:
+                table_estimates, duration = dry_run(
+                    QueryCachingDatabaseMapping(database_map, self._query_cache_size * 1024 * 1024), self._specification
+                )
+            finally:
+                database_map.close()
+            estimates[output_label] = table_estimates
+            self._logger.msg.emit(
+                estimates_summary(f"Dry run estimates for <b>{output_label}</b>:", table_estimates, duration)
+            )
+        return estimates
+
+    def _skip_unchanged_databases(self, databases, out_urls, specification_dict):
+        """Removes databases that have not changed since their last export from ``databases``.
+
+        Args:
+            databases (dict): mapping from database URL to output label; modified in-place
+            out_urls (dict): mapping from database URL to output URL
+            specification_dict (dict): serialized export specification
+
+        Returns:
+            tuple: mapping from output label to fingerprint and mapping from output label to reused output files
+        """
+        fingerprints = {}
+        reused_files = {}
+        if self._output_time_stamps:
+            return fingerprints, reused_files
+        previous_fingerprints = self._read_data_dir_json(EXPORTER_FINGERPRINT_FILE_PREFIX)
+        previous_files = self._read_manifest()
+        for url, label in list(databases.items()):
+            if self._specification.output_format == OutputFormat.SQL and out_urls.get(url) is not None:
+                continue
+            fingerprint = export_fingerprint(url, specification_dict)
+            if fingerprint is None:
+                continue
+            fingerprints[label] = fingerprint
+            files = previous_files.get(label)
+            if (
+                fingerprint != previous_fingerprints.get(label)
+                or not files
+                or not all(Path(self._data_dir, file).exists() for file in files)
+            ):
+                continue
+            del databases[url]
+            reused_files[label] = set(files)
+            self._logger.msg.emit(f"<b>{self.name}</b>: {label} is up to date. Skipping.")
+        return fingerprints, reused_files
+
+    def _manifest_key(self):
+        """Returns the key that identifies current execution in the manifest index.
+
+        Returns:
+            str: manifest key
+        """
+        return self.hash_filter_id() if self._filter_id else ""
+
+    def _read_manifest(self):
+        """Reads output files of current execution's previous run from the manifest index.
+
+        Returns:
+            dict: mapping from output label to list of file paths relative to data directory
+        """
+        manifests = read_manifest_index(self._data_dir)
+        if manifests is None:
+            return {}
+        return manifests.get(self._manifest_key(), {})
+
+    def _data_dir_file_name(self, prefix):
+        """Builds a file name for execution specific files in item's data directory.
+
+        Args:
+            prefix (str): file name prefix
+
+        Returns:
+            str: file name
+        """
+        return prefix + (f"-{self.hash_filter_id()}" if self._filter_id else "") + ".json"
+
+    def _read_data_dir_json(self, prefix):
+        """Reads an execution specific JSON file from item's data directory.
+
+        Args:
+            prefix (str): file name prefix
+
+        Returns:
+            dict: file contents or empty dict if file does not exist
+        """
+        file_path = Path(self._data_dir, self._data_dir_file_name(prefix))
+        if not file_path.exists():
+            return {}
+        with open(file_path) as json_file:
+            return json.load(json_file)
+
+    def _write_manifests(self, fingerprints):
+        """Writes execution manifest and fingerprints of exported databases.
+
+        Args:
+            fingerprints (dict): mapping from output label to database fingerprint
+        """
+        update_manifest_index(
+            self._data_dir,
+            self._manifest_key(),
+            {label: sorted(files) for label, files in self._result_files.items()},
+        )
+        with open(
+            Path(self._data_dir, self._data_dir_file_name(EXPORTER_FINGERPRINT_FILE_PREFIX)), "w"
+        ) as fingerprint_file:
+            dump(
+                {label: fingerprints[label] for label in self._result_files if label in fingerprints}, fingerprint_file
+            )
+
+    def _write_metrics(self, metrics):
+        """Appends per-mapping metrics of current execution to the metrics history file.
+
+        Args:
+            metrics (dict): mapping from output label to list of serialized mapping metrics
+        """
+        history = self._read_data_dir_json(EXPORTER_METRICS_FILE_PREFIX).get("executions", [])
+        history.append({"time": datetime.now().isoformat(timespec="seconds"), "outputs": metrics})
+        with open(Path(self._data_dir, self._data_dir_file_name(EXPORTER_METRICS_FILE_PREFIX)), "w") as metrics_file:
+            dump({"executions": history[-MAX_METRICS_HISTORY:]}, metrics_file)
+
     def exclude_execution(self, forward_resources, backward_resources, lock):
         """See base class."""
-        manifest_file_name = (
-            EXPORTER_EXECUTION_MANIFEST_FILE_PREFIX + (f"-{self.hash_filter_id()}" if self._filter_id else "")
-        ) + ".json"
-        manifest_file_path = Path(self._data_dir, manifest_file_name)
-        if not manifest_file_path.exists():
+        manifest = self._read_manifest()
+        if not manifest:
             return
-        with open(Path(self._data_dir, manifest_file_name)) as manifest_file:
-            manifest = json.load(manifest_file)
         self._result_files = {label: set(files) for label, files in manifest.items()}
 
     def _output_resources_forward(self):
@@ -236,7 +408,20 @@ class ExecutableItem(ExecutableItemBase):
                     channel.out_url.update(credentials)
         output_time_stamps = item_dict.get("output_time_stamps", False)
         cancel_on_error = item_dict.get("cancel_on_error", True)
+        export_process_count = item_dict.get("export_process_count", 1)
+        query_cache_size = item_dict.get("query_cache_size", DEFAULT_QUERY_CACHE_SIZE)
+        table_writer_count = item_dict.get("table_writer_count", 1)
         gams_path = app_settings.value("appSettings/gamsPath", defaultValue=None)
         return ExecutableItem(
-            name, specification, output_channels, output_time_stamps, cancel_on_error, gams_path, project_dir, logger
+            name,
+            specification,
+            output_channels,
+            output_time_stamps,
+            cancel_on_error,
+            gams_path,
+            project_dir,
+            logger,
+            export_process_count,
+            query_cache_size,
+            table_writer_count,
         )
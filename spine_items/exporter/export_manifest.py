@@ -13,10 +13,34 @@
 """Contains utilities to manage export manifest files."""
 import json
 from itertools import dropwhile
+import os
 from pathlib import Path
+from threading import Lock
 from spine_engine.project_item.project_item_resource import file_resource_in_pack, transient_file_resource
 from .specification import OutputFormat
-from .utils import EXPORTER_EXECUTION_MANIFEST_FILE_PREFIX
+from .utils import EXPORTER_EXECUTION_MANIFEST_FILE_PREFIX, EXPORTER_MANIFEST_INDEX_FILE_NAME
+
+MANIFEST_INDEX_VERSION = 1
+"""Version of manifest index records."""
+_MIN_RECORDS_BEFORE_COMPACTION = 100
+"""Number of records the index may hold before superseded records are pruned."""
+
+_index_lock = Lock()
+_index_cache = {}
+
+
+class _CachedIndex:
+    """In-memory copy of a manifest index file."""
+
+    def __init__(self):
+        self.signature = None
+        """Inode, modification time and size of index file when it was last read."""
+        self.offset = 0
+        """Number of bytes parsed so far."""
+        self.record_count = 0
+        """Number of records parsed so far including superseded ones."""
+        self.entries = {}
+        """Mapping from filter key to mapping from output label to list of file paths."""
 
 
 def exported_files_as_resources(item_name, exported_files, data_dir, output_channels, output_format):
@@ -37,15 +61,16 @@ def exported_files_as_resources(item_name, exported_files, data_dir, output_chan
         output_channels = tuple(c for c in output_channels if c.out_url is None)
     if manifests is not None:
         out_labels = {c.out_label for c in output_channels}
-        manifests = {
-            label: files for label, files in _collect_execution_manifests(data_dir).items() if label in out_labels
+        exported_files = {
+            label: [str(Path(data_dir, f)) for f in files] for label, files in manifests.items() if label in out_labels
         }
-        exported_files = {label: [str(Path(data_dir, f)) for f in files] for label, files in manifests.items()}
+    # Files listed in the index are trusted; only a stale in-memory cache is checked against the file system.
+    check_files = manifests is None
     resources = list()
     if exported_files is not None:
         for channel in output_channels:
             if channel.out_label:
-                files = {f for f in exported_files.get(channel.out_label, []) if Path(f).exists()}
+                files = {f for f in exported_files.get(channel.out_label, []) if not check_files or Path(f).exists()}
                 if files:
                     resources += [file_resource_in_pack(item_name, channel.out_label, f) for f in files]
                 else:
@@ -57,37 +82,246 @@ def exported_files_as_resources(item_name, exported_files, data_dir, output_chan
     return resources, exported_files
 
 
+def read_manifest_index(data_dir):
+    """Reads the manifest index of given data directory.
+
+    The index is cached in memory; only records appended since the previous call are parsed.
+    Legacy per-execution manifest files are migrated into the index when it does not exist yet.
+
+    Args:
+        data_dir (str): item's data directory
+
+    Returns:
+        dict: mapping from filter key to mapping from output label to list of file paths relative to data_dir,
+            or None if there are no manifests
+    """
+    with _index_lock:
+        entries = _read_index(data_dir)
+    if entries is None:
+        return None
+    return {filter_key: dict(files) for filter_key, files in entries.items()}
+
+
+def update_manifest_index(data_dir, filter_key, files):
+    """Records the output files of an execution in the manifest index.
+
+    Args:
+        data_dir (str): item's data directory
+        filter_key (str): key that identifies the execution's filter; empty string if unfiltered
+        files (dict): mapping from output label to list of file paths relative to data_dir
+    """
+    record = {"version": MANIFEST_INDEX_VERSION, "filter": filter_key, "files": files}
+    with _index_lock:
+        entries = _read_index(data_dir)
+        if entries is None:
+            _rewrite_index(data_dir, {filter_key: files})
+            return
+        cached = _index_cache[_index_path(data_dir)]
+        entries[filter_key] = files
+        cached.record_count += 1
+        if cached.record_count > max(_MIN_RECORDS_BEFORE_COMPACTION, 2 * len(entries)):
+            _rewrite_index(data_dir, entries)
+        else:
+            with open(_index_path(data_dir), "a") as index_file:
+                index_file.write(json.dumps(record) + "\n")
+            _refresh_signature(data_dir)
+
+
+def remove_manifest_index(data_dir):
+    """Deletes the manifest index of given data directory.
+
+    Args:
+        data_dir (str): item's data directory
+    """
+    path = _index_path(data_dir)
+    with _index_lock:
+        _index_cache.pop(path, None)
+        if path.exists():
+            path.unlink()
+
+
 def _collect_execution_manifests(data_dir):
-    """Collects output file names from export manifest files written by exporter's executable item.
+    """Collects output file names from the manifest index written by exporter's executable item.
 
     Args:
         data_dir (str): item's data directory
 
     Returns:
-        dict: mapping from output label to list of file paths, or None if no manifest files were found
+        dict: mapping from output label to list of file paths, or None if no manifests were found
     """
-    manifests = None
-    for path in Path(data_dir).iterdir():
-        if path.name.startswith(EXPORTER_EXECUTION_MANIFEST_FILE_PREFIX) and path.suffix == ".json":
-            with open(path) as manifest_file:
-                manifest = json.load(manifest_file)
-            for out_file_name, paths in manifest.items():
-                relative_paths = list()
-                for file_path in paths:
-                    p = Path(file_path)
-                    if p.is_absolute():
-                        # Legacy manifests had absolute paths
-                        try:
-                            relative_paths.append(p.relative_to(data_dir))
-                        except ValueError:
-                            # Project may have been moved to another directory (or system)
-                            # so data_dir is differs from manifest file content.
-                            # Try resolving the relative path manually.
-                            parts = tuple(dropwhile(lambda part: part != "output", p.parts))
-                            relative_paths.append(str(Path(*parts)))
-                    else:
-                        relative_paths.append(file_path)
-                if manifests is None:
-                    manifests = dict()
-                manifests.setdefault(out_file_name, list()).extend(paths)
+    entries = read_manifest_index(data_dir)
+    if entries is None:
+        return None
+    manifests = dict()
+    for files in entries.values():
+        for out_label, paths in files.items():
+            manifests.setdefault(out_label, list()).extend(paths)
     return manifests
+
+
+def _index_path(data_dir):
+    """Returns path to manifest index file.
+
+    Args:
+        data_dir (str): item's data directory
+
+    Returns:
+        Path: index file path
+    """
+    return Path(data_dir, EXPORTER_MANIFEST_INDEX_FILE_NAME)
+
+
+def _file_signature(path):
+    """Identifies the state of a file on disk.
+
+    Args:
+        path (Path): file path
+
+    Returns:
+        tuple: file's inode, modification time and size, or None if file does not exist
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+def _read_index(data_dir):
+    """Brings the cached index up to date with the index file.
+
+    Must be called with the index lock held.
+
+    Args:
+        data_dir (str): item's data directory
+
+    Returns:
+        dict: cached index entries, or None if there are no manifests
+    """
+    path = _index_path(data_dir)
+    signature = _file_signature(path)
+    if signature is None:
+        _index_cache.pop(path, None)
+        legacy_entries = _migrate_legacy_manifests(data_dir)
+        if legacy_entries is None:
+            return None
+        signature = _file_signature(path)
+    cached = _index_cache.get(path)
+    if cached is not None and cached.signature == signature:
+        return cached.entries
+    if cached is None or cached.signature[0] != signature[0] or signature[2] < cached.offset:
+        cached = _CachedIndex()
+        _index_cache[path] = cached
+    with open(path, "rb") as index_file:
+        index_file.seek(cached.offset)
+        tail = index_file.read()
+    complete_length = tail.rfind(b"\n") + 1
+    for line in tail[:complete_length].splitlines():
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        cached.record_count += 1
+        if record.get("version") != MANIFEST_INDEX_VERSION:
+            continue
+        cached.entries[record["filter"]] = record["files"]
+    cached.offset += complete_length
+    cached.signature = signature
+    return cached.entries
+
+
+def _refresh_signature(data_dir):
+    """Marks cached index as up to date after it has been written by this process.
+
+    Must be called with the index lock held.
+
+    Args:
+        data_dir (str): item's data directory
+    """
+    path = _index_path(data_dir)
+    cached = _index_cache[path]
+    cached.signature = _file_signature(path)
+    cached.offset = cached.signature[2]
+
+
+def _rewrite_index(data_dir, entries):
+    """Replaces index file by one that contains only given entries.
+
+    Must be called with the index lock held.
+
+    Args:
+        data_dir (str): item's data directory
+        entries (dict): mapping from filter key to mapping from output label to list of file paths
+    """
+    path = _index_path(data_dir)
+    temp_path = path.with_name(path.name + ".tmp")
+    with open(temp_path, "w") as index_file:
+        for filter_key, files in entries.items():
+            record = {"version": MANIFEST_INDEX_VERSION, "filter": filter_key, "files": files}
+            index_file.write(json.dumps(record) + "\n")
+    os.replace(temp_path, path)
+    cached = _CachedIndex()
+    cached.entries = entries
+    cached.record_count = len(entries)
+    _index_cache[path] = cached
+    _refresh_signature(data_dir)
+
+
+def _migrate_legacy_manifests(data_dir):
+    """Moves the contents of legacy per-execution manifest files into a new index.
+
+    Must be called with the index lock held.
+
+    Args:
+        data_dir (str): item's data directory
+
+    Returns:
+        dict: migrated entries, or None if there were no legacy manifests
+    """
+    legacy_files = [
+        path
+        for path in Path(data_dir).iterdir()
+        if path.name.startswith(EXPORTER_EXECUTION_MANIFEST_FILE_PREFIX) and path.suffix == ".json"
+    ]
+    if not legacy_files:
+        return None
+    entries = {}
+    for path in legacy_files:
+        filter_key = path.stem[len(EXPORTER_EXECUTION_MANIFEST_FILE_PREFIX) :].lstrip("-")
+        entries[filter_key] = _read_legacy_manifest(path, data_dir)
+    _rewrite_index(data_dir, entries)
+    for path in legacy_files:
+        path.unlink()
+    return entries
+
+
+def _read_legacy_manifest(path, data_dir):
+    """Reads output file names from a legacy manifest file.
+
+    Args:
+        path (Path): path to manifest file
+        data_dir (str): item's data directory
+
+    Returns:
+        dict: mapping from output label to list of file paths relative to data_dir
+    """
+    with open(path) as manifest_file:
+        manifest = json.load(manifest_file)
+    files = dict()
+    for out_file_name, paths in manifest.items():
+        relative_paths = list()
+        for file_path in paths:
+            p = Path(file_path)
+            if p.is_absolute():
+                # Legacy manifests had absolute paths
+                try:
+                    relative_paths.append(str(p.relative_to(data_dir)))
+                except ValueError:
+                    # Project may have been moved to another directory (or system)
+                    # so data_dir is differs from manifest file content.
+                    # Try resolving the relative path manually.
+                    parts = tuple(dropwhile(lambda part: part != "output", p.parts))
+                    relative_paths.append(str(Path(*parts)))
+            else:
+                relative_paths.append(file_path)
+        files[out_file_name] = relative_paths
+    return files
@@ -21,16 +21,30 @@ from spinetoolbox.helpers import SealCommand
 from spinetoolbox.project_item.project_item import ProjectItem
 from spine_engine.utils.serialization import deserialize_path
 from spinedb_api import clear_filter_configs
-from .export_manifest import exported_files_as_resources
+from .export_manifest import exported_files_as_resources, remove_manifest_index
 from .specification import OutputFormat
 from ..commands import UpdateCancelOnErrorCommand
+from ..utils import strip_compression_suffix
 from .mvcmodels.full_url_list_model import FullUrlListModel
 from .widgets.export_list_item import ExportListItem
 from .item_info import ItemInfo
 from .executable_item import ExecutableItem
-from .commands import CommandId, UpdateOutLabel, UpdateOutputTimeStampsFlag, UpdateOutUrl
+from .commands import (
+    CommandId,
+    UpdateExportProcessCount,
+    UpdateOutLabel,
+    UpdateOutputTimeStampsFlag,
+    UpdateOutUrl,
+    UpdateQueryCacheSize,
+    UpdateTableWriterCount,
+)
 from .output_channel import OutputChannel
-from .utils import EXPORTER_EXECUTION_MANIFEST_FILE_PREFIX, output_database_resources
+from .query_cache import DEFAULT_QUERY_CACHE_SIZE
+from .utils import (
+    EXPORTER_EXECUTION_MANIFEST_FILE_PREFIX,
+    EXPORTER_FINGERPRINT_FILE_PREFIX,
+    output_database_resources,
+)
 
 
 @dataclass
@@ -58,6 +72,9 @@ class Exporter(ProjectItem):
         output_channels=None,
         output_time_stamps=False,
         cancel_on_error=True,
+        export_process_count=1,
+        query_cache_size=DEFAULT_QUERY_CACHE_SIZE,
+        table_writer_count=1,
     ):
         """
         Args:
@@ -71,11 +88,17 @@ class Exporter(ProjectItem):
             output_channels (list of OutputChannel, optional): input and output labels
             output_time_stamps (bool): True to include time stamps to output directory names
             cancel_on_error (bool): True to fail execution in case of non-fatal errors
+            export_process_count (int): maximum number of databases to export in parallel
+            query_cache_size (int): maximum size of cached query results in megabytes
+            table_writer_count (int): maximum number of CSV tables to write in parallel
         """
         super().__init__(name, description, x, y, project)
         self._toolbox = toolbox
         self._append_output_time_stamps = output_time_stamps
         self._cancel_on_error = cancel_on_error
+        self._export_process_count = export_process_count
+        self._query_cache_size = query_cache_size
+        self._table_writer_count = table_writer_count
         self._output_filenames = dict()
         self._export_list_items = dict()
         self._full_url_model = FullUrlListModel()
@@ -167,6 +190,9 @@ class Exporter(ProjectItem):
         self._properties_ui.cancel_on_error_check_box.setCheckState(
             Qt.CheckState.Checked if self._cancel_on_error else Qt.CheckState.Unchecked
         )
+        self._properties_ui.export_process_count_spin_box.setValue(self._export_process_count)
+        self._properties_ui.query_cache_size_spin_box.setValue(self._query_cache_size)
+        self._properties_ui.table_writer_count_spin_box.setValue(self._table_writer_count)
 
     def _set_properties_message(self):
         if self._specification is None:
@@ -268,7 +294,7 @@ class Exporter(ProjectItem):
             return
         output_formats = set()
         for channel in self._output_channels:
-            name, separator, extension = channel.out_label.rpartition(".")
+            name, separator, extension = strip_compression_suffix(channel.out_label).rpartition(".")
             if not separator:
                 continue
             output_format = OutputFormat.output_format_from_extension(extension)
@@ -383,6 +409,9 @@ class Exporter(ProjectItem):
         serialized = super().item_dict()
         serialized["output_time_stamps"] = self._append_output_time_stamps
         serialized["cancel_on_error"] = self._cancel_on_error
+        serialized["export_process_count"] = self._export_process_count
+        serialized["query_cache_size"] = self._query_cache_size
+        serialized["table_writer_count"] = self._table_writer_count
         serialized["output_labels"] = sorted(
             [c.to_dict(self._project.project_dir) for c in self._output_channels], key=itemgetter("in_label")
         )
@@ -429,6 +458,9 @@ class Exporter(ProjectItem):
                     channel.out_url.update(credentials)
         output_time_stamps = item_dict.get("output_time_stamps", False)
         cancel_on_error = item_dict.get("cancel_on_error", True)
+        export_process_count = item_dict.get("export_process_count", 1)
+        query_cache_size = item_dict.get("query_cache_size", DEFAULT_QUERY_CACHE_SIZE)
+        table_writer_count = item_dict.get("table_writer_count", 1)
         specification_name = item_dict.get("specification", "")
         specification = project.get_specification(specification_name)
         if specification_name and not specification:
@@ -444,6 +476,9 @@ class Exporter(ProjectItem):
             output_channels,
             output_time_stamps,
             cancel_on_error,
+            export_process_count,
+            query_cache_size,
+            table_writer_count,
         )
 
     def rename(self, new_name, rename_data_dir_message):
@@ -451,8 +486,12 @@ class Exporter(ProjectItem):
         if not super().rename(new_name, rename_data_dir_message):
             return False
         for path in Path(self.data_dir).iterdir():
-            if path.name.startswith(EXPORTER_EXECUTION_MANIFEST_FILE_PREFIX) and path.suffix == ".json":
+            if (
+                path.name.startswith((EXPORTER_EXECUTION_MANIFEST_FILE_PREFIX, EXPORTER_FINGERPRINT_FILE_PREFIX))
+                and path.suffix == ".json"
+            ):
                 path.unlink()
+        remove_manifest_index(self.data_dir)
         if self._exported_files is not None:
             data_dir_parts = Path(self.data_dir).parts
             for label, file_list in self._exported_files.items():
@@ -474,6 +513,9 @@ class Exporter(ProjectItem):
         s = super().make_signal_handler_dict()
         s[self._properties_ui.output_time_stamps_check_box.stateChanged] = self._change_output_time_stamps_flag
         s[self._properties_ui.cancel_on_error_check_box.stateChanged] = self._cancel_on_error_option_changed
+        s[self._properties_ui.export_process_count_spin_box.valueChanged] = self._change_export_process_count
+        s[self._properties_ui.query_cache_size_spin_box.valueChanged] = self._change_query_cache_size
+        s[self._properties_ui.table_writer_count_spin_box.valueChanged] = self._change_table_writer_count
         s[self._properties_ui.specification_button.clicked] = self.show_specification_window
         s[self._properties_ui.specification_combo_box.textActivated] = self._change_specification
         return s
@@ -502,6 +544,77 @@ class Exporter(ProjectItem):
         if self._active:
             self._properties_ui.output_time_stamps_check_box.setChecked(flag)
 
+    @Slot(int)
+    def _change_export_process_count(self, count):
+        """
+        Pushes a command that changes the number of parallel export processes.
+
+        Args:
+            count (int): new process count
+        """
+        if count == self._export_process_count:
+            return
+        self._toolbox.undo_stack.push(
+            UpdateExportProcessCount(self.name, count, self._export_process_count, self._project)
+        )
+
+    def set_export_process_count(self, count):
+        """
+        Sets the number of parallel export processes.
+
+        Args:
+            count (int): process count
+        """
+        self._export_process_count = count
+        if self._active:
+            self._properties_ui.export_process_count_spin_box.setValue(count)
+
+    @Slot(int)
+    def _change_query_cache_size(self, size):
+        """
+        Pushes a command that changes the size of query cache.
+
+        Args:
+            size (int): new cache size in megabytes
+        """
+        if size == self._query_cache_size:
+            return
+        self._toolbox.undo_stack.push(UpdateQueryCacheSize(self.name, size, self._query_cache_size, self._project))
+
+    def set_query_cache_size(self, size):
+        """
+        Sets the size of query cache.
+
+        Args:
+            size (int): cache size in megabytes
+        """
+        self._query_cache_size = size
+        if self._active:
+            self._properties_ui.query_cache_size_spin_box.setValue(size)
+
+    @Slot(int)
+    def _change_table_writer_count(self, count):
+        """
+        Pushes a command that changes the number of CSV tables written in parallel.
+
+        Args:
+            count (int): new writer count
+        """
+        if count == self._table_writer_count:
+            return
+        self._toolbox.undo_stack.push(UpdateTableWriterCount(self.name, count, self._table_writer_count, self._project))
+
+    def set_table_writer_count(self, count):
+        """
+        Sets the number of CSV tables written in parallel.
+
+        Args:
+            count (int): writer count
+        """
+        self._table_writer_count = count
+        if self._active:
+            self._properties_ui.table_writer_count_spin_box.setValue(count)
+
     def _check_missing_specification(self):
         """Checks specification's status."""
         self._notifications.missing_specification = not self._specification_name
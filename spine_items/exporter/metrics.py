@@ -0,0 +1,165 @@
+######################################################################################################################
+# Copyright (C) 2017-2022 Spine project consortium
+# Copyright Spine Items contributors
+# This file is part of Spine Items.
+# Spine Items is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+
+"""Contains tools to measure how long each export mapping takes to write."""
+from dataclasses import asdict, dataclass
+import time
+from spinedb_api.spine_io.exporters.writer import Writer, write
+
+
+@dataclass
+class MappingMetrics:
+    """Performance figures of a single export mapping."""
+
+    mapping: str
+    """Mapping's name."""
+    wall_time: float = 0.0
+    """Total time spent writing the mapping in seconds."""
+    query_time: float = 0.0
+    """Time spent executing database queries in seconds."""
+    rows: int = 0
+    """Number of rows emitted including headers."""
+    bytes: int = 0
+    """Approximate size of the emitted cells in bytes."""
+
+    def to_dict(self):
+        """Serializes metrics to dictionary.
+
+        Returns:
+            dict: serialized metrics
+        """
+        return asdict(self)
+
+
+def write_with_metrics(database_map, writer, specifications):
+    """Writes mappings measuring each of them.
+
+    All mappings are written in a single :func:`write` call so they share its row cache.
+
+    Args:
+        database_map (QueryCachingDatabaseMapping): database map
+        writer (Writer): output writer
+        specifications (dict): mapping from mapping name to :class:`MappingSpecification`
+
+    Returns:
+        list of MappingMetrics: metrics for each mapping
+    """
+    measuring_writer = _MeasuringWriter(writer, database_map)
+    write(
+        database_map,
+        measuring_writer,
+        *(specification.root for specification in specifications.values()),
+        empty_data_header=measuring_writer.header_flags(specifications),
+        group_fns=[specification.group_fn for specification in specifications.values()],
+    )
+    return measuring_writer.metrics
+
+
+def metrics_summary(title, metrics):
+    """Formats metrics into an HTML table for the execution log.
+
+    Args:
+        title (str): table's title
+        metrics (list of MappingMetrics): mapping metrics
+
+    Returns:
+        str: summary
+    """
+    header = "".join(f"<th>{name}</th>" for name in ("mapping", "time (s)", "query time (s)", "rows", "bytes"))
+    rows = [
+        f"<tr><td>{m.mapping}</td><td>{m.wall_time:.3f}</td><td>{m.query_time:.3f}</td>"
+        f"<td>{m.rows}</td><td>{m.bytes}</td></tr>"
+        for m in metrics
+    ]
+    return f"{title}<table><tr>{header}</tr>{''.join(rows)}</table>"
+
+
+class _MeasuringWriter(Writer):
+    """Forwards tables and rows to another writer measuring each mapping.
+
+    :func:`write` takes the next mapping and its header flag only when it is done with the previous mapping.
+    The flags are generated lazily by :meth:`header_flags` which lets the writer know when a new mapping starts.
+    """
+
+    def __init__(self, writer, database_map):
+        """
+        Args:
+            writer (Writer): wrapped writer
+            database_map (QueryCachingDatabaseMapping): database map
+        """
+        self._writer = writer
+        self._database_map = database_map
+        self.metrics = []
+        self._current = None
+        self._start_time = None
+        self._query_time_before = None
+
+    def header_flags(self, specifications):
+        """Yields mappings' empty data header flags starting measurement of each mapping.
+
+        Args:
+            specifications (dict): mapping from mapping name to :class:`MappingSpecification`
+
+        Yields:
+            bool: True if mapping's header should be written even if there is no data
+        """
+        for name, specification in specifications.items():
+            self._finish_mapping()
+            self._current = MappingMetrics(name)
+            self._query_time_before = self._database_map.query_time
+            self._start_time = time.perf_counter()
+            yield specification.always_export_header
+
+    def _finish_mapping(self):
+        """Records metrics of current mapping."""
+        if self._current is None:
+            return
+        self._current.wall_time = time.perf_counter() - self._start_time
+        self._current.query_time = self._database_map.query_time - self._query_time_before
+        self.metrics.append(self._current)
+        self._current = None
+
+    def start(self):
+        self._writer.start()
+
+    def finish(self):
+        self._finish_mapping()
+        self._writer.finish()
+
+    def start_table(self, table_name, title_key):
+        return self._writer.start_table(table_name, title_key)
+
+    def finish_table(self):
+        self._writer.finish_table()
+
+    def write_row(self, row):
+        self._current.rows += 1
+        self._current.bytes += sum(cell_size(cell) for cell in row)
+        return self._writer.write_row(row)
+
+
+def cell_size(cell):
+    """Estimates the size of a cell in output.
+
+    Args:
+        cell (Any): cell's value
+
+    Returns:
+        int: size in bytes
+    """
+    if isinstance(cell, str):
+        return len(cell)
+    if cell is None:
+        return 0
+    if isinstance(cell, (int, float)):
+        return 8
+    return len(str(cell))
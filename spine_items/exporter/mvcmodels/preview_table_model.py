@@ -15,11 +15,19 @@ from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
 
 
 class PreviewTableModel(QAbstractTableModel):
+    """Model for a single preview table.
+
+    Rows are exposed to views in batches through :meth:`fetchMore` so large tables do not freeze the GUI.
+    """
+
     MAX_COLUMNS = 50
+    FETCH_BATCH_SIZE = 1000
 
     def __init__(self):
         super().__init__()
         self._table = list()
+        self._row_count = 0
+        self._column_count = 0
         self._mapping_name = None
         self._table_name = None
         self._row_to_map_color = {}
@@ -33,13 +41,49 @@ class PreviewTableModel(QAbstractTableModel):
         if not self._table:
             return
         self.beginResetModel()
-        self._table.clear()
+        self._table = list()
+        self._row_count = 0
+        self._column_count = 0
         self.endResetModel()
 
+    def canFetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return False
+        return self._row_count < len(self._table)
+
     def columnCount(self, parent=QModelIndex()):
-        if not self._table:
-            return 0
-        return min(max(len(row) for row in self._table), self.MAX_COLUMNS)
+        return self._column_count
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        first = self._row_count
+        last = min(first + self.FETCH_BATCH_SIZE, len(self._table)) - 1
+        if last < first:
+            return
+        column_count = self._column_count_up_to(last + 1)
+        if column_count > self._column_count:
+            self.beginInsertColumns(QModelIndex(), self._column_count, column_count - 1)
+            self._column_count = column_count
+            self.endInsertColumns()
+        self.beginInsertRows(QModelIndex(), first, last)
+        self._row_count = last + 1
+        self.endInsertRows()
+
+    def _column_count_up_to(self, row_count):
+        """Calculates column count after given number of rows have been fetched.
+
+        Args:
+            row_count (int): number of fetched rows
+
+        Returns:
+            int: column count
+        """
+        if self._column_count == self.MAX_COLUMNS:
+            return self._column_count
+        new_rows = self._table[self._row_count : row_count]
+        longest_row = max((len(row) for row in new_rows), default=0)
+        return min(max(longest_row, self._column_count), self.MAX_COLUMNS)
 
     def data(self, index, role=Qt.ItemDataRole.DisplayRole):
         if role == Qt.ItemDataRole.DisplayRole:
@@ -88,6 +132,10 @@ class PreviewTableModel(QAbstractTableModel):
         self._mapping_name = mapping_name
         self._table_name = table_name
         self._table = table
+        self._row_count = 0
+        self._column_count = 0
+        self._column_count = self._column_count_up_to(self.FETCH_BATCH_SIZE)
+        self._row_count = min(len(table), self.FETCH_BATCH_SIZE)
         self._reset_colors(mapping_colors)
         self.endResetModel()
 
@@ -122,7 +170,7 @@ class PreviewTableModel(QAbstractTableModel):
         self._max_mapping_column = max(self._column_to_map_color, default=-1)
 
     def rowCount(self, parent=QModelIndex()):
-        return len(self._table)
+        return self._row_count
 
     def table_name(self):
         """Returns current table's name.
@@ -0,0 +1,128 @@
+######################################################################################################################
+# Copyright (C) 2017-2022 Spine project consortium
+# Copyright Spine Items contributors
+# This file is part of Spine Items.
+# Spine Items is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+
+"""Contains a cache for export preview tables."""
+from collections import OrderedDict
+import hashlib
+import json
+import sys
+from threading import Lock
+from spinedb_api.mapping import to_dict as mapping_to_dict
+
+DEFAULT_MEMORY_BUDGET = 64 * 1024 * 1024
+"""Default maximum size of cached preview tables in bytes."""
+
+
+def preview_key(url, mapping, always_export_header, group_fn, max_tables, max_rows):
+    """Builds a cache key for preview tables.
+
+    The key does not include database revision which is given separately to :class:`PreviewCache`.
+
+    Args:
+        url (str): database URL
+        mapping (ExportMapping): root mapping
+        always_export_header (bool): True if header is written even when there is no data
+        group_fn (str): group function name
+        max_tables (int): maximum number of preview tables
+        max_rows (int): maximum number of rows per table
+
+    Returns:
+        tuple: cache key
+    """
+    serialized = json.dumps(mapping_to_dict(mapping), sort_keys=True, default=str)
+    mapping_hash = hashlib.sha1(serialized.encode("utf-8")).hexdigest()
+    return url, mapping_hash, always_export_header, group_fn, max_tables, max_rows
+
+
+class PreviewCache:
+    """Thread-safe least recently used cache for preview tables with a memory budget."""
+
+    def __init__(self, memory_budget=DEFAULT_MEMORY_BUDGET):
+        """
+        Args:
+            memory_budget (int): maximum approximate size of cached tables in bytes
+        """
+        self._memory_budget = memory_budget
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def size(self):
+        """Approximate size of cached tables in bytes."""
+        return self._size
+
+    def clear(self):
+        """Empties the cache."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def get(self, key, revision):
+        """Returns cached tables.
+
+        Args:
+            key (tuple): cache key
+            revision (tuple): database revision
+
+        Returns:
+            dict: mapping from table name to table, or None if key is not in cache
+        """
+        with self._lock:
+            entry = self._entries.get((key, revision))
+            if entry is None:
+                return None
+            self._entries.move_to_end((key, revision))
+            return dict(entry[0])
+
+    def put(self, key, revision, tables):
+        """Stores tables in the cache evicting least recently used entries if needed.
+
+        Tables larger than the entire memory budget are not cached.
+
+        Args:
+            key (tuple): cache key
+            revision (tuple): database revision
+            tables (dict): mapping from table name to table
+        """
+        size = _tables_size(tables)
+        if size > self._memory_budget:
+            return
+        with self._lock:
+            old_entry = self._entries.pop((key, revision), None)
+            if old_entry is not None:
+                self._size -= old_entry[1]
+            self._entries[key, revision] = (dict(tables), size)
+            self._size += size
+            while self._size > self._memory_budget:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._size -= evicted_size
+
+
+def _tables_size(tables):
+    """Estimates the memory footprint of preview tables.
+
+    Args:
+        tables (dict): mapping from table name to table
+
+    Returns:
+        int: approximate size in bytes
+    """
+    size = sys.getsizeof(tables)
+    for table in tables.values():
+        size += sys.getsizeof(table)
+        for row in table:
+            size += sys.getsizeof(row) + sum(sys.getsizeof(cell) for cell in row)
+    return size
@@ -14,18 +14,38 @@
 import numpy
 from spinedb_api.spine_io.exporters.writer import Writer
 
+CANCELLATION_CHECK_INTERVAL = 100
+"""Number of rows written between checks for cancellation."""
+
 
 class TableWriter(Writer):
-    """An export writer that writes to a Python dictionary."""
+    """An export writer that writes to a Python dictionary.
+
+    Writing can be cancelled from another thread by setting the cancel event.
+    The event is checked when a new table starts and after every batch of rows.
+    """
 
-    def __init__(self):
+    def __init__(self, cancel_event=None):
+        """
+        Args:
+            cancel_event (threading.Event, optional): event that signals cancellation
+        """
         self._tables = dict()
         self._current_table = None
+        self._cancel_event = cancel_event
+        self._rows_until_check = CANCELLATION_CHECK_INTERVAL
+
+    @property
+    def cancelled(self):
+        """True if writing has been cancelled."""
+        return self._cancel_event is not None and self._cancel_event.is_set()
 
     def finish_table(self):
         self._current_table = None
 
     def start_table(self, table_name, title_key):
+        if self.cancelled:
+            return False
         self._current_table = self._tables.setdefault(table_name, list())
         return True
 
@@ -36,6 +56,10 @@ class TableWriter(Writer):
 
     def write_row(self, row):
         self._current_table.append([_sanitize(cell) for cell in row])
+        self._rows_until_check -= 1
+        if self._rows_until_check == 0:
+            self._rows_until_check = CANCELLATION_CHECK_INTERVAL
+            return not self.cancelled
         return True
 
 
@@ -0,0 +1,262 @@
+######################################################################################################################
+# Copyright (C) 2017-2022 Spine project consortium
+# Copyright Spine Items contributors
+# This file is part of Spine Items.
+# Spine Items is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+
+"""Contains a database map wrapper that shares query results between export mappings."""
+from collections import OrderedDict
+import sys
+import time
+from spinedb_api.query import Query
+
+DEFAULT_QUERY_CACHE_SIZE = 256
+"""Default maximum size of cached query results in megabytes."""
+_FETCH_SIZE = 1000
+
+
+class QueryCachingDatabaseMapping:
+    """Wraps a database map so that identical queries hit the database only once.
+
+    Export mappings build their queries through :meth:`query`.
+    Statements are compiled and their results are stored in memory
+    so that mappings that read the same data, or a mapping that splits its output into multiple tables,
+    reuse the rows fetched earlier.
+    Results are streamed from the database the first time they are requested
+    and kept only if they fit into the cache; least recently used results are evicted first.
+    All other attributes are delegated to the wrapped database map.
+    """
+
+    def __init__(self, database_map, max_size=DEFAULT_QUERY_CACHE_SIZE * 1024 * 1024):
+        """
+        Args:
+            database_map (DatabaseMapping): database map to wrap
+            max_size (int): maximum estimated size of cached results in bytes; 0 disables caching
+        """
+        self._database_map = database_map
+        self._bind = _CachingBind(database_map.engine, max_size)
+
+    def __getattr__(self, name):
+        return getattr(self._database_map, name)
+
+    @property
+    def cache_hits(self):
+        """Number of queries that were served from the cache."""
+        return self._bind.hits
+
+    @property
+    def cache_size(self):
+        """Estimated size of cached results in bytes."""
+        return self._bind.size
+
+    @property
+    def query_time(self):
+        """Total time spent executing queries and fetching their results in seconds."""
+        return self._bind.query_time
+
+    def prune(self):
+        """Forgets cached results that have not been requested since the previous call.
+
+        When the filters of the wrapped database map change between exports,
+        results that the new filters still share with the old ones are kept
+        while results that are specific to the old filters are released.
+        """
+        self._bind.prune()
+
+    def query(self, *args):
+        """Returns a query whose results are cached.
+
+        Args:
+            *args: SQL expressions to select
+
+        Returns:
+            Query: query
+        """
+        return Query(self._bind, *args)
+
+
+class _CachingBind:
+    """Executes statements on an engine and caches the fetched rows."""
+
+    def __init__(self, engine, max_size):
+        """
+        Args:
+            engine (Engine): database engine
+            max_size (int): maximum estimated size of cached results in bytes
+        """
+        self._engine = engine
+        self._max_size = max_size
+        self._results = OrderedDict()
+        self._requested = set()
+        self.size = 0
+        self.hits = 0
+        self.query_time = 0.0
+
+    def execute(self, statement):
+        """Executes given statement or returns cached results.
+
+        Args:
+            statement (Select): statement to execute
+
+        Returns:
+            _CachedResult or _StreamingResult: query result
+        """
+        key = None
+        if self._max_size > 0:
+            compiled = statement.compile(dialect=self._engine.dialect)
+            key = (str(compiled), repr(sorted(compiled.params.items())))
+            self._requested.add(key)
+            cached = self._results.get(key)
+            if cached is not None:
+                self._results.move_to_end(key)
+                self.hits += 1
+                return _CachedResult(cached[0])
+        start = time.perf_counter()
+        result = self._engine.execute(statement)
+        self.query_time += time.perf_counter() - start
+        return _StreamingResult(result, self, key)
+
+    def fits(self, size):
+        """Tests if results of given size can be cached.
+
+        Args:
+            size (int): estimated size of results in bytes
+
+        Returns:
+            bool: True if results fit into the cache, False otherwise
+        """
+        return size <= self._max_size
+
+    def store(self, key, rows, size):
+        """Caches rows evicting least recently used results if needed.
+
+        Args:
+            key (tuple): statement key
+            rows (list): result rows
+            size (int): estimated size of rows in bytes
+        """
+        previous = self._results.pop(key, None)
+        if previous is not None:
+            self.size -= previous[1]
+        self._results[key] = (rows, size)
+        self.size += size
+        while self.size > self._max_size:
+            _, (_, evicted_size) = self._results.popitem(last=False)
+            self.size -= evicted_size
+
+    def prune(self):
+        """Drops results that have not been requested since the previous prune."""
+        for key in [key for key in self._results if key not in self._requested]:
+            _, size = self._results.pop(key)
+            self.size -= size
+        self._requested = set()
+
+
+def _estimate_size(row):
+    """Estimates the memory footprint of a result row.
+
+    Args:
+        row (Row): result row
+
+    Returns:
+        int: size in bytes
+    """
+    return sys.getsizeof(row) + sum(sys.getsizeof(value) for value in row)
+
+
+class _StreamingResult:
+    """Streams rows from the database in chunks and caches them once they have all been read.
+
+    Mimics the parts of SqlAlchemy's result proxy that :class:`Query` uses.
+    """
+
+    def __init__(self, result, bind, key):
+        """
+        Args:
+            result (ResultProxy): database result
+            bind (_CachingBind): bind that caches the rows
+            key (tuple, optional): statement key; if None, rows are not cached
+        """
+        self._result = result
+        self._bind = bind
+        self._key = key
+        self._recorded = [] if key is not None else None
+        self._recorded_size = 0
+        self._iterator = self._stream()
+
+    def _stream(self):
+        """Yields rows fetching them in chunks."""
+        while True:
+            start = time.perf_counter()
+            chunk = self._result.fetchmany(_FETCH_SIZE)
+            self._bind.query_time += time.perf_counter() - start
+            if not chunk:
+                break
+            if self._recorded is not None:
+                self._recorded_size += _estimate_size(chunk[0]) * len(chunk)
+                if self._bind.fits(self._recorded_size):
+                    self._recorded += chunk
+                else:
+                    self._recorded = None
+            yield from chunk
+        if self._recorded is not None:
+            self._bind.store(self._key, self._recorded, self._recorded_size)
+            self._recorded = None
+
+    def __iter__(self):
+        return self._iterator
+
+    def __next__(self):
+        return next(self._iterator)
+
+    def fetchall(self):
+        return list(self._iterator)
+
+    def fetchone(self):
+        return next(self._iterator, None)
+
+    def first(self):
+        row = next(self._iterator, None)
+        self._result.close()
+        return row
+
+    def scalar(self):
+        row = self.first()
+        return row[0] if row is not None else None
+
+
+class _CachedResult:
+    """Mimics the parts of SqlAlchemy's result proxy that :class:`Query` uses."""
+
+    def __init__(self, rows):
+        """
+        Args:
+            rows (list): result rows
+        """
+        self._rows = rows
+        self._iterator = iter(rows)
+
+    def __iter__(self):
+        return self._iterator
+
+    def __next__(self):
+        return next(self._iterator)
+
+    def fetchall(self):
+        return list(self._iterator)
+
+    def fetchone(self):
+        return next(self._iterator, None)
+
+    def first(self):
+        return next(self._iterator, None)
+
+    def scalar(self):
+        row = next(self._iterator, None)
+        return row[0] if row is not None else None
@@ -11,8 +11,13 @@
 ######################################################################################################################
 
 """Contains Exporter's specifications."""
+from collections import OrderedDict
 from dataclasses import dataclass
 from enum import Enum, unique
+import hashlib
+import json
+from threading import Lock
+from weakref import WeakKeyDictionary
 from spine_engine.project_item.project_item_specification import ProjectItemSpecification
 from spinedb_api.mapping import to_dict as mapping_to_dict, Position, unflatten
 from spinedb_api.export_mapping.export_mapping import (
@@ -28,8 +33,16 @@ from spinedb_api.export_mapping.export_mapping import (
     DefaultValueIndexNameMapping,
     legacy_group_fn_from_dict,
 )
+from ..utils import COMPRESSED_FILE_SUFFIXES
 from .item_info import ItemInfo
 
+MAX_COMPILED_SPECIFICATIONS = 16
+"""Maximum number of compiled specifications kept in cache."""
+
+_compiled_specifications = OrderedDict()
+_compiled_specifications_by_identity = WeakKeyDictionary()
+_compiled_specifications_lock = Lock()
+
 
 @unique
 class MappingType(Enum):
@@ -66,6 +79,8 @@ class OutputFormat(Enum):
     EXCEL = "Excel"
     GDX = "gdx"
     SQL = "SQL"
+    PARQUET = "Parquet"
+    ARROW = "Arrow IPC"
 
     def is_compatible_file_extension(self, extension):
         """Tests if given file extension is acceptable for current output format.
@@ -81,19 +96,31 @@ class OutputFormat(Enum):
             return extension == "gdx"
         if self == OutputFormat.SQL:
             return extension in ("sqlite", "sqlite3")
+        if self == OutputFormat.PARQUET:
+            return extension == "parquet"
+        if self == OutputFormat.ARROW:
+            return extension in ("arrow", "feather")
         return False
 
-    def file_extension(self):
+    def file_extension(self, compression=None):
         """Returns a file extension for the output format.
 
+        Args:
+            compression (str, optional): compression codec
+
         Returns:
             str: file extension without the dot
         """
+        suffix = self.compressed_file_suffix(compression)
+        if suffix is not None:
+            return self.file_extension() + "." + suffix
         return {
             OutputFormat.CSV: "csv",
             OutputFormat.EXCEL: "xlsx",
             OutputFormat.GDX: "gdx",
             OutputFormat.SQL: "sqlite",
+            OutputFormat.PARQUET: "parquet",
+            OutputFormat.ARROW: "arrow",
         }[self]
 
     @staticmethod
@@ -108,9 +135,12 @@ class OutputFormat(Enum):
         """
         try:
             return {
+                "arrow": OutputFormat.ARROW,
                 "csv": OutputFormat.CSV,
                 "dat": OutputFormat.CSV,
+                "feather": OutputFormat.ARROW,
                 "gdx": OutputFormat.GDX,
+                "parquet": OutputFormat.PARQUET,
                 "sqlite": OutputFormat.SQL,
                 "txt": OutputFormat.CSV,
                 "xlsx": OutputFormat.EXCEL,
@@ -133,7 +163,73 @@ class OutputFormat(Enum):
         Returns:
             bool: True if multiple output files are possible, False otherwise
         """
-        return self == OutputFormat.CSV
+        return self in (OutputFormat.CSV, OutputFormat.PARQUET, OutputFormat.ARROW)
+
+    def supports_row_batching(self):
+        """Tests if the output format's writer honors the row batch size.
+
+        Returns:
+            bool: True if rows are written in batches of configurable size, False otherwise
+        """
+        return self in (OutputFormat.SQL, OutputFormat.PARQUET, OutputFormat.ARROW)
+
+    def compression_options(self):
+        """Returns the compression codecs available for the output format.
+
+        Returns:
+            tuple of str: codec names; empty if the format does not support compression
+        """
+        if self == OutputFormat.CSV:
+            return tuple(COMPRESSED_FILE_SUFFIXES)
+        if self == OutputFormat.PARQUET:
+            return ("snappy", "gzip", "zstd", "brotli", "lz4")
+        if self == OutputFormat.ARROW:
+            return ("lz4", "zstd")
+        return ()
+
+    def compressed_file_suffix(self, compression):
+        """Returns the extra file name suffix of compressed output files.
+
+        Only text formats are compressed as whole files;
+        other formats compress their contents internally and need no suffix.
+
+        Args:
+            compression (str, optional): compression codec
+
+        Returns:
+            str: suffix without the dot or None if output files have no extra suffix
+        """
+        if self != OutputFormat.CSV:
+            return None
+        return COMPRESSED_FILE_SUFFIXES.get(compression)
+
+
+class ExcelMode(Enum):
+    """Ways to write Excel workbooks."""
+
+    STANDARD = "Standard"
+    """Builds the workbook in memory; updates existing output files."""
+    STREAMING = "Streaming"
+    """Streams rows into write-only sheets."""
+    STREAMING_SPLIT_SHEETS = "Streaming, split sheets"
+    """Streams rows into write-only sheets continuing on new sheets when Excel's row limit is reached."""
+
+    def is_streaming(self):
+        """Tests if mode uses write-only sheets.
+
+        Returns:
+            bool: True if mode streams rows, False otherwise
+        """
+        return self != ExcelMode.STANDARD
+
+
+class GdxMode(Enum):
+    """Ways to write .gdx files."""
+
+    STANDARD = "Standard"
+    """Writes symbols record by record through gdx2py."""
+    BATCHED = "Batched"
+    """Gathers records into arrays and writes them in GDX raw mode."""
 
 
 @dataclass(eq=False)
@@ -174,19 +270,37 @@ class MappingSpecification:
 class Specification(ProjectItemSpecification):
     """Exporter's specification."""
 
-    def __init__(self, name="", description="", mapping_specifications=None, output_format=OutputFormat.default()):
+    def __init__(
+        self,
+        name="",
+        description="",
+        mapping_specifications=None,
+        output_format=OutputFormat.default(),
+        row_batch_size=0,
+        compression=None,
+        excel_mode=ExcelMode.STANDARD,
+        gdx_mode=GdxMode.STANDARD,
+    ):
         """
         Args:
             name (str): specification name
             description (str): description
             mapping_specifications (dict, optional): mapping from export mapping name to ``MappingSpecification``
             output_format (OutputFormat): output format
+            row_batch_size (int): number of rows to write before flushing output; 0 disables batching
+            compression (str, optional): compression codec name; None disables compression
+            excel_mode (ExcelMode): how Excel workbooks are written
+            gdx_mode (GdxMode): how .gdx files are written
         """
         super().__init__(name, description, ItemInfo.item_type())
         if mapping_specifications is None:
             mapping_specifications = dict()
         self._mapping_specifications = mapping_specifications
         self.output_format = output_format
+        self.row_batch_size = row_batch_size
+        self.compression = compression
+        self.excel_mode = excel_mode
+        self.gdx_mode = gdx_mode
 
     def is_equivalent(self, other):
         """
@@ -199,7 +313,12 @@ class Specification(ProjectItemSpecification):
             bool: True if specifications are equivalent, False otherwise
         """
         return (
-            self.output_format == other.output_format and self._mapping_specifications == other._mapping_specifications
+            self.output_format == other.output_format
+            and self.row_batch_size == other.row_batch_size
+            and self.compression == other.compression
+            and self.excel_mode == other.excel_mode
+            and self.gdx_mode == other.gdx_mode
+            and self._mapping_specifications == other._mapping_specifications
         )
 
     def mapping_specifications(self):
@@ -280,6 +399,10 @@ class Specification(ProjectItemSpecification):
         return {
             "item_type": ItemInfo.item_type(),
             "output_format": self.output_format.value,
+            "row_batch_size": self.row_batch_size,
+            "compression": self.compression,
+            "excel_mode": self.excel_mode.value,
+            "gdx_mode": self.gdx_mode.value,
             "name": self.name,
             "description": self.description,
             "mappings": mappings,
@@ -323,11 +446,95 @@ class Specification(ProjectItemSpecification):
             output_format = OutputFormat(specification_dict["output_format"])
         except ValueError:
             output_format = OutputFormat.default()
+        try:
+            excel_mode = ExcelMode(specification_dict.get("excel_mode", ExcelMode.STANDARD.value))
+        except ValueError:
+            excel_mode = ExcelMode.STANDARD
+        try:
+            gdx_mode = GdxMode(specification_dict.get("gdx_mode", GdxMode.STANDARD.value))
+        except ValueError:
+            gdx_mode = GdxMode.STANDARD
         return Specification(
-            specification_dict["name"], specification_dict["description"], mapping_specifications, output_format
+            specification_dict["name"],
+            specification_dict["description"],
+            mapping_specifications,
+            output_format,
+            specification_dict.get("row_batch_size", 0),
+            specification_dict.get("compression"),
+            excel_mode,
+            gdx_mode,
         )
 
 
+class CompiledSpecification:
+    """Ready-to-use form of a specification that executions share.
+
+    Restoring a specification from its dictionary rebuilds every export mapping tree.
+    A compiled specification holds a restored private copy of the specification
+    together with its serialized form so executions can use it as is.
+    Compiled specifications are picklable.
+    """
+
+    def __init__(self, specification_dict, digest):
+        """
+        Args:
+            specification_dict (dict): serialized specification
+            digest (str): digest that identifies the revision of the specification
+        """
+        self.specification_dict = specification_dict
+        self.digest = digest
+        self.specification = Specification.from_dict(specification_dict)
+
+
+def compile_specification(specification):
+    """Returns compiled form of given specification.
+
+    Compiled specifications are cached by their contents so a specification is compiled only once per revision.
+    Specification editor replaces specifications instead of modifying them,
+    so compiled specifications are also cached by specification's identity to skip serialization altogether.
+
+    Args:
+        specification (Specification): specification to compile
+
+    Returns:
+        CompiledSpecification: compiled specification
+    """
+    with _compiled_specifications_lock:
+        compiled = _compiled_specifications_by_identity.get(specification)
+    if compiled is not None:
+        return compiled
+    specification_dict = specification.to_dict()
+    serialized = json.dumps(specification_dict)
+    digest = hashlib.sha1(serialized.encode("utf-8")).hexdigest()
+    with _compiled_specifications_lock:
+        compiled = _compiled_specifications.get(digest)
+        if compiled is not None:
+            _compiled_specifications.move_to_end(digest)
+            _compiled_specifications_by_identity[specification] = compiled
+            return compiled
+    compiled = CompiledSpecification(specification_dict, digest)
+    with _compiled_specifications_lock:
+        _compiled_specifications[digest] = compiled
+        _compiled_specifications_by_identity[specification] = compiled
+        while len(_compiled_specifications) > MAX_COMPILED_SPECIFICATIONS:
+            _compiled_specifications.popitem(last=False)
+    return compiled
+
+
+def restore_specification(specification):
+    """Returns a usable specification from its compiled or serialized form.
+
+    Args:
+        specification (CompiledSpecification or dict): compiled or serialized specification
+
+    Returns:
+        Specification: specification
+    """
+    if isinstance(specification, CompiledSpecification):
+        return specification.specification
+    return Specification.from_dict(specification)
+
+
 def _add_index_names(mapping):
     """Adds index name mappings to legacy mappings that don't have them.
 
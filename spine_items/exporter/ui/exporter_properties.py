@@ -28,7 +28,7 @@ from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
     QPalette, QPixmap, QRadialGradient, QTransform)
 from PySide6.QtWidgets import (QApplication, QCheckBox, QComboBox, QFrame,
     QHBoxLayout, QLabel, QSizePolicy, QSpacerItem,
-    QToolButton, QVBoxLayout, QWidget)
+    QSpinBox, QToolButton, QVBoxLayout, QWidget)
 from spine_items import resources_icons_rc
 
 class Ui_Form(object):
@@ -107,6 +107,70 @@ class Ui_Form(object):
 
         self.verticalLayout_2.addWidget(self.cancel_on_error_check_box)
 
+        self.horizontalLayout = QHBoxLayout()
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.export_process_count_label = QLabel(self.frame)
+        self.export_process_count_label.setObjectName(u"export_process_count_label")
+
+        self.horizontalLayout.addWidget(self.export_process_count_label)
+
+        self.export_process_count_spin_box = QSpinBox(self.frame)
+        self.export_process_count_spin_box.setObjectName(u"export_process_count_spin_box")
+        self.export_process_count_spin_box.setMinimum(1)
+        self.export_process_count_spin_box.setMaximum(64)
+
+        self.horizontalLayout.addWidget(self.export_process_count_spin_box)
+
+        self.horizontalSpacer = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout.addItem(self.horizontalSpacer)
+
+
+        self.verticalLayout_2.addLayout(self.horizontalLayout)
+
+        self.horizontalLayout_2 = QHBoxLayout()
+        self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
+        self.query_cache_size_label = QLabel(self.frame)
+        self.query_cache_size_label.setObjectName(u"query_cache_size_label")
+
+        self.horizontalLayout_2.addWidget(self.query_cache_size_label)
+
+        self.query_cache_size_spin_box = QSpinBox(self.frame)
+        self.query_cache_size_spin_box.setObjectName(u"query_cache_size_spin_box")
+        self.query_cache_size_spin_box.setMinimum(0)
+        self.query_cache_size_spin_box.setMaximum(65536)
+        self.query_cache_size_spin_box.setSingleStep(64)
+
+        self.horizontalLayout_2.addWidget(self.query_cache_size_spin_box)
+
+        self.horizontalSpacer_2 = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_2.addItem(self.horizontalSpacer_2)
+
+
+        self.verticalLayout_2.addLayout(self.horizontalLayout_2)
+
+        self.horizontalLayout_3 = QHBoxLayout()
+        self.horizontalLayout_3.setObjectName(u"horizontalLayout_3")
+        self.table_writer_count_label = QLabel(self.frame)
+        self.table_writer_count_label.setObjectName(u"table_writer_count_label")
+
+        self.horizontalLayout_3.addWidget(self.table_writer_count_label)
+
+        self.table_writer_count_spin_box = QSpinBox(self.frame)
+        self.table_writer_count_spin_box.setObjectName(u"table_writer_count_spin_box")
+        self.table_writer_count_spin_box.setMinimum(1)
+        self.table_writer_count_spin_box.setMaximum(64)
+
+        self.horizontalLayout_3.addWidget(self.table_writer_count_spin_box)
+
+        self.horizontalSpacer_3 = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_3.addItem(self.horizontalSpacer_3)
+
+
+        self.verticalLayout_2.addLayout(self.horizontalLayout_3)
+
 
         self.verticalLayout.addWidget(self.frame)
 
@@ -131,5 +195,17 @@ class Ui_Form(object):
 #endif // QT_CONFIG(tooltip)
         self.output_time_stamps_check_box.setText(QCoreApplication.translate("Form", u"Time stamp output directories", None))
         self.cancel_on_error_check_box.setText(QCoreApplication.translate("Form", u"Cancel export on error", None))
+        self.export_process_count_label.setText(QCoreApplication.translate("Form", u"Parallel exports:", None))
+#if QT_CONFIG(tooltip)
+        self.export_process_count_spin_box.setToolTip(QCoreApplication.translate("Form", u"Maximum number of databases or scenarios to export simultaneously in separate processes.", None))
+#endif // QT_CONFIG(tooltip)
+        self.query_cache_size_label.setText(QCoreApplication.translate("Form", u"Query cache (MB):", None))
+#if QT_CONFIG(tooltip)
+        self.query_cache_size_spin_box.setToolTip(QCoreApplication.translate("Form", u"Maximum memory used to share query results between mappings. Set to 0 to disable the cache.", None))
+#endif // QT_CONFIG(tooltip)
+        self.table_writer_count_label.setText(QCoreApplication.translate("Form", u"Parallel tables:", None))
+#if QT_CONFIG(tooltip)
+        self.table_writer_count_spin_box.setToolTip(QCoreApplication.translate("Form", u"Maximum number of CSV tables written simultaneously in separate threads.", None))
+#endif // QT_CONFIG(tooltip)
     # retranslateUi
 
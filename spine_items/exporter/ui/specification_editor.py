@@ -69,6 +69,48 @@ class Ui_MainWindow(object):
 
         self.horizontalLayout_3.addWidget(self.export_format_combo_box)
 
+        self.row_batch_size_label = QLabel(self.centralwidget)
+        self.row_batch_size_label.setObjectName(u"row_batch_size_label")
+
+        self.horizontalLayout_3.addWidget(self.row_batch_size_label)
+
+        self.row_batch_size_spin_box = QSpinBox(self.centralwidget)
+        self.row_batch_size_spin_box.setObjectName(u"row_batch_size_spin_box")
+        self.row_batch_size_spin_box.setMaximum(100000000)
+        self.row_batch_size_spin_box.setSingleStep(1000)
+
+        self.horizontalLayout_3.addWidget(self.row_batch_size_spin_box)
+
+        self.compression_label = QLabel(self.centralwidget)
+        self.compression_label.setObjectName(u"compression_label")
+
+        self.horizontalLayout_3.addWidget(self.compression_label)
+
+        self.compression_combo_box = QComboBox(self.centralwidget)
+        self.compression_combo_box.setObjectName(u"compression_combo_box")
+
+        self.horizontalLayout_3.addWidget(self.compression_combo_box)
+
+        self.excel_mode_label = QLabel(self.centralwidget)
+        self.excel_mode_label.setObjectName(u"excel_mode_label")
+
+        self.horizontalLayout_3.addWidget(self.excel_mode_label)
+
+        self.excel_mode_combo_box = QComboBox(self.centralwidget)
+        self.excel_mode_combo_box.setObjectName(u"excel_mode_combo_box")
+
+        self.horizontalLayout_3.addWidget(self.excel_mode_combo_box)
+
+        self.gdx_mode_label = QLabel(self.centralwidget)
+        self.gdx_mode_label.setObjectName(u"gdx_mode_label")
+
+        self.horizontalLayout_3.addWidget(self.gdx_mode_label)
+
+        self.gdx_mode_combo_box = QComboBox(self.centralwidget)
+        self.gdx_mode_combo_box.setObjectName(u"gdx_mode_combo_box")
+
+        self.horizontalLayout_3.addWidget(self.gdx_mode_combo_box)
+
         self.live_preview_check_box = QCheckBox(self.centralwidget)
         self.live_preview_check_box.setObjectName(u"live_preview_check_box")
         self.live_preview_check_box.setChecked(False)
@@ -139,6 +181,11 @@ class Ui_MainWindow(object):
 
         self.horizontalLayout.addWidget(self.max_preview_rows_spin_box)
 
+        self.dry_run_button = QPushButton(self.frame_preview)
+        self.dry_run_button.setObjectName(u"dry_run_button")
+
+        self.horizontalLayout.addWidget(self.dry_run_button)
+
 
         self.horizontalLayout_3.addWidget(self.frame_preview)
 
@@ -354,12 +401,17 @@ class Ui_MainWindow(object):
         self.verticalLayout_10.addWidget(self.splitter_3)
 
         MainWindow.setCentralWidget(self.centralwidget)
-        QWidget.setTabOrder(self.export_format_combo_box, self.live_preview_check_box)
+        QWidget.setTabOrder(self.export_format_combo_box, self.row_batch_size_spin_box)
+        QWidget.setTabOrder(self.row_batch_size_spin_box, self.compression_combo_box)
+        QWidget.setTabOrder(self.compression_combo_box, self.excel_mode_combo_box)
+        QWidget.setTabOrder(self.excel_mode_combo_box, self.gdx_mode_combo_box)
+        QWidget.setTabOrder(self.gdx_mode_combo_box, self.live_preview_check_box)
         QWidget.setTabOrder(self.live_preview_check_box, self.database_url_combo_box)
         QWidget.setTabOrder(self.database_url_combo_box, self.load_url_from_fs_button)
         QWidget.setTabOrder(self.load_url_from_fs_button, self.max_preview_tables_spin_box)
         QWidget.setTabOrder(self.max_preview_tables_spin_box, self.max_preview_rows_spin_box)
-        QWidget.setTabOrder(self.max_preview_rows_spin_box, self.mappings_table)
+        QWidget.setTabOrder(self.max_preview_rows_spin_box, self.dry_run_button)
+        QWidget.setTabOrder(self.dry_run_button, self.mappings_table)
         QWidget.setTabOrder(self.mappings_table, self.add_mapping_button)
         QWidget.setTabOrder(self.add_mapping_button, self.remove_mapping_button)
         QWidget.setTabOrder(self.remove_mapping_button, self.toggle_enabled_button)
@@ -387,6 +439,23 @@ class Ui_MainWindow(object):
     def retranslateUi(self, MainWindow):
         MainWindow.setWindowTitle(QCoreApplication.translate("MainWindow", u"MainWindow", None))
         self.label.setText(QCoreApplication.translate("MainWindow", u"Export format:", None))
+        self.row_batch_size_label.setText(QCoreApplication.translate("MainWindow", u"Row batch size:", None))
+#if QT_CONFIG(tooltip)
+        self.row_batch_size_spin_box.setToolTip(QCoreApplication.translate("MainWindow", u"<html><head/><body><p>Number of rows written to output before they are flushed and committed. Bounds the memory an export may use. Applies to SQL, Parquet and Arrow output.</p></body></html>", None))
+#endif // QT_CONFIG(tooltip)
+        self.row_batch_size_spin_box.setSpecialValueText(QCoreApplication.translate("MainWindow", u"No batching", None))
+        self.compression_label.setText(QCoreApplication.translate("MainWindow", u"Compression:", None))
+#if QT_CONFIG(tooltip)
+        self.compression_combo_box.setToolTip(QCoreApplication.translate("MainWindow", u"<html><head/><body><p>Compression codec for output files. Available codecs depend on export format.</p></body></html>", None))
+#endif // QT_CONFIG(tooltip)
+        self.excel_mode_label.setText(QCoreApplication.translate("MainWindow", u"Excel mode:", None))
+#if QT_CONFIG(tooltip)
+        self.excel_mode_combo_box.setToolTip(QCoreApplication.translate("MainWindow", u"<html><head/><body><p>How Excel workbooks are written. <span style=\" font-weight:700;\">Standard</span> builds the workbook in memory. <span style=\" font-weight:700;\">Streaming</span> writes rows as they come using little memory but overwrites existing files. With <span style=\" font-weight:700;\">split sheets</span> tables that exceed Excel's row limit continue on new sheets.</p></body></html>", None))
+#endif // QT_CONFIG(tooltip)
+        self.gdx_mode_label.setText(QCoreApplication.translate("MainWindow", u"GDX mode:", None))
+#if QT_CONFIG(tooltip)
+        self.gdx_mode_combo_box.setToolTip(QCoreApplication.translate("MainWindow", u"<html><head/><body><p>How .gdx files are written. <span style=\" font-weight:700;\">Batched</span> gathers the records of each symbol into compact arrays which needs far less memory for large symbols.</p></body></html>", None))
+#endif // QT_CONFIG(tooltip)
         self.live_preview_check_box.setText(QCoreApplication.translate("MainWindow", u"Live preview", None))
         self.label_9.setText(QCoreApplication.translate("MainWindow", u"Database url:", None))
 #if QT_CONFIG(tooltip)
@@ -395,6 +464,10 @@ class Ui_MainWindow(object):
         self.load_url_from_fs_button.setText(QCoreApplication.translate("MainWindow", u"...", None))
         self.label_3.setText(QCoreApplication.translate("MainWindow", u"Max. tables", None))
         self.label_2.setText(QCoreApplication.translate("MainWindow", u"Max. content rows:", None))
+#if QT_CONFIG(tooltip)
+        self.dry_run_button.setToolTip(QCoreApplication.translate("MainWindow", u"<html><head/><body><p>Runs all enabled mappings against the database without writing anything and reports the number of rows and the estimated size of each output table.</p></body></html>", None))
+#endif // QT_CONFIG(tooltip)
+        self.dry_run_button.setText(QCoreApplication.translate("MainWindow", u"Dry run", None))
         self.label_11.setText(QCoreApplication.translate("MainWindow", u"Mappings", None))
         self.add_mapping_button.setText(QCoreApplication.translate("MainWindow", u"Add", None))
         self.remove_mapping_button.setText(QCoreApplication.translate("MainWindow", u"Remove", None))
@@ -11,11 +11,23 @@
 
 """Contains utilities for Exporter."""
 from dataclasses import dataclass
+import hashlib
+import json
 from spine_engine.project_item.project_item_resource import url_resource
-from spine_items.utils import convert_to_sqlalchemy_url
+from spinedb_api import DatabaseMapping, SpineDBAPIError
+from spinedb_api.filters.tools import filter_configs, load_filters
+from spine_items.utils import convert_to_sqlalchemy_url, database_revision
 
 EXPORTER_EXECUTION_MANIFEST_FILE_PREFIX = ".export-manifest"
-"""Prefix for the temporary files that exporter's executable uses to communicate output paths."""
+"""Prefix for the legacy files that exporter's executable used to communicate output paths."""
+EXPORTER_MANIFEST_INDEX_FILE_NAME = ".export-manifest-index.jsonl"
+"""Name of the file that collects output paths of all executions of an exporter."""
+EXPORTER_FINGERPRINT_FILE_PREFIX = ".export-fingerprints"
+"""Prefix for the files that record fingerprints of exported databases."""
+EXPORTER_METRICS_FILE_PREFIX = ".export-metrics"
+"""Prefix for the files that record per-mapping performance metrics of past exports."""
+MAX_METRICS_HISTORY = 50
+"""Maximum number of past executions kept in the metrics file."""
 
 
 @dataclass
@@ -60,3 +72,35 @@ def output_database_resources(item_name, output_channels):
         url = str(convert_to_sqlalchemy_url(channel.out_url))
         resources.append(url_resource(item_name, url, channel.out_label))
     return resources
+
+
+def export_fingerprint(url, specification_dict):
+    """Computes a fingerprint that changes whenever given database or export specification changes.
+
+    The fingerprint covers the latest commit of the database, the filters in the URL and the specification.
+
+    Args:
+        url (str): database URL, possibly with filter configs
+        specification_dict (dict): serialized export specification
+
+    Returns:
+        str: fingerprint or None if the database could not be read
+    """
+    try:
+        db_map = DatabaseMapping(url, apply_filters=False)
+    except SpineDBAPIError:
+        return None
+    try:
+        revision = database_revision(db_map)
+    finally:
+        db_map.close()
+    if revision is None:
+        return None
+    fingerprint_data = {
+        "url": url,
+        "filters": load_filters(filter_configs(url)),
+        "commit": list(revision),
+        "specification": specification_dict,
+    }
+    serialized = json.dumps(fingerprint_data, sort_keys=True, default=str)
+    return hashlib.sha1(serialized.encode("utf-8")).hexdigest()
@@ -12,18 +12,25 @@
 
 """Contains :class:`PreviewUpdater`."""
 from copy import deepcopy
+from threading import Event
 from time import monotonic
-from PySide6.QtCore import QItemSelectionModel, QModelIndex, QObject, QRunnable, Qt, QThreadPool, Signal, Slot
+from PySide6.QtCore import QItemSelectionModel, QModelIndex, QObject, QRunnable, Qt, QThreadPool, QTimer, Signal, Slot
 from PySide6.QtWidgets import QFileDialog
 from spinedb_api.export_mapping.group_functions import NoGroup
 from spinedb_api.spine_io.exporters.writer import write
-from spinedb_api import DatabaseMapping, SpineDBVersionError, SpineDBAPIError
+from spinedb_api import SpineDBVersionError, SpineDBAPIError
 from spinetoolbox.helpers import busy_effect
 from ..mvcmodels.full_url_list_model import FullUrlListModel
 from ..mvcmodels.mappings_table_model import MappingsTableModel
 from ..mvcmodels.preview_tree_model import PreviewTreeModel
 from ..mvcmodels.preview_table_model import PreviewTableModel
+from ..database_map_pool import DatabaseMapPool
+from ..preview_cache import PreviewCache, preview_key
 from ..preview_table_writer import TableWriter
+from ..utils import database_revision
+
+_DEBOUNCE_INTERVAL = 250
+"""Milliseconds to wait for further edits before starting preview workers."""
 
 
 class PreviewUpdater:
@@ -72,6 +79,15 @@ class PreviewUpdater:
         self._preview_tree_model.rowsInserted.connect(self._expand_tree_after_table_insert)
         self._preview_table_model = PreviewTableModel()
         self._stamps = dict()
+        self._workers = dict()
+        self._pending_mapping_names = dict()
+        self._debounce_timer = QTimer()
+        self._debounce_timer.setSingleShot(True)
+        self._debounce_timer.setInterval(_DEBOUNCE_INTERVAL)
+        self._debounce_timer.timeout.connect(self._start_pending_workers)
+        self._preview_cache = PreviewCache()
+        self._revisions = dict()
+        self._database_map_pool = DatabaseMapPool()
         self._thread_pool = QThreadPool()
         self._mapping_tables = dict()
         self._ui.preview_tree_view.setModel(self._preview_tree_model)
@@ -95,7 +111,7 @@ class PreviewUpdater:
         if not current_url:
             return
         self._current_url = current_url
-        self._stamps.clear()
+        self._cancel_all_workers()
         for row in range(self._mappings_table_model.rowCount()):
             index = self._mappings_table_model.index(row, 0)
             if index.data(Qt.ItemDataRole.CheckStateRole) == Qt.CheckState.Checked:
@@ -261,7 +277,7 @@ class PreviewUpdater:
                 continue
             removed_name = index.data()
             self._preview_tree_model.remove_mapping(removed_name)
-            self._stamps.pop((self._current_url, removed_name), None)
+            self._cancel_worker(removed_name)
 
     @Slot(QModelIndex, QModelIndex, list)
     def _rename_mapping(self, top_left, bottom_right, roles):
@@ -283,7 +299,7 @@ class PreviewUpdater:
         old_name, new_name = self._preview_tree_model.rename_mappings(names)
         if not old_name:
             return
-        self._stamps.pop((self._current_url, old_name), None)
+        self._cancel_worker(old_name)
         self._set_current_table(new_name)
 
     @Slot(QModelIndex, QModelIndex, list)
@@ -306,7 +322,7 @@ class PreviewUpdater:
             name = index.data()
             if not enabled and self._preview_tree_model.has_name(name):
                 self._preview_tree_model.remove_mapping(name)
-                self._stamps.pop((self._current_url, name), None)
+                self._cancel_worker(name)
             elif not self._preview_tree_model.has_name(name):
                 self._load_preview_data(name)
 
@@ -394,32 +410,110 @@ class PreviewUpdater:
 
     def _load_preview_data(self, mapping_name):
         """
-        Loads preview data from database into the preview tables if the url is set and live previews are enabled.
+        Schedules loading preview data from database into the preview tables
+        if the url is set and live previews are enabled.
+
+        Rapid successive requests are debounced so only the latest one starts a worker.
 
         Args:
             mapping_name (str): mapping's name
         """
         if self._current_url is None or not self._ui.live_preview_check_box.isChecked() or not mapping_name:
             return
+        self._cancel_worker(mapping_name)
+        self._pending_mapping_names[mapping_name] = None
+        self._debounce_timer.start()
+
+    @Slot()
+    def _start_pending_workers(self):
+        """Starts preview workers for mappings that have pending requests."""
+        mapping_names = list(self._pending_mapping_names)
+        self._pending_mapping_names.clear()
+        if self._current_url is None or not self._ui.live_preview_check_box.isChecked():
+            return
+        for mapping_name in mapping_names:
+            if self._mappings_table_model.index_of(mapping_name).isValid():
+                self._start_worker(mapping_name)
+
+    def _start_worker(self, mapping_name):
+        """
+        Loads preview data from database into the preview tables.
+
+        Args:
+            mapping_name (str): mapping's name
+        """
         mapping_spec = self._mappings_table_model.mapping_specification(mapping_name)
         max_tables = self._ui.max_preview_tables_spin_box.value()
         max_rows = self._ui.max_preview_rows_spin_box.value()
         id_ = (self._current_url, mapping_name)
         stamp = monotonic()
         self._stamps[id_] = stamp
+        mapping = deepcopy(mapping_spec.root)
+        cache_key = preview_key(
+            self._current_url, mapping, mapping_spec.always_export_header, mapping_spec.group_fn, max_tables, max_rows
+        )
+        known_revision = self._revisions.get(self._current_url)
+        if known_revision is not None:
+            tables = self._preview_cache.get(cache_key, known_revision)
+            if tables is not None:
+                self._show_tables(mapping_name, tables)
+            else:
+                known_revision = None
         worker = _Worker(
             self._current_url,
             mapping_name,
-            deepcopy(mapping_spec.root),
+            mapping,
             mapping_spec.always_export_header,
             stamp,
             max_tables,
             max_rows,
             mapping_spec.group_fn,
+            self._preview_cache,
+            cache_key,
+            known_revision,
+            self._database_map_pool,
         )
+        worker.signals.revision_read.connect(self._update_revision)
         worker.signals.table_written.connect(self._add_or_update_data)
+        worker.signals.finished.connect(self._forget_worker)
+        self._workers[id_] = worker
         self._thread_pool.start(worker)
 
+    def _cancel_worker(self, mapping_name):
+        """Cancels pending and running preview work for given mapping.
+
+        Args:
+            mapping_name (str): mapping's name
+        """
+        self._pending_mapping_names.pop(mapping_name, None)
+        id_ = (self._current_url, mapping_name)
+        self._stamps.pop(id_, None)
+        worker = self._workers.pop(id_, None)
+        if worker is not None:
+            worker.cancel()
+
+    def _cancel_all_workers(self):
+        """Cancels all pending and running preview work."""
+        self._debounce_timer.stop()
+        self._pending_mapping_names.clear()
+        self._stamps.clear()
+        for worker in self._workers.values():
+            worker.cancel()
+        self._workers.clear()
+
+    @Slot(str, object)
+    def _update_revision(self, url, revision):
+        """Stores the latest known revision of a database.
+
+        Args:
+            url (str): database URL
+            revision (tuple, optional): database revision
+        """
+        if revision is None:
+            self._revisions.pop(url, None)
+        else:
+            self._revisions[url] = revision
+
     @Slot(tuple, str, object, float)
     def _add_or_update_data(self, worker_id, mapping_name, data, stamp):
         """
@@ -431,11 +525,30 @@ class PreviewUpdater:
             data (dict): mapping from table name to table
             stamp (float): worker's time stamp
         """
-        current_stamp = self._stamps.pop(worker_id, None)
-        if stamp != current_stamp:
-            if current_stamp is not None:
-                self._stamps[worker_id] = current_stamp
+        if self._stamps.get(worker_id) != stamp:
             return
+        self._show_tables(mapping_name, data)
+
+    @Slot(tuple, float)
+    def _forget_worker(self, worker_id, stamp):
+        """Drops bookkeeping of a finished worker unless a newer worker has replaced it.
+
+        Args:
+            worker_id (tuple): a worker identifier
+            stamp (float): worker's time stamp
+        """
+        if self._stamps.get(worker_id) != stamp:
+            return
+        del self._stamps[worker_id]
+        self._workers.pop(worker_id, None)
+
+    def _show_tables(self, mapping_name, data):
+        """Updates preview tree with new tables.
+
+        Args:
+            mapping_name (str): mapping's name
+            data (dict): mapping from table name to table
+        """
         self._preview_tree_model.add_or_update_tables(mapping_name, data)
         mapping_index = self._ui.mappings_table.selectionModel().currentIndex()
         self._change_selected_table(mapping_index, mapping_index)
@@ -471,9 +584,11 @@ class PreviewUpdater:
 
     def tear_down(self):
         """Stops all workers."""
-        self._stamps.clear()
+        self._cancel_all_workers()
+        self._preview_cache.clear()
         self._thread_pool.clear()
         self._thread_pool.deleteLater()
+        self._database_map_pool.close()
         self._url_model.rowsInserted.disconnect(self._enable_controls_after_url_insertion)
         self._url_model.modelReset.disconnect(self._enable_controls)
         self._url_model.destroyed.disconnect(self._forget_url_model)
@@ -481,11 +596,41 @@ class PreviewUpdater:
 
 class _Worker(QRunnable):
     class Signals(QObject):
+        revision_read = Signal(str, object)
         table_written = Signal(tuple, str, object, float)
+        finished = Signal(tuple, float)
 
     def __init__(
-        self, url, mapping_name, mapping, always_export_header, stamp, max_tables=20, max_rows=20, group_fn=NoGroup.NAME
+        self,
+        url,
+        mapping_name,
+        mapping,
+        always_export_header,
+        stamp,
+        max_tables=20,
+        max_rows=20,
+        group_fn=NoGroup.NAME,
+        cache=None,
+        cache_key=None,
+        known_revision=None,
+        database_map_pool=None,
     ):
+        """
+        Args:
+            url (str): database URL
+            mapping_name (str): mapping's name
+            mapping (ExportMapping): root mapping
+            always_export_header (bool): True if header is written even when there is no data
+            stamp (float): time stamp
+            max_tables (int): maximum number of tables
+            max_rows (int): maximum number of rows per table
+            group_fn (str): group function name
+            cache (PreviewCache, optional): preview cache
+            cache_key (tuple, optional): key of preview tables in cache
+            known_revision (tuple, optional): database revision whose cached tables have already been shown
+            database_map_pool (DatabaseMapPool, optional): pool to borrow database map from;
+                if None, a database map is opened and closed just for this worker
+        """
         super().__init__()
         self._url = url
         self._mapping_name = mapping_name
@@ -495,12 +640,33 @@ class _Worker(QRunnable):
         self._max_rows = max_rows
         self._group_fn = group_fn
         self._stamp = stamp
+        self._cache = cache
+        self._cache_key = cache_key
+        self._known_revision = known_revision
+        self._database_map_pool = database_map_pool if database_map_pool is not None else DatabaseMapPool(0)
+        self._cancel_event = Event()
         self.signals = self.Signals()
 
+    def cancel(self):
+        """Requests the worker to stop as soon as possible.
+
+        Cancelled worker does not emit its results.
+        """
+        self._cancel_event.set()
+
     @busy_effect
     def run(self):
         try:
-            db_map = DatabaseMapping(self._url)
+            if not self._cancel_event.is_set():
+                self._write_tables()
+        finally:
+            self.signals.finished.emit((self._url, self._mapping_name), self._stamp)
+            self.signals.deleteLater()
+
+    def _write_tables(self):
+        """Writes preview tables or fetches them from cache and emits them."""
+        try:
+            db_map = self._database_map_pool.acquire(self._url)
         except SpineDBVersionError:
             tables = {"error": [["unsupported database version"]]}
             self.signals.table_written.emit((self._url, self._mapping_name), self._mapping_name, tables, self._stamp)
@@ -509,8 +675,20 @@ class _Worker(QRunnable):
             tables = {"error": [[str(error)]]}
             self.signals.table_written.emit((self._url, self._mapping_name), self._mapping_name, tables, self._stamp)
             return
+        reusable = True
         try:
-            writer = TableWriter()
+            revision = database_revision(db_map) if self._cache is not None else None
+            self.signals.revision_read.emit(self._url, revision)
+            if revision is not None:
+                if revision == self._known_revision:
+                    return
+                tables = self._cache.get(self._cache_key, revision)
+                if tables is not None:
+                    self.signals.table_written.emit(
+                        (self._url, self._mapping_name), self._mapping_name, tables, self._stamp
+                    )
+                    return
+            writer = TableWriter(self._cancel_event)
             write(
                 db_map,
                 writer,
@@ -520,13 +698,17 @@ class _Worker(QRunnable):
                 max_rows=self._max_rows,
                 group_fns=self._group_fn,
             )
+            if writer.cancelled:
+                return
+            if revision is not None:
+                self._cache.put(self._cache_key, revision, writer.tables)
             self.signals.table_written.emit(
                 (self._url, self._mapping_name), self._mapping_name, writer.tables, self._stamp
             )
         except SpineDBAPIError as error:
+            reusable = False
             tables = {"error": [[str(error)]]}
             self.signals.table_written.emit((self._url, self._mapping_name), self._mapping_name, tables, self._stamp)
             return
         finally:
-            db_map.close()
-            self.signals.deleteLater()
+            self._database_map_pool.release(db_map, reusable)
@@ -15,7 +15,8 @@ from copy import deepcopy
 import json
 from PySide6.QtCore import QItemSelectionModel, QMimeData, QModelIndex, QPoint, Qt, Signal, Slot
 from PySide6.QtGui import QKeySequence, QAction
-from PySide6.QtWidgets import QApplication, QHeaderView, QMenu
+from PySide6.QtWidgets import QApplication, QHeaderView, QMenu, QMessageBox
+from spinedb_api import DatabaseMapping, SpineDBAPIError
 from spinedb_api.mapping import unflatten
 from spinedb_api.export_mapping import (
     alternative_export,
@@ -42,7 +43,7 @@ from spinedb_api.export_mapping.group_functions import (
     NoGroup,
 )
 from spinetoolbox.project_item.specification_editor_window import SpecificationEditorWindowBase
-from spinetoolbox.helpers import SealCommand
+from spinetoolbox.helpers import busy_effect, SealCommand
 from .preview_updater import PreviewUpdater
 from ..commands import (
     ChangeWriteOrder,
@@ -56,17 +57,23 @@ from ..commands import (
     SetAlwaysExportHeader,
     SetMappingEnabled,
     SetMappingType,
+    SetCompression,
+    SetExcelMode,
+    SetGdxMode,
     SetExportFormat,
+    SetRowBatchSize,
     SetMapping,
     SetUseFixedTableNameFlag,
     SetFixedTableName,
     SetGroupFunction,
     SetHighlightDimension,
 )
+from ..dry_run import dry_run, estimates_summary
 from ..mvcmodels.mappings_table_model import MappingsTableModel
 from ..mvcmodels.mapping_editor_table_model import EditorColumn, MappingEditorTableModel, POSITION_DISPLAY_TEXT
 from ..mvcmodels.mappings_table_proxy import MappingsTableProxy
-from ..specification import MappingSpecification, MappingType, OutputFormat, Specification
+from ..query_cache import QueryCachingDatabaseMapping
+from ..specification import ExcelMode, GdxMode, MappingSpecification, MappingType, OutputFormat, Specification
 from .filter_edit_delegate import FilterEditDelegate
 from .position_edit_delegate import PositionEditDelegate
 from ...widgets import combo_box_width
@@ -100,6 +107,8 @@ mapping_type_to_parameter_type_label = {
 
 _MAPPINGS_MIME_TYPE = "application/spine_items-exportmappings"
 
+_NO_COMPRESSION = "None"
+
 
 class SpecificationEditorWindow(SpecificationEditorWindowBase):
     """Interface to edit exporter specifications."""
@@ -142,6 +151,19 @@ class SpecificationEditorWindow(SpecificationEditorWindowBase):
         self._ui.export_format_combo_box.addItems([output_format.value for output_format in OutputFormat])
         self._ui.export_format_combo_box.setCurrentText(self._new_spec.output_format.value)
         self._ui.export_format_combo_box.currentTextChanged.connect(self._change_format)
+        self._ui.row_batch_size_spin_box.setValue(self._new_spec.row_batch_size)
+        self._ui.row_batch_size_spin_box.setEnabled(self._new_spec.output_format.supports_row_batching())
+        self._ui.row_batch_size_spin_box.valueChanged.connect(self._change_row_batch_size)
+        self._populate_compression_combo_box()
+        self._ui.compression_combo_box.currentTextChanged.connect(self._change_compression)
+        self._ui.excel_mode_combo_box.addItems([mode.value for mode in ExcelMode])
+        self._ui.excel_mode_combo_box.setCurrentText(self._new_spec.excel_mode.value)
+        self._ui.excel_mode_combo_box.setEnabled(self._new_spec.output_format == OutputFormat.EXCEL)
+        self._ui.excel_mode_combo_box.currentTextChanged.connect(self._change_excel_mode)
+        self._ui.gdx_mode_combo_box.addItems([mode.value for mode in GdxMode])
+        self._ui.gdx_mode_combo_box.setCurrentText(self._new_spec.gdx_mode.value)
+        self._ui.gdx_mode_combo_box.setEnabled(self._new_spec.output_format == OutputFormat.GDX)
+        self._ui.gdx_mode_combo_box.currentTextChanged.connect(self._change_gdx_mode)
         self._add_mapping_action = QAction("Add Mapping", self)
         self._add_mapping_action.triggered.connect(self._new_mapping)
         self._ui.add_mapping_button.clicked.connect(self._add_mapping_action.trigger)
@@ -191,6 +213,7 @@ class SpecificationEditorWindow(SpecificationEditorWindowBase):
         self._ui.fix_table_name_line_edit.textEdited.connect(self._change_fix_table_name)
         self._ui.fix_table_name_line_edit.editingFinished.connect(self._finish_editing_fix_table_name)
         self._ui.group_fn_combo_box.currentTextChanged.connect(self._change_root_mapping_group_fn)
+        self._ui.dry_run_button.clicked.connect(self._dry_run)
         self._compact_mapping_action = QAction("Compact mapping", self)
         self._compact_mapping_action.triggered.connect(self._compact_mapping)
         self._ui.compact_button.clicked.connect(self._compact_mapping_action.trigger)
@@ -231,7 +254,20 @@ class SpecificationEditorWindow(SpecificationEditorWindowBase):
         description = self._spec_toolbar.description()
         mapping_specification = deepcopy(self._new_spec.mapping_specifications())
         output_format = self._new_spec.output_format
-        return Specification(spec_name, description, mapping_specification, output_format)
+        row_batch_size = self._new_spec.row_batch_size
+        compression = self._new_spec.compression
+        excel_mode = self._new_spec.excel_mode
+        gdx_mode = self._new_spec.gdx_mode
+        return Specification(
+            spec_name,
+            description,
+            mapping_specification,
+            output_format,
+            row_batch_size,
+            compression,
+            excel_mode,
+            gdx_mode,
+        )
 
     @Slot(str)
     def _change_format(self, current):
@@ -242,7 +278,9 @@ class SpecificationEditorWindow(SpecificationEditorWindowBase):
             current (str): new export format
         """
         output_format = OutputFormat(current)
-        self._undo_stack.push(SetExportFormat(self, output_format, self._new_spec.output_format))
+        self._undo_stack.push(
+            SetExportFormat(self, output_format, self._new_spec.output_format, self._new_spec.compression)
+        )
 
     def set_export_format_silently(self, export_format):
         """
@@ -256,6 +294,118 @@ class SpecificationEditorWindow(SpecificationEditorWindowBase):
             self._ui.export_format_combo_box.currentTextChanged.disconnect(self._change_format)
             self._ui.export_format_combo_box.setCurrentText(export_format.value)
             self._ui.export_format_combo_box.currentTextChanged.connect(self._change_format)
+        if self._new_spec.compression not in export_format.compression_options():
+            self._new_spec.compression = None
+        self._ui.compression_combo_box.currentTextChanged.disconnect(self._change_compression)
+        self._populate_compression_combo_box()
+        self._ui.compression_combo_box.currentTextChanged.connect(self._change_compression)
+        self._ui.row_batch_size_spin_box.setEnabled(export_format.supports_row_batching())
+        self._ui.excel_mode_combo_box.setEnabled(export_format == OutputFormat.EXCEL)
+        self._ui.gdx_mode_combo_box.setEnabled(export_format == OutputFormat.GDX)
+
+    def _populate_compression_combo_box(self):
+        """Fills compression combo box with codecs available for current export format."""
+        options = self._new_spec.output_format.compression_options()
+        self._ui.compression_combo_box.clear()
+        self._ui.compression_combo_box.addItems([_NO_COMPRESSION, *options])
+        self._ui.compression_combo_box.setEnabled(bool(options))
+        self._ui.compression_combo_box.setCurrentText(
+            self._new_spec.compression if self._new_spec.compression is not None else _NO_COMPRESSION
+        )
+
+    @Slot(str)
+    def _change_compression(self, current):
+        """
+        Pushes ``SetCompression`` command to undo stack.
+
+        Args:
+            current (str): new compression codec
+        """
+        compression = current if current != _NO_COMPRESSION else None
+        self._undo_stack.push(SetCompression(self, compression, self._new_spec.compression))
+
+    def set_compression_silently(self, compression):
+        """
+        Sets compression codec.
+
+        Args:
+            compression (str, optional): new compression codec
+        """
+        self._new_spec.compression = compression
+        text = compression if compression is not None else _NO_COMPRESSION
+        if text != self._ui.compression_combo_box.currentText():
+            self._ui.compression_combo_box.currentTextChanged.disconnect(self._change_compression)
+            self._ui.compression_combo_box.setCurrentText(text)
+            self._ui.compression_combo_box.currentTextChanged.connect(self._change_compression)
+
+    @Slot(str)
+    def _change_excel_mode(self, current):
+        """
+        Pushes ``SetExcelMode`` command to undo stack.
+
+        Args:
+            current (str): new Excel mode
+        """
+        self._undo_stack.push(SetExcelMode(self, ExcelMode(current), self._new_spec.excel_mode))
+
+    def set_excel_mode_silently(self, excel_mode):
+        """
+        Sets Excel mode.
+
+        Args:
+            excel_mode (ExcelMode): new Excel mode
+        """
+        self._new_spec.excel_mode = excel_mode
+        if excel_mode.value != self._ui.excel_mode_combo_box.currentText():
+            self._ui.excel_mode_combo_box.currentTextChanged.disconnect(self._change_excel_mode)
+            self._ui.excel_mode_combo_box.setCurrentText(excel_mode.value)
+            self._ui.excel_mode_combo_box.currentTextChanged.connect(self._change_excel_mode)
+
+    @Slot(str)
+    def _change_gdx_mode(self, current):
+        """
+        Pushes ``SetGdxMode`` command to undo stack.
+
+        Args:
+            current (str): new GDX mode
+        """
+        self._undo_stack.push(SetGdxMode(self, GdxMode(current), self._new_spec.gdx_mode))
+
+    def set_gdx_mode_silently(self, gdx_mode):
+        """
+        Sets GDX mode.
+
+        Args:
+            gdx_mode (GdxMode): new GDX mode
+        """
+        self._new_spec.gdx_mode = gdx_mode
+        if gdx_mode.value != self._ui.gdx_mode_combo_box.currentText():
+            self._ui.gdx_mode_combo_box.currentTextChanged.disconnect(self._change_gdx_mode)
+            self._ui.gdx_mode_combo_box.setCurrentText(gdx_mode.value)
+            self._ui.gdx_mode_combo_box.currentTextChanged.connect(self._change_gdx_mode)
+
+    @Slot(int)
+    def _change_row_batch_size(self, batch_size):
+        """
+        Pushes ``SetRowBatchSize`` command to undo stack.
+
+        Args:
+            batch_size (int): new row batch size
+        """
+        self._undo_stack.push(SetRowBatchSize(self, batch_size, self._new_spec.row_batch_size))
+
+    def set_row_batch_size_silently(self, batch_size):
+        """
+        Sets row batch size.
+
+        Args:
+            batch_size (int): new row batch size
+        """
+        self._new_spec.row_batch_size = batch_size
+        if batch_size != self._ui.row_batch_size_spin_box.value():
+            self._ui.row_batch_size_spin_box.valueChanged.disconnect(self._change_row_batch_size)
+            self._ui.row_batch_size_spin_box.setValue(batch_size)
+            self._ui.row_batch_size_spin_box.valueChanged.connect(self._change_row_batch_size)
 
     def _sniff_export_format(self):
         """Tries to guess the export file format from user given export label.
@@ -1020,6 +1170,24 @@ class SpecificationEditorWindow(SpecificationEditorWindowBase):
         mapping_name = self._sort_mappings_table_model.mapToSource(self._sort_mappings_table_model.index(row, 0)).data()
         self._undo_stack.push(CompactMapping(self._mapping_editor_model, mapping_name))
 
+    @busy_effect
+    @Slot(bool)
+    def _dry_run(self, _=False):
+        """Runs current specification against the preview database and shows the estimated output."""
+        url = self._ui.database_url_combo_box.currentText()
+        if not url:
+            return
+        try:
+            database_map = DatabaseMapping(url)
+        except SpineDBAPIError as error:
+            QMessageBox.information(self, "Error while opening database", f"Could not open database {url}:\n{error}")
+            return
+        try:
+            estimates, duration = dry_run(QueryCachingDatabaseMapping(database_map), self._new_spec)
+        finally:
+            database_map.close()
+        QMessageBox.information(self, "Dry run", estimates_summary("Estimated output:", estimates, duration))
+
     def tear_down(self):
         if not super().tear_down():
             return False
@@ -0,0 +1,337 @@
+######################################################################################################################
+# Copyright (C) 2017-2022 Spine project consortium
+# Copyright Spine Items contributors
+# This file is part of Spine Items.
+# Spine Items is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+
+"""Contains columnar export writers for Parquet and Arrow IPC files."""
+from abc import ABC, abstractmethod
+import os
+import os.path
+import pyarrow
+from pyarrow import ipc, parquet
+from spinedb_api import parameter_value
+from spinedb_api.spine_io.exporters.writer import Writer, WriterException
+
+DEFAULT_RECORD_BATCH_SIZE = 65536
+"""Number of rows per Parquet row group or Arrow record batch unless configured otherwise."""
+
+
+class _ColumnarWriter(Writer, ABC):
+    """Base class for writers that write each table into a typed columnar file.
+
+    The first row of each table is expected to contain the column names.
+    Rows are buffered and written in record batches so memory use stays bounded.
+    Column types are inferred from each batch.
+    If a batch does not fit the types of the batches written before it,
+    integer columns are widened to floats and other conflicting columns to strings;
+    the rows already in the file are then rewritten with the wider types.
+    Columns that contain no values at all are written as strings.
+    """
+
+    @property
+    @abstractmethod
+    def _extension(self):
+        """File name extension without the leading dot."""
+
+    def __init__(self, path, backup_file_name, compression=None, batch_size=DEFAULT_RECORD_BATCH_SIZE):
+        """
+        Args:
+            path (Path or str): path to output directory
+            backup_file_name (str): output file name if no table name is provided by the mappings
+            compression (str, optional): compression codec name
+            batch_size (int): number of rows per record batch
+        """
+        super().__init__()
+        self._path = path
+        self._default_table_name = backup_file_name
+        self._compression = compression
+        self._batch_size = batch_size
+        self._file_name = None
+        self._column_names = None
+        self._buffered_rows = []
+        self._open_files = {}
+        self._schemas = {}
+        self._finished_files = set()
+
+    def finish(self):
+        """Closes all open files."""
+        for file_writer in self._open_files.values():
+            file_writer.close()
+        self._finished_files.update(self._open_files)
+        self._open_files.clear()
+        self._schemas.clear()
+
+    def finish_table(self):
+        """See base class."""
+        self._flush()
+        schema = self._schemas.get(self._file_name)
+        if schema is None:
+            if self._column_names is not None:
+                self._open_file(self._empty_schema())
+        elif pyarrow.null() in schema.types:
+            try:
+                self._rewrite_file(_without_nulls(schema))
+            except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError) as error:
+                raise WriterException(f"Failed to convert data for {os.path.basename(self._file_name)}: {error}")
+        self._file_name = None
+        self._column_names = None
+
+    def output_files(self):
+        """Returns absolute paths to files that have been written.
+
+        Returns:
+            set of str: file paths
+        """
+        return self._finished_files
+
+    def start_table(self, table_name, title_key):
+        """See base class."""
+        if table_name is None:
+            table_name = self._default_table_name
+        else:
+            table_name = table_name + "." + self._extension
+        self._file_name = os.path.join(self._path, table_name)
+        if self._file_name not in self._open_files and os.path.exists(self._file_name):
+            os.remove(self._file_name)
+        self._column_names = None
+        return True
+
+    def write_row(self, row):
+        """See base class."""
+        if self._column_names is None:
+            self._column_names = [str(name) if name is not None else f"column_{i + 1}" for i, name in enumerate(row)]
+            return True
+        if len(row) != len(self._column_names):
+            raise WriterException(
+                f"Row in {os.path.basename(self._file_name)} has {len(row)} columns"
+                f" while the header has {len(self._column_names)}."
+            )
+        self._buffered_rows.append(row)
+        if len(self._buffered_rows) == self._batch_size:
+            self._flush()
+        return True
+
+    def _empty_schema(self):
+        """Builds a schema of string columns for tables that have no data.
+
+        Returns:
+            pyarrow.Schema: schema
+        """
+        return pyarrow.schema([(name, pyarrow.string()) for name in self._column_names])
+
+    def _flush(self):
+        """Writes buffered rows into current file."""
+        if not self._buffered_rows:
+            return
+        columns = [_convert_column(column) for column in zip(*self._buffered_rows)]
+        self._buffered_rows.clear()
+        try:
+            arrays = [_to_array(column) for column in columns]
+            schema = self._schemas.get(self._file_name)
+            if schema is None:
+                schema = pyarrow.schema([(name, array.type) for name, array in zip(self._column_names, arrays)])
+                self._open_file(schema)
+            else:
+                batch_schema = pyarrow.schema(
+                    [(field.name, _common_type(field.type, array.type)) for field, array in zip(schema, arrays)]
+                )
+                if batch_schema != schema:
+                    schema = batch_schema
+                    self._rewrite_file(schema)
+                arrays = [_cast(array, field.type) for array, field in zip(arrays, schema)]
+            batch = pyarrow.record_batch(arrays, schema=schema)
+        except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError) as error:
+            raise WriterException(f"Failed to convert data for {os.path.basename(self._file_name)}: {error}")
+        self._open_files[self._file_name].write_batch(batch)
+
+    def _open_file(self, schema):
+        """Opens current file for writing.
+
+        Args:
+            schema (pyarrow.Schema): table schema
+        """
+        self._open_files[self._file_name] = self._open(self._file_name, schema)
+        self._schemas[self._file_name] = schema
+
+    def _rewrite_file(self, schema):
+        """Rewrites the batches written to current file so far with a wider schema.
+
+        Args:
+            schema (pyarrow.Schema): new table schema
+        """
+        self._open_files.pop(self._file_name).close()
+        written_file_name = self._file_name + ".partial"
+        os.replace(self._file_name, written_file_name)
+        try:
+            self._open_file(schema)
+            file_writer = self._open_files[self._file_name]
+            for batch in self._read_batches(written_file_name):
+                arrays = [_cast(array, field.type) for array, field in zip(batch.columns, schema)]
+                file_writer.write_batch(pyarrow.record_batch(arrays, schema=schema))
+        finally:
+            os.remove(written_file_name)
+
+    @abstractmethod
+    def _open(self, file_name, schema):
+        """Opens a new file for writing.
+
+        Args:
+            file_name (str): path to output file
+            schema (pyarrow.Schema): table schema
+
+        Returns:
+            object: file writer that has ``write_batch()`` and ``close()``
+        """
+
+    @abstractmethod
+    def _read_batches(self, file_name):
+        """Reads record batches from a closed file.
+
+        Args:
+            file_name (str): path to file
+
+        Yields:
+            pyarrow.RecordBatch: record batch
+        """
+
+
+class ParquetWriter(_ColumnarWriter):
+    """Writes tables into Parquet files."""
+
+    _extension = "parquet"
+
+    def _open(self, file_name, schema):
+        """See base class."""
+        return parquet.ParquetWriter(file_name, schema, compression=self._compression or "none")
+
+    def _read_batches(self, file_name):
+        """See base class."""
+        with open(file_name, "rb") as source:
+            yield from parquet.ParquetFile(source).iter_batches(batch_size=self._batch_size)
+
+
+class ArrowWriter(_ColumnarWriter):
+    """Writes tables into Arrow IPC (Feather v2) files."""
+
+    _extension = "arrow"
+
+    def _open(self, file_name, schema):
+        """See base class."""
+        options = ipc.IpcWriteOptions(compression=self._compression)
+        return ipc.new_file(file_name, schema, options=options)
+
+    def _read_batches(self, file_name):
+        """See base class."""
+        with ipc.open_file(file_name) as reader:
+            for i in range(reader.num_record_batches):
+                yield reader.get_batch(i)
+
+
+def _convert_column(column):
+    """Converts Spine specific values in a column to types Arrow understands.
+
+    Args:
+        column (tuple): column values
+
+    Returns:
+        list: converted values
+    """
+    converted = []
+    for x in column:
+        if isinstance(x, parameter_value.DateTime):
+            x = x.value
+        elif isinstance(x, parameter_value.Duration):
+            x = parameter_value.relativedelta_to_duration(x.value)
+        elif isinstance(x, parameter_value.IndexedValue):
+            x = str(x)
+        converted.append(x)
+    return converted
+
+
+def _to_array(column):
+    """Converts a column to Arrow array inferring its type.
+
+    Columns with mixed types fall back to strings.
+    Columns with no values get the null type.
+
+    Args:
+        column (list): column values
+
+    Returns:
+        pyarrow.Array: array
+    """
+    try:
+        return pyarrow.array(column)
+    except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError):
+        return _to_strings(column)
+
+
+def _to_strings(values):
+    """Converts values to Arrow string array.
+
+    Args:
+        values (Iterable): values to convert
+
+    Returns:
+        pyarrow.Array: array
+    """
+    return pyarrow.array([str(x) if x is not None else None for x in values], type=pyarrow.string())
+
+
+def _common_type(written_type, batch_type):
+    """Finds a type that can hold values of both given types.
+
+    Args:
+        written_type (pyarrow.DataType): type of column in file
+        batch_type (pyarrow.DataType): type of column in new batch
+
+    Returns:
+        pyarrow.DataType: common type
+    """
+    if written_type == batch_type or batch_type == pyarrow.null():
+        return written_type
+    if written_type == pyarrow.null():
+        return batch_type
+    if {written_type, batch_type} == {pyarrow.int64(), pyarrow.float64()}:
+        return pyarrow.float64()
+    return pyarrow.string()
+
+
+def _cast(array, type_):
+    """Casts array to given type.
+
+    Values are converted to strings the same way as columns with mixed types.
+
+    Args:
+        array (pyarrow.Array): array to cast
+        type_ (pyarrow.DataType): target type
+
+    Returns:
+        pyarrow.Array: cast array
+    """
+    if array.type == type_:
+        return array
+    if type_ == pyarrow.string():
+        return _to_strings(array.to_pylist())
+    return array.cast(type_)
+
+
+def _without_nulls(schema):
+    """Replaces null typed fields in schema by string fields.
+
+    Args:
+        schema (pyarrow.Schema): schema
+
+    Returns:
+        pyarrow.Schema: schema without null types
+    """
+    return pyarrow.schema(
+        [(field.name, pyarrow.string() if field.type == pyarrow.null() else field.type) for field in schema]
+    )
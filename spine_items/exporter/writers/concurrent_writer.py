@@ -0,0 +1,163 @@
+######################################################################################################################
+# Copyright (C) 2017-2022 Spine project consortium
+# Copyright Spine Items contributors
+# This file is part of Spine Items.
+# Spine Items is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+
+"""Contains a writer that writes output tables concurrently."""
+from concurrent.futures import FIRST_COMPLETED, wait
+import os
+import os.path
+import shutil
+from tempfile import mkdtemp
+from spinedb_api.spine_io.exporters.writer import Writer, WriterException
+
+DEFAULT_MAX_PART_ROWS = 100000
+"""Maximum number of rows buffered before they are handed to a worker."""
+
+
+class ConcurrentTableWriter(Writer):
+    """Writes tables into separate files in a pool of workers.
+
+    Rows of each table are buffered and handed to the executor when the table finishes
+    or the buffer fills up. Every worker writes its rows with a fresh writer into a private part directory.
+    When writing finishes, parts are moved to the output directory in the order they were produced;
+    parts that target the same file are concatenated. The resulting files are identical
+    to what the wrapped writer would have produced alone, provided its file format can be concatenated,
+    e.g. CSV, gzip or zstd.
+    """
+
+    def __init__(self, writer_factory, out_dir, executor, worker_count, max_part_rows=DEFAULT_MAX_PART_ROWS):
+        """
+        Args:
+            writer_factory (Callable): picklable callable that takes a directory and returns a multi-file writer
+            out_dir (str): output directory
+            executor (Executor): thread or process pool that writes the parts
+            worker_count (int): number of workers in executor; bounds the number of parts waiting in memory
+            max_part_rows (int): maximum number of rows per part
+        """
+        super().__init__()
+        self._writer_factory = writer_factory
+        self._out_dir = out_dir
+        self._executor = executor
+        self._max_part_rows = max_part_rows
+        self._max_pending_parts = 2 * worker_count
+        self._parts_dir = None
+        self._futures = []
+        self._table_name = None
+        self._title_key = None
+        self._rows = []
+        self._table_submitted = False
+        self._finished_files = set()
+
+    def start(self):
+        """See base class."""
+        self._parts_dir = mkdtemp(prefix=".parts-", dir=self._out_dir)
+        self._futures = []
+        self._finished_files = set()
+
+    def start_table(self, table_name, title_key):
+        """See base class."""
+        self._table_name = table_name
+        self._title_key = title_key
+        self._rows = []
+        self._table_submitted = False
+        return True
+
+    def write_row(self, row):
+        """See base class."""
+        self._rows.append(row)
+        if len(self._rows) == self._max_part_rows:
+            self._submit_part()
+        return True
+
+    def finish_table(self):
+        """See base class."""
+        if self._rows or not self._table_submitted:
+            # Empty tables get a part, too, so they produce the same (empty) file as the wrapped writer would.
+            self._submit_part()
+
+    def finish(self):
+        """Waits for the workers and assembles the output files."""
+        try:
+            part_files = [future.result() for future in self._futures]
+            for files in part_files:
+                for part_file in files:
+                    self._assemble(part_file)
+        except WriterException:
+            raise
+        except Exception as error:
+            raise WriterException(f"Failed to write output table: {error}")
+        finally:
+            for future in self._futures:
+                future.cancel()
+            self._futures = []
+            shutil.rmtree(self._parts_dir, ignore_errors=True)
+
+    def output_files(self):
+        """Returns absolute paths to files that have been written.
+
+        Returns:
+            set of str: file paths
+        """
+        return self._finished_files
+
+    def _submit_part(self):
+        """Hands buffered rows to the executor."""
+        part_dir = os.path.join(self._parts_dir, str(len(self._futures)))
+        self._futures.append(
+            self._executor.submit(
+                _write_part, self._writer_factory, part_dir, self._table_name, self._title_key, self._rows
+            )
+        )
+        self._rows = []
+        self._table_submitted = True
+        pending = [future for future in self._futures if not future.done()]
+        if len(pending) > self._max_pending_parts:
+            wait(pending, return_when=FIRST_COMPLETED)
+
+    def _assemble(self, part_file):
+        """Moves a part file to output directory or appends it to an existing output file.
+
+        Args:
+            part_file (str): path to part file
+        """
+        file_name = os.path.join(self._out_dir, os.path.basename(part_file))
+        if file_name not in self._finished_files:
+            os.replace(part_file, file_name)
+            self._finished_files.add(file_name)
+            return
+        with open(file_name, "ab") as out_file, open(part_file, "rb") as in_file:
+            shutil.copyfileobj(in_file, out_file)
+
+
+def _write_part(writer_factory, part_dir, table_name, title_key, rows):
+    """Writes a single table into part directory.
+
+    Args:
+        writer_factory (Callable): callable that takes a directory and returns a multi-file writer
+        part_dir (str): directory for the part
+        table_name (str, optional): table's name
+        title_key (dict, optional): table's title key
+        rows (list of list): table rows
+
+    Returns:
+        list of str: paths to written files
+    """
+    os.makedirs(part_dir)
+    writer = writer_factory(part_dir)
+    writer.start()
+    try:
+        writer.start_table(table_name, title_key)
+        for row in rows:
+            writer.write_row(row)
+        writer.finish_table()
+    finally:
+        writer.finish()
+    return sorted(writer.output_files())
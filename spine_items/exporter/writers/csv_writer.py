@@ -0,0 +1,45 @@
+######################################################################################################################
+# Copyright (C) 2017-2022 Spine project consortium
+# Copyright Spine Items contributors
+# This file is part of Spine Items.
+# Spine Items is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+
+"""Contains a compressing CSV export writer."""
+import csv
+import os
+import os.path
+from spinedb_api.spine_io.exporters.csv_writer import CsvWriter
+from ...utils import COMPRESSED_FILE_SUFFIXES, open_file
+
+
+class CompressedCsvWriter(CsvWriter):
+    """CSV writer that compresses output files while writing them."""
+
+    def __init__(self, path, backup_file_name, compression):
+        """
+        Args:
+            path (Path or str): path to output directory
+            backup_file_name (str): output file name if no table name is provided by the mappings
+            compression (str): compression codec, one of the keys in ``COMPRESSED_FILE_SUFFIXES``
+        """
+        super().__init__(path, backup_file_name)
+        self._suffix = COMPRESSED_FILE_SUFFIXES[compression]
+
+    def start_table(self, table_name, title_key):
+        """See base class."""
+        if table_name is None:
+            table_name = self._default_table_name
+        else:
+            table_name = table_name + ".csv." + self._suffix
+        self._file_name = os.path.join(self._path, table_name)
+        if self._file_name not in self._finished_files and os.path.exists(self._file_name):
+            os.remove(self._file_name)
+        self._file = open_file(self._file_name, "a", encoding="utf-8", newline="")
+        self._out = csv.writer(self._file)
+        return True
@@ -0,0 +1,171 @@
+######################################################################################################################
+# Copyright (C) 2017-2022 Spine project consortium
+# Copyright Spine Items contributors
+# This file is part of Spine Items.
+# Spine Items is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+
+"""Contains a streaming Excel export writer."""
+import re
+import numpy
+from openpyxl import Workbook
+from openpyxl.workbook.child import INVALID_TITLE_REGEX
+from spinedb_api.spine_io.exporters.writer import Writer, WriterException
+
+EXCEL_MAX_ROWS = 1048576
+"""Maximum number of rows in an Excel worksheet."""
+_MAX_SHEET_TITLE_LENGTH = 31
+
+
+class StreamingExcelWriter(Writer):
+    """Excel writer that streams rows into write-only worksheets.
+
+    Unlike ``spinedb_api``'s ``ExcelWriter`` this writer never holds a worksheet in memory:
+    rows are serialized as they arrive and only a small buffer per sheet is kept.
+    The downside is that existing output files are overwritten instead of updated.
+    """
+
+    def __init__(self, file_path, split_sheets=False, max_sheet_rows=EXCEL_MAX_ROWS):
+        """
+        Args:
+            file_path (str): path to output file
+            split_sheets (bool): if True, continues on a new sheet when a sheet becomes full;
+                otherwise, overflowing the sheet is an error
+            max_sheet_rows (int): maximum number of rows per sheet
+        """
+        super().__init__()
+        self._file_path = file_path
+        self._split_sheets = split_sheets
+        self._max_sheet_rows = max_sheet_rows
+        self._workbook = None
+        self._sheets = {}
+        self._current_table = None
+        self._current_sheet = None
+
+    def start(self):
+        """See base class."""
+        self._workbook = Workbook(write_only=True)
+        self._sheets = {}
+
+    def finish(self):
+        """See base class."""
+        if self._workbook is None:
+            return
+        if not self._workbook.worksheets:
+            self._workbook.create_sheet("Sheet1")
+        try:
+            self._workbook.save(self._file_path)
+        finally:
+            self._workbook.close()
+            self._workbook = None
+            self._sheets = {}
+
+    def start_table(self, table_name, title_key):
+        """See base class."""
+        self._current_table = re.sub(INVALID_TITLE_REGEX, "", table_name) if table_name is not None else None
+        self._current_sheet = self._sheets.get(self._current_table)
+        if self._current_sheet is None:
+            self._current_sheet = self._first_sheet(self._current_table)
+            self._sheets[self._current_table] = self._current_sheet
+        return True
+
+    def finish_table(self):
+        """See base class."""
+        self._current_sheet = None
+
+    def write_row(self, row):
+        """See base class."""
+        if self._current_sheet.row_count == self._max_sheet_rows:
+            if not self._split_sheets:
+                raise WriterException(
+                    f"Sheet '{self._current_sheet.worksheet.title}' exceeds the limit of {self._max_sheet_rows} rows."
+                )
+            self._current_sheet = self._continuation_sheet(self._current_sheet)
+            self._sheets[self._current_table] = self._current_sheet
+        self._current_sheet.worksheet.append([_convert_to_excel(cell) for cell in row])
+        self._current_sheet.row_count += 1
+        return True
+
+    def _first_sheet(self, table_name):
+        """Creates table's first sheet.
+
+        Args:
+            table_name (str, optional): table's name
+
+        Returns:
+            _Sheet: new sheet
+        """
+        if table_name is None:
+            return _Sheet(self._workbook.create_sheet())
+        return self._create_sheet(table_name, 1)
+
+    def _continuation_sheet(self, sheet):
+        """Creates a sheet that continues a full one.
+
+        Args:
+            sheet (_Sheet): full sheet
+
+        Returns:
+            _Sheet: new sheet
+        """
+        return self._create_sheet(sheet.base_title, sheet.part + 1)
+
+    def _create_sheet(self, base_title, part):
+        """Creates a sheet whose title fits Excel's limit and differs from existing titles.
+
+        Args:
+            base_title (str): table's title
+            part (int): number of the first free sheet to try within the table
+
+        Returns:
+            _Sheet: new sheet
+        """
+        existing_titles = set(self._workbook.sheetnames)
+        while True:
+            suffix = f" ({part})" if part > 1 else ""
+            title = base_title[: _MAX_SHEET_TITLE_LENGTH - len(suffix)] + suffix
+            if title not in existing_titles:
+                break
+            part += 1
+        return _Sheet(self._workbook.create_sheet(title), base_title, part)
+
+
+class _Sheet:
+    """Bookkeeping for a write-only worksheet."""
+
+    def __init__(self, worksheet, base_title=None, part=1):
+        """
+        Args:
+            worksheet (WriteOnlyWorksheet): worksheet
+            base_title (str, optional): title of table's first sheet; defaults to worksheet's title
+            part (int): sheet's number within the table
+        """
+        self.worksheet = worksheet
+        self.base_title = base_title if base_title is not None else worksheet.title
+        self.part = part
+        self.row_count = 0
+
+
+def _convert_to_excel(x):
+    """Converts parameter values to formats that are comprehensible to openpyxl.
+
+    Args:
+        x (Any): a parameter value
+
+    Returns:
+        float or str: Excel compatible value
+    """
+    if isinstance(x, (float, numpy.floating)):
+        if numpy.isnan(x):
+            return "nan"
+        return float(x)
+    if isinstance(x, numpy.integer):
+        return int(x)
+    if not isinstance(x, (float, int, str)) and x is not None:
+        return str(x)
+    return x
@@ -0,0 +1,339 @@
+######################################################################################################################
+# Copyright (C) 2017-2022 Spine project consortium
+# Copyright Spine Items contributors
+# This file is part of Spine Items.
+# Spine Items is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+
+"""Contains a .gdx export writer that writes symbols in bulk."""
+from array import array
+import os.path
+import numpy
+import gdxcc
+from spinedb_api.spine_io.exporters.gdx_writer import SPECIAL_CONVERSIONS
+from spinedb_api.spine_io.exporters.writer import Writer, WriterException
+
+
+class BatchedGdxWriter(Writer):
+    """Gdx writer that gathers the records of each symbol into flat arrays.
+
+    Labels are mapped to integer UEL numbers as rows arrive, so a symbol's records take
+    one integer per dimension and one float instead of a tuple of strings.
+    When writing finishes, all labels are registered with the GDX library at once
+    and each symbol is sorted and deduplicated with numpy before its records are handed over
+    in GDX's raw mode which skips the per-record label lookups of string mode.
+
+    The writer interprets tables like ``spinedb_api``'s ``GdxWriter``: an optional first row of strings
+    names the dimensions and an empty last dimension name makes the table a parameter.
+    """
+
+    def __init__(self, file_path, gams_directory, gdx_file_factory=None):
+        """
+        Args:
+            file_path (str): path to output file
+            gams_directory (str, optional): GAMS directory; None to use default GAMS installation
+            gdx_file_factory (Callable, optional): callable that takes file path and GAMS directory
+                and returns an object with :class:`GdxFile`'s interface
+        """
+        super().__init__()
+        self._file_path = file_path
+        self._gams_dir = gams_directory
+        self._gdx_file_factory = gdx_file_factory if gdx_file_factory is not None else GdxFile
+        self._gdx_file = None
+        self._labels = _Labels()
+        self._symbols = {}
+        self._current_symbol_name = None
+        self._current_symbol = None
+        self._current_row_count = 0
+        self._dimensions_missing = True
+
+    def start(self):
+        """See base class."""
+        self._gdx_file = self._gdx_file_factory(self._file_path, self._gams_dir)
+        self._labels = _Labels()
+        self._symbols = {}
+
+    def finish(self):
+        """Writes gathered symbols to file."""
+        if self._gdx_file is None:
+            return
+        try:
+            self._gdx_file.register_labels(self._labels.names)
+            for name, symbol in self._symbols.items():
+                symbol.write(self._gdx_file, name)
+        finally:
+            self._gdx_file.close()
+            self._gdx_file = None
+            self._labels = _Labels()
+            self._symbols = {}
+
+    def start_table(self, table_name, title_key):
+        """See base class."""
+        if not table_name:
+            raise WriterException("Gdx does not support anonymous tables.")
+        self._current_symbol_name = table_name
+        self._current_symbol = self._symbols.get(table_name)
+        if self._current_symbol is None:
+            self._current_symbol = self._symbols[table_name] = _Symbol()
+        self._current_row_count = 0
+        self._dimensions_missing = True
+        return True
+
+    def finish_table(self):
+        """See base class."""
+        self._current_symbol_name = None
+        self._current_symbol = None
+
+    def write_row(self, row):
+        """See base class."""
+        symbol = self._current_symbol
+        # First row should contain dimensions unless we are exporting a GAMS scalar.
+        if self._current_row_count == 0 and self._dimensions_missing and row and isinstance(row[0], str):
+            symbol.set_dimensions(tuple(row), self._current_symbol_name)
+            self._dimensions_missing = False
+            return True
+        self._current_row_count += 1
+        symbol.add_record(row, self._labels, self._current_symbol_name)
+        return True
+
+
+class _Labels:
+    """Assigns UEL numbers to labels in order of appearance."""
+
+    def __init__(self):
+        self.names = []
+        """Label strings; label's UEL number is its index plus one."""
+        self.numbers = {}
+        """Mapping from label string to UEL number."""
+
+    def register(self, label):
+        """Returns label's UEL number registering the label if needed.
+
+        Labels are keyed by their string form only,
+        so e.g. ``1``, ``1.0`` and ``True`` get distinct UELs as they do in string mode.
+
+        Args:
+            label (Any): label; non-string labels are converted to strings
+
+        Returns:
+            int: UEL number
+        """
+        name = str(label)
+        number = self.numbers.get(name)
+        if number is None:
+            self.names.append(name)
+            number = len(self.names)
+            self.numbers[name] = number
+        return number
+
+
+class _Symbol:
+    """Records of a single GAMS symbol."""
+
+    def __init__(self):
+        self.dimensions = None
+        """Dimension names from the header row."""
+        self.is_parameter = False
+        self.is_scalar = False
+        self.width = None
+        """Number of labels per record."""
+        self.keys = array("i")
+        """Flattened UEL numbers of all records."""
+        self.values = array("d")
+        """Record values; zeros for sets."""
+
+    def set_dimensions(self, dimensions, name):
+        """Sets or checks symbol's dimensions.
+
+        Args:
+            dimensions (tuple of str): dimension names
+            name (str): symbol's name
+        """
+        if self.dimensions is not None:
+            if dimensions != self.dimensions:
+                raise WriterException(f"Cannot append to `{name}`: dimensions don't match.")
+            return
+        if self.width is not None and dimensions[-1] == "":
+            raise WriterException(f"Cannot append to `{name}`: dimensions don't match.")
+        self.dimensions = dimensions
+        self.is_parameter = dimensions[-1] == ""
+
+    def add_record(self, row, labels, name):
+        """Appends a row to symbol's records.
+
+        Args:
+            row (list): table row
+            labels (_Labels): label registry
+            name (str): symbol's name
+        """
+        if self.width is None:
+            if len(row) == 1 and isinstance(row[0], (float, int)):
+                self.is_scalar = True
+                self.values.append(row[0])
+                return
+            self.width = len(row) - 1 if self.is_parameter else len(row)
+            if self.width == 0:
+                raise WriterException(f"Table '{name}' has no dimensions.")
+        elif self.is_scalar:
+            return
+        if self.is_parameter:
+            key = row[:-1]
+            value = row[-1]
+        else:
+            key = row
+            value = 0.0
+        if len(key) != self.width:
+            raise WriterException(f"Rows of table '{name}' have inconsistent lengths.")
+        try:
+            self.values.append(value)
+        except TypeError:
+            raise WriterException(f"Failed to create GAMS parameter in table '{name}': non-numeric value {value}.")
+        numbers = labels.numbers
+        try:
+            self.keys.extend([numbers[label] for label in key])
+        except KeyError:
+            self.keys.extend([labels.register(label) for label in key])
+
+    def write(self, gdx_file, name):
+        """Writes symbol to file.
+
+        Args:
+            gdx_file (GdxFile): output file
+            name (str): symbol's name
+        """
+        if self.is_scalar:
+            keys = numpy.empty((1, 0), dtype=numpy.intc)
+            gdx_file.write_symbol(name, gdxcc.GMS_DT_PAR, (), keys, _convert_to_gams(numpy.array(self.values[:1])))
+            return
+        if self.dimensions is not None:
+            domain = self.dimensions[:-1] if self.is_parameter else self.dimensions
+        else:
+            domain = ("*",) * (self.width if self.width is not None else 1)
+        if self.width is not None and len(domain) != self.width:
+            raise WriterException(f"Dimensions of '{name}' don't match its data.")
+        domain = tuple(dimension if dimension else "*" for dimension in domain)
+        symbol_type = gdxcc.GMS_DT_PAR if self.is_parameter else gdxcc.GMS_DT_SET
+        if self.width is None:
+            keys = numpy.empty((0, len(domain)), dtype=numpy.intc)
+            gdx_file.write_symbol(name, symbol_type, domain, keys, numpy.empty(0))
+            return
+        keys = numpy.frombuffer(self.keys, dtype=numpy.intc).reshape(-1, self.width)
+        values = _convert_to_gams(numpy.frombuffer(self.values, dtype=numpy.float64))
+        order = numpy.lexsort(keys.T[::-1])
+        keys = keys[order]
+        values = values[order]
+        # Raw mode requires strictly increasing keys; the last one of duplicates wins.
+        last_of_key = numpy.ones(len(keys), dtype=bool)
+        last_of_key[:-1] = numpy.any(keys[1:] != keys[:-1], axis=1)
+        gdx_file.write_symbol(name, symbol_type, domain, keys[last_of_key], values[last_of_key])
+
+
+class GdxFile:
+    """Thin wrapper around the GDX library's raw write mode."""
+
+    def __init__(self, file_path, gams_directory):
+        """
+        Args:
+            file_path (str): path to output file
+            gams_directory (str, optional): GAMS directory; None to use default GAMS installation
+        """
+        self._handle = gdxcc.new_gdxHandle_tp()
+        if gams_directory is None:
+            success, error = gdxcc.gdxCreate(self._handle, gdxcc.GMS_SSSIZE)
+        else:
+            success, error = gdxcc.gdxCreateD(self._handle, gams_directory, gdxcc.GMS_SSSIZE)
+        if not success:
+            gdxcc.gdxFree(self._handle)
+            raise WriterException(f"Could not open .gdx file : {error}")
+        success, error_number = gdxcc.gdxOpenWrite(self._handle, os.path.abspath(file_path), "Spine Toolbox")
+        if not success:
+            error = gdxcc.gdxErrorStr(self._handle, error_number)[1]
+            gdxcc.gdxFree(self._handle)
+            raise WriterException(f"Could not open .gdx file : {error}")
+
+    def register_labels(self, labels):
+        """Registers labels in raw mode; label's UEL number is its position in the list plus one.
+
+        Args:
+            labels (list of str): labels
+        """
+        self._check(gdxcc.gdxUELRegisterRawStart(self._handle))
+        for label in labels:
+            if not gdxcc.gdxUELRegisterRaw(self._handle, label):
+                gdxcc.gdxUELRegisterDone(self._handle)
+                raise WriterException(f"Failed to register GAMS label '{label}'.")
+        self._check(gdxcc.gdxUELRegisterDone(self._handle))
+
+    def write_symbol(self, name, symbol_type, domain, keys, values):
+        """Writes a symbol.
+
+        Args:
+            name (str): symbol's name
+            symbol_type (int): GDX data type
+            domain (tuple of str): domain set names
+            keys (numpy.ndarray): sorted UEL numbers, one row per record
+            values (numpy.ndarray): record values
+        """
+        self._check(gdxcc.gdxDataWriteRawStart(self._handle, name, "", len(domain), symbol_type, 0))
+        try:
+            _, symbol_number = gdxcc.gdxFindSymbol(self._handle, name)
+            if not gdxcc.gdxSymbolSetDomainX(self._handle, symbol_number, list(domain)):
+                raise WriterException(f"Unable to set domain for symbol '{name}'.")
+            key_array = gdxcc.intArray(gdxcc.GMS_MAX_INDEX_DIM)
+            value_array = gdxcc.doubleArray(gdxcc.GMS_VAL_MAX)
+            # Keys are sorted, so consecutive records usually differ in the last dimension only.
+            # Find the key elements that change from record to record up front
+            # so the record loop copies only those into the key array.
+            changed = numpy.ones(keys.shape, dtype=bool)
+            changed[1:] = keys[1:] != keys[:-1]
+            records, dimensions = numpy.nonzero(changed)
+            key_updates = iter(zip(dimensions.tolist(), keys[records, dimensions].tolist()))
+            update_counts = changed.sum(axis=1).tolist()
+            set_key = key_array.__setitem__
+            level = gdxcc.GMS_VAL_LEVEL
+            write_raw = gdxcc.gdxDataWriteRaw
+            for update_count, value in zip(update_counts, values.tolist()):
+                for _ in range(update_count):
+                    set_key(*next(key_updates))
+                value_array[level] = value
+                if not write_raw(self._handle, key_array, value_array):
+                    self._check(False)
+        finally:
+            gdxcc.gdxDataWriteDone(self._handle)
+
+    def close(self):
+        """Closes the file."""
+        gdxcc.gdxClose(self._handle)
+        gdxcc.gdxFree(self._handle)
+
+    def _check(self, success):
+        """Raises an exception if GDX library reported an error.
+
+        Args:
+            success (int): return value of a GDX library call
+        """
+        if not success:
+            error = gdxcc.gdxErrorStr(self._handle, gdxcc.gdxGetLastError(self._handle))[1]
+            raise WriterException(f"Failed to write .gdx file: {error}")
+
+
+def _convert_to_gams(values):
+    """Converts special float values to corresponding GAMS constants.
+
+    Args:
+        values (numpy.ndarray): values to convert
+
+    Returns:
+        numpy.ndarray: converted values
+    """
+    conversions = [(numpy.isnan(values), gdxcc.GMS_SV_UNDEF)]
+    conversions += [(values == special, gams_value) for special, gams_value in SPECIAL_CONVERSIONS.items()]
+    converted = values.copy()
+    for mask, gams_value in conversions:
+        converted[mask] = gams_value
+    return converted
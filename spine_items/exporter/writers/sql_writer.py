@@ -0,0 +1,114 @@
+######################################################################################################################
+# Copyright (C) 2017-2022 Spine project consortium
+# Copyright Spine Items contributors
+# This file is part of Spine Items.
+# Spine Items is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+
+"""Contains SQL export writers."""
+import csv
+from io import StringIO
+from spinedb_api.spine_io.exporters.sql_writer import SqlWriter
+
+DEFAULT_INSERT_BATCH_SIZE = 10000
+"""Number of rows :class:`BulkSqlWriter` inserts at once unless configured otherwise."""
+
+
+class BulkSqlWriter(SqlWriter):
+    """SQL writer that inserts rows in bulk.
+
+    Rows are buffered and sent to the database in batches using ``executemany``
+    or, for PostgreSQL over psycopg2, ``COPY ... FROM STDIN``.
+    Like the base writer, commits once per table.
+    """
+
+    def __init__(self, database, overwrite_existing, batch_size=DEFAULT_INSERT_BATCH_SIZE):
+        """
+        Args:
+            database (str): URL or path to output .sqlite file
+            overwrite_existing (bool): if True, overwrites tables in existing database, otherwise appends to the tables
+            batch_size (int): number of rows per insert
+        """
+        super().__init__(database, overwrite_existing)
+        self._batch_size = batch_size
+        self._buffered_rows = []
+        self._use_copy = self._engine.dialect.name == "postgresql" and self._engine.dialect.driver == "psycopg2"
+
+    def finish_table(self):
+        """See base class."""
+        self._flush()
+        super().finish_table()
+
+    def start_table(self, table_name, title_key):
+        """See base class."""
+        self._buffered_rows.clear()
+        self._column_converters = None
+        return super().start_table(table_name, title_key)
+
+    def write_row(self, row):
+        """See base class."""
+        if self._column_converters is None:
+            # Let the base class handle the header and create the table using the first data row.
+            return super().write_row(row)
+        self._buffered_rows.append([convert(x) for convert, x in zip(self._column_converters, row)])
+        if len(self._buffered_rows) == self._batch_size:
+            self._flush()
+        return True
+
+    def _flush(self):
+        """Inserts buffered rows into current table."""
+        if not self._buffered_rows:
+            return
+        if self._use_copy:
+            self._copy_rows(self._buffered_rows)
+        else:
+            keys = [column.key for column in self._table.columns]
+            self._session.execute(self._table.insert(), [dict(zip(keys, row)) for row in self._buffered_rows])
+        self._buffered_rows.clear()
+
+    def _copy_rows(self, rows):
+        """Loads rows into current table using PostgreSQL's COPY.
+
+        Args:
+            rows (list of list): rows to load
+        """
+        buffer = StringIO()
+        csv.writer(buffer).writerows(rows)
+        buffer.seek(0)
+        preparer = self._engine.dialect.identifier_preparer
+        column_names = ", ".join(preparer.quote(column.name) for column in self._table.columns)
+        statement = f"COPY {preparer.format_table(self._table)} ({column_names}) FROM STDIN WITH (FORMAT csv)"
+        cursor = self._session.connection().connection.cursor()
+        try:
+            cursor.copy_expert(statement, buffer)
+        finally:
+            cursor.close()
+
+
+class BatchedSqlWriter(BulkSqlWriter):
+    """SQL writer that inserts and commits rows in fixed size batches.
+
+    The base writer commits once per table which keeps the entire table in a single transaction.
+    Committing in batches bounds the amount of uncommitted data regardless of table size.
+    """
+
+    def __init__(self, database, overwrite_existing, batch_size):
+        """
+        Args:
+            database (str): URL or path to output .sqlite file
+            overwrite_existing (bool): if True, overwrites tables in existing database, otherwise appends to the tables
+            batch_size (int): number of rows per insert and commit
+        """
+        super().__init__(database, overwrite_existing, batch_size)
+
+    def _flush(self):
+        """Inserts and commits buffered rows."""
+        if not self._buffered_rows:
+            return
+        super()._flush()
+        self._session.commit()
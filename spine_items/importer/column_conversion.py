@@ -0,0 +1,273 @@
+######################################################################################################################
+# Copyright (C) 2017-2022 Spine project consortium
+# Copyright Spine Items contributors
+# This file is part of Spine Items.
+# Spine Items is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+
+"""Contains column-wise type conversion of source tables."""
+from itertools import islice
+import numpy
+from spinedb_api import InvalidMapping
+from spinedb_api.import_mapping.import_mapping_compat import parse_named_mapping_spec
+from spinedb_api.import_mapping.type_conversion import DateTimeConvertSpec, FloatConvertSpec, StringConvertSpec
+from spinedb_api.parameter_value import DateTime, ParameterValueFormatError
+
+_BLOCK_SIZE = 4096
+_CHUNK_SIZE = 16 * _BLOCK_SIZE
+_CONVERSION_ERRORS = (ValueError, TypeError, OverflowError, ParameterValueFormatError)
+_type_of = numpy.frompyfunc(type, 1, 1)
+
+
+def bulk_conversion_start_row(mapping_specs):
+    """Finds the first source table row that mappings convert by column types.
+
+    Pivoted mappings and mappings with filters read unconverted cells,
+    so tables that have them are not converted in bulk.
+
+    Args:
+        mapping_specs (list of dict): named mapping specifications of a table
+
+    Returns:
+        int: row index or None if the table should not be converted in bulk
+    """
+    start_rows = []
+    for spec in mapping_specs:
+        try:
+            _, root_mapping = parse_named_mapping_spec(spec)
+        except (InvalidMapping, ValueError):
+            return None
+        if root_mapping.is_pivoted() or any(component.filter_re for component in root_mapping.flatten()):
+            return None
+        start_rows.append(root_mapping.read_start_row)
+    return min(start_rows, default=None)
+
+
+def convert_columns(rows, column_convert_specs, first_row):
+    """Converts float, string and datetime typed columns of source table rows column by column.
+
+    Cells that cannot be converted are left as they are
+    so the usual per-cell conversion of import mappings processes them and reports their errors.
+
+    Args:
+        rows (list): table rows; modified in place
+        column_convert_specs (dict): mapping from column index to :class:`ConvertSpec`
+        first_row (int): index of first row to convert
+
+    Returns:
+        set of int: columns where all cells were converted and need no further per-cell conversion
+    """
+    converted_columns = set()
+    table = rows[first_row:]
+    for column, spec in column_convert_specs.items():
+        convert = _CONVERTERS.get(type(spec))
+        if convert is None:
+            continue
+        values = numpy.array(
+            [row[column] if row is not None and column < len(row) else None for row in table], dtype=object
+        )
+        positions = numpy.flatnonzero(numpy.not_equal(values, None))
+        converted, all_converted = convert(spec, values[positions])
+        for i, value in zip((positions + first_row).tolist(), converted.tolist()):
+            row = rows[i]
+            if not isinstance(row, list):
+                row = rows[i] = list(row)
+            row[column] = value
+        if all_converted:
+            converted_columns.add(column)
+    return converted_columns
+
+
+def convert_column_chunks(rows, column_convert_specs, first_row, converted_columns, chunk_size=_CHUNK_SIZE):
+    """Converts typed columns of source table rows chunk by chunk while the rows are being iterated.
+
+    Once all rows have been iterated, ``converted_columns`` contains the columns
+    where all cells were converted and need no further per-cell conversion.
+
+    Args:
+        rows (Iterable of list): table rows
+        column_convert_specs (dict): mapping from column index to :class:`ConvertSpec`
+        first_row (int): index of first row to convert
+        converted_columns (set of int): set to update with fully converted columns
+        chunk_size (int): number of rows to convert at once
+
+    Yields:
+        list: table row
+    """
+    fully_converted = {column for column, spec in column_convert_specs.items() if type(spec) in _CONVERTERS}
+    rows = iter(rows)
+    chunk_start = 0
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            break
+        if first_row - chunk_start < len(chunk):
+            fully_converted &= convert_columns(chunk, column_convert_specs, max(first_row - chunk_start, 0))
+        chunk_start += len(chunk)
+        yield from chunk
+    converted_columns.update(fully_converted)
+
+
+def skip_converted_cells(column_convert_specs):
+    """Wraps convert specs of bulk converted column types so they leave already converted cells as they are.
+
+    Columns that :func:`convert_columns` converts only partially keep their convert specs;
+    the wrapped specs convert only the cells that were left unconverted.
+
+    Args:
+        column_convert_specs (dict): mapping from column index to :class:`ConvertSpec`
+
+    Returns:
+        dict: mapping from column index to convert spec
+    """
+    return {
+        column: _SkipConvertedSpec(spec) if type(spec) in _CONVERTED_TYPES else spec
+        for column, spec in column_convert_specs.items()
+    }
+
+
+class _SkipConvertedSpec:
+    """Convert spec that passes through cells that already have the converted type."""
+
+    def __init__(self, spec):
+        """
+        Args:
+            spec (ConvertSpec): wrapped convert spec
+        """
+        self._spec = spec
+        self._converted_type = _CONVERTED_TYPES[type(spec)]
+
+    def __getattr__(self, name):
+        return getattr(self._spec, name)
+
+    def __call__(self, value):
+        if value is None or type(value) is self._converted_type:
+            return value
+        return self._spec(value)
+
+
+def _convert_floats(spec, values):
+    """Converts values to floats.
+
+    Args:
+        spec (FloatConvertSpec): convert spec
+        values (numpy.ndarray): values to convert
+
+    Returns:
+        tuple: converted values and a flag that is True if all values were converted
+    """
+    return _convert_with_numpy(spec, values, float, (str, int, bool), numpy.float64)
+
+
+def _convert_strings(spec, values):
+    """Converts values to strings.
+
+    Args:
+        spec (StringConvertSpec): convert spec
+        values (numpy.ndarray): values to convert
+
+    Returns:
+        tuple: converted values and a flag that is True if all values were converted
+    """
+    return _convert_with_numpy(spec, values, str, (int, float, bool), str)
+
+
+def _convert_datetimes(spec, values):
+    """Converts values to datetimes parsing each distinct string only once.
+
+    Args:
+        spec (DateTimeConvertSpec): convert spec
+        values (numpy.ndarray): values to convert
+
+    Returns:
+        tuple: converted values and a flag that is True if all values were converted
+    """
+    types = _type_of(values)
+    converted = values.copy()
+    strings = numpy.flatnonzero(types == str)
+    all_converted = True
+    if len(strings):
+        unique, inverse = numpy.unique(values[strings].astype(str), return_inverse=True)
+        unique_converted, unique_success = _convert_each(spec, unique.astype(object))
+        success = unique_success[inverse]
+        converted[strings[success]] = unique_converted[inverse[success]]
+        all_converted = bool(success.all())
+    others = numpy.flatnonzero((types != str) & (types != DateTime))
+    if len(others):
+        others_converted, success = _convert_each(spec, values[others])
+        converted[others[success]] = others_converted[success]
+        all_converted = all_converted and bool(success.all())
+    return converted, all_converted
+
+
+def _convert_with_numpy(spec, values, target_type, bulk_types, dtype):
+    """Converts values by casting them to NumPy type in blocks.
+
+    Empty strings, values of other than bulk types and blocks that fail to cast are converted one by one by the spec.
+
+    Args:
+        spec (ConvertSpec): convert spec
+        values (numpy.ndarray): values to convert
+        target_type (type): Python type of converted values
+        bulk_types (tuple of type): types of values that cast to NumPy type the same way as spec converts them
+        dtype (type): NumPy type to cast to
+
+    Returns:
+        tuple: converted values and a flag that is True if all values were converted
+    """
+    types = _type_of(values)
+    converted = values.copy()
+    is_bulk = numpy.zeros(len(values), dtype=bool)
+    for bulk_type in bulk_types:
+        is_bulk |= types == bulk_type
+    is_bulk &= numpy.not_equal(values, "")
+    unconverted = [numpy.flatnonzero((types != target_type) & ~is_bulk)]
+    bulk = numpy.flatnonzero(is_bulk)
+    for start in range(0, len(bulk), _BLOCK_SIZE):
+        block = bulk[start : start + _BLOCK_SIZE]
+        try:
+            converted[block] = values[block].astype(dtype).tolist()
+        except _CONVERSION_ERRORS:
+            unconverted.append(block)
+    unconverted = numpy.concatenate(unconverted)
+    if not len(unconverted):
+        return converted, True
+    one_by_one, success = _convert_each(spec, values[unconverted])
+    converted[unconverted[success]] = one_by_one[success]
+    return converted, bool(success.all())
+
+
+def _convert_each(spec, values):
+    """Converts values one by one.
+
+    Args:
+        spec (ConvertSpec): convert spec
+        values (numpy.ndarray): values to convert
+
+    Returns:
+        tuple: converted values and a boolean array that is True where conversion succeeded
+    """
+    converted = numpy.empty(len(values), dtype=object)
+    success = numpy.ones(len(values), dtype=bool)
+    for i, value in enumerate(values):
+        try:
+            converted[i] = spec(value)
+        except _CONVERSION_ERRORS:
+            success[i] = False
+    return converted, success
+
+
+_CONVERTERS = {
+    FloatConvertSpec: _convert_floats,
+    StringConvertSpec: _convert_strings,
+    DateTimeConvertSpec: _convert_datetimes,
+}
+"""Mapping from convert spec type to column converter."""
+
+_CONVERTED_TYPES = {FloatConvertSpec: float, StringConvertSpec: str, DateTimeConvertSpec: DateTime}
+"""Mapping from convert spec type to the type of converted values."""
@@ -0,0 +1,29 @@
+######################################################################################################################
+# Copyright (C) 2017-2022 Spine project consortium
+# Copyright Spine Items contributors
+# This file is part of Spine Items.
+# Spine Items is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+
+"""Contains a CSV connector that reads compressed files transparently."""
+from spinedb_api.spine_io.importers import csv_reader
+from ..utils import COMPRESSED_FILE_SUFFIXES, open_file
+
+# The base class opens its source with the built-in open().
+# Shadowing open() in the base class' module lets it read compressed files;
+# open_file() opens uncompressed files exactly like the built-in does.
+csv_reader.open = open_file
+
+
+class CSVConnector(csv_reader.CSVConnector):
+    """CSV connector that also reads gzip and zstd compressed files.
+
+    The class name is the same as the base class' so existing specifications keep working.
+    """
+
+    FILE_EXTENSIONS = ";;".join(["*.csv"] + [f"*.csv.{suffix}" for suffix in COMPRESSED_FILE_SUFFIXES.values()])
@@ -12,6 +12,8 @@
 
 """Importer's execute kernel (do_work), as target for a multiprocess.Process"""
 import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from spine_engine.project_item.project_item_resource import get_source, get_source_extras
 from spinedb_api import clear_filter_configs, InvalidMapping
 from spinedb_api.helpers import remove_credentials_from_url
@@ -19,13 +21,366 @@ from spinedb_api.spine_db_client import SpineDBClient
 from spinedb_api.parameter_value import to_database
 from spinedb_api.import_mapping.type_conversion import value_to_convert_spec
 from spine_engine.utils.helpers import create_log_file_timestamp
+from .column_conversion import bulk_conversion_start_row, convert_column_chunks, skip_converted_cells
+from ..utils import process_memory_usage, RecordingLogger, replay_messages
+
+_IMPORT_ORDER = (
+    "alternatives",
+    "scenarios",
+    "scenario_alternatives",
+    "entity_classes",
+    "object_classes",
+    "relationship_classes",
+    "parameter_value_lists",
+    "list_values",
+    "parameter_definitions",
+    "object_parameters",
+    "relationship_parameters",
+    "entities",
+    "objects",
+    "relationships",
+    "entity_groups",
+    "object_groups",
+    "entity_alternatives",
+    "parameter_values",
+    "object_parameter_values",
+    "relationship_parameter_values",
+)
+"""Item types in the order they must be imported to satisfy references between them."""
+_MB = 1024 * 1024
 
 
 def do_work(
-    process, mapping, cancel_on_error, on_conflict, logs_dir, source_resources, connector, to_server_urls, lock, logger
+    process,
+    mapping,
+    cancel_on_error,
+    on_conflict,
+    logs_dir,
+    source_resources,
+    connector,
+    to_server_urls,
+    lock,
+    logger,
+    process_count=1,
+    batch_size=0,
+    commit_each_batch=False,
+    memory_limit=0,
 ):
-    all_data = []
+    """
+    Imports source resources into target databases.
+
+    Args:
+        process (ReturningProcess): the process running this function
+        mapping (dict): import mapping
+        cancel_on_error (bool): if True, bails out on non-fatal errors
+        on_conflict (str): conflict resolution strategy for spinedb_api.import_data
+        logs_dir (str): path to directory where error logs are written
+        source_resources (list of ProjectItemResource): resources to import
+        connector (SourceConnection): unconnected source connector
+        to_server_urls (list of str): target database server URLs
+        lock (Lock): lock that serializes writing to target databases
+        logger (LoggerInterface): a logger
+        process_count (int): maximum number of processes reading source resources in parallel;
+            ignored when importing in batches
+        batch_size (int): maximum number of items to send to target databases at once; 0 disables batching
+        commit_each_batch (bool): if True, commits after each batch instead of once per resource
+        memory_limit (int): memory usage in megabytes that stops importing in batches; 0 for unlimited;
+            checked after each mapping
+
+    Returns:
+        tuple: boolean success flag; on success also list of paths to source files that were imported without errors
+    """
     all_errors = []
+    imported_sources = []
+    to_clients = [SpineDBClient.from_server_url(server_url) for server_url in to_server_urls]
+    if batch_size > 0:
+        successful = _import_in_batches(
+            process,
+            mapping,
+            cancel_on_error,
+            on_conflict,
+            logs_dir,
+            source_resources,
+            connector,
+            to_clients,
+            lock,
+            logger,
+            batch_size,
+            commit_each_batch,
+            memory_limit,
+            all_errors,
+            imported_sources,
+        )
+    elif process_count > 1 and len(source_resources) > 1:
+        successful = _import_in_parallel(
+            process,
+            mapping,
+            cancel_on_error,
+            on_conflict,
+            logs_dir,
+            source_resources,
+            connector,
+            to_clients,
+            lock,
+            logger,
+            process_count,
+            all_errors,
+            imported_sources,
+        )
+    else:
+        successful = _import_serially(
+            process,
+            mapping,
+            cancel_on_error,
+            on_conflict,
+            logs_dir,
+            source_resources,
+            connector,
+            to_clients,
+            lock,
+            logger,
+            all_errors,
+            imported_sources,
+        )
+    if not successful:
+        return (False,)
+    if all_errors:
+        # Log errors in a time stamped file into the logs directory
+        timestamp = create_log_file_timestamp()
+        logfilepath = os.path.abspath(os.path.join(logs_dir, timestamp + "_read_error.log"))
+        with open(logfilepath, "w") as f:
+            for err in all_errors:
+                f.write(f"{err}\n")
+        # Make error log file anchor with path as tooltip
+        logfile_anchor = (
+            "<a style='color:#BB99FF;' title='" + logfilepath + "' href='file:///" + logfilepath + "'>Error log</a>"
+        )
+        logger.msg_error.emit(logfile_anchor)
+        if cancel_on_error:
+            logger.msg_error.emit("Cancel import on error has been set. Bailing out.")
+            return (False,)
+        logger.msg_warning.emit("Ignoring errors. Set Cancel import on error to bail out instead.")
+    return True, imported_sources
+
+
+def _import_serially(
+    process,
+    mapping,
+    cancel_on_error,
+    on_conflict,
+    logs_dir,
+    source_resources,
+    connector,
+    to_clients,
+    lock,
+    logger,
+    all_errors,
+    imported_sources,
+):
+    """Reads source resources one by one and writes their data to target databases.
+
+    Args:
+        process (ReturningProcess): the process running the import
+        mapping (dict): import mapping
+        cancel_on_error (bool): if True, bails out on non-fatal errors
+        on_conflict (str): conflict resolution strategy for spinedb_api.import_data
+        logs_dir (str): path to directory where error logs are written
+        source_resources (list of ProjectItemResource): resources to import
+        connector (SourceConnection): source connector
+        to_clients (list of SpineDBClient): target database clients
+        lock (Lock): lock that serializes writing to target databases
+        logger (LoggerInterface): a logger
+        all_errors (list): collected read errors
+        imported_sources (list of str): collected paths to source files that were imported without errors
+
+    Returns:
+        bool: True if import can continue, False if it should bail out
+    """
+    read_settings = _read_settings(mapping)
+    for resource in source_resources:
+        all_data = []
+        successful, errors = _read_resource(
+            resource, connector, read_settings, cancel_on_error, logger, _list_appender(all_data)
+        )
+        if not successful:
+            return False
+        all_errors.extend(errors)
+        successful, clean = _write_data(
+            process, all_data, to_clients, lock, cancel_on_error, on_conflict, logs_dir, logger
+        )
+        if not successful:
+            return False
+        _collect_clean_source(resource, clean and not errors, imported_sources)
+    return True
+
+
+def _import_in_batches(
+    process,
+    mapping,
+    cancel_on_error,
+    on_conflict,
+    logs_dir,
+    source_resources,
+    connector,
+    to_clients,
+    lock,
+    logger,
+    batch_size,
+    commit_each_batch,
+    memory_limit,
+    all_errors,
+    imported_sources,
+):
+    """Reads source resources one by one and sends their data to target databases in fixed size batches.
+
+    Mapped data is written as soon as a batch fills up instead of after the whole resource has been read.
+    Source tables are not kept in memory between mappings; each mapping reads its table again.
+
+    Mappings process a whole source table at once, so memory usage is checked after each mapping
+    rather than while a table is being read.
+    Unless ``commit_each_batch`` is set, ``lock`` is held from the first written batch
+    until the whole resource has been read and committed.
+
+    Args:
+        process (ReturningProcess): the process running the import
+        mapping (dict): import mapping
+        cancel_on_error (bool): if True, bails out on non-fatal errors
+        on_conflict (str): conflict resolution strategy for spinedb_api.import_data
+        logs_dir (str): path to directory where error logs are written
+        source_resources (list of ProjectItemResource): resources to import
+        connector (SourceConnection): source connector
+        to_clients (list of SpineDBClient): target database clients
+        lock (Lock): lock that serializes writing to target databases
+        logger (LoggerInterface): a logger
+        batch_size (int): maximum number of items in a batch
+        commit_each_batch (bool): if True, commits after each batch instead of once per resource
+        memory_limit (int): memory usage in megabytes that stops the import; 0 for unlimited
+        all_errors (list): collected read errors
+        imported_sources (list of str): collected paths to source files that were imported without errors
+
+    Returns:
+        bool: True if import can continue, False if it should bail out
+    """
+    if memory_limit > 0 and process_memory_usage() is None:
+        logger.msg_warning.emit("Memory usage cannot be measured on this platform. Memory limit is ignored.")
+        memory_limit = 0
+    read_settings = _read_settings(mapping)
+    for resource in source_resources:
+        writer = _BatchWriter(
+            process,
+            to_clients,
+            lock,
+            cancel_on_error,
+            on_conflict,
+            logs_dir,
+            logger,
+            batch_size,
+            commit_each_batch,
+            memory_limit,
+        )
+        successful, errors = _read_resource(
+            resource, connector, read_settings, cancel_on_error, logger, writer.add, share_tables=False
+        )
+        if not successful:
+            writer.abort()
+            return False
+        all_errors.extend(errors)
+        clean = writer.finish()
+        if not clean and cancel_on_error:
+            return False
+        _collect_clean_source(resource, clean and not errors, imported_sources)
+    return True
+
+
+def _import_in_parallel(
+    process,
+    mapping,
+    cancel_on_error,
+    on_conflict,
+    logs_dir,
+    source_resources,
+    connector,
+    to_clients,
+    lock,
+    logger,
+    process_count,
+    all_errors,
+    imported_sources,
+):
+    """Reads source resources simultaneously in a pool of worker processes and writes their data to target databases.
+
+    Each worker receives its own copy of the unconnected connector
+    and sends the mapped data of its whole resource back to this process in one piece.
+    Data is written in the order the resources were given, one resource at a time,
+    and messages logged by the workers are relayed to ``logger`` in the same order.
+
+    Args:
+        process (ReturningProcess): the process running the import
+        mapping (dict): import mapping
+        cancel_on_error (bool): if True, bails out on non-fatal errors
+        on_conflict (str): conflict resolution strategy for spinedb_api.import_data
+        logs_dir (str): path to directory where error logs are written
+        source_resources (list of ProjectItemResource): resources to import
+        connector (SourceConnection): unconnected source connector
+        to_clients (list of SpineDBClient): target database clients
+        lock (Lock): lock that serializes writing to target databases
+        logger (LoggerInterface): a logger
+        process_count (int): maximum number of worker processes
+        all_errors (list): collected read errors
+        imported_sources (list of str): collected paths to source files that were imported without errors
+
+    Returns:
+        bool: True if import can continue, False if it should bail out
+    """
+    with ProcessPoolExecutor(max_workers=min(process_count, len(source_resources))) as executor:
+        futures = [
+            executor.submit(_read_resource_in_worker, resource, connector, mapping, cancel_on_error)
+            for resource in source_resources
+        ]
+        for resource, future in zip(source_resources, futures):
+            try:
+                successful, all_data, errors, messages = future.result()
+            except Exception as error:  # pylint: disable=broad-except
+                logger.msg_error.emit(f"Failed to read <b>{resource.label}</b>: {error}")
+                for pending in futures:
+                    pending.cancel()
+                return False
+            replay_messages(messages, logger)
+            if successful:
+                all_errors.extend(errors)
+                successful, clean = _write_data(
+                    process, all_data, to_clients, lock, cancel_on_error, on_conflict, logs_dir, logger
+                )
+            if not successful:
+                for pending in futures:
+                    pending.cancel()
+                return False
+            _collect_clean_source(resource, clean and not errors, imported_sources)
+    return True
+
+
+def _collect_clean_source(resource, clean, imported_sources):
+    """Adds source file's path to imported sources if it was imported without errors.
+
+    Args:
+        resource (ProjectItemResource): imported resource
+        clean (bool): True if there were no read or import errors
+        imported_sources (list of str): paths to source files that were imported without errors
+    """
+    if clean and resource.hasfilepath:
+        imported_sources.append(resource.path)
+
+
+def _read_settings(mapping):
+    """Collects the tables, options and type conversions of selected tables from import mapping.
+
+    Args:
+        mapping (dict): import mapping
+
+    Returns:
+        tuple: table mappings, table options, column convert specs, default column convert functions
+            and row convert specs
+    """
     table_mappings = {
         name: mappings
         for name, mappings in mapping.get("table_mappings", {}).items()
@@ -47,21 +402,98 @@ def do_work(
         tn: {int(col): value_to_convert_spec(spec) for col, spec in cols.items()}
         for tn, cols in mapping.get("table_row_types", {}).items()
     }
-    to_clients = [SpineDBClient.from_server_url(server_url) for server_url in to_server_urls]
-    for resource in source_resources:
-        src = get_source(resource)
-        if resource.hasfilepath:
-            source_anchor = f"<a style='color:#BB99FF;' title='{src}' href='file:///{src}'>{os.path.basename(src)}</a>"
-        else:
-            safe_url = remove_credentials_from_url(src)
-            source_anchor = f"<p style='color:#BB99FF;'>{safe_url}</p>"
-        logger.msg.emit("Importing " + source_anchor)
-        extras = get_source_extras(resource)
-        try:
-            connector.connect_to_source(src, **extras)
-        except Exception as error:  # pylint: disable=broad-except
-            logger.msg_error.emit(f"Failed to connect to {source_anchor}: {error}")
-            return (False,)
+    return (
+        table_mappings,
+        table_options,
+        table_column_convert_specs,
+        table_default_column_convert_fns,
+        table_row_convert_specs,
+    )
+
+
+def _read_resource_in_worker(resource, connector, mapping, cancel_on_error):
+    """Reads a source resource in a worker process.
+
+    Args:
+        resource (ProjectItemResource): resource to read
+        connector (SourceConnection): worker's own unconnected source connector
+        mapping (dict): import mapping
+        cancel_on_error (bool): if True, bails out on non-fatal errors
+
+    Returns:
+        tuple: continuation flag, list of mapped data, list of read errors and recorded log messages
+    """
+    logger = RecordingLogger()
+    all_data = []
+    successful, errors = _read_resource(
+        resource, connector, _read_settings(mapping), cancel_on_error, logger, _list_appender(all_data)
+    )
+    return successful, all_data, errors, logger.messages
+
+
+def _list_appender(data_list):
+    """Creates a data sink for :func:`_read_resource` that collects mapped data into a list.
+
+    Args:
+        data_list (list): list to append to
+
+    Returns:
+        Callable: data sink
+    """
+
+    def append(data):
+        data_list.append(data)
+        return True
+
+    return append
+
+
+def _read_resource(resource, connector, read_settings, cancel_on_error, logger, data_sink, share_tables=True):
+    """Reads and maps the selected tables of a source resource.
+
+    Tables with several mappings are read from the source only once; all their mappings are applied to the same rows.
+    Float, string and datetime typed columns are converted column by column while reading.
+
+    Args:
+        resource (ProjectItemResource): resource to read
+        connector (SourceConnection): source connector
+        read_settings (tuple): settings returned by :func:`_read_settings`
+        cancel_on_error (bool): if True, bails out on non-fatal errors
+        logger (LoggerInterface): a logger
+        data_sink (Callable): called with the mapped data of each mapping; returns False to bail out
+        share_tables (bool): if True, keeps the rows of tables that have several mappings in memory between mappings
+
+    Returns:
+        tuple: continuation flag and list of read errors
+    """
+    (
+        table_mappings,
+        table_options,
+        table_column_convert_specs,
+        table_default_column_convert_fns,
+        table_row_convert_specs,
+    ) = read_settings
+    all_errors = []
+    src = get_source(resource)
+    if resource.hasfilepath:
+        source_anchor = f"<a style='color:#BB99FF;' title='{src}' href='file:///{src}'>{os.path.basename(src)}</a>"
+    else:
+        safe_url = remove_credentials_from_url(src)
+        source_anchor = f"<p style='color:#BB99FF;'>{safe_url}</p>"
+    logger.msg.emit("Importing " + source_anchor)
+    extras = get_source_extras(resource)
+    try:
+        connector.connect_to_source(src, **extras)
+    except Exception as error:  # pylint: disable=broad-except
+        logger.msg_error.emit(f"Failed to connect to {source_anchor}: {error}")
+        return False, all_errors
+    column_convert_specs = {name: dict(specs) for name, specs in table_column_convert_specs.items()}
+    convert_rows = _column_converter(table_mappings, table_column_convert_specs, column_convert_specs)
+    if share_tables:
+        shared_tables = {name for name, mappings in table_mappings.items() if len(mappings) > 1}
+    else:
+        shared_tables = set()
+    with read_tables_once(connector, shared_tables, convert_rows):
         for name, mappings in table_mappings.items():
             logger.msg.emit(f"Processing table <b>{name}</b>")
             for spec in mappings:
@@ -71,7 +503,7 @@ def do_work(
                     data, errors = connector.get_mapped_data(
                         {name: [spec]},
                         table_options,
-                        table_column_convert_specs,
+                        column_convert_specs,
                         table_default_column_convert_fns,
                         table_row_convert_specs,
                         unparse_value=to_database,
@@ -80,8 +512,10 @@ def do_work(
                     logger.msg_error.emit(f"Failed to import: {error}")
                     if cancel_on_error:
                         logger.msg_error.emit("Cancel import on error has been set. Bailing out.")
-                        return (False,)
+                        connector.disconnect()
+                        return False, all_errors
                     logger.msg_warning.emit("Ignoring errors. Set Cancel import on error to bail out instead.")
+                    all_errors.append(f"{mapping_name}: {error}")
                     continue
                 if not errors:
                     logger.msg.emit(f"Successful ({sum(len(d) for d in data.values())} data to be written).")
@@ -89,39 +523,352 @@ def do_work(
                     logger.msg_warning.emit(
                         f"Read {sum(len(d) for d in data.values())} data with {len(errors)} errors."
                     )
-                all_data.append(data)
                 all_errors.extend(errors)
-        connector.disconnect()
-        if all_data:
-            for client in to_clients:
-                lock.acquire()
-                try:
-                    with process.maybe_idle:
-                        client.db_checkin()
-                    success = _import_data_to_url(cancel_on_error, on_conflict, logs_dir, all_data, client, logger)
-                    client.db_checkout()
-                    if not success and cancel_on_error:
-                        return (False,)
-                finally:
-                    lock.release()
-            all_data.clear()
-    if all_errors:
-        # Log errors in a time stamped file into the logs directory
-        timestamp = create_log_file_timestamp()
-        logfilepath = os.path.abspath(os.path.join(logs_dir, timestamp + "_read_error.log"))
-        with open(logfilepath, "w") as f:
-            for err in all_errors:
-                f.write(f"{err}\n")
-        # Make error log file anchor with path as tooltip
-        logfile_anchor = (
-            "<a style='color:#BB99FF;' title='" + logfilepath + "' href='file:///" + logfilepath + "'>Error log</a>"
+                if not data_sink(data):
+                    connector.disconnect()
+                    return False, all_errors
+    connector.disconnect()
+    return True, all_errors
+
+
+def _column_converter(table_mappings, table_column_convert_specs, remaining_convert_specs):
+    """Creates a function for :func:`read_tables_once` that converts typed columns of tables column by column.
+
+    Convert specs of columns that get fully converted are removed from ``remaining_convert_specs``
+    once all rows of the table have been iterated; the other specs skip cells that are already converted.
+    Connector looks up table's convert specs before reading the table and keeps using the same dict,
+    so mappings skip per-cell conversion of those columns.
+    Row convert specs are not converted in bulk; connector applies them cell by cell.
+
+    Args:
+        table_mappings (dict): mapping from table name to named mapping specifications
+        table_column_convert_specs (dict): mapping from table name to column convert specs
+        remaining_convert_specs (dict): copy of ``table_column_convert_specs`` to be passed to connector
+
+    Returns:
+        Callable: function that takes table name and row iterator and returns iterator over converted rows
+    """
+    start_rows = {}
+    for name, mappings in table_mappings.items():
+        if not table_column_convert_specs.get(name):
+            continue
+        start_row = bulk_conversion_start_row(mappings)
+        if start_row is not None:
+            start_rows[name] = start_row
+
+    def convert(table, rows):
+        start_row = start_rows.get(table)
+        if start_row is None:
+            yield from rows
+            return
+        specs = table_column_convert_specs[table]
+        remaining = remaining_convert_specs[table]
+        remaining.clear()
+        remaining.update(skip_converted_cells(specs))
+        converted_columns = set()
+        yield from convert_column_chunks(rows, specs, start_row, converted_columns)
+        for column in converted_columns:
+            del remaining[column]
+
+    return convert
+
+
+@contextmanager
+def read_tables_once(connector, shared_tables, convert_rows=None):
+    """Makes connector read shared source tables only once no matter how many mappings are applied to them.
+
+    The rows of the most recently read shared table are kept in memory
+    and served to subsequent requests of the same table.
+    Other tables are passed through from the connector without keeping their rows.
+
+    Args:
+        connector (SourceConnection): source connector
+        shared_tables (set of str): names of tables that are read by more than one mapping
+        convert_rows (Callable, optional): called with table name and row iterator when a table is read;
+            returns an iterator over converted rows
+
+    Yields:
+        SourceConnection: the connector
+    """
+    read_table = connector.get_data_iterator
+    cache = {}
+
+    def read(table, options, max_rows):
+        data_iterator, header = read_table(table, options, max_rows)
+        if convert_rows is not None:
+            data_iterator = convert_rows(table, data_iterator)
+        return data_iterator, header
+
+    def get_data_iterator(table, options, max_rows=-1):
+        if table not in shared_tables:
+            cache.clear()
+            return read(table, options, max_rows)
+        key = (table, max_rows)
+        cached = cache.get(key)
+        if cached is None:
+            cache.clear()
+            data_iterator, header = read(table, options, max_rows)
+            cached = cache[key] = list(data_iterator), header
+        rows, header = cached
+        return iter(rows), header
+
+    connector.get_data_iterator = get_data_iterator
+    try:
+        yield connector
+    finally:
+        del connector.get_data_iterator
+
+
+def _write_data(process, all_data, to_clients, lock, cancel_on_error, on_conflict, logs_dir, logger):
+    """Writes mapped data of a single resource to target databases.
+
+    Args:
+        process (ReturningProcess): the process running the import
+        all_data (list of dict): mapped data
+        to_clients (list of SpineDBClient): target database clients
+        lock (Lock): lock that serializes writing to target databases
+        cancel_on_error (bool): if True, bails out on non-fatal errors
+        on_conflict (str): conflict resolution strategy for spinedb_api.import_data
+        logs_dir (str): path to directory where error logs are written
+        logger (LoggerInterface): a logger
+
+    Returns:
+        tuple: True if import can continue, False if it should bail out,
+            and True if data was imported without errors, False otherwise
+    """
+    if not all_data:
+        return True, True
+    clean = True
+    for client in to_clients:
+        lock.acquire()
+        try:
+            with process.maybe_idle:
+                client.db_checkin()
+            success = _import_data_to_url(cancel_on_error, on_conflict, logs_dir, all_data, client, logger)
+            client.db_checkout()
+            if not success:
+                if cancel_on_error:
+                    return False, False
+                clean = False
+        finally:
+            lock.release()
+    return True, clean
+
+
+class _BatchWriter:
+    """Sends mapped data of a single resource to target databases in fixed size batches."""
+
+    def __init__(
+        self,
+        process,
+        to_clients,
+        lock,
+        cancel_on_error,
+        on_conflict,
+        logs_dir,
+        logger,
+        batch_size,
+        commit_each_batch,
+        memory_limit,
+    ):
+        """
+        Args:
+            process (ReturningProcess): the process running the import
+            to_clients (list of SpineDBClient): target database clients
+            lock (Lock): lock that serializes writing to target databases
+            cancel_on_error (bool): if True, bails out on non-fatal errors
+            on_conflict (str): conflict resolution strategy for spinedb_api.import_data
+            logs_dir (str): path to directory where error logs are written
+            logger (LoggerInterface): a logger
+            batch_size (int): maximum number of items in a batch
+            commit_each_batch (bool): if True, commits after each batch, otherwise commits in :meth:`finish`
+            memory_limit (int): memory usage in megabytes that stops the import; 0 for unlimited
+        """
+        self._process = process
+        self._to_clients = to_clients
+        self._lock = lock
+        self._cancel_on_error = cancel_on_error
+        self._on_conflict = on_conflict
+        self._logs_dir = logs_dir
+        self._logger = logger
+        self._batch_size = batch_size
+        self._commit_each_batch = commit_each_batch
+        self._memory_limit = memory_limit * _MB
+        self._batch = {}
+        self._batch_item_count = 0
+        self._checked_in = False
+        self._committed_counts = [0 for _ in to_clients]
+        self._uncommitted_counts = [0 for _ in to_clients]
+        self._import_errors = []
+
+    def add(self, data):
+        """Adds mapped data to the batch and writes the batch whenever it fills up.
+
+        Memory usage is checked once all data has been added.
+
+        Args:
+            data (dict): mapped data
+
+        Returns:
+            bool: True if import can continue, False if it should bail out
+        """
+        for item_type in _in_import_order(data):
+            items = data[item_type]
+            start = 0
+            while start < len(items):
+                chunk = items[start : start + self._batch_size - self._batch_item_count]
+                self._batch.setdefault(item_type, []).extend(chunk)
+                self._batch_item_count += len(chunk)
+                start += len(chunk)
+                if self._batch_item_count >= self._batch_size and not self._write_batch():
+                    return False
+        return self._check_memory()
+
+    def finish(self):
+        """Writes remaining data, commits and reports the results.
+
+        Returns:
+            bool: True if everything was imported without errors, False otherwise
+        """
+        if not self._write_batch():
+            return False
+        for index, client in enumerate(self._to_clients):
+            self._commit(index)
+            import_count = self._committed_counts[index]
+            if import_count > 0:
+                clean_url = clear_filter_configs(remove_credentials_from_url(client.get_db_url()))
+                self._logger.msg_success.emit(
+                    f"Inserted {import_count} data with {len(self._import_errors)} errors into {clean_url}"
+                )
+            else:
+                self._logger.msg_warning.emit("No new data imported")
+        self._check_out()
+        if self._import_errors:
+            _write_import_error_log(self._import_errors, self._logs_dir, self._logger)
+            return False
+        return True
+
+    def abort(self):
+        """Rolls back uncommitted changes and releases target databases."""
+        self._roll_back()
+        self._check_out()
+
+    def _write_batch(self):
+        """Sends current batch to target databases.
+
+        Returns:
+            bool: True if import can continue, False if it should bail out
+        """
+        if not self._batch:
+            return True
+        batch = {**self._batch, "on_conflict": self._on_conflict}
+        self._batch = {}
+        self._batch_item_count = 0
+        self._check_in()
+        for index, client in enumerate(self._to_clients):
+            response = client.import_data(batch, "")
+            if "error" in response:
+                self._import_errors.append(response["error"])
+                continue
+            import_count, import_errors = response["result"]
+            self._uncommitted_counts[index] += import_count
+            self._import_errors += import_errors
+            if import_errors:
+                self._logger.msg_error.emit("Errors while importing a batch.")
+                if self._cancel_on_error:
+                    self._logger.msg_error.emit("Cancel import on error is set. Bailing out.")
+                    self.abort()
+                    _write_import_error_log(self._import_errors, self._logs_dir, self._logger)
+                    return False
+                self._logger.msg_warning.emit("Ignoring errors. Set Cancel import on error to bail out instead.")
+            if self._commit_each_batch:
+                self._commit(index)
+        if self._commit_each_batch:
+            self._check_out()
+        return True
+
+    def _check_memory(self):
+        """Bails out if memory usage exceeds the limit.
+
+        Returns:
+            bool: True if import can continue, False if it should bail out
+        """
+        if not self._memory_limit:
+            return True
+        usage = process_memory_usage()
+        if usage <= self._memory_limit:
+            return True
+        self._logger.msg_error.emit(
+            f"Memory usage {usage // _MB} MB exceeds the limit of {self._memory_limit // _MB} MB. Bailing out."
         )
-        logger.msg_error.emit(logfile_anchor)
-        if cancel_on_error:
-            logger.msg_error.emit("Cancel import on error has been set. Bailing out.")
-            return (False,)
-        logger.msg_warning.emit("Ignoring errors. Set Cancel import on error to bail out instead.")
-    return (True,)
+        self.abort()
+        return False
+
+    def _check_in(self):
+        """Acquires the lock and checks in to target databases unless already done.
+
+        The lock is released in :meth:`_check_out` which happens after each batch
+        only if batches are committed one by one.
+        """
+        if self._checked_in:
+            return
+        self._lock.acquire()
+        self._checked_in = True
+        with self._process.maybe_idle:
+            for client in self._to_clients:
+                client.db_checkin()
+
+    def _check_out(self):
+        """Checks out of target databases and releases the lock if checked in."""
+        if not self._checked_in:
+            return
+        try:
+            for client in self._to_clients:
+                client.db_checkout()
+        finally:
+            self._checked_in = False
+            self._lock.release()
+
+    def _commit(self, index):
+        """Commits uncommitted changes in a target database.
+
+        Args:
+            index (int): client index
+        """
+        if self._uncommitted_counts[index] == 0:
+            return
+        self._to_clients[index].call_method("commit_session", "Import data by Spine Toolbox Importer")
+        self._committed_counts[index] += self._uncommitted_counts[index]
+        self._uncommitted_counts[index] = 0
+
+    def _roll_back(self):
+        """Rolls back uncommitted changes in target databases."""
+        for index, client in enumerate(self._to_clients):
+            if self._uncommitted_counts[index] == 0:
+                continue
+            if self._committed_counts[index] > 0:
+                self._logger.msg_error.emit("Rolling back changes since last commit.")
+            else:
+                self._logger.msg_error.emit("Rolling back changes.")
+            client.call_method("rollback_session")
+            self._uncommitted_counts[index] = 0
+
+
+def _in_import_order(data):
+    """Yields item types of mapped data in the order they must be imported.
+
+    Args:
+        data (dict): mapped data
+
+    Yields:
+        str: item type
+    """
+    for item_type in _IMPORT_ORDER:
+        if item_type in data:
+            yield item_type
+    for item_type in data:
+        if item_type not in _IMPORT_ORDER:
+            yield item_type
 
 
 def _import_data_to_url(cancel_on_error, on_conflict, logs_dir, all_data, client, logger):
@@ -154,16 +901,26 @@ def _import_data_to_url(cancel_on_error, on_conflict, logs_dir, all_data, client
     else:
         logger.msg_warning.emit("No new data imported")
     if all_import_errors:
-        # Log errors in a time stamped file into the logs directory
-        timestamp = create_log_file_timestamp()
-        logfilepath = os.path.abspath(os.path.join(logs_dir, timestamp + "_import_error.log"))
-        with open(logfilepath, "w") as f:
-            for err in all_import_errors:
-                f.write(str(err) + "\n")
-        # Make error log file anchor with path as tooltip
-        logfile_anchor = (
-            "<a style='color:#BB99FF;' title='" + logfilepath + "' href='file:///" + logfilepath + "'>Error log</a>"
-        )
-        logger.msg_error.emit(logfile_anchor)
+        _write_import_error_log(all_import_errors, logs_dir, logger)
         return False
     return True
+
+
+def _write_import_error_log(import_errors, logs_dir, logger):
+    """Writes import errors into a time stamped file in the logs directory and logs a link to it.
+
+    Args:
+        import_errors (list): import errors
+        logs_dir (str): path to directory where error logs are written
+        logger (LoggerInterface): a logger
+    """
+    timestamp = create_log_file_timestamp()
+    logfilepath = os.path.abspath(os.path.join(logs_dir, timestamp + "_import_error.log"))
+    with open(logfilepath, "w") as f:
+        for err in import_errors:
+            f.write(str(err) + "\n")
+    # Make error log file anchor with path as tooltip
+    logfile_anchor = (
+        "<a style='color:#BB99FF;' title='" + logfilepath + "' href='file:///" + logfilepath + "'>Error log</a>"
+    )
+    logger.msg_error.emit(logfile_anchor)
@@ -11,10 +11,13 @@
 ######################################################################################################################
 
 """Contains Importer's executable item as well as support utilities."""
+import json
 import os
 from contextlib import ExitStack
+from pathlib import Path
+from spinedb_api import clear_filter_configs
+from spinedb_api.helpers import remove_credentials_from_url
 from spinedb_api.spine_io.gdx_utils import find_gams_directory
-from spinedb_api.spine_io.importers.csv_reader import CSVConnector
 from spinedb_api.spine_io.importers.excel_reader import ExcelConnector
 from spinedb_api.spine_io.importers.gdx_connector import GdxConnector
 from spinedb_api.spine_io.importers.json_reader import JSONConnector
@@ -25,12 +28,29 @@ from spine_engine.project_item.project_item_resource import get_labelled_source_
 from spine_engine.utils.returning_process import ReturningProcess
 from spine_engine.spine_engine import ItemExecutionFinishState
 from ..db_writer_executable_item_base import DBWriterExecutableItemBase
+from .csv_connector import CSVConnector
 from .item_info import ItemInfo
 from .do_work import do_work
+from .utils import IMPORTER_FINGERPRINT_FILE_NAME, is_unchanged, mapping_digest, source_fingerprint, target_revision
 
 
 class ExecutableItem(DBWriterExecutableItemBase):
-    def __init__(self, name, mapping, selected_files, gams_path, cancel_on_error, on_conflict, project_dir, logger):
+    def __init__(
+        self,
+        name,
+        mapping,
+        selected_files,
+        gams_path,
+        cancel_on_error,
+        on_conflict,
+        project_dir,
+        logger,
+        import_process_count=1,
+        import_batch_size=0,
+        commit_each_batch=False,
+        memory_limit=0,
+        skip_unchanged=False,
+    ):
         """
         Args:
             name (str): Importer's name
@@ -41,6 +61,13 @@ class ExecutableItem(DBWriterExecutableItemBase):
             on_conflict (str): conflict resolution strategy for spinedb_api.import_data
             project_dir (str): absolute path to project directory
             logger (LoggerInterface): a logger
+            import_process_count (int): maximum number of processes reading source files in parallel;
+                each process pickles the mapped data of its whole file back to the parent process,
+                so up to this many files' worth of mapped data may be held in memory at once
+            import_batch_size (int): maximum number of items to write at once; 0 writes each source file at once
+            commit_each_batch (bool): if True, commits after each batch instead of once per source file
+            memory_limit (int): memory usage in megabytes that stops importing in batches; 0 for unlimited
+            skip_unchanged (bool): if True, source files that have not changed since their last import are skipped
         """
         super().__init__(name, project_dir, logger)
         self._mapping = mapping
@@ -48,6 +75,11 @@ class ExecutableItem(DBWriterExecutableItemBase):
         self._gams_path = gams_path
         self._cancel_on_error = cancel_on_error
         self._on_conflict = on_conflict
+        self._import_process_count = import_process_count
+        self._import_batch_size = import_batch_size
+        self._commit_each_batch = commit_each_batch
+        self._memory_limit = memory_limit
+        self._skip_unchanged = skip_unchanged
         self._process = None
 
     @staticmethod
@@ -76,6 +108,16 @@ class ExecutableItem(DBWriterExecutableItemBase):
         to_resources = [r for r in backward_resources if r.type_ == "database"]
         if not selected_resources or not to_resources:
             return ItemExecutionFinishState.SUCCESS
+        fingerprints = {}
+        if self._skip_unchanged:
+            target_revisions = [target_revision(resource.url) for resource in to_resources]
+            selected_resources, fingerprints = self._skip_unchanged_resources(
+                selected_resources, to_resources, target_revisions
+            )
+            if not selected_resources:
+                for resource in to_resources:
+                    resource.quick_db_checkout()
+                return ItemExecutionFinishState.SUCCESS
         source_type = self._mapping["source_type"]
         if source_type == "GdxConnector":
             source_settings = {"gams_directory": self._gams_system_directory()}
@@ -103,11 +145,103 @@ class ExecutableItem(DBWriterExecutableItemBase):
                     to_server_urls,
                     lock,
                     self._logger,
+                    self._import_process_count,
+                    self._import_batch_size,
+                    self._commit_each_batch,
+                    self._memory_limit,
                 ),
             )
             return_value = self._process.run_until_complete()
             self._process = None
-            return ItemExecutionFinishState.SUCCESS if return_value[0] else ItemExecutionFinishState.FAILURE
+            if not return_value[0]:
+                return ItemExecutionFinishState.FAILURE
+            if fingerprints:
+                self._write_fingerprints(
+                    _clean_fingerprints(fingerprints, selected_resources, return_value[1]),
+                    to_resources,
+                    target_revisions,
+                    lock,
+                )
+            return ItemExecutionFinishState.SUCCESS
+
+    def _skip_unchanged_resources(self, resources, to_resources, target_revisions):
+        """Leaves out source files that have already been imported into all target databases.
+
+        Fingerprints recorded for a target database are used only if the database is still at the same revision.
+
+        Args:
+            resources (list of ProjectItemResource): source resources
+            to_resources (list of ProjectItemResource): target database resources
+            target_revisions (list of list): current revisions of target databases
+
+        Returns:
+            tuple: resources to import and mapping from source file path to fingerprint
+        """
+        stored_fingerprints = self._read_fingerprints()
+        target_fingerprints = [
+            _valid_source_fingerprints(stored_fingerprints.get(_fingerprint_key(r)), revision)
+            for r, revision in zip(to_resources, target_revisions)
+        ]
+        specification_digest = mapping_digest(self._mapping)
+        fingerprints = {}
+        changed_resources = []
+        for resource in resources:
+            if not resource.hasfilepath:
+                changed_resources.append(resource)
+                continue
+            path = resource.path
+            previous = [target.get(path) for target in target_fingerprints]
+            try:
+                fingerprint = source_fingerprint(path, specification_digest, previous[0])
+            except OSError:
+                changed_resources.append(resource)
+                continue
+            fingerprints[path] = fingerprint
+            if all(is_unchanged(fingerprint, target_previous) for target_previous in previous):
+                self._logger.msg.emit(
+                    f"<b>{self.name}</b>: {os.path.basename(path)} has not changed since last import. Skipping."
+                )
+                continue
+            changed_resources.append(resource)
+        return changed_resources, fingerprints
+
+    def _read_fingerprints(self):
+        """Reads fingerprints of imported source files from item's data directory.
+
+        Returns:
+            dict: mapping from target database to its revision and mapping from source file path to fingerprint
+        """
+        file_path = Path(self._data_dir, IMPORTER_FINGERPRINT_FILE_NAME)
+        if not file_path.exists():
+            return {}
+        with open(file_path) as fingerprint_file:
+            return json.load(fingerprint_file)
+
+    def _write_fingerprints(self, fingerprints, to_resources, previous_revisions, lock):
+        """Records fingerprints of successfully imported source files together with target databases' revisions.
+
+        Args:
+            fingerprints (dict): mapping from source file path to fingerprint
+            to_resources (list of ProjectItemResource): target database resources
+            previous_revisions (list of list): revisions of target databases before import
+            lock (Lock): lock that serializes writing to target databases
+        """
+        lock.acquire()
+        try:
+            revisions = [target_revision(resource.url) for resource in to_resources]
+        finally:
+            lock.release()
+        stored_fingerprints = self._read_fingerprints()
+        for resource, previous_revision, revision in zip(to_resources, previous_revisions, revisions):
+            key = _fingerprint_key(resource)
+            if revision is None:
+                stored_fingerprints.pop(key, None)
+                continue
+            sources = _valid_source_fingerprints(stored_fingerprints.get(key), previous_revision)
+            sources.update(fingerprints)
+            stored_fingerprints[key] = {"revision": revision, "sources": sources}
+        with open(Path(self._data_dir, IMPORTER_FINGERPRINT_FILE_NAME), "w") as fingerprint_file:
+            json.dump(stored_fingerprints, fingerprint_file)
 
     def _gams_system_directory(self):
         """Returns GAMS system path or None if GAMS default is to be used."""
@@ -131,4 +265,72 @@ class ExecutableItem(DBWriterExecutableItemBase):
         gams_path = app_settings.value("appSettings/gamsPath", defaultValue=None)
         cancel_on_error = item_dict["cancel_on_error"]
         on_conflict = item_dict["on_conflict"]
-        return cls(name, mapping, selected_files, gams_path, cancel_on_error, on_conflict, project_dir, logger)
+        import_process_count = item_dict.get("import_process_count", 1)
+        import_batch_size = item_dict.get("import_batch_size", 0)
+        commit_each_batch = item_dict.get("commit_each_batch", False)
+        memory_limit = item_dict.get("memory_limit", 0)
+        skip_unchanged = item_dict.get("skip_unchanged", False)
+        return cls(
+            name,
+            mapping,
+            selected_files,
+            gams_path,
+            cancel_on_error,
+            on_conflict,
+            project_dir,
+            logger,
+            import_process_count,
+            import_batch_size,
+            commit_each_batch,
+            memory_limit,
+            skip_unchanged,
+        )
+
+
+def _fingerprint_key(resource):
+    """Returns the key of target database in fingerprint file.
+
+    Args:
+        resource (ProjectItemResource): target database resource
+
+    Returns:
+        str: database URL without credentials and filters
+    """
+    return remove_credentials_from_url(clear_filter_configs(resource.url))
+
+
+def _valid_source_fingerprints(target_fingerprints, revision):
+    """Returns the source file fingerprints recorded for a target database if they are still valid.
+
+    Args:
+        target_fingerprints (dict, optional): recorded revision and source fingerprints of target database
+        revision (list, optional): current revision of target database
+
+    Returns:
+        dict: mapping from source file path to fingerprint
+    """
+    if revision is None or not target_fingerprints or target_fingerprints.get("revision") != revision:
+        return {}
+    return dict(target_fingerprints["sources"])
+
+
+def _clean_fingerprints(fingerprints, imported_resources, clean_sources):
+    """Drops fingerprints of source files whose import had errors.
+
+    Fingerprints of files that were skipped because they had not changed are kept.
+
+    Args:
+        fingerprints (dict): mapping from source file path to fingerprint
+        imported_resources (list of ProjectItemResource): resources that were imported
+        clean_sources (list of str): paths to source files that were imported without errors
+
+    Returns:
+        dict: mapping from source file path to fingerprint
+    """
+    clean_sources = set(clean_sources)
+    imported_paths = {resource.path for resource in imported_resources if resource.hasfilepath}
+    return {
+        path: fingerprint
+        for path, fingerprint in fingerprints.items()
+        if path not in imported_paths or path in clean_sources
+    }
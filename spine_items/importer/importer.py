@@ -17,7 +17,16 @@ from PySide6.QtCore import QModelIndex, Qt, Slot
 from spinetoolbox.helpers import create_dir
 from spinetoolbox.widgets.custom_menus import ItemSpecificationMenu
 from ..db_writer_item_base import DBWriterItemBase
-from ..commands import UpdateCancelOnErrorCommand, ChangeItemSelectionCommand, UpdateOnConflictCommand
+from ..commands import (
+    UpdateCancelOnErrorCommand,
+    ChangeItemSelectionCommand,
+    UpdateCommitEachBatchCommand,
+    UpdateImportBatchSizeCommand,
+    UpdateImportProcessCountCommand,
+    UpdateMemoryLimitCommand,
+    UpdateOnConflictCommand,
+    UpdateSkipUnchangedCommand,
+)
 from ..models import CheckableFileListModel
 from .executable_item import ExecutableItem
 from .item_info import ItemInfo
@@ -36,6 +45,11 @@ class Importer(DBWriterItemBase):
         cancel_on_error=True,
         on_conflict="merge",
         file_selection=None,
+        import_process_count=1,
+        import_batch_size=0,
+        commit_each_batch=False,
+        memory_limit=0,
+        skip_unchanged=False,
     ):
         """Importer class.
 
@@ -50,6 +64,12 @@ class Importer(DBWriterItemBase):
             cancel_on_error (bool): if True the item's execution will stop on import error
             on_conflict (str): how to handle conflicts between parallel importers
             file_selection (dict, optional): a map from label to a bool indicating if the file item is checked
+            import_process_count (int): maximum number of source files to read in parallel;
+                mapped data of each file being read is held in memory at once
+            import_batch_size (int): maximum number of items to write at once; 0 writes each source file at once
+            commit_each_batch (bool): if True, commits after each batch instead of once per source file
+            memory_limit (int): memory usage in megabytes that stops importing in batches; 0 for unlimited
+            skip_unchanged (bool): if True, source files that have not changed since their last import are skipped
         """
         super().__init__(name, description, x, y, project)
         # Make logs subdirectory for this item
@@ -67,6 +87,11 @@ class Importer(DBWriterItemBase):
             )
         self.cancel_on_error = cancel_on_error
         self.on_conflict = on_conflict
+        self.import_process_count = import_process_count
+        self.import_batch_size = import_batch_size
+        self.commit_each_batch = commit_each_batch
+        self.memory_limit = memory_limit
+        self.skip_unchanged = skip_unchanged
         self._file_model = CheckableFileListModel(header_label="Available resources")
         self._file_model.set_initial_state(file_selection if file_selection is not None else dict())
         self._file_model.checked_state_changed.connect(self._push_file_selection_change_to_undo_stack)
@@ -88,9 +113,14 @@ class Importer(DBWriterItemBase):
         s[self._properties_ui.treeView_files.doubleClicked] = self._handle_files_double_clicked
         s[self._properties_ui.comboBox_specification.textActivated] = self._change_specification
         s[self._properties_ui.cancel_on_error_checkBox.stateChanged] = self._handle_cancel_on_error_changed
+        s[self._properties_ui.skip_unchanged_check_box.stateChanged] = self._handle_skip_unchanged_changed
         s[self._properties_ui.radioButton_on_conflict_merge.clicked] = self._update_on_conflict
         s[self._properties_ui.radioButton_on_conflict_keep.clicked] = self._update_on_conflict
         s[self._properties_ui.radioButton_on_conflict_replace.clicked] = self._update_on_conflict
+        s[self._properties_ui.import_process_count_spin_box.valueChanged] = self._handle_import_process_count_changed
+        s[self._properties_ui.import_batch_size_spin_box.valueChanged] = self._handle_import_batch_size_changed
+        s[self._properties_ui.commit_each_batch_check_box.stateChanged] = self._handle_commit_each_batch_changed
+        s[self._properties_ui.memory_limit_spin_box.valueChanged] = self._handle_memory_limit_changed
         return s
 
     @Slot(str)
@@ -125,6 +155,27 @@ class Importer(DBWriterItemBase):
         self._properties_ui.cancel_on_error_checkBox.setCheckState(check_state)
         self._properties_ui.cancel_on_error_checkBox.blockSignals(False)
 
+    @Slot(int)
+    def _handle_skip_unchanged_changed(self, _state):
+        skip_unchanged = self._properties_ui.skip_unchanged_check_box.isChecked()
+        if self.skip_unchanged == skip_unchanged:
+            return
+        self._toolbox.undo_stack.push(UpdateSkipUnchangedCommand(self.name, skip_unchanged, self._project))
+
+    def set_skip_unchanged(self, skip_unchanged):
+        """Sets skip unchanged files setting.
+
+        Args:
+            skip_unchanged (bool): True to skip unchanged files
+        """
+        self.skip_unchanged = skip_unchanged
+        if not self._active:
+            return
+        check_state = Qt.CheckState.Checked if self.skip_unchanged else Qt.CheckState.Unchecked
+        self._properties_ui.skip_unchanged_check_box.blockSignals(True)
+        self._properties_ui.skip_unchanged_check_box.setCheckState(check_state)
+        self._properties_ui.skip_unchanged_check_box.blockSignals(False)
+
     def _on_conflict(self):
         """Reads the on_conflict strategy from UI."""
         strategies = {
@@ -160,12 +211,108 @@ class Importer(DBWriterItemBase):
             return
         self._set_on_conflict()
 
+    @Slot(int)
+    def _handle_import_process_count_changed(self, count):
+        if self.import_process_count == count:
+            return
+        self._toolbox.undo_stack.push(UpdateImportProcessCountCommand(self.name, count, self._project))
+
+    def set_import_process_count(self, count):
+        """Sets the number of parallel source reading processes.
+
+        Args:
+            count (int): process count
+        """
+        self.import_process_count = count
+        if not self._active:
+            return
+        self._properties_ui.import_process_count_spin_box.blockSignals(True)
+        self._properties_ui.import_process_count_spin_box.setValue(count)
+        self._properties_ui.import_process_count_spin_box.blockSignals(False)
+
+    @Slot(int)
+    def _handle_import_batch_size_changed(self, batch_size):
+        if self.import_batch_size == batch_size:
+            return
+        self._toolbox.undo_stack.push(UpdateImportBatchSizeCommand(self.name, batch_size, self._project))
+
+    def set_import_batch_size(self, batch_size):
+        """Sets import batch size.
+
+        Args:
+            batch_size (int): batch size; 0 disables batching
+        """
+        self.import_batch_size = batch_size
+        if not self._active:
+            return
+        self._properties_ui.import_batch_size_spin_box.blockSignals(True)
+        self._properties_ui.import_batch_size_spin_box.setValue(batch_size)
+        self._properties_ui.import_batch_size_spin_box.blockSignals(False)
+        self._update_batch_widgets_enabled()
+
+    @Slot(int)
+    def _handle_commit_each_batch_changed(self, _state):
+        commit_each_batch = self._properties_ui.commit_each_batch_check_box.isChecked()
+        if self.commit_each_batch == commit_each_batch:
+            return
+        self._toolbox.undo_stack.push(UpdateCommitEachBatchCommand(self.name, commit_each_batch, self._project))
+
+    def set_commit_each_batch(self, commit_each_batch):
+        """Sets commit after each batch setting.
+
+        Args:
+            commit_each_batch (bool): True to commit after each batch
+        """
+        self.commit_each_batch = commit_each_batch
+        if not self._active:
+            return
+        check_state = Qt.CheckState.Checked if self.commit_each_batch else Qt.CheckState.Unchecked
+        self._properties_ui.commit_each_batch_check_box.blockSignals(True)
+        self._properties_ui.commit_each_batch_check_box.setCheckState(check_state)
+        self._properties_ui.commit_each_batch_check_box.blockSignals(False)
+
+    @Slot(int)
+    def _handle_memory_limit_changed(self, memory_limit):
+        if self.memory_limit == memory_limit:
+            return
+        self._toolbox.undo_stack.push(UpdateMemoryLimitCommand(self.name, memory_limit, self._project))
+
+    def set_memory_limit(self, memory_limit):
+        """Sets memory limit.
+
+        Args:
+            memory_limit (int): memory limit in megabytes; 0 for unlimited
+        """
+        self.memory_limit = memory_limit
+        if not self._active:
+            return
+        self._properties_ui.memory_limit_spin_box.blockSignals(True)
+        self._properties_ui.memory_limit_spin_box.setValue(memory_limit)
+        self._properties_ui.memory_limit_spin_box.blockSignals(False)
+
+    def _update_batch_widgets_enabled(self):
+        """Enables batch import settings only when batching is on."""
+        batching = self.import_batch_size > 0
+        self._properties_ui.commit_each_batch_check_box.setEnabled(batching)
+        self._properties_ui.memory_limit_spin_box.setEnabled(batching)
+        self._properties_ui.import_process_count_spin_box.setEnabled(not batching)
+
     def restore_selections(self):
         """Restores selections into shared widgets when this project item is selected."""
         self._properties_ui.cancel_on_error_checkBox.setCheckState(
             Qt.CheckState.Checked if self.cancel_on_error else Qt.CheckState.Unchecked
         )
+        self._properties_ui.skip_unchanged_check_box.setCheckState(
+            Qt.CheckState.Checked if self.skip_unchanged else Qt.CheckState.Unchecked
+        )
         self._set_on_conflict()
+        self._properties_ui.import_process_count_spin_box.setValue(self.import_process_count)
+        self._properties_ui.import_batch_size_spin_box.setValue(self.import_batch_size)
+        self._properties_ui.commit_each_batch_check_box.setCheckState(
+            Qt.CheckState.Checked if self.commit_each_batch else Qt.CheckState.Unchecked
+        )
+        self._properties_ui.memory_limit_spin_box.setValue(self.memory_limit)
+        self._update_batch_widgets_enabled()
         self._properties_ui.treeView_files.setModel(self._file_model)
         self._update_ui()
 
@@ -285,6 +432,11 @@ class Importer(DBWriterItemBase):
             d["specification"] = self.specification().name
         d["cancel_on_error"] = self.cancel_on_error
         d["on_conflict"] = self.on_conflict
+        d["import_process_count"] = self.import_process_count
+        d["import_batch_size"] = self.import_batch_size
+        d["commit_each_batch"] = self.commit_each_batch
+        d["memory_limit"] = self.memory_limit
+        d["skip_unchanged"] = self.skip_unchanged
         selections = list()
         for row in range(self._file_model.rowCount()):
             label, selected = self._file_model.checked_data(self._file_model.index(row, 0))
@@ -300,8 +452,27 @@ class Importer(DBWriterItemBase):
         cancel_on_error = item_dict.get("cancel_on_error", False)
         on_conflict = item_dict.get("on_conflict", "merge")
         file_selection = {label: selected for label, selected in item_dict.get("file_selection", list())}
+        import_process_count = item_dict.get("import_process_count", 1)
+        import_batch_size = item_dict.get("import_batch_size", 0)
+        commit_each_batch = item_dict.get("commit_each_batch", False)
+        memory_limit = item_dict.get("memory_limit", 0)
+        skip_unchanged = item_dict.get("skip_unchanged", False)
         return Importer(
-            name, description, x, y, toolbox, project, specification_name, cancel_on_error, on_conflict, file_selection
+            name,
+            description,
+            x,
+            y,
+            toolbox,
+            project,
+            specification_name,
+            cancel_on_error,
+            on_conflict,
+            file_selection,
+            import_process_count,
+            import_batch_size,
+            commit_each_batch,
+            memory_limit,
+            skip_unchanged,
         )
 
     def notify_destination(self, source_item):
@@ -28,8 +28,8 @@ from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
     QPalette, QPixmap, QRadialGradient, QTransform)
 from PySide6.QtWidgets import (QApplication, QCheckBox, QComboBox, QFrame,
     QHBoxLayout, QHeaderView, QLabel, QRadioButton,
-    QSizePolicy, QToolButton, QTreeView, QVBoxLayout,
-    QWidget)
+    QSizePolicy, QSpacerItem, QSpinBox, QToolButton,
+    QTreeView, QVBoxLayout, QWidget)
 from spine_items import resources_icons_rc
 
 class Ui_Form(object):
@@ -96,6 +96,11 @@ class Ui_Form(object):
 
         self.verticalLayout_2.addWidget(self.cancel_on_error_checkBox)
 
+        self.skip_unchanged_check_box = QCheckBox(self.frame)
+        self.skip_unchanged_check_box.setObjectName(u"skip_unchanged_check_box")
+
+        self.verticalLayout_2.addWidget(self.skip_unchanged_check_box)
+
         self.label = QLabel(self.frame)
         self.label.setObjectName(u"label")
 
@@ -121,15 +126,88 @@ class Ui_Form(object):
 
         self.verticalLayout_2.addLayout(self.horizontalLayout)
 
+        self.horizontalLayout_2 = QHBoxLayout()
+        self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
+        self.import_process_count_label = QLabel(self.frame)
+        self.import_process_count_label.setObjectName(u"import_process_count_label")
+
+        self.horizontalLayout_2.addWidget(self.import_process_count_label)
+
+        self.import_process_count_spin_box = QSpinBox(self.frame)
+        self.import_process_count_spin_box.setObjectName(u"import_process_count_spin_box")
+        self.import_process_count_spin_box.setMinimum(1)
+        self.import_process_count_spin_box.setMaximum(64)
+
+        self.horizontalLayout_2.addWidget(self.import_process_count_spin_box)
+
+        self.horizontalSpacer = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_2.addItem(self.horizontalSpacer)
+
+
+        self.verticalLayout_2.addLayout(self.horizontalLayout_2)
+
+        self.horizontalLayout_3 = QHBoxLayout()
+        self.horizontalLayout_3.setObjectName(u"horizontalLayout_3")
+        self.import_batch_size_label = QLabel(self.frame)
+        self.import_batch_size_label.setObjectName(u"import_batch_size_label")
+
+        self.horizontalLayout_3.addWidget(self.import_batch_size_label)
+
+        self.import_batch_size_spin_box = QSpinBox(self.frame)
+        self.import_batch_size_spin_box.setObjectName(u"import_batch_size_spin_box")
+        self.import_batch_size_spin_box.setMaximum(100000000)
+        self.import_batch_size_spin_box.setSingleStep(1000)
+
+        self.horizontalLayout_3.addWidget(self.import_batch_size_spin_box)
+
+        self.horizontalSpacer_2 = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_3.addItem(self.horizontalSpacer_2)
+
+
+        self.verticalLayout_2.addLayout(self.horizontalLayout_3)
+
+        self.commit_each_batch_check_box = QCheckBox(self.frame)
+        self.commit_each_batch_check_box.setObjectName(u"commit_each_batch_check_box")
+
+        self.verticalLayout_2.addWidget(self.commit_each_batch_check_box)
+
+        self.horizontalLayout_4 = QHBoxLayout()
+        self.horizontalLayout_4.setObjectName(u"horizontalLayout_4")
+        self.memory_limit_label = QLabel(self.frame)
+        self.memory_limit_label.setObjectName(u"memory_limit_label")
+
+        self.horizontalLayout_4.addWidget(self.memory_limit_label)
+
+        self.memory_limit_spin_box = QSpinBox(self.frame)
+        self.memory_limit_spin_box.setObjectName(u"memory_limit_spin_box")
+        self.memory_limit_spin_box.setMaximum(1048576)
+        self.memory_limit_spin_box.setSingleStep(256)
+
+        self.horizontalLayout_4.addWidget(self.memory_limit_spin_box)
+
+        self.horizontalSpacer_3 = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_4.addItem(self.horizontalSpacer_3)
+
+
+        self.verticalLayout_2.addLayout(self.horizontalLayout_4)
+
 
         self.verticalLayout.addWidget(self.frame)
 
         QWidget.setTabOrder(self.comboBox_specification, self.toolButton_edit_specification)
         QWidget.setTabOrder(self.toolButton_edit_specification, self.treeView_files)
         QWidget.setTabOrder(self.treeView_files, self.cancel_on_error_checkBox)
-        QWidget.setTabOrder(self.cancel_on_error_checkBox, self.radioButton_on_conflict_keep)
+        QWidget.setTabOrder(self.cancel_on_error_checkBox, self.skip_unchanged_check_box)
+        QWidget.setTabOrder(self.skip_unchanged_check_box, self.radioButton_on_conflict_keep)
         QWidget.setTabOrder(self.radioButton_on_conflict_keep, self.radioButton_on_conflict_replace)
         QWidget.setTabOrder(self.radioButton_on_conflict_replace, self.radioButton_on_conflict_merge)
+        QWidget.setTabOrder(self.radioButton_on_conflict_merge, self.import_process_count_spin_box)
+        QWidget.setTabOrder(self.import_process_count_spin_box, self.import_batch_size_spin_box)
+        QWidget.setTabOrder(self.import_batch_size_spin_box, self.commit_each_batch_check_box)
+        QWidget.setTabOrder(self.commit_each_batch_check_box, self.memory_limit_spin_box)
 
         self.retranslateUi(Form)
 
@@ -149,9 +227,31 @@ class Ui_Form(object):
         self.cancel_on_error_checkBox.setToolTip(QCoreApplication.translate("Form", u"If there are any errors when trying to import data cancel the whole import.", None))
 #endif // QT_CONFIG(tooltip)
         self.cancel_on_error_checkBox.setText(QCoreApplication.translate("Form", u"Cancel import on error", None))
+#if QT_CONFIG(tooltip)
+        self.skip_unchanged_check_box.setToolTip(QCoreApplication.translate("Form", u"Do not import files that have not changed since they were last imported into the same database.", None))
+#endif // QT_CONFIG(tooltip)
+        self.skip_unchanged_check_box.setText(QCoreApplication.translate("Form", u"Skip unchanged files", None))
         self.label.setText(QCoreApplication.translate("Form", u"If values already exist", None))
         self.radioButton_on_conflict_keep.setText(QCoreApplication.translate("Form", u"Keep existing", None))
         self.radioButton_on_conflict_replace.setText(QCoreApplication.translate("Form", u"Replace", None))
         self.radioButton_on_conflict_merge.setText(QCoreApplication.translate("Form", u"Merge indexes", None))
+        self.import_process_count_label.setText(QCoreApplication.translate("Form", u"Parallel reads:", None))
+#if QT_CONFIG(tooltip)
+        self.import_process_count_spin_box.setToolTip(QCoreApplication.translate("Form", u"Maximum number of source files to read simultaneously in separate processes. Each process sends the whole mapped content of its file back at once, so memory usage grows with the count.", None))
+#endif // QT_CONFIG(tooltip)
+        self.import_batch_size_label.setText(QCoreApplication.translate("Form", u"Import batch size:", None))
+#if QT_CONFIG(tooltip)
+        self.import_batch_size_spin_box.setToolTip(QCoreApplication.translate("Form", u"Maximum number of items to write to the database at once. Off writes each source file at once.", None))
+#endif // QT_CONFIG(tooltip)
+        self.import_batch_size_spin_box.setSpecialValueText(QCoreApplication.translate("Form", u"Off", None))
+#if QT_CONFIG(tooltip)
+        self.commit_each_batch_check_box.setToolTip(QCoreApplication.translate("Form", u"Commit after each batch instead of once per source file. Otherwise, target databases stay locked until the whole file has been imported.", None))
+#endif // QT_CONFIG(tooltip)
+        self.commit_each_batch_check_box.setText(QCoreApplication.translate("Form", u"Commit after each batch", None))
+        self.memory_limit_label.setText(QCoreApplication.translate("Form", u"Memory limit (MB):", None))
+#if QT_CONFIG(tooltip)
+        self.memory_limit_spin_box.setToolTip(QCoreApplication.translate("Form", u"Stop importing in batches if the import process uses more memory than this. Memory usage is checked after each mapping.", None))
+#endif // QT_CONFIG(tooltip)
+        self.memory_limit_spin_box.setSpecialValueText(QCoreApplication.translate("Form", u"None", None))
     # retranslateUi
 
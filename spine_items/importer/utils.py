@@ -0,0 +1,116 @@
+######################################################################################################################
+# Copyright (C) 2017-2022 Spine project consortium
+# Copyright Spine Items contributors
+# This file is part of Spine Items.
+# Spine Items is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+
+"""Contains utilities for Importer."""
+import hashlib
+import json
+import os
+from spinedb_api import clear_filter_configs, DatabaseMapping, SpineDBAPIError
+from ..utils import database_revision
+
+IMPORTER_FINGERPRINT_FILE_NAME = ".import-fingerprints.json"
+"""Name of the file that records fingerprints of imported source files."""
+_HASH_BLOCK_SIZE = 1024 * 1024
+
+
+def mapping_digest(mapping):
+    """Computes a digest that changes whenever import mapping changes.
+
+    Args:
+        mapping (dict): import mapping
+
+    Returns:
+        str: digest
+    """
+    serialized = json.dumps(mapping, sort_keys=True, default=str)
+    return hashlib.sha1(serialized.encode("utf-8")).hexdigest()
+
+
+def source_fingerprint(path, specification_digest, previous=None):
+    """Computes a fingerprint of a source file.
+
+    The fingerprint consists of file's size, modification time, content hash and import specification's digest.
+    Content hash is taken from the previous fingerprint if file's size and modification time have not changed.
+
+    Args:
+        path (str): path to source file
+        specification_digest (str): digest of import mapping
+        previous (dict, optional): previous fingerprint of the file
+
+    Returns:
+        dict: fingerprint
+    """
+    stat = os.stat(path)
+    fingerprint = {"size": stat.st_size, "mtime": stat.st_mtime_ns, "specification": specification_digest}
+    if (
+        previous is not None
+        and previous.get("size") == fingerprint["size"]
+        and previous.get("mtime") == fingerprint["mtime"]
+        and "content" in previous
+    ):
+        fingerprint["content"] = previous["content"]
+    else:
+        fingerprint["content"] = _file_digest(path)
+    return fingerprint
+
+
+def is_unchanged(fingerprint, previous):
+    """Checks if source file and import specification are the same as when the previous fingerprint was taken.
+
+    Modification time is ignored since touching a file does not change its contents.
+
+    Args:
+        fingerprint (dict): current fingerprint
+        previous (dict, optional): previous fingerprint
+
+    Returns:
+        bool: True if file is unchanged, False otherwise
+    """
+    if previous is None:
+        return False
+    return all(fingerprint[key] == previous.get(key) for key in ("size", "content", "specification"))
+
+
+def target_revision(url):
+    """Reads the revision of a target database.
+
+    Revision identifies both the database and its latest commit,
+    so it changes when the database is purged, modified by others or recreated.
+
+    Args:
+        url (str): database URL
+
+    Returns:
+        list: id and date of the latest commit, or None if the database could not be read
+    """
+    try:
+        with DatabaseMapping(clear_filter_configs(url)) as db_map:
+            revision = database_revision(db_map)
+    except SpineDBAPIError:
+        return None
+    return list(revision) if revision is not None else None
+
+
+def _file_digest(path):
+    """Hashes file contents.
+
+    Args:
+        path (str): path to file
+
+    Returns:
+        str: digest
+    """
+    digest = hashlib.sha1()
+    with open(path, "rb") as input_file:
+        for block in iter(lambda: input_file.read(_HASH_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
@@ -20,7 +20,6 @@ from spinedb_api.helpers import remove_credentials_from_url
 from spinetoolbox.project_item.specification_editor_window import SpecificationEditorWindowBase
 from spinetoolbox.helpers import get_open_file_name_in_last_dir
 from spinetoolbox.config import APPLICATION_PATH
-from spinedb_api.spine_io.importers.csv_reader import CSVConnector
 from spinedb_api.spine_io.importers.excel_reader import ExcelConnector
 from spinedb_api.spine_io.importers.gdx_connector import GdxConnector
 from spinedb_api.spine_io.importers.json_reader import JSONConnector
@@ -28,6 +27,7 @@ from spinedb_api.spine_io.importers.datapackage_reader import DataPackageConnect
 from spinedb_api.spine_io.importers.sqlalchemy_connector import SqlAlchemyConnector
 from spinedb_api.spine_io.importers.reader import SourceConnection
 from spinedb_api.spine_io.gdx_utils import find_gams_directory
+from ..csv_connector import CSVConnector
 from ..connection_manager import ConnectionManager
 from ..commands import RestoreMappingsFromDict
 from .import_sources import ImportSources
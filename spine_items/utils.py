@@ -11,15 +11,22 @@
 ######################################################################################################################
 
 """ Contains utilities shared between project items. """
+import gzip
+import io
 import os.path
+import sys
 from contextlib import suppress
 from sqlalchemy import create_engine
 from sqlalchemy.engine.url import URL, make_url
 import spinedb_api
+from spinedb_api import SpineDBAPIError
 from spinedb_api.filters.scenario_filter import scenario_name_from_dict
 from spine_engine.utils.queue_logger import SuppressedMessage
 from spinedb_api.helpers import remove_credentials_from_url, SUPPORTED_DIALECTS, UNSUPPORTED_DIALECTS
 
+COMPRESSED_FILE_SUFFIXES = {"gzip": "gz", "zstd": "zst"}
+"""Mapping from compression codec to file name suffix of compressed text files."""
+
 
 class URLError(Exception):
     """Exception for errors in URL dicts."""
@@ -154,6 +161,38 @@ class _NoLogger:
         return SuppressedMessage()
 
 
+class _RecordedMessage:
+    def __init__(self, signal_name, messages):
+        self._signal_name = signal_name
+        self._messages = messages
+
+    def emit(self, *args):
+        self._messages.append((self._signal_name, args))
+
+
+class RecordingLogger:
+    """A picklable logger that records emitted messages so they can be replayed in another process."""
+
+    def __init__(self):
+        self.messages = []
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return _RecordedMessage(name, self.messages)
+
+
+def replay_messages(messages, logger):
+    """Emits messages recorded by :class:`RecordingLogger` using given logger.
+
+    Args:
+        messages (list of tuple): recorded messages
+        logger (LoggerInterface): a logger
+    """
+    for signal_name, args in messages:
+        getattr(logger, signal_name).emit(*args)
+
+
 def split_url_credentials(url):
     """Pops username and password information from URL.
 
@@ -242,3 +281,110 @@ def escape_backward_slashes(string):
         str: escaped string
     """
     return string.replace("\\", "\\\\")
+
+
+def compression_from_file_name(file_name):
+    """Figures out file's compression codec from its name.
+
+    Args:
+        file_name (str or Path): file name or path
+
+    Returns:
+        str: compression codec or None if file is not compressed
+    """
+    _, separator, suffix = str(file_name).rpartition(".")
+    if not separator:
+        return None
+    for compression, compressed_suffix in COMPRESSED_FILE_SUFFIXES.items():
+        if suffix == compressed_suffix:
+            return compression
+    return None
+
+
+def strip_compression_suffix(file_name):
+    """Removes compressed file suffix from file name.
+
+    Args:
+        file_name (str): file name
+
+    Returns:
+        str: file name without the compression suffix
+    """
+    if compression_from_file_name(file_name) is None:
+        return file_name
+    return file_name.rpartition(".")[0]
+
+
+def open_file(path, mode="r", encoding=None, newline=None):
+    """Opens a file compressing or decompressing it transparently if its suffix says it is compressed.
+
+    Zstandard compression requires the ``zstandard`` package.
+
+    Args:
+        path (str or Path): path to file
+        mode (str): file mode; supports reading, writing and appending in text or binary mode
+        encoding (str, optional): text encoding
+        newline (str, optional): newline handling in text mode
+
+    Returns:
+        IO: file object
+    """
+    compression = compression_from_file_name(path)
+    if compression is None:
+        return open(path, mode, encoding=encoding, newline=newline)
+    binary = "b" in mode
+    if compression == "gzip":
+        if binary:
+            return gzip.open(path, mode)
+        return gzip.open(path, mode.replace("t", "") + "t", encoding=encoding, newline=newline)
+    import zstandard  # pylint: disable=import-outside-toplevel
+
+    if mode.replace("t", "").replace("b", "") == "r":
+        # Appending writes a new frame; read across frames to get all of the data.
+        reader = zstandard.ZstdDecompressor().stream_reader(open(path, "rb"), read_across_frames=True)
+        if binary:
+            return reader
+        return io.TextIOWrapper(reader, encoding=encoding, newline=newline)
+    if binary:
+        return zstandard.open(path, mode)
+    return zstandard.open(path, mode, encoding=encoding, newline=newline)
+
+
+def process_memory_usage():
+    """Returns the resident memory size of current process.
+
+    On Linux, the current size is read from ``/proc``.
+    Other POSIX systems report the peak size instead.
+
+    Returns:
+        int: memory usage in bytes or None if it cannot be determined on this platform
+    """
+    with suppress(OSError, ValueError, IndexError, AttributeError):
+        with open("/proc/self/statm") as statm:
+            resident_pages = int(statm.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE")
+    try:
+        import resource  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def database_revision(db_map):
+    """Returns an identifier for the latest committed state of a database.
+
+    Args:
+        db_map (DatabaseMapping): database map
+
+    Returns:
+        tuple: id and date of the latest commit, or None if it could not be determined
+    """
+    try:
+        commit_sq = db_map.commit_sq
+        last_commit = db_map.query(commit_sq.c.id, commit_sq.c.date).order_by(commit_sq.c.id.desc()).first()
+    except SpineDBAPIError:
+        return None
+    if last_commit is None:
+        return None
+    return last_commit.id, str(last_commit.date)
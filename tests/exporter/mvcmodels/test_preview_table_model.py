@@ -0,0 +1,75 @@
+######################################################################################################################
+# Copyright (C) 2017-2022 Spine project consortium
+# Copyright Spine Items contributors
+# This file is part of Spine Items.
+# Spine Items is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+
+"""Unit tests for export preview table model."""
+import unittest
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QColor
+from PySide6.QtWidgets import QApplication
+from spine_items.exporter.mvcmodels.preview_table_model import PreviewTableModel
+
+
+class TestPreviewTableModel(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        if not QApplication.instance():
+            QApplication()
+
+    def setUp(self):
+        self._model = PreviewTableModel()
+
+    def tearDown(self):
+        self._model.deleteLater()
+
+    def test_small_table_is_fetched_at_once(self):
+        self._model.reset("mapping", "table", [["a", "b"], ["c"]], {})
+        self.assertEqual(self._model.rowCount(), 2)
+        self.assertEqual(self._model.columnCount(), 2)
+        self.assertFalse(self._model.canFetchMore())
+        self.assertEqual(self._model.index(1, 0).data(), "c")
+        self.assertIsNone(self._model.index(1, 1).data())
+
+    def test_large_table_is_fetched_in_batches(self):
+        batch_size = PreviewTableModel.FETCH_BATCH_SIZE
+        table = [[i] for i in range(batch_size)] + [[i, i] for i in range(batch_size + 1)]
+        self._model.reset("mapping", "table", table, {})
+        self.assertEqual(self._model.rowCount(), batch_size)
+        self.assertEqual(self._model.columnCount(), 1)
+        self.assertTrue(self._model.canFetchMore())
+        self._model.fetchMore()
+        self.assertEqual(self._model.rowCount(), 2 * batch_size)
+        self.assertEqual(self._model.columnCount(), 2)
+        self._model.fetchMore()
+        self.assertEqual(self._model.rowCount(), len(table))
+        self.assertFalse(self._model.canFetchMore())
+
+    def test_column_count_is_limited(self):
+        self._model.reset("mapping", "table", [list(range(PreviewTableModel.MAX_COLUMNS + 1))], {})
+        self.assertEqual(self._model.columnCount(), PreviewTableModel.MAX_COLUMNS)
+
+    def test_clear(self):
+        table = [["a"]]
+        self._model.reset("mapping", "table", table, {})
+        self._model.clear()
+        self.assertEqual(self._model.rowCount(), 0)
+        self.assertEqual(self._model.columnCount(), 0)
+        self.assertEqual(table, [["a"]])
+
+    def test_cells_are_colored_by_mapping_position(self):
+        red = QColor(Qt.GlobalColor.red)
+        self._model.reset("mapping", "table", [["a", "b"]], {0: red})
+        self.assertEqual(self._model.index(0, 0).data(Qt.ItemDataRole.BackgroundRole), red)
+        self.assertIsNone(self._model.index(0, 1).data(Qt.ItemDataRole.BackgroundRole))
+
+
+if __name__ == "__main__":
+    unittest.main()
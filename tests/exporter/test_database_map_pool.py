@@ -0,0 +1,105 @@
+######################################################################################################################
+# Copyright (C) 2017-2022 Spine project consortium
+# Copyright Spine Items contributors
+# This file is part of Spine Items.
+# Spine Items is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+
+"""Unit tests for the ``database_map_pool`` module."""
+import os
+import os.path
+from tempfile import TemporaryDirectory
+import unittest
+from unittest import mock
+from spinedb_api import DatabaseMapping, import_object_classes
+from spine_items.exporter.database_map_pool import DatabaseMapPool
+
+
+class TestDatabaseMapPool(unittest.TestCase):
+    def setUp(self):
+        self._temp_dir = TemporaryDirectory()
+        self._path = os.path.join(self._temp_dir.name, "db.sqlite")
+        self._url = "sqlite:///" + self._path
+        with DatabaseMapping(self._url, create=True) as db_map:
+            import_object_classes(db_map, ("oc",))
+            db_map.commit_session("Add test data.")
+
+    def tearDown(self):
+        self._temp_dir.cleanup()
+
+    def test_released_map_is_reused(self):
+        pool = DatabaseMapPool()
+        db_map = pool.acquire(self._url)
+        pool.release(db_map)
+        self.assertIs(pool.acquire(self._url), db_map)
+
+    def test_simultaneous_borrowers_get_different_maps(self):
+        pool = DatabaseMapPool()
+        db_map1 = pool.acquire(self._url)
+        db_map2 = pool.acquire(self._url)
+        self.assertIsNot(db_map1, db_map2)
+        pool.release(db_map1)
+        pool.release(db_map2)
+        pool.close()
+
+    def test_map_is_not_reused_after_file_changes(self):
+        pool = DatabaseMapPool()
+        db_map = pool.acquire(self._url)
+        pool.release(db_map)
+        stat = os.stat(self._path)
+        os.utime(self._path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000000))
+        new_db_map = pool.acquire(self._url)
+        self.assertIsNot(new_db_map, db_map)
+        self.assertTrue(db_map.closed)
+        pool.release(new_db_map)
+
+    def test_map_is_not_reused_after_new_commits_when_there_is_no_database_file(self):
+        pool = DatabaseMapPool()
+        with mock.patch("spine_items.exporter.database_map_pool._file_signature") as file_signature:
+            file_signature.return_value = None
+            db_map = pool.acquire(self._url)
+            pool.release(db_map)
+            self.assertIs(pool.acquire(self._url), db_map)
+            pool.release(db_map)
+            with DatabaseMapping(self._url) as writing_db_map:
+                import_object_classes(writing_db_map, ("another_oc",))
+                writing_db_map.commit_session("Add more data.")
+            new_db_map = pool.acquire(self._url)
+            self.assertIsNot(new_db_map, db_map)
+            self.assertTrue(db_map.closed)
+            pool.release(new_db_map)
+        pool.close()
+
+    def test_map_that_is_not_reusable_gets_closed(self):
+        pool = DatabaseMapPool()
+        db_map = pool.acquire(self._url)
+        pool.release(db_map, reusable=False)
+        self.assertTrue(db_map.closed)
+        self.assertIsNot(pool.acquire(self._url), db_map)
+
+    def test_excess_idle_maps_are_closed(self):
+        pool = DatabaseMapPool(max_idle_maps=1)
+        db_map1 = pool.acquire(self._url)
+        db_map2 = pool.acquire(self._url)
+        pool.release(db_map1)
+        pool.release(db_map2)
+        self.assertFalse(db_map1.closed)
+        self.assertTrue(db_map2.closed)
+        pool.close()
+        self.assertTrue(db_map1.closed)
+
+    def test_maps_released_after_close_are_closed(self):
+        pool = DatabaseMapPool()
+        db_map = pool.acquire(self._url)
+        pool.close()
+        pool.release(db_map)
+        self.assertTrue(db_map.closed)
+
+
+if __name__ == "__main__":
+    unittest.main()
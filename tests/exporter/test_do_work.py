@@ -12,17 +12,35 @@
 
 """Unit tests for Exporter's :func:`do_work` function."""
 from csv import reader
+import gzip
 import os.path
 import sqlite3
 from tempfile import TemporaryDirectory
 import unittest
-from unittest.mock import MagicMock
-from spinedb_api import DatabaseMapping, import_object_classes, import_objects
+from unittest.mock import MagicMock, patch
+from openpyxl import load_workbook
+from spinedb_api import (
+    DatabaseMapping,
+    import_alternatives,
+    import_entity_alternatives,
+    import_object_classes,
+    import_objects,
+    import_scenario_alternatives,
+    import_scenarios,
+)
 from spinedb_api.export_mapping.export_mapping import FixedValueMapping
 from spinedb_api.export_mapping.group_functions import NoGroup
-from spinedb_api.export_mapping import entity_export
-from spine_items.exporter.do_work import do_work
-from spine_items.exporter.specification import OutputFormat, Specification, MappingSpecification, MappingType
+from spinedb_api.export_mapping import alternative_export, entity_export, scenario_export
+from spinedb_api.filters.scenario_filter import scenario_filter_config
+from spinedb_api.filters.tools import append_filter_config
+from spine_items.exporter.do_work import _export_in_parallel, _split_database_groups, do_work
+from spine_items.exporter.specification import (
+    ExcelMode,
+    OutputFormat,
+    Specification,
+    MappingSpecification,
+    MappingType,
+)
 from spinedb_api.mapping import Position
 
 
@@ -59,6 +77,269 @@ class TestWithCsvWriter(unittest.TestCase):
         expected = [["oc1", "o11"], ["oc1", "o12"], ["oc2", "o21"], ["oc2", "o22"], ["oc2", "o23"]]
         self.assertEqual(table, expected)
 
+    def test_export_databases_in_parallel(self):
+        second_url = "sqlite:///" + os.path.join(self._temp_dir.name, "second_db.sqlite")
+        with DatabaseMapping(second_url, create=True) as db_map:
+            import_object_classes(db_map, ("oc3",))
+            import_objects(db_map, (("oc3", "o31"),))
+            db_map.commit_session("Add test data.")
+        root_mapping = entity_export(entity_class_position=0, entity_position=1)
+        mapping_specification = MappingSpecification(
+            MappingType.entities, True, True, NoGroup.NAME, False, root_mapping
+        )
+        specification = Specification("name", "description", {"mapping": mapping_specification})
+        databases = {self._url: "first_parallel.csv", second_url: "second_parallel.csv"}
+        logger = MagicMock()
+        success, written_files, metrics = do_work(
+            None,
+            specification.to_dict(),
+            False,
+            False,
+            "",
+            self._temp_dir.name,
+            databases,
+            {},
+            "",
+            "",
+            logger,
+            2,
+        )
+        self.assertTrue(success)
+        self.assertEqual(list(metrics), ["first_parallel.csv", "second_parallel.csv"])
+        self.assertEqual([m["rows"] for m in metrics["first_parallel.csv"]], [5])
+        self.assertEqual([m["rows"] for m in metrics["second_parallel.csv"]], [1])
+        first_path = os.path.join(self._temp_dir.name, "first_parallel.csv")
+        second_path = os.path.join(self._temp_dir.name, "second_parallel.csv")
+        self.assertEqual(written_files, {"first_parallel.csv": {first_path}, "second_parallel.csv": {second_path}})
+        with open(first_path) as input_:
+            table = [row for row in reader(input_)]
+        self.assertEqual(table, [["oc1", "o11"], ["oc1", "o12"], ["oc2", "o21"], ["oc2", "o22"], ["oc2", "o23"]])
+        with open(second_path) as input_:
+            table = [row for row in reader(input_)]
+        self.assertEqual(table, [["oc3", "o31"]])
+        self.assertEqual(logger.msg_success.emit.call_count, 2)
+
+    def test_export_scenarios_through_single_database_map(self):
+        scenario_url = "sqlite:///" + os.path.join(self._temp_dir.name, "scenario_db.sqlite")
+        with DatabaseMapping(scenario_url, create=True) as db_map:
+            import_alternatives(db_map, ("alt1", "alt2"))
+            import_scenarios(db_map, (("scen1", False), ("scen2", False)))
+            import_scenario_alternatives(db_map, (("scen1", "alt1"), ("scen2", "alt2")))
+            db_map.commit_session("Add test data.")
+        root_mapping = alternative_export(0)
+        mapping_specification = MappingSpecification(
+            MappingType.alternatives, True, True, NoGroup.NAME, False, root_mapping
+        )
+        specification = Specification("name", "description", {"mapping": mapping_specification})
+        first_url = append_filter_config(scenario_url, scenario_filter_config("scen1"))
+        second_url = append_filter_config(scenario_url, scenario_filter_config("scen2"))
+        databases = {first_url: "scen1.csv", second_url: "scen2.csv"}
+        logger = MagicMock()
+        with patch("spine_items.exporter.do_work.DatabaseMapping", wraps=DatabaseMapping) as database_mapping:
+            success, written_files, _ = do_work(
+                None, specification.to_dict(), False, False, "", self._temp_dir.name, databases, {}, "", "", logger
+            )
+        self.assertTrue(success)
+        self.assertEqual(database_mapping.call_count, 1)
+        first_path = os.path.join(self._temp_dir.name, "scen1.csv")
+        second_path = os.path.join(self._temp_dir.name, "scen2.csv")
+        self.assertEqual(written_files, {"scen1.csv": {first_path}, "scen2.csv": {second_path}})
+        with open(first_path) as input_:
+            self.assertEqual([row for row in reader(input_)], [["alt1"]])
+        with open(second_path) as input_:
+            self.assertEqual([row for row in reader(input_)], [["alt2"]])
+
+    def test_export_scenarios_of_single_database_in_parallel(self):
+        scenario_url = "sqlite:///" + os.path.join(self._temp_dir.name, "parallel_scenario_db.sqlite")
+        with DatabaseMapping(scenario_url, create=True) as db_map:
+            import_alternatives(db_map, ("alt1", "alt2"))
+            import_scenarios(db_map, (("scen1", False), ("scen2", False)))
+            import_scenario_alternatives(db_map, (("scen1", "alt1"), ("scen2", "alt2")))
+            db_map.commit_session("Add test data.")
+        root_mapping = alternative_export(0)
+        mapping_specification = MappingSpecification(
+            MappingType.alternatives, True, True, NoGroup.NAME, False, root_mapping
+        )
+        specification = Specification("name", "description", {"mapping": mapping_specification})
+        first_url = append_filter_config(scenario_url, scenario_filter_config("scen1"))
+        second_url = append_filter_config(scenario_url, scenario_filter_config("scen2"))
+        databases = {first_url: "scen1.csv", second_url: "scen2.csv"}
+        logger = MagicMock()
+        with patch("spine_items.exporter.do_work._export_in_parallel", wraps=_export_in_parallel) as export_in_parallel:
+            success, _, _ = do_work(
+                None, specification.to_dict(), False, False, "", self._temp_dir.name, databases, {}, "", "", logger, 2
+            )
+        self.assertTrue(success)
+        export_in_parallel.assert_called_once()
+        with open(os.path.join(self._temp_dir.name, "scen1.csv")) as input_:
+            self.assertEqual([row for row in reader(input_)], [["alt1"]])
+        with open(os.path.join(self._temp_dir.name, "scen2.csv")) as input_:
+            self.assertEqual([row for row in reader(input_)], [["alt2"]])
+
+    def test_export_entity_activity_of_scenarios_through_single_database_map(self):
+        scenario_url = "sqlite:///" + os.path.join(self._temp_dir.name, "entity_activity_db.sqlite")
+        with DatabaseMapping(scenario_url, create=True) as db_map:
+            import_alternatives(db_map, ("alt1", "alt2"))
+            import_object_classes(db_map, ("oc",))
+            import_objects(db_map, (("oc", "e1"), ("oc", "e2")))
+            import_entity_alternatives(
+                db_map, (("oc", "e1", "alt1", True), ("oc", "e2", "alt1", True), ("oc", "e2", "alt2", False))
+            )
+            import_scenarios(db_map, (("scen1", False), ("scen2", False)))
+            import_scenario_alternatives(db_map, (("scen1", "alt1"), ("scen2", "alt2")))
+            db_map.commit_session("Add test data.")
+        root_mapping = entity_export(entity_class_position=0, entity_position=1)
+        mapping_specification = MappingSpecification(
+            MappingType.entities, True, True, NoGroup.NAME, False, root_mapping
+        )
+        specification = Specification("name", "description", {"mapping": mapping_specification})
+        first_url = append_filter_config(scenario_url, scenario_filter_config("scen1"))
+        second_url = append_filter_config(scenario_url, scenario_filter_config("scen2"))
+        databases = {first_url: "scen1.csv", second_url: "scen2.csv"}
+        logger = MagicMock()
+        success, _, _ = do_work(
+            None, specification.to_dict(), False, False, "", self._temp_dir.name, databases, {}, "", "", logger
+        )
+        self.assertTrue(success)
+        with open(os.path.join(self._temp_dir.name, "scen1.csv")) as input_:
+            self.assertEqual([row for row in reader(input_)], [["oc", "e1"], ["oc", "e2"]])
+        with open(os.path.join(self._temp_dir.name, "scen2.csv")) as input_:
+            self.assertEqual([row for row in reader(input_)], [["oc", "e1"]])
+
+    def test_export_tables_concurrently(self):
+        root_mapping = entity_export(entity_class_position=Position.table_name, entity_position=0)
+        mapping_specification = MappingSpecification(
+            MappingType.entities, True, True, NoGroup.NAME, False, root_mapping
+        )
+        specification = Specification("name", "description", {"mapping": mapping_specification})
+        out_dir = os.path.join(self._temp_dir.name, "concurrent")
+        databases = {self._url: "concurrent.csv"}
+        logger = MagicMock()
+        success, written_files, _ = do_work(
+            None,
+            specification.to_dict(),
+            False,
+            False,
+            "",
+            out_dir,
+            databases,
+            {},
+            "",
+            "",
+            logger,
+            table_writer_count=2,
+        )
+        self.assertTrue(success)
+        oc1_path = os.path.join(out_dir, "oc1.csv")
+        oc2_path = os.path.join(out_dir, "oc2.csv")
+        self.assertEqual(written_files, {"concurrent.csv": {oc1_path, oc2_path}})
+        with open(oc1_path) as input_:
+            self.assertEqual([row for row in reader(input_)], [["o11"], ["o12"]])
+        with open(oc2_path) as input_:
+            self.assertEqual([row for row in reader(input_)], [["o21"], ["o22"], ["o23"]])
+        self.assertEqual(sorted(os.listdir(out_dir)), ["oc1.csv", "oc2.csv"])
+
+    def test_empty_table_is_written_concurrently_like_sequentially(self):
+        mapping_specification = MappingSpecification(
+            MappingType.scenarios, True, True, NoGroup.NAME, False, scenario_export(scenario_position=0)
+        )
+        specification = Specification("name", "description", {"mapping": mapping_specification})
+        logger = MagicMock()
+        for table_writer_count in (1, 2):
+            out_dir = os.path.join(self._temp_dir.name, f"empty_{table_writer_count}")
+            databases = {self._url: "empty.csv"}
+            success, written_files, _ = do_work(
+                None,
+                specification.to_dict(),
+                False,
+                False,
+                "",
+                out_dir,
+                databases,
+                {},
+                "",
+                "",
+                logger,
+                table_writer_count=table_writer_count,
+            )
+            self.assertTrue(success)
+            out_path = os.path.join(out_dir, "empty.csv")
+            self.assertEqual(written_files, {"empty.csv": {out_path}})
+            with open(out_path) as input_:
+                self.assertEqual(input_.read(), "")
+            self.assertEqual(os.listdir(out_dir), ["empty.csv"])
+
+    def test_export_to_compressed_csv(self):
+        root_mapping = FixedValueMapping(Position.table_name, "compressed_table")
+        root_mapping.child = entity_export(entity_class_position=0, entity_position=1)
+        mapping_specification = MappingSpecification(
+            MappingType.entities, True, True, NoGroup.NAME, False, root_mapping
+        )
+        specification = Specification(
+            "name", "description", {"mapping": mapping_specification}, OutputFormat.CSV, compression="gzip"
+        )
+        databases = {self._url: "compressed.csv"}
+        logger = MagicMock()
+        success, written_files, _ = do_work(
+            None, specification.to_dict(), False, False, "", self._temp_dir.name, databases, {}, "", "", logger
+        )
+        self.assertTrue(success)
+        out_path = os.path.join(self._temp_dir.name, "compressed_table.csv.gz")
+        self.assertEqual(written_files, {"compressed.csv": {out_path}})
+        with gzip.open(out_path, "rt", newline="") as input_:
+            table = [row for row in reader(input_)]
+        self.assertEqual(table, [["oc1", "o11"], ["oc1", "o12"], ["oc2", "o21"], ["oc2", "o22"], ["oc2", "o23"]])
+
+    def test_export_to_streaming_excel(self):
+        root_mapping = FixedValueMapping(Position.table_name, "entities")
+        root_mapping.child = entity_export(entity_class_position=0, entity_position=1)
+        mapping_specification = MappingSpecification(
+            MappingType.entities, True, True, NoGroup.NAME, False, root_mapping
+        )
+        specification = Specification(
+            "name",
+            "description",
+            {"mapping": mapping_specification},
+            OutputFormat.EXCEL,
+            excel_mode=ExcelMode.STREAMING,
+        )
+        databases = {self._url: "streamed.xlsx"}
+        logger = MagicMock()
+        success, written_files, _ = do_work(
+            None, specification.to_dict(), False, False, "", self._temp_dir.name, databases, {}, "", "", logger
+        )
+        self.assertTrue(success)
+        out_path = os.path.join(self._temp_dir.name, "streamed.xlsx")
+        self.assertEqual(written_files, {"streamed.xlsx": {out_path}})
+        workbook = load_workbook(out_path, read_only=True)
+        table = [list(row) for row in workbook["entities"].iter_rows(values_only=True)]
+        workbook.close()
+        self.assertEqual(table, [["oc1", "o11"], ["oc1", "o12"], ["oc2", "o21"], ["oc2", "o22"], ["oc2", "o23"]])
+
+    def test_export_to_parquet(self):
+        try:
+            from pyarrow import parquet
+        except ImportError:
+            self.skipTest("requires pyarrow")
+        root_mapping = entity_export(entity_class_position=0, entity_position=1)
+        root_mapping.header = "class"
+        root_mapping.child.header = "entity"
+        mapping_specification = MappingSpecification(
+            MappingType.entities, True, True, NoGroup.NAME, False, root_mapping
+        )
+        specification = Specification("name", "description", {"mapping": mapping_specification}, OutputFormat.PARQUET)
+        databases = {self._url: "entities"}
+        logger = MagicMock()
+        success, written_files, _ = do_work(
+            None, specification.to_dict(), False, False, "", self._temp_dir.name, databases, {}, "", "", logger
+        )
+        self.assertTrue(success)
+        out_path = os.path.join(self._temp_dir.name, "entities.parquet")
+        self.assertEqual(written_files, {"entities": {out_path}})
+        table = parquet.read_table(out_path)
+        self.assertEqual(table.column("class").to_pylist(), ["oc1", "oc1", "oc2", "oc2", "oc2"])
+        self.assertEqual(table.column("entity").to_pylist(), ["o11", "o12", "o21", "o22", "o23"])
+
     def test_export_to_output_database(self):
         object_root = entity_export(entity_class_position=0, entity_position=1)
         object_root.header = "object_class"
@@ -96,5 +377,17 @@ class TestWithCsvWriter(unittest.TestCase):
         connection.close()
 
 
+class TestSplitDatabaseGroups(unittest.TestCase):
+    def test_largest_groups_are_split_until_every_worker_has_a_group(self):
+        groups = [{"a1": "a1", "a2": "a2", "a3": "a3", "a4": "a4"}, {"b1": "b1"}]
+        self.assertEqual(
+            _split_database_groups(groups, 3), [{"a1": "a1", "a2": "a2"}, {"a3": "a3", "a4": "a4"}, {"b1": "b1"}]
+        )
+
+    def test_single_database_groups_are_not_split(self):
+        groups = [{"a": "a"}, {"b": "b"}]
+        self.assertEqual(_split_database_groups(groups, 4), groups)
+
+
 if __name__ == "__main__":
     unittest.main()
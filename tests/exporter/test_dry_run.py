@@ -0,0 +1,72 @@
+######################################################################################################################
+# Copyright (C) 2017-2022 Spine project consortium
+# Copyright Spine Items contributors
+# This file is part of Spine Items.
+# Spine Items is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+
+"""Unit tests for the ``dry_run`` module."""
+import unittest
+from spinedb_api import DatabaseMapping, import_object_classes, import_objects
+from spinedb_api.export_mapping import entity_export
+from spinedb_api.export_mapping.group_functions import NoGroup
+from spinedb_api.mapping import Position
+from spine_items.exporter.dry_run import dry_run, estimates_summary, TableEstimate
+from spine_items.exporter.specification import MappingSpecification, MappingType, Specification
+
+
+class TestDryRun(unittest.TestCase):
+    def setUp(self):
+        self._db_map = DatabaseMapping("sqlite://", create=True)
+        import_object_classes(self._db_map, ("oc1", "oc2"))
+        import_objects(self._db_map, (("oc1", "o11"), ("oc2", "o21"), ("oc2", "o22")))
+        self._db_map.commit_session("Add test data.")
+
+    def tearDown(self):
+        self._db_map.close()
+
+    def test_counts_rows_and_bytes_per_table(self):
+        specification = Specification(
+            mapping_specifications={
+                "entities": MappingSpecification(
+                    MappingType.entities, True, True, NoGroup.NAME, False, entity_export(Position.table_name, 0)
+                ),
+            }
+        )
+        estimates, duration = dry_run(self._db_map, specification)
+        self.assertEqual(estimates, [TableEstimate("entities", "oc1", 1, 4), TableEstimate("entities", "oc2", 2, 8)])
+        self.assertGreaterEqual(duration, 0.0)
+
+    def test_disabled_mappings_are_skipped(self):
+        specification = Specification(
+            mapping_specifications={
+                "classes": MappingSpecification(
+                    MappingType.entities, False, True, NoGroup.NAME, False, entity_export(0)
+                ),
+                "entities": MappingSpecification(
+                    MappingType.entities, True, True, NoGroup.NAME, False, entity_export(0, 1)
+                ),
+            }
+        )
+        estimates, _ = dry_run(self._db_map, specification)
+        self.assertEqual(estimates, [TableEstimate("entities", None, 3, 24)])
+
+
+class TestEstimatesSummary(unittest.TestCase):
+    def test_summary_contains_totals(self):
+        estimates = [TableEstimate("mapping", "table_1", 2, 10), TableEstimate("mapping", None, 3, 5)]
+        summary = estimates_summary("Title", estimates, 0.5)
+        self.assertTrue(summary.startswith("Title<table>"))
+        self.assertIn("<tr><td>mapping</td><td>table_1</td><td>2</td><td>10</td></tr>", summary)
+        self.assertIn("<tr><td>mapping</td><td></td><td>3</td><td>5</td></tr>", summary)
+        self.assertIn("<td>2 tables</td><td>5</td><td>15</td>", summary)
+        self.assertTrue(summary.endswith("Dry run took 0.500 s."))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -16,11 +16,15 @@ from unittest import mock
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from PySide6.QtWidgets import QApplication
+from spinedb_api import DatabaseMapping, import_object_classes, import_objects
+from spinedb_api.export_mapping import entity_export
+from spinedb_api.export_mapping.group_functions import NoGroup
 from spine_engine.project_item.project_item_resource import database_resource
+from spine_items.exporter.dry_run import TableEstimate
 from spine_items.exporter.executable_item import ExecutableItem
 from spine_items.exporter.exporter import Exporter
 from spine_items.exporter.output_channel import OutputChannel
-from spine_items.exporter.specification import Specification
+from spine_items.exporter.specification import MappingSpecification, MappingType, Specification
 from tests.mock_helpers import clean_up_toolbox, create_toolboxui_with_project
 
 
@@ -73,5 +77,36 @@ class TestExecutableItemWithToolbox(unittest.TestCase):
         self.assertEqual(executable.name, exporter.name)
 
 
+class TestExecutableItem(unittest.TestCase):
+    def setUp(self):
+        self._temp_dir = TemporaryDirectory()
+
+    def tearDown(self):
+        self._temp_dir.cleanup()
+
+    def test_dry_run(self):
+        url = "sqlite:///" + str(Path(self._temp_dir.name, "database.sqlite"))
+        with DatabaseMapping(url, create=True) as db_map:
+            import_object_classes(db_map, ("oc",))
+            import_objects(db_map, (("oc", "o1"), ("oc", "o2")))
+            db_map.commit_session("Add test data.")
+        specification = Specification(
+            mapping_specifications={
+                "entities": MappingSpecification(
+                    MappingType.entities, True, True, NoGroup.NAME, False, entity_export(0, 1)
+                )
+            }
+        )
+        output_channels = [OutputChannel("in label", "My exporter", "out label")]
+        logger = mock.MagicMock()
+        executable = ExecutableItem(
+            "My exporter", specification, output_channels, False, False, "", self._temp_dir.name, logger
+        )
+        estimates = executable.dry_run([database_resource("My data store", url, "in label")])
+        self.assertEqual(estimates, {"out label": [TableEstimate("entities", None, 2, 12)]})
+        logger.msg.emit.assert_called_once()
+        self.assertFalse(Path(executable._data_dir, "output").exists())
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,143 @@
+######################################################################################################################
+# Copyright (C) 2017-2022 Spine project consortium
+# Copyright Spine Items contributors
+# This file is part of Spine Items.
+# Spine Items is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+
+"""Unit tests for the ``export_manifest`` module."""
+import json
+from pathlib import Path
+from tempfile import TemporaryDirectory
+import unittest
+from unittest import mock
+from spine_items.exporter import export_manifest
+from spine_items.exporter.export_manifest import (
+    read_manifest_index,
+    remove_manifest_index,
+    update_manifest_index,
+)
+from spine_items.exporter.utils import EXPORTER_MANIFEST_INDEX_FILE_NAME
+
+
+class TestManifestIndex(unittest.TestCase):
+    def setUp(self):
+        self._temp_dir = TemporaryDirectory()
+        self._data_dir = self._temp_dir.name
+
+    def tearDown(self):
+        remove_manifest_index(self._data_dir)
+        self._temp_dir.cleanup()
+
+    def test_read_returns_none_when_there_are_no_manifests(self):
+        self.assertIsNone(read_manifest_index(self._data_dir))
+
+    def test_latest_update_of_filter_key_wins(self):
+        update_manifest_index(self._data_dir, "", {"label": ["output/a.csv"]})
+        update_manifest_index(self._data_dir, "filter", {"label": ["output/filter/a.csv"]})
+        update_manifest_index(self._data_dir, "", {"label": ["output/b.csv"]})
+        expected = {"": {"label": ["output/b.csv"]}, "filter": {"label": ["output/filter/a.csv"]}}
+        self.assertEqual(read_manifest_index(self._data_dir), expected)
+        export_manifest._index_cache.clear()
+        self.assertEqual(read_manifest_index(self._data_dir), expected)
+
+    def test_updates_are_appended(self):
+        update_manifest_index(self._data_dir, "1", {"label": ["output/1/a.csv"]})
+        update_manifest_index(self._data_dir, "2", {"label": ["output/2/a.csv"]})
+        lines = Path(self._data_dir, EXPORTER_MANIFEST_INDEX_FILE_NAME).read_text().splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertEqual(
+            json.loads(lines[1]),
+            {"version": export_manifest.MANIFEST_INDEX_VERSION, "filter": "2", "files": {"label": ["output/2/a.csv"]}},
+        )
+
+    def test_only_new_records_are_parsed_after_external_append(self):
+        update_manifest_index(self._data_dir, "1", {"label": ["output/1/a.csv"]})
+        read_manifest_index(self._data_dir)
+        record = {"version": export_manifest.MANIFEST_INDEX_VERSION, "filter": "2", "files": {"label": ["b.csv"]}}
+        with open(Path(self._data_dir, EXPORTER_MANIFEST_INDEX_FILE_NAME), "a") as index_file:
+            index_file.write(json.dumps(record) + "\n")
+        with mock.patch("spine_items.exporter.export_manifest.json.loads", wraps=json.loads) as loads:
+            entries = read_manifest_index(self._data_dir)
+            self.assertEqual(loads.call_count, 1)
+            entries = read_manifest_index(self._data_dir)
+            self.assertEqual(loads.call_count, 1)
+        self.assertEqual(entries, {"1": {"label": ["output/1/a.csv"]}, "2": {"label": ["b.csv"]}})
+
+    def test_incomplete_last_record_is_ignored(self):
+        update_manifest_index(self._data_dir, "1", {"label": ["a.csv"]})
+        with open(Path(self._data_dir, EXPORTER_MANIFEST_INDEX_FILE_NAME), "a") as index_file:
+            index_file.write('{"version": 1, "filt')
+        self.assertEqual(read_manifest_index(self._data_dir), {"1": {"label": ["a.csv"]}})
+
+    def test_records_of_unknown_version_are_skipped(self):
+        update_manifest_index(self._data_dir, "1", {"label": ["a.csv"]})
+        with open(Path(self._data_dir, EXPORTER_MANIFEST_INDEX_FILE_NAME), "a") as index_file:
+            index_file.write(json.dumps({"version": 999, "filter": "2", "files": {}}) + "\n")
+        self.assertEqual(read_manifest_index(self._data_dir), {"1": {"label": ["a.csv"]}})
+
+    def test_superseded_records_are_compacted(self):
+        with mock.patch.object(export_manifest, "_MIN_RECORDS_BEFORE_COMPACTION", 3):
+            for i in range(4):
+                update_manifest_index(self._data_dir, "", {"label": [f"{i}.csv"]})
+        lines = Path(self._data_dir, EXPORTER_MANIFEST_INDEX_FILE_NAME).read_text().splitlines()
+        self.assertEqual(len(lines), 1)
+        self.assertEqual(read_manifest_index(self._data_dir), {"": {"label": ["3.csv"]}})
+
+    def test_legacy_manifests_are_migrated(self):
+        with open(Path(self._data_dir, ".export-manifest.json"), "w") as manifest_file:
+            json.dump({"label": ["output/a.csv"]}, manifest_file)
+        absolute_path = str(Path(self._data_dir, "output", "hash", "a.csv"))
+        with open(Path(self._data_dir, ".export-manifest-hash.json"), "w") as manifest_file:
+            json.dump({"label": [absolute_path]}, manifest_file)
+        self.assertEqual(
+            read_manifest_index(self._data_dir),
+            {"": {"label": ["output/a.csv"]}, "hash": {"label": [str(Path("output", "hash", "a.csv"))]}},
+        )
+        self.assertFalse(Path(self._data_dir, ".export-manifest.json").exists())
+        self.assertFalse(Path(self._data_dir, ".export-manifest-hash.json").exists())
+        self.assertTrue(Path(self._data_dir, EXPORTER_MANIFEST_INDEX_FILE_NAME).exists())
+
+    def test_remove_manifest_index(self):
+        update_manifest_index(self._data_dir, "", {"label": ["a.csv"]})
+        remove_manifest_index(self._data_dir)
+        self.assertFalse(Path(self._data_dir, EXPORTER_MANIFEST_INDEX_FILE_NAME).exists())
+        self.assertIsNone(read_manifest_index(self._data_dir))
+
+
+class TestExportedFilesAsResources(unittest.TestCase):
+    def test_resources_from_all_filters_are_collected(self):
+        with TemporaryDirectory() as data_dir:
+            for name in ("a.csv", "b.csv"):
+                Path(data_dir, name).touch()
+            update_manifest_index(data_dir, "1", {"label": ["a.csv"]})
+            update_manifest_index(data_dir, "2", {"label": ["b.csv"], "unknown label": ["c.csv"]})
+            channel = mock.MagicMock(out_label="label")
+            resources, exported_files = export_manifest.exported_files_as_resources(
+                "exporter", None, data_dir, [channel], None
+            )
+            remove_manifest_index(data_dir)
+        self.assertEqual(exported_files, {"label": [str(Path(data_dir, "a.csv")), str(Path(data_dir, "b.csv"))]})
+        self.assertEqual(len(resources), 2)
+
+    def test_files_in_index_are_not_checked_on_disk(self):
+        with TemporaryDirectory() as data_dir:
+            update_manifest_index(data_dir, "", {"label": ["a.csv"]})
+            channel = mock.MagicMock(out_label="label")
+            with mock.patch.object(export_manifest.Path, "exists") as exists:
+                resources, exported_files = export_manifest.exported_files_as_resources(
+                    "exporter", None, data_dir, [channel], None
+                )
+                exists.assert_not_called()
+            remove_manifest_index(data_dir)
+        self.assertEqual(exported_files, {"label": [str(Path(data_dir, "a.csv"))]})
+        self.assertEqual(len(resources), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+######################################################################################################################
+# Copyright (C) 2017-2022 Spine project consortium
+# Copyright Spine Items contributors
+# This file is part of Spine Items.
+# Spine Items is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+
+"""Unit tests for the ``metrics`` module."""
+import unittest
+from spinedb_api import DatabaseMapping, import_object_classes, import_objects
+from spinedb_api.export_mapping import entity_export
+from spinedb_api.export_mapping.group_functions import NoGroup
+from spinedb_api.spine_io.exporters.writer import Writer
+from spine_items.exporter.metrics import MappingMetrics, metrics_summary, write_with_metrics
+from spine_items.exporter.query_cache import QueryCachingDatabaseMapping
+from spine_items.exporter.specification import MappingSpecification, MappingType
+
+
+class _ListWriter(Writer):
+    def __init__(self):
+        self.calls = []
+
+    def start(self):
+        self.calls.append("start")
+
+    def finish(self):
+        self.calls.append("finish")
+
+    def start_table(self, table_name, title_key):
+        self.calls.append(("table", table_name))
+        return True
+
+    def finish_table(self):
+        self.calls.append("finish_table")
+
+    def write_row(self, row):
+        self.calls.append(row)
+        return True
+
+
+class TestWriteWithMetrics(unittest.TestCase):
+    def setUp(self):
+        self._db_map = DatabaseMapping("sqlite://", create=True)
+        import_object_classes(self._db_map, ("oc1", "oc2"))
+        import_objects(self._db_map, (("oc1", "o11"), ("oc2", "o21"), ("oc2", "o22")))
+        self._db_map.commit_session("Add test data.")
+
+    def tearDown(self):
+        self._db_map.close()
+
+    def test_each_mapping_gets_its_own_metrics(self):
+        specifications = {
+            "classes": MappingSpecification(MappingType.entities, True, True, NoGroup.NAME, False, entity_export(0)),
+            "entities": MappingSpecification(
+                MappingType.entities, True, True, NoGroup.NAME, False, entity_export(0, 1)
+            ),
+        }
+        writer = _ListWriter()
+        metrics = write_with_metrics(QueryCachingDatabaseMapping(self._db_map), writer, specifications)
+        self.assertEqual(
+            writer.calls,
+            [
+                "start",
+                ("table", None),
+                ["oc1"],
+                ["oc2"],
+                "finish_table",
+                ("table", None),
+                ["oc1", "o11"],
+                ["oc2", "o21"],
+                ["oc2", "o22"],
+                "finish_table",
+                "finish",
+            ],
+        )
+        self.assertEqual([m.mapping for m in metrics], ["classes", "entities"])
+        self.assertEqual([m.rows for m in metrics], [2, 3])
+        self.assertEqual([m.bytes for m in metrics], [6, 18])
+        for mapping_metrics in metrics:
+            self.assertGreater(mapping_metrics.wall_time, 0.0)
+            self.assertGreaterEqual(mapping_metrics.wall_time, mapping_metrics.query_time)
+
+
+class TestMetricsSummary(unittest.TestCase):
+    def test_summary_contains_all_mappings(self):
+        summary = metrics_summary("Stats:", [MappingMetrics("first", 1.5, 0.5, 23, 99), MappingMetrics("second")])
+        self.assertTrue(summary.startswith("Stats:<table>"))
+        self.assertIn("<tr><td>first</td><td>1.500</td><td>0.500</td><td>23</td><td>99</td></tr>", summary)
+        self.assertIn("<tr><td>second</td><td>0.000</td><td>0.000</td><td>0</td><td>0</td></tr>", summary)
+
+
+if __name__ == "__main__":
+    unittest.main()
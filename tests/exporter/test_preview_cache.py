@@ -0,0 +1,83 @@
+######################################################################################################################
+# Copyright (C) 2017-2022 Spine project consortium
+# Copyright Spine Items contributors
+# This file is part of Spine Items.
+# Spine Items is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+
+"""Unit tests for the ``preview_cache`` module."""
+import unittest
+from spinedb_api.export_mapping import entity_export
+from spinedb_api.export_mapping.group_functions import NoGroup
+from spine_items.exporter.preview_cache import PreviewCache, preview_key
+
+
+class TestPreviewKey(unittest.TestCase):
+    def test_equal_mappings_produce_equal_keys(self):
+        key1 = preview_key("sqlite://", entity_export(0, 1), False, NoGroup.NAME, 20, 20)
+        key2 = preview_key("sqlite://", entity_export(0, 1), False, NoGroup.NAME, 20, 20)
+        self.assertEqual(key1, key2)
+
+    def test_different_mappings_produce_different_keys(self):
+        key1 = preview_key("sqlite://", entity_export(0, 1), False, NoGroup.NAME, 20, 20)
+        key2 = preview_key("sqlite://", entity_export(1, 0), False, NoGroup.NAME, 20, 20)
+        self.assertNotEqual(key1, key2)
+
+    def test_preview_limits_are_part_of_key(self):
+        key1 = preview_key("sqlite://", entity_export(0, 1), False, NoGroup.NAME, 20, 20)
+        key2 = preview_key("sqlite://", entity_export(0, 1), False, NoGroup.NAME, 20, 10)
+        self.assertNotEqual(key1, key2)
+
+
+class TestPreviewCache(unittest.TestCase):
+    def test_get_returns_stored_tables(self):
+        cache = PreviewCache()
+        tables = {"table": [["a", "b"]]}
+        cache.put(("key",), (1, "date"), tables)
+        self.assertEqual(cache.get(("key",), (1, "date")), tables)
+        self.assertIsNone(cache.get(("key",), (2, "date")))
+        self.assertIsNone(cache.get(("other key",), (1, "date")))
+
+    def test_modifying_returned_tables_does_not_modify_cache(self):
+        cache = PreviewCache()
+        cache.put(("key",), (1, "date"), {None: [["a"]]})
+        tables = cache.get(("key",), (1, "date"))
+        tables["<anonymous table>"] = tables.pop(None)
+        self.assertEqual(cache.get(("key",), (1, "date")), {None: [["a"]]})
+
+    def test_least_recently_used_entries_are_evicted_when_budget_is_exceeded(self):
+        tables = {"table": [["a" * 100]]}
+        cache = PreviewCache()
+        cache.put(("probe",), (1, "date"), tables)
+        entry_size = cache.size
+        cache = PreviewCache(memory_budget=2 * entry_size)
+        cache.put(("key 1",), (1, "date"), tables)
+        cache.put(("key 2",), (1, "date"), tables)
+        cache.get(("key 1",), (1, "date"))
+        cache.put(("key 3",), (1, "date"), tables)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.size, 2 * entry_size)
+        self.assertIsNotNone(cache.get(("key 1",), (1, "date")))
+        self.assertIsNone(cache.get(("key 2",), (1, "date")))
+        self.assertIsNotNone(cache.get(("key 3",), (1, "date")))
+
+    def test_tables_larger_than_budget_are_not_cached(self):
+        cache = PreviewCache(memory_budget=1)
+        cache.put(("key",), (1, "date"), {"table": [["a" * 100]]})
+        self.assertEqual(len(cache), 0)
+
+    def test_clear(self):
+        cache = PreviewCache()
+        cache.put(("key",), (1, "date"), {"table": [["a"]]})
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.size, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+######################################################################################################################
+# Copyright (C) 2017-2022 Spine project consortium
+# Copyright Spine Items contributors
+# This file is part of Spine Items.
+# Spine Items is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+
+"""Unit tests for the ``preview_table_writer`` module."""
+from threading import Event
+import unittest
+from spine_items.exporter.preview_table_writer import CANCELLATION_CHECK_INTERVAL, TableWriter
+
+
+class TestTableWriter(unittest.TestCase):
+    def test_writes_tables_to_dictionary(self):
+        writer = TableWriter()
+        self.assertTrue(writer.start_table("table", {}))
+        self.assertTrue(writer.write_row(["a", 2.0]))
+        writer.finish_table()
+        self.assertEqual(writer.tables, {"table": [["a", 2.0]]})
+        self.assertFalse(writer.cancelled)
+
+    def test_cancelled_writer_does_not_start_new_tables(self):
+        cancel_event = Event()
+        writer = TableWriter(cancel_event)
+        cancel_event.set()
+        self.assertTrue(writer.cancelled)
+        self.assertFalse(writer.start_table("table", {}))
+
+    def test_cancellation_is_checked_after_batch_of_rows(self):
+        cancel_event = Event()
+        writer = TableWriter(cancel_event)
+        writer.start_table("table", {})
+        cancel_event.set()
+        for i in range(CANCELLATION_CHECK_INTERVAL - 1):
+            self.assertTrue(writer.write_row([i]))
+        self.assertFalse(writer.write_row([CANCELLATION_CHECK_INTERVAL]))
+
+
+if __name__ == "__main__":
+    unittest.main()
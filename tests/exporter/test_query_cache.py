@@ -0,0 +1,95 @@
+######################################################################################################################
+# Copyright (C) 2017-2022 Spine project consortium
+# Copyright Spine Items contributors
+# This file is part of Spine Items.
+# Spine Items is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+
+"""Unit tests for the ``query_cache`` module."""
+import unittest
+from spinedb_api import DatabaseMapping, import_object_classes, import_objects
+from spinedb_api.export_mapping import entity_export, rows
+from spinedb_api.export_mapping.export_mapping import FixedValueMapping
+from spinedb_api.mapping import Position
+from spine_items.exporter.query_cache import QueryCachingDatabaseMapping
+
+
+class TestQueryCachingDatabaseMapping(unittest.TestCase):
+    def setUp(self):
+        self._db_map = DatabaseMapping("sqlite://", create=True)
+        import_object_classes(self._db_map, ("oc1", "oc2"))
+        import_objects(self._db_map, (("oc1", "o11"), ("oc2", "o21"), ("oc2", "o22")))
+        self._db_map.commit_session("Add test data.")
+
+    def tearDown(self):
+        self._db_map.close()
+
+    def test_identical_mappings_reuse_rows(self):
+        caching_db_map = QueryCachingDatabaseMapping(self._db_map)
+        first_rows = list(rows(entity_export(0, 1), caching_db_map))
+        self.assertEqual(caching_db_map.cache_hits, 0)
+        second_rows = list(rows(entity_export(0, 1), caching_db_map))
+        self.assertEqual(caching_db_map.cache_hits, 1)
+        self.assertEqual(first_rows, second_rows)
+        self.assertEqual(first_rows, [["oc1", "o11"], ["oc2", "o21"], ["oc2", "o22"]])
+
+    def test_different_mappings_are_not_mixed_up(self):
+        caching_db_map = QueryCachingDatabaseMapping(self._db_map)
+        entity_rows = list(rows(entity_export(0, 1), caching_db_map))
+        root_mapping = FixedValueMapping(Position.table_name, "table")
+        root_mapping.child = entity_export(1, 0)
+        swapped_rows = list(rows(root_mapping, caching_db_map))
+        self.assertEqual(entity_rows, [["oc1", "o11"], ["oc2", "o21"], ["oc2", "o22"]])
+        self.assertEqual(swapped_rows, [["o11", "oc1"], ["o21", "oc2"], ["o22", "oc2"]])
+
+    def test_prune_keeps_only_rows_requested_since_previous_prune(self):
+        caching_db_map = QueryCachingDatabaseMapping(self._db_map)
+        list(rows(entity_export(0, 1), caching_db_map))
+        caching_db_map.prune()
+        list(rows(entity_export(0, 1), caching_db_map))
+        self.assertEqual(caching_db_map.cache_hits, 1)
+        caching_db_map.prune()
+        caching_db_map.prune()
+        list(rows(entity_export(0, 1), caching_db_map))
+        self.assertEqual(caching_db_map.cache_hits, 1)
+
+    def test_results_that_do_not_fit_into_cache_are_not_kept(self):
+        caching_db_map = QueryCachingDatabaseMapping(self._db_map, max_size=1)
+        first_rows = list(rows(entity_export(0, 1), caching_db_map))
+        second_rows = list(rows(entity_export(0, 1), caching_db_map))
+        self.assertEqual(caching_db_map.cache_hits, 0)
+        self.assertEqual(caching_db_map.cache_size, 0)
+        self.assertEqual(first_rows, second_rows)
+        self.assertEqual(first_rows, [["oc1", "o11"], ["oc2", "o21"], ["oc2", "o22"]])
+
+    def test_cache_size_stays_within_limit(self):
+        unlimited_db_map = QueryCachingDatabaseMapping(self._db_map)
+        list(rows(entity_export(0, 1), unlimited_db_map))
+        required_size = unlimited_db_map.cache_size
+        self.assertGreater(required_size, 0)
+        caching_db_map = QueryCachingDatabaseMapping(self._db_map, max_size=required_size)
+        list(rows(entity_export(0, 1), caching_db_map))
+        list(rows(entity_export(0, 1), caching_db_map))
+        self.assertEqual(caching_db_map.cache_hits, 1)
+        self.assertLessEqual(caching_db_map.cache_size, required_size)
+
+    def test_zero_size_disables_caching(self):
+        caching_db_map = QueryCachingDatabaseMapping(self._db_map, max_size=0)
+        list(rows(entity_export(0, 1), caching_db_map))
+        entity_rows = list(rows(entity_export(0, 1), caching_db_map))
+        self.assertEqual(caching_db_map.cache_hits, 0)
+        self.assertEqual(caching_db_map.cache_size, 0)
+        self.assertEqual(entity_rows, [["oc1", "o11"], ["oc2", "o21"], ["oc2", "o22"]])
+
+    def test_delegates_other_attributes_to_database_map(self):
+        caching_db_map = QueryCachingDatabaseMapping(self._db_map)
+        self.assertIs(caching_db_map.entity_class_sq, self._db_map.entity_class_sq)
+
+
+if __name__ == "__main__":
+    unittest.main()
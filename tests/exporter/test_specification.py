@@ -10,8 +10,20 @@
 ######################################################################################################################
 
 """Unit tests for the ''specification'' module"""
+import pickle
 import unittest
-from spine_items.exporter.specification import MappingSpecification, MappingType, OutputFormat, Specification
+from unittest import mock
+from spine_items.exporter.specification import (
+    compile_specification,
+    CompiledSpecification,
+    ExcelMode,
+    GdxMode,
+    MappingSpecification,
+    MappingType,
+    OutputFormat,
+    restore_specification,
+    Specification,
+)
 from spinedb_api.export_mapping import entity_export
 from spinedb_api.mapping import Position
 
@@ -31,8 +43,100 @@ class TestSpecification(unittest.TestCase):
         specification = Specification(mapping_specifications=mapping_specifications, output_format=OutputFormat.CSV)
         self.assertTrue(specification.is_exporting_multiple_files())
 
+    def test_row_batch_size_survives_serialization(self):
+        mapping_root = entity_export(0, 1)
+        mapping_specification = MappingSpecification(MappingType.entities, True, False, "", False, mapping_root)
+        specification = Specification("spec", "", {"Only mapping": mapping_specification}, row_batch_size=1000)
+        restored = Specification.from_dict(specification.to_dict())
+        self.assertEqual(restored.row_batch_size, 1000)
+
+    def test_compression_survives_serialization(self):
+        mapping_root = entity_export(0, 1)
+        mapping_specification = MappingSpecification(MappingType.entities, True, False, "", False, mapping_root)
+        specification = Specification(
+            "spec", "", {"Only mapping": mapping_specification}, OutputFormat.PARQUET, compression="zstd"
+        )
+        restored = Specification.from_dict(specification.to_dict())
+        self.assertEqual(restored.output_format, OutputFormat.PARQUET)
+        self.assertEqual(restored.compression, "zstd")
+
+    def test_excel_mode_survives_serialization(self):
+        mapping_root = entity_export(0, 1)
+        mapping_specification = MappingSpecification(MappingType.entities, True, False, "", False, mapping_root)
+        specification = Specification(
+            "spec",
+            "",
+            {"Only mapping": mapping_specification},
+            OutputFormat.EXCEL,
+            excel_mode=ExcelMode.STREAMING_SPLIT_SHEETS,
+        )
+        restored = Specification.from_dict(specification.to_dict())
+        self.assertEqual(restored.excel_mode, ExcelMode.STREAMING_SPLIT_SHEETS)
+
+    def test_excel_mode_defaults_to_standard(self):
+        mapping_root = entity_export(0, 1)
+        mapping_specification = MappingSpecification(MappingType.entities, True, False, "", False, mapping_root)
+        specification_dict = Specification("spec", "", {"Only mapping": mapping_specification}).to_dict()
+        del specification_dict["excel_mode"]
+        self.assertEqual(Specification.from_dict(specification_dict).excel_mode, ExcelMode.STANDARD)
+
+    def test_gdx_mode_survives_serialization(self):
+        mapping_root = entity_export(0, 1)
+        mapping_specification = MappingSpecification(MappingType.entities, True, False, "", False, mapping_root)
+        specification = Specification(
+            "spec", "", {"Only mapping": mapping_specification}, OutputFormat.GDX, gdx_mode=GdxMode.BATCHED
+        )
+        restored = Specification.from_dict(specification.to_dict())
+        self.assertEqual(restored.gdx_mode, GdxMode.BATCHED)
+
+
+class TestCompileSpecification(unittest.TestCase):
+    def _make_specification(self, row_batch_size=0):
+        mapping_root = entity_export(0, 1)
+        mapping_specification = MappingSpecification(MappingType.entities, True, False, "", False, mapping_root)
+        return Specification("spec", "", {"Only mapping": mapping_specification}, row_batch_size=row_batch_size)
+
+    def test_compiled_specification_is_equivalent_to_original(self):
+        specification = self._make_specification(row_batch_size=100)
+        compiled = compile_specification(specification)
+        self.assertEqual(compiled.specification_dict, specification.to_dict())
+        self.assertIsNot(compiled.specification, specification)
+        self.assertEqual(compiled.specification.to_dict(), specification.to_dict())
+
+    def test_specification_is_compiled_once_per_revision(self):
+        compiled = compile_specification(self._make_specification())
+        self.assertIs(compile_specification(self._make_specification()), compiled)
+        changed = compile_specification(self._make_specification(row_batch_size=100))
+        self.assertIsNot(changed, compiled)
+        self.assertNotEqual(changed.digest, compiled.digest)
+
+    def test_same_specification_is_not_serialized_again(self):
+        specification = self._make_specification()
+        compiled = compile_specification(specification)
+        with mock.patch.object(specification, "to_dict") as to_dict:
+            self.assertIs(compile_specification(specification), compiled)
+            to_dict.assert_not_called()
+
+    def test_compiled_specification_is_picklable(self):
+        compiled = compile_specification(self._make_specification(row_batch_size=100))
+        restored = pickle.loads(pickle.dumps(compiled))
+        self.assertIsInstance(restored, CompiledSpecification)
+        self.assertEqual(restored.specification.to_dict(), compiled.specification_dict)
+
+    def test_restore_specification_accepts_compiled_and_serialized_forms(self):
+        specification = self._make_specification(row_batch_size=100)
+        compiled = compile_specification(specification)
+        self.assertIs(restore_specification(compiled), compiled.specification)
+        self.assertEqual(restore_specification(specification.to_dict()).row_batch_size, 100)
+
 
 class TestOutputFormat(unittest.TestCase):
+    def test_supports_row_batching(self):
+        self.assertEqual(
+            [output_format for output_format in OutputFormat if output_format.supports_row_batching()],
+            [OutputFormat.SQL, OutputFormat.PARQUET, OutputFormat.ARROW],
+        )
+
     def test_compatible_file_extensions(self):
         self.assertTrue(OutputFormat.CSV.is_compatible_file_extension("csv"))
         self.assertTrue(OutputFormat.CSV.is_compatible_file_extension("dat"))
@@ -44,6 +148,11 @@ class TestOutputFormat(unittest.TestCase):
         self.assertFalse(OutputFormat.GDX.is_compatible_file_extension("XXX"))
         self.assertTrue(OutputFormat.SQL.is_compatible_file_extension("sqlite"))
         self.assertFalse(OutputFormat.SQL.is_compatible_file_extension("XXX"))
+        self.assertTrue(OutputFormat.PARQUET.is_compatible_file_extension("parquet"))
+        self.assertFalse(OutputFormat.PARQUET.is_compatible_file_extension("XXX"))
+        self.assertTrue(OutputFormat.ARROW.is_compatible_file_extension("arrow"))
+        self.assertTrue(OutputFormat.ARROW.is_compatible_file_extension("feather"))
+        self.assertFalse(OutputFormat.ARROW.is_compatible_file_extension("XXX"))
 
     def test_every_format_has_file_extensions(self):
         for output_format in OutputFormat:
@@ -59,11 +168,25 @@ class TestOutputFormat(unittest.TestCase):
         self.assertEqual(OutputFormat.output_format_from_extension("gdx"), OutputFormat.GDX)
         self.assertEqual(OutputFormat.output_format_from_extension("sqlite"), OutputFormat.SQL)
         self.assertEqual(OutputFormat.output_format_from_extension("xlsx"), OutputFormat.EXCEL)
+        self.assertEqual(OutputFormat.output_format_from_extension("parquet"), OutputFormat.PARQUET)
+        self.assertEqual(OutputFormat.output_format_from_extension("arrow"), OutputFormat.ARROW)
+        self.assertEqual(OutputFormat.output_format_from_extension("feather"), OutputFormat.ARROW)
         self.assertIsNone(OutputFormat.output_format_from_extension("XXX"))
 
+    def test_compressed_file_extension(self):
+        self.assertEqual(OutputFormat.CSV.file_extension("gzip"), "csv.gz")
+        self.assertEqual(OutputFormat.CSV.file_extension("zstd"), "csv.zst")
+        self.assertEqual(OutputFormat.PARQUET.file_extension("zstd"), "parquet")
+
     def test_default_format(self):
         self.assertEqual(OutputFormat.default(), OutputFormat.CSV)
 
+    def test_compression_options(self):
+        self.assertEqual(OutputFormat.CSV.compression_options(), ("gzip", "zstd"))
+        self.assertEqual(OutputFormat.EXCEL.compression_options(), ())
+        self.assertIn("zstd", OutputFormat.PARQUET.compression_options())
+        self.assertEqual(OutputFormat.ARROW.compression_options(), ("lz4", "zstd"))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -11,10 +11,12 @@
 
 """Contains unit tests for Exporter's ``utils`` module."""
 import os.path
+from tempfile import TemporaryDirectory
 import unittest
 from spine_engine.project_item.project_item_resource import url_resource
+from spinedb_api import DatabaseMapping, import_object_classes
 from spine_items.exporter.output_channel import OutputChannel
-from spine_items.exporter.utils import output_database_resources
+from spine_items.exporter.utils import export_fingerprint, output_database_resources
 
 
 class TestOutputDatabaseResources(unittest.TestCase):
@@ -31,5 +33,38 @@ class TestOutputDatabaseResources(unittest.TestCase):
         self.assertEqual(resources, [url_resource(item_name, expected_url, "out database")])
 
 
+class TestExportFingerprint(unittest.TestCase):
+    def setUp(self):
+        self._temp_dir = TemporaryDirectory()
+        self._url = "sqlite:///" + os.path.join(self._temp_dir.name, "db.sqlite")
+        with DatabaseMapping(self._url, create=True):
+            pass
+
+    def tearDown(self):
+        self._temp_dir.cleanup()
+
+    def test_fingerprint_is_stable_when_nothing_changes(self):
+        specification_dict = {"name": "spec"}
+        self.assertEqual(
+            export_fingerprint(self._url, specification_dict), export_fingerprint(self._url, specification_dict)
+        )
+
+    def test_fingerprint_changes_with_new_commit(self):
+        specification_dict = {"name": "spec"}
+        fingerprint = export_fingerprint(self._url, specification_dict)
+        with DatabaseMapping(self._url) as db_map:
+            import_object_classes(db_map, ("oc",))
+            db_map.commit_session("Add object class.")
+        self.assertNotEqual(export_fingerprint(self._url, specification_dict), fingerprint)
+
+    def test_fingerprint_changes_with_specification(self):
+        fingerprint = export_fingerprint(self._url, {"name": "spec"})
+        self.assertNotEqual(export_fingerprint(self._url, {"name": "other spec"}), fingerprint)
+
+    def test_fingerprint_of_nonexistent_database_is_none(self):
+        url = "sqlite:///" + os.path.join(self._temp_dir.name, "missing.sqlite")
+        self.assertIsNone(export_fingerprint(url, {}))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -10,11 +10,18 @@
 ######################################################################################################################
 
 """Unit tests for the ``preview_updater`` module."""
+import os.path
+from tempfile import TemporaryDirectory
 import unittest
 from unittest import mock
 from PySide6.QtWidgets import QApplication, QComboBox, QWidget
+from spinedb_api import DatabaseMapping, import_object_classes, import_objects
+from spinedb_api.export_mapping import entity_export
+from spinedb_api.export_mapping.group_functions import NoGroup
+from spine_items.exporter.database_map_pool import DatabaseMapPool
 from spine_items.exporter.mvcmodels.full_url_list_model import FullUrlListModel
-from spine_items.exporter.widgets.preview_updater import PreviewUpdater
+from spine_items.exporter.preview_cache import PreviewCache, preview_key
+from spine_items.exporter.widgets.preview_updater import PreviewUpdater, _Worker
 
 
 class TestPreviewUpdater(unittest.TestCase):
@@ -47,6 +54,120 @@ class TestPreviewUpdater(unittest.TestCase):
         self.assertIsNot(preview_updater._url_model, url_model)
         preview_updater.tear_down()
 
+    def test_finished_worker_is_forgotten_unless_replaced(self):
+        ui = mock.MagicMock()
+        ui.database_url_combo_box = QComboBox(self._parent_widget)
+        preview_updater = PreviewUpdater(
+            mock.MagicMock(),
+            ui,
+            FullUrlListModel(),
+            mock.MagicMock(),
+            mock.MagicMock(),
+            mock.MagicMock(),
+            "",
+        )
+        worker_id = ("sqlite://", "mapping")
+        preview_updater._stamps[worker_id] = 2.0
+        preview_updater._workers[worker_id] = mock.MagicMock()
+        preview_updater._forget_worker(worker_id, 1.0)
+        self.assertIn(worker_id, preview_updater._stamps)
+        self.assertIn(worker_id, preview_updater._workers)
+        preview_updater._forget_worker(worker_id, 2.0)
+        self.assertNotIn(worker_id, preview_updater._stamps)
+        self.assertNotIn(worker_id, preview_updater._workers)
+        preview_updater.tear_down()
+
+
+class TestWorker(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        if not QApplication.instance():
+            QApplication()
+
+    def setUp(self):
+        self._temp_dir = TemporaryDirectory()
+        self._url = "sqlite:///" + os.path.join(self._temp_dir.name, "db.sqlite")
+        with DatabaseMapping(self._url, create=True) as db_map:
+            import_object_classes(db_map, ("oc",))
+            import_objects(db_map, (("oc", "o1"), ("oc", "o2")))
+            db_map.commit_session("Add test data.")
+        self._finished = []
+
+    def tearDown(self):
+        self._temp_dir.cleanup()
+
+    def _run_worker(self, cache, known_revision=None, database_map_pool=None, cancel=False):
+        mapping = entity_export(0, 1)
+        key = preview_key(self._url, mapping, False, NoGroup.NAME, 20, 20)
+        worker = _Worker(
+            self._url,
+            "mapping",
+            mapping,
+            False,
+            1.0,
+            20,
+            20,
+            NoGroup.NAME,
+            cache,
+            key,
+            known_revision,
+            database_map_pool,
+        )
+        worker.setAutoDelete(False)
+        revisions = []
+        written = []
+        worker.signals.revision_read.connect(lambda url, revision: revisions.append(revision))
+        worker.signals.table_written.connect(lambda worker_id, name, tables, stamp: written.append(tables))
+        worker.signals.finished.connect(lambda worker_id, stamp: self._finished.append(worker_id))
+        if cancel:
+            worker.cancel()
+        worker.run()
+        return revisions, written
+
+    def test_tables_are_cached_by_database_revision(self):
+        cache = PreviewCache()
+        revisions, written = self._run_worker(cache)
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(written, [{None: [["oc", "o1"], ["oc", "o2"]]}])
+        with mock.patch("spine_items.exporter.widgets.preview_updater.write") as write:
+            _, written = self._run_worker(cache)
+            write.assert_not_called()
+        self.assertEqual(written, [{None: [["oc", "o1"], ["oc", "o2"]]}])
+        with mock.patch("spine_items.exporter.widgets.preview_updater.write") as write:
+            _, written = self._run_worker(cache, revisions[0])
+            write.assert_not_called()
+        self.assertEqual(written, [])
+        self.assertEqual(len(self._finished), 3)
+
+    def test_new_commit_invalidates_cached_tables(self):
+        cache = PreviewCache()
+        self._run_worker(cache)
+        with DatabaseMapping(self._url) as db_map:
+            import_objects(db_map, (("oc", "o3"),))
+            db_map.commit_session("Add more data.")
+        _, written = self._run_worker(cache)
+        self.assertEqual(written, [{None: [["oc", "o1"], ["oc", "o2"], ["oc", "o3"]]}])
+        self.assertEqual(len(cache), 2)
+
+    def test_database_map_is_borrowed_from_pool(self):
+        pool = DatabaseMapPool()
+        db_map = pool.acquire(self._url)
+        pool.release(db_map)
+        _, written = self._run_worker(PreviewCache(), database_map_pool=pool)
+        self.assertEqual(written, [{None: [["oc", "o1"], ["oc", "o2"]]}])
+        self.assertIs(pool.acquire(self._url), db_map)
+        self.assertFalse(db_map.closed)
+        pool.release(db_map)
+        pool.close()
+
+    def test_cancelled_worker_does_not_emit_or_cache_tables(self):
+        cache = PreviewCache()
+        revisions, written = self._run_worker(cache, cancel=True)
+        self.assertEqual(revisions, [])
+        self.assertEqual(written, [])
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(self._finished, [(self._url, "mapping")])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -17,7 +17,15 @@ from tempfile import TemporaryDirectory
 import unittest
 from unittest import mock
 from PySide6.QtWidgets import QApplication
-from spine_items.exporter.specification import MappingSpecification, MappingType, OutputFormat, Specification
+from spinedb_api import DatabaseMapping, import_object_classes, import_objects
+from spine_items.exporter.specification import (
+    ExcelMode,
+    GdxMode,
+    MappingSpecification,
+    MappingType,
+    OutputFormat,
+    Specification,
+)
 from spine_items.exporter.widgets.specification_editor_window import SpecificationEditorWindow
 from spinedb_api.export_mapping.export_mapping import FixedValueMapping, EntityClassMapping
 from spinedb_api.export_mapping.export_mapping import from_dict as mappings_from_dict
@@ -44,6 +52,61 @@ class TestSpecificationEditorWindow(unittest.TestCase):
         self.assertEqual(editor._ui.mappings_table.model().rowCount(), 1)
         self.assertEqual(editor._ui.mappings_table.model().index(0, 0).data(), "Mapping (1)")
 
+    def test_compression_options_follow_export_format(self):
+        editor = SpecificationEditorWindow(self._toolbox)
+        editor._ui.export_format_combo_box.setCurrentText(OutputFormat.EXCEL.value)
+        self.assertFalse(editor._ui.compression_combo_box.isEnabled())
+        editor._ui.export_format_combo_box.setCurrentText(OutputFormat.PARQUET.value)
+        self.assertTrue(editor._ui.compression_combo_box.isEnabled())
+        editor._ui.compression_combo_box.setCurrentText("zstd")
+        self.assertEqual(editor._new_spec.compression, "zstd")
+        editor._ui.export_format_combo_box.setCurrentText(OutputFormat.EXCEL.value)
+        self.assertIsNone(editor._new_spec.compression)
+        self.assertEqual(editor._ui.compression_combo_box.currentText(), "None")
+        editor._undo_stack.undo()
+        self.assertEqual(editor._new_spec.output_format, OutputFormat.PARQUET)
+        self.assertEqual(editor._new_spec.compression, "zstd")
+        self.assertEqual(editor._ui.compression_combo_box.currentText(), "zstd")
+
+    def test_excel_mode_is_enabled_for_excel_only(self):
+        editor = SpecificationEditorWindow(self._toolbox)
+        editor._ui.export_format_combo_box.setCurrentText(OutputFormat.CSV.value)
+        self.assertFalse(editor._ui.excel_mode_combo_box.isEnabled())
+        editor._ui.export_format_combo_box.setCurrentText(OutputFormat.EXCEL.value)
+        self.assertTrue(editor._ui.excel_mode_combo_box.isEnabled())
+        editor._ui.excel_mode_combo_box.setCurrentText(ExcelMode.STREAMING.value)
+        self.assertEqual(editor._new_spec.excel_mode, ExcelMode.STREAMING)
+        editor._undo_stack.undo()
+        self.assertEqual(editor._new_spec.excel_mode, ExcelMode.STANDARD)
+        self.assertEqual(editor._ui.excel_mode_combo_box.currentText(), ExcelMode.STANDARD.value)
+
+    def test_gdx_mode_is_enabled_for_gdx_only(self):
+        editor = SpecificationEditorWindow(self._toolbox)
+        editor._ui.export_format_combo_box.setCurrentText(OutputFormat.CSV.value)
+        self.assertFalse(editor._ui.gdx_mode_combo_box.isEnabled())
+        editor._ui.export_format_combo_box.setCurrentText(OutputFormat.GDX.value)
+        self.assertTrue(editor._ui.gdx_mode_combo_box.isEnabled())
+        editor._ui.gdx_mode_combo_box.setCurrentText(GdxMode.BATCHED.value)
+        self.assertEqual(editor._new_spec.gdx_mode, GdxMode.BATCHED)
+        editor._undo_stack.undo()
+        self.assertEqual(editor._new_spec.gdx_mode, GdxMode.STANDARD)
+
+    def test_dry_run_shows_estimates(self):
+        url = "sqlite:///" + str(pathlib.Path(self._temp_dir.name, "db.sqlite"))
+        with DatabaseMapping(url, create=True) as db_map:
+            import_object_classes(db_map, ("oc",))
+            import_objects(db_map, (("oc", "o1"), ("oc", "o2")))
+            db_map.commit_session("Add test data.")
+        editor = SpecificationEditorWindow(self._toolbox)
+        editor._ui.database_url_combo_box.model().append(url)
+        editor._ui.database_url_combo_box.setCurrentText(url)
+        with mock.patch("spine_items.exporter.widgets.specification_editor_window.QMessageBox") as message_box:
+            editor._dry_run()
+        message_box.information.assert_called_once()
+        summary = message_box.information.call_args.args[2]
+        self.assertTrue(summary.startswith("Estimated output:"))
+        self.assertIn("<td>1 tables</td><td>2</td>", summary)
+
     def test_mapping_in_table_name_position_disables_fixed_table_name_widgets(self):
         editor = SpecificationEditorWindow(self._toolbox)
         self.assertTrue(editor._ui.fix_table_name_check_box.isEnabled())
@@ -0,0 +1,137 @@
+######################################################################################################################
+# Copyright (C) 2017-2022 Spine project consortium
+# Copyright Spine Items contributors
+# This file is part of Spine Items.
+# Spine Items is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+
+"""Unit tests for the ``arrow_writer`` module."""
+from pathlib import Path
+from tempfile import TemporaryDirectory
+import unittest
+from spinedb_api.spine_io.exporters.writer import WriterException
+
+try:
+    import pyarrow
+    from pyarrow import ipc, parquet
+    from spine_items.exporter.writers.arrow_writer import ArrowWriter, ParquetWriter
+except ImportError:
+    pyarrow = None
+
+
+def _write_tables(writer, tables):
+    writer.start()
+    try:
+        for table_name, rows in tables.items():
+            writer.start_table(table_name, {})
+            for row in rows:
+                writer.write_row(row)
+            writer.finish_table()
+    finally:
+        writer.finish()
+
+
+@unittest.skipIf(pyarrow is None, "requires pyarrow")
+class TestParquetWriter(unittest.TestCase):
+    def setUp(self):
+        self._temp_dir = TemporaryDirectory()
+
+    def tearDown(self):
+        self._temp_dir.cleanup()
+
+    def test_writes_typed_columns(self):
+        writer = ParquetWriter(self._temp_dir.name, "out.parquet", "zstd", batch_size=2)
+        rows = [["name", "index", "value", "flag"], ["a", 1, 2.5, True], ["b", 2, 3.5, False], ["c", 3, None, True]]
+        _write_tables(writer, {"table": rows})
+        out_path = str(Path(self._temp_dir.name, "table.parquet"))
+        self.assertEqual(writer.output_files(), {out_path})
+        table = parquet.read_table(out_path)
+        self.assertEqual(table.schema.types, [pyarrow.string(), pyarrow.int64(), pyarrow.float64(), pyarrow.bool_()])
+        self.assertEqual(
+            table.to_pylist(),
+            [
+                {"name": "a", "index": 1, "value": 2.5, "flag": True},
+                {"name": "b", "index": 2, "value": 3.5, "flag": False},
+                {"name": "c", "index": 3, "value": None, "flag": True},
+            ],
+        )
+        self.assertEqual(parquet.ParquetFile(out_path).metadata.row_group(0).column(0).compression, "ZSTD")
+
+    def test_mixed_types_fall_back_to_strings(self):
+        writer = ParquetWriter(self._temp_dir.name, "out.parquet")
+        _write_tables(writer, {"table": [["value"], [1.0], ["text"]]})
+        table = parquet.read_table(str(Path(self._temp_dir.name, "table.parquet")))
+        self.assertEqual(table.column("value").to_pylist(), ["1.0", "text"])
+
+    def test_column_types_are_widened_across_batches(self):
+        writer = ParquetWriter(self._temp_dir.name, "out.parquet", batch_size=2)
+        rows = [
+            ["integers", "empty_first", "mixed", "empty"],
+            [1, None, 1, None],
+            [2, None, 2, None],
+            [3, 5, 3, None],
+            [1.5, 6, "text", None],
+            [4, 7, 4, None],
+        ]
+        _write_tables(writer, {"table": rows})
+        table = parquet.read_table(str(Path(self._temp_dir.name, "table.parquet")))
+        self.assertEqual(table.schema.types, [pyarrow.float64(), pyarrow.int64(), pyarrow.string(), pyarrow.string()])
+        self.assertEqual(table.column("integers").to_pylist(), [1.0, 2.0, 3.0, 1.5, 4.0])
+        self.assertEqual(table.column("empty_first").to_pylist(), [None, None, 5, 6, 7])
+        self.assertEqual(table.column("mixed").to_pylist(), ["1", "2", "3", "text", "4"])
+        self.assertEqual(table.column("empty").to_pylist(), [None, None, None, None, None])
+
+    def test_header_only_table_produces_empty_file(self):
+        writer = ParquetWriter(self._temp_dir.name, "out.parquet")
+        _write_tables(writer, {"table": [["column"]]})
+        table = parquet.read_table(str(Path(self._temp_dir.name, "table.parquet")))
+        self.assertEqual(table.column_names, ["column"])
+        self.assertEqual(table.num_rows, 0)
+
+    def test_ragged_rows_raise(self):
+        writer = ParquetWriter(self._temp_dir.name, "out.parquet")
+        with self.assertRaises(WriterException):
+            _write_tables(writer, {"table": [["x", "y"], [1, 2], [3]]})
+
+    def test_anonymous_table_uses_backup_file_name(self):
+        writer = ParquetWriter(self._temp_dir.name, "out.parquet")
+        _write_tables(writer, {None: [["column"], ["x"]]})
+        self.assertEqual(writer.output_files(), {str(Path(self._temp_dir.name, "out.parquet"))})
+
+
+@unittest.skipIf(pyarrow is None, "requires pyarrow")
+class TestArrowWriter(unittest.TestCase):
+    def setUp(self):
+        self._temp_dir = TemporaryDirectory()
+
+    def tearDown(self):
+        self._temp_dir.cleanup()
+
+    def test_writes_table_per_file(self):
+        writer = ArrowWriter(self._temp_dir.name, "out.arrow", "lz4", batch_size=1)
+        _write_tables(writer, {"first": [["x"], [1], [2]], "second": [["y"], ["a"]]})
+        first_path = str(Path(self._temp_dir.name, "first.arrow"))
+        second_path = str(Path(self._temp_dir.name, "second.arrow"))
+        self.assertEqual(writer.output_files(), {first_path, second_path})
+        with ipc.open_file(first_path) as reader:
+            self.assertEqual(reader.read_all().to_pylist(), [{"x": 1}, {"x": 2}])
+        with ipc.open_file(second_path) as reader:
+            self.assertEqual(reader.read_all().to_pylist(), [{"y": "a"}])
+
+    def test_integer_column_is_widened_when_later_batch_has_floats(self):
+        writer = ArrowWriter(self._temp_dir.name, "out.arrow", batch_size=1)
+        _write_tables(writer, {"table": [["x"], [1], [2], [2.5]]})
+        with ipc.open_file(str(Path(self._temp_dir.name, "table.arrow"))) as reader:
+            table = reader.read_all()
+        self.assertEqual(table.schema.types, [pyarrow.float64()])
+        self.assertEqual(table.column("x").to_pylist(), [1.0, 2.0, 2.5])
+        self.assertEqual(writer.output_files(), {str(Path(self._temp_dir.name, "table.arrow"))})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+######################################################################################################################
+# Copyright (C) 2017-2022 Spine project consortium
+# Copyright Spine Items contributors
+# This file is part of Spine Items.
+# Spine Items is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+
+"""Unit tests for the ``concurrent_writer`` module."""
+from concurrent.futures import ThreadPoolExecutor
+import csv
+from functools import partial
+import gzip
+import os
+from pathlib import Path
+from tempfile import TemporaryDirectory
+import unittest
+from spinedb_api.spine_io.exporters.csv_writer import CsvWriter
+from spinedb_api.spine_io.exporters.writer import WriterException
+from spine_items.exporter.writers.concurrent_writer import ConcurrentTableWriter
+from spine_items.exporter.writers.csv_writer import CompressedCsvWriter
+
+
+def _write_tables(writer, tables):
+    writer.start()
+    try:
+        for table_name, rows in tables:
+            writer.start_table(table_name, {})
+            for row in rows:
+                writer.write_row(row)
+            writer.finish_table()
+    finally:
+        writer.finish()
+
+
+def _read_csv(path):
+    with open(path, newline="") as in_file:
+        return list(csv.reader(in_file))
+
+
+class _FailingWriter(CsvWriter):
+    def write_row(self, row):
+        raise RuntimeError("write failed")
+
+
+class TestConcurrentTableWriter(unittest.TestCase):
+    def setUp(self):
+        self._temp_dir = TemporaryDirectory()
+
+    def tearDown(self):
+        self._temp_dir.cleanup()
+
+    def test_tables_are_written_to_separate_files(self):
+        tables = [("first", [["a", 1], ["b", 2]]), ("second", [["c", 3]])]
+        with ThreadPoolExecutor(2) as executor:
+            writer = ConcurrentTableWriter(
+                partial(CsvWriter, backup_file_name="out.csv"), self._temp_dir.name, executor, 2
+            )
+            _write_tables(writer, tables)
+        first_path = str(Path(self._temp_dir.name, "first.csv"))
+        second_path = str(Path(self._temp_dir.name, "second.csv"))
+        self.assertEqual(writer.output_files(), {first_path, second_path})
+        self.assertEqual(_read_csv(first_path), [["a", "1"], ["b", "2"]])
+        self.assertEqual(_read_csv(second_path), [["c", "3"]])
+        self.assertEqual(sorted(os.listdir(self._temp_dir.name)), ["first.csv", "second.csv"])
+
+    def test_repeated_tables_and_large_tables_are_concatenated_in_order(self):
+        tables = [("first", [["a"], ["b"], ["c"]]), ("second", [["d"]]), ("first", [["e"]])]
+        with ThreadPoolExecutor(2) as executor:
+            writer = ConcurrentTableWriter(
+                partial(CsvWriter, backup_file_name="out.csv"), self._temp_dir.name, executor, 2, max_part_rows=2
+            )
+            _write_tables(writer, tables)
+        self.assertEqual(_read_csv(Path(self._temp_dir.name, "first.csv")), [["a"], ["b"], ["c"], ["e"]])
+        self.assertEqual(_read_csv(Path(self._temp_dir.name, "second.csv")), [["d"]])
+
+    def test_compressed_parts_are_concatenated(self):
+        tables = [("table", [["a"], ["ä"], ["c"]])]
+        with ThreadPoolExecutor(2) as executor:
+            writer = ConcurrentTableWriter(
+                partial(CompressedCsvWriter, backup_file_name="out.csv.gz", compression="gzip"),
+                self._temp_dir.name,
+                executor,
+                2,
+                max_part_rows=2,
+            )
+            _write_tables(writer, tables)
+        with gzip.open(Path(self._temp_dir.name, "table.csv.gz"), "rt", encoding="utf-8", newline="") as in_file:
+            self.assertEqual(list(csv.reader(in_file)), [["a"], ["ä"], ["c"]])
+
+    def test_empty_table_produces_empty_file(self):
+        tables = [("empty", []), ("first", [["a"]]), ("first", [])]
+        with ThreadPoolExecutor(2) as executor:
+            writer = ConcurrentTableWriter(
+                partial(CsvWriter, backup_file_name="out.csv"), self._temp_dir.name, executor, 2
+            )
+            _write_tables(writer, tables)
+        empty_path = str(Path(self._temp_dir.name, "empty.csv"))
+        first_path = str(Path(self._temp_dir.name, "first.csv"))
+        self.assertEqual(writer.output_files(), {empty_path, first_path})
+        self.assertEqual(_read_csv(empty_path), [])
+        self.assertEqual(_read_csv(first_path), [["a"]])
+
+    def test_worker_errors_raise_writer_exception(self):
+        with ThreadPoolExecutor(1) as executor:
+            writer = ConcurrentTableWriter(
+                partial(_FailingWriter, backup_file_name="out.csv"), self._temp_dir.name, executor, 1
+            )
+            with self.assertRaises(WriterException):
+                _write_tables(writer, [("table", [["a"]])])
+        self.assertEqual(os.listdir(self._temp_dir.name), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+######################################################################################################################
+# Copyright (C) 2017-2022 Spine project consortium
+# Copyright Spine Items contributors
+# This file is part of Spine Items.
+# Spine Items is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+
+"""Unit tests for the ``excel_writer`` module."""
+from pathlib import Path
+from tempfile import TemporaryDirectory
+import unittest
+import numpy
+from openpyxl import load_workbook
+from spinedb_api.spine_io.exporters.writer import WriterException
+from spine_items.exporter.writers.excel_writer import StreamingExcelWriter
+
+
+def _write_tables(writer, tables):
+    writer.start()
+    try:
+        for table_name, rows in tables:
+            writer.start_table(table_name, {})
+            for row in rows:
+                writer.write_row(row)
+            writer.finish_table()
+    finally:
+        writer.finish()
+
+
+def _read_workbook(path):
+    workbook = load_workbook(path, read_only=True)
+    try:
+        return {sheet.title: [list(row) for row in sheet.iter_rows(values_only=True)] for sheet in workbook}
+    finally:
+        workbook.close()
+
+
+class TestStreamingExcelWriter(unittest.TestCase):
+    def setUp(self):
+        self._temp_dir = TemporaryDirectory()
+        self._path = str(Path(self._temp_dir.name, "out.xlsx"))
+
+    def tearDown(self):
+        self._temp_dir.cleanup()
+
+    def test_writes_tables_to_sheets(self):
+        writer = StreamingExcelWriter(self._path)
+        _write_tables(writer, [("first", [["a", 1.0], ["b", numpy.float64(2.0)]]), ("second", [["c", numpy.int64(3)]])])
+        self.assertEqual(_read_workbook(self._path), {"first": [["a", 1], ["b", 2]], "second": [["c", 3]]})
+
+    def test_rows_of_same_table_go_to_same_sheet(self):
+        writer = StreamingExcelWriter(self._path)
+        _write_tables(writer, [("table", [["a"]]), ("other", [["b"]]), ("table", [["c"]])])
+        self.assertEqual(_read_workbook(self._path), {"table": [["a"], ["c"]], "other": [["b"]]})
+
+    def test_empty_workbook_gets_a_sheet(self):
+        writer = StreamingExcelWriter(self._path)
+        _write_tables(writer, [])
+        self.assertEqual(_read_workbook(self._path), {"Sheet1": []})
+
+    def test_overflowing_sheet_raises_without_splitting(self):
+        writer = StreamingExcelWriter(self._path, max_sheet_rows=2)
+        with self.assertRaises(WriterException):
+            _write_tables(writer, [("table", [["a"], ["b"], ["c"]])])
+
+    def test_overflowing_rows_continue_on_new_sheets(self):
+        writer = StreamingExcelWriter(self._path, split_sheets=True, max_sheet_rows=2)
+        _write_tables(writer, [("table", [["a"], ["b"], ["c"], ["d"], ["e"]])])
+        self.assertEqual(
+            _read_workbook(self._path), {"table": [["a"], ["b"]], "table (2)": [["c"], ["d"]], "table (3)": [["e"]]}
+        )
+
+    def test_continuation_sheet_titles_fit_excel_limit(self):
+        table_name = 31 * "x"
+        writer = StreamingExcelWriter(self._path, split_sheets=True, max_sheet_rows=1)
+        _write_tables(writer, [(table_name, [["a"], ["b"]])])
+        self.assertEqual(_read_workbook(self._path), {table_name: [["a"]], 27 * "x" + " (2)": [["b"]]})
+
+    def test_long_table_names_are_truncated_to_unique_titles(self):
+        writer = StreamingExcelWriter(self._path)
+        _write_tables(writer, [(40 * "x" + "_first", [["a"]]), (40 * "x" + "_second", [["b"]])])
+        self.assertEqual(_read_workbook(self._path), {31 * "x": [["a"]], 27 * "x" + " (2)": [["b"]]})
+
+    def test_empty_table_gets_a_sheet(self):
+        writer = StreamingExcelWriter(self._path)
+        _write_tables(writer, [("empty", []), ("table", [["a"]])])
+        self.assertEqual(_read_workbook(self._path), {"empty": [], "table": [["a"]]})
+
+    def test_nan_is_written_as_string(self):
+        writer = StreamingExcelWriter(self._path)
+        _write_tables(writer, [("table", [[float("nan"), numpy.float64("nan"), 2.0]])])
+        self.assertEqual(_read_workbook(self._path), {"table": [["nan", "nan", 2]]})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+######################################################################################################################
+# Copyright (C) 2017-2022 Spine project consortium
+# Copyright Spine Items contributors
+# This file is part of Spine Items.
+# Spine Items is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+
+"""Unit tests for the ``gdx_writer`` module."""
+import math
+import unittest
+from spinedb_api.spine_io.exporters.writer import WriterException
+
+try:
+    import gdxcc
+    from spine_items.exporter.writers.gdx_writer import BatchedGdxWriter
+except ImportError:
+    gdxcc = None
+
+
+class _RecordingGdxFile:
+    def __init__(self, file_path, gams_directory):
+        self.labels = None
+        self.symbols = {}
+        self.closed = False
+
+    def register_labels(self, labels):
+        self.labels = labels
+
+    def write_symbol(self, name, symbol_type, domain, keys, values):
+        records = [
+            (tuple(self.labels[uel - 1] for uel in key), value) for key, value in zip(keys.tolist(), values.tolist())
+        ]
+        self.symbols[name] = (symbol_type, domain, records)
+
+    def close(self):
+        self.closed = True
+
+
+@unittest.skipIf(gdxcc is None, "requires gdxcc")
+class TestBatchedGdxWriter(unittest.TestCase):
+    def setUp(self):
+        self._gdx_file = None
+
+    def _make_writer(self):
+        def make_file(file_path, gams_directory):
+            self._gdx_file = _RecordingGdxFile(file_path, gams_directory)
+            return self._gdx_file
+
+        return BatchedGdxWriter("out.gdx", None, make_file)
+
+    def _write_tables(self, tables):
+        writer = self._make_writer()
+        writer.start()
+        try:
+            for table_name, rows in tables:
+                writer.start_table(table_name, {})
+                for row in rows:
+                    writer.write_row(row)
+                writer.finish_table()
+        finally:
+            writer.finish()
+        self.assertTrue(self._gdx_file.closed)
+        return self._gdx_file.symbols
+
+    def test_set(self):
+        symbols = self._write_tables([("unit_node", [["unit", "node"], ["u2", "n1"], ["u1", "n2"], ["u1", "n1"]])])
+        self.assertEqual(
+            symbols,
+            {
+                "unit_node": (
+                    gdxcc.GMS_DT_SET,
+                    ("unit", "node"),
+                    [(("u2", "n1"), 0.0), (("u1", "n1"), 0.0), (("u1", "n2"), 0.0)],
+                )
+            },
+        )
+
+    def test_parameter_records_are_sorted_by_uel_number_and_deduplicated(self):
+        symbols = self._write_tables(
+            [("capacity", [["unit", "time", ""], ["u1", "t2", 2.0], ["u1", "t1", 1.0], ["u1", "t2", 3]])]
+        )
+        self.assertEqual(
+            symbols,
+            {"capacity": (gdxcc.GMS_DT_PAR, ("unit", "time"), [(("u1", "t2"), 3.0), (("u1", "t1"), 1.0)])},
+        )
+
+    def test_special_values_are_converted(self):
+        symbols = self._write_tables([("p", [["i", ""], ["a", math.inf], ["b", math.nan]])])
+        _, _, records = symbols["p"]
+        self.assertEqual(records, [(("a",), gdxcc.GMS_SV_PINF), (("b",), gdxcc.GMS_SV_UNDEF)])
+
+    def test_scalar(self):
+        symbols = self._write_tables([("scalar", [[2.3]])])
+        self.assertEqual(symbols, {"scalar": (gdxcc.GMS_DT_PAR, (), [((), 2.3)])})
+
+    def test_set_without_dimensions_uses_universal_domain(self):
+        symbols = self._write_tables([("set", [[1, "a"]])])
+        self.assertEqual(symbols, {"set": (gdxcc.GMS_DT_SET, ("*", "*"), [(("1", "a"), 0.0)])})
+
+    def test_labels_that_compare_equal_get_distinct_uels(self):
+        symbols = self._write_tables([("set", [["i", "j"], [1, "a"], [1.0, "a"], [True, "a"], ["1", "a"]])])
+        _, _, records = symbols["set"]
+        self.assertEqual(records, [(("1", "a"), 0.0), (("1.0", "a"), 0.0), (("True", "a"), 0.0)])
+
+    def test_empty_parameter(self):
+        symbols = self._write_tables([("p", [["i", "j", ""]])])
+        self.assertEqual(symbols, {"p": (gdxcc.GMS_DT_PAR, ("i", "j"), [])})
+
+    def test_tables_with_same_name_are_merged(self):
+        symbols = self._write_tables([("set", [["i"], ["a"]]), ("set", [["i"], ["b"]])])
+        self.assertEqual(symbols, {"set": (gdxcc.GMS_DT_SET, ("i",), [(("a",), 0.0), (("b",), 0.0)])})
+
+    def test_appending_with_different_dimensions_raises(self):
+        with self.assertRaises(WriterException):
+            self._write_tables([("set", [["i"], ["a"]]), ("set", [["j"], ["b"]])])
+
+    def test_anonymous_table_raises(self):
+        with self.assertRaises(WriterException):
+            self._write_tables([(None, [["a"]])])
+
+    def test_non_numeric_parameter_value_raises(self):
+        with self.assertRaises(WriterException):
+            self._write_tables([("p", [["i", ""], ["a", "b"]])])
+
+
+if __name__ == "__main__":
+    unittest.main()
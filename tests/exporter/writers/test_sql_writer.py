@@ -0,0 +1,107 @@
+######################################################################################################################
+# Copyright (C) 2017-2022 Spine project consortium
+# Copyright Spine Items contributors
+# This file is part of Spine Items.
+# Spine Items is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+
+"""Unit tests for the ``sql_writer`` module."""
+from pathlib import Path
+import sqlite3
+from tempfile import TemporaryDirectory
+import unittest
+from unittest import mock
+from spine_items.exporter.writers.sql_writer import BatchedSqlWriter, BulkSqlWriter
+
+
+class TestBatchedSqlWriter(unittest.TestCase):
+    def setUp(self):
+        self._temp_dir = TemporaryDirectory()
+
+    def tearDown(self):
+        self._temp_dir.cleanup()
+
+    def test_commits_in_batches(self):
+        out_path = str(Path(self._temp_dir.name, "out.sqlite"))
+        writer = BatchedSqlWriter(out_path, overwrite_existing=True, batch_size=2)
+        writer.start()
+        try:
+            writer.start_table("table", {})
+            with mock.patch.object(writer._session, "commit", wraps=writer._session.commit) as commit:
+                writer.write_row(["column"])
+                for value in range(5):
+                    writer.write_row([value])
+                self.assertEqual(commit.call_count, 2)
+            writer.finish_table()
+        finally:
+            writer.finish()
+        connection = sqlite3.connect(out_path)
+        try:
+            self.assertEqual(connection.execute("SELECT * FROM 'table'").fetchall(), [(0,), (1,), (2,), (3,), (4,)])
+        finally:
+            connection.close()
+
+
+class TestBulkSqlWriter(unittest.TestCase):
+    def setUp(self):
+        self._temp_dir = TemporaryDirectory()
+        self._out_path = str(Path(self._temp_dir.name, "out.sqlite"))
+
+    def tearDown(self):
+        self._temp_dir.cleanup()
+
+    def _write_table(self, table_name, rows, overwrite_existing=True, batch_size=2):
+        writer = BulkSqlWriter(self._out_path, overwrite_existing, batch_size)
+        writer.start()
+        try:
+            writer.start_table(table_name, {})
+            for row in rows:
+                writer.write_row(row)
+            writer.finish_table()
+        finally:
+            writer.finish()
+
+    def _read_table(self, table_name):
+        connection = sqlite3.connect(self._out_path)
+        try:
+            return connection.execute(f"SELECT * FROM '{table_name}'").fetchall()
+        finally:
+            connection.close()
+
+    def test_writes_all_rows_when_row_count_is_not_multiple_of_batch_size(self):
+        self._write_table("table", [["name", "value"], ["a", 1.0], ["b", 2.0], ["c", 3.0], ["d", 4.0]])
+        self.assertEqual(self._read_table("table"), [("a", 1.0), ("b", 2.0), ("c", 3.0), ("d", 4.0)])
+
+    def test_inserts_batches_with_single_statement(self):
+        writer = BulkSqlWriter(self._out_path, True, 3)
+        writer.start()
+        try:
+            writer.start_table("table", {})
+            writer.write_row(["column"])
+            writer.write_row([0])
+            with mock.patch.object(writer._session, "execute", wraps=writer._session.execute) as execute:
+                for value in range(1, 7):
+                    writer.write_row([value])
+                self.assertEqual(execute.call_count, 2)
+            writer.finish_table()
+        finally:
+            writer.finish()
+        self.assertEqual(self._read_table("table"), [(value,) for value in range(7)])
+
+    def test_appends_to_existing_table(self):
+        self._write_table("table", [["column"], [1], [2], [3]])
+        self._write_table("table", [["column"], [4], [5], [6]], overwrite_existing=False)
+        self.assertEqual(self._read_table("table"), [(1,), (2,), (3,), (4,), (5,), (6,)])
+
+    def test_header_only_creates_empty_table(self):
+        self._write_table("table", [["column"]])
+        self.assertEqual(self._read_table("table"), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
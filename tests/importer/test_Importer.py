@@ -78,9 +78,14 @@ class TestImporter(unittest.TestCase):
             d,
             {
                 "cancel_on_error": True,
+                "commit_each_batch": False,
                 "description": "Very best test importer",
                 "file_selection": [["<source 1>/file1.dat", True], ["<source 2>/file2.dat", False]],
+                "import_batch_size": 0,
+                "import_process_count": 1,
+                "memory_limit": 0,
                 "on_conflict": "merge",
+                "skip_unchanged": False,
                 "specification": "import specification",
                 "type": "Importer",
                 "x": 0.0,
@@ -115,6 +115,179 @@ class TestImporterExecutable(unittest.TestCase):
             self.assertEqual(len(entity_list), 1)
             self.assertEqual(entity_list[0].name, "entity")
 
+    def test_execute_import_files_in_parallel(self):
+        data_file_1 = Path(self._temp_dir.name, "data1.dat")
+        self._write_simple_data(data_file_1)
+        data_file_2 = Path(self._temp_dir.name, "data2.dat")
+        with open(data_file_2, "w") as out_file:
+            out_file.write("class,other_entity\n")
+        mapping = self._simple_input_data_mapping()
+        database_path = Path(self._temp_dir.name, "database.sqlite")
+        database_url = "sqlite:///" + str(database_path)
+        create_new_spine_database(database_url)
+        logger = mock.MagicMock()
+        logger.__reduce__ = lambda _: (mock.MagicMock, ())
+        executable = ExecutableItem(
+            "name",
+            mapping,
+            [str(data_file_1), str(data_file_2)],
+            "",
+            True,
+            "merge",
+            self._temp_dir.name,
+            logger,
+            import_process_count=2,
+        )
+        database_resources = [database_resource("provider", database_url)]
+        file_resources = [file_resource("provider", str(data_file_1)), file_resource("provider", str(data_file_2))]
+        with db_server_manager() as mngr_queue:
+            for r in database_resources:
+                r.metadata["db_server_manager_queue"] = mngr_queue
+            self.assertTrue(executable.execute(file_resources, database_resources, Lock()))
+        self.assertIsNone(executable._process)
+        with DatabaseMapping(database_url) as database_map:
+            class_list = database_map.query(database_map.entity_class_sq).all()
+            self.assertEqual(len(class_list), 1)
+            entity_list = database_map.query(database_map.entity_sq).filter_by(class_id=class_list[0].id).all()
+            self.assertEqual({entity.name for entity in entity_list}, {"entity", "other_entity"})
+
+    def test_execute_import_in_batches(self):
+        data_file = Path(self._temp_dir.name, "data.dat")
+        with open(data_file, "w") as out_file:
+            out_file.write("class,entity_1\nclass,entity_2\nclass,entity_3\n")
+        mapping = self._simple_input_data_mapping()
+        database_path = Path(self._temp_dir.name, "database.sqlite")
+        database_url = "sqlite:///" + str(database_path)
+        create_new_spine_database(database_url)
+        logger = mock.MagicMock()
+        logger.__reduce__ = lambda _: (mock.MagicMock, ())
+        executable = ExecutableItem(
+            "name",
+            mapping,
+            [str(data_file)],
+            "",
+            True,
+            "merge",
+            self._temp_dir.name,
+            logger,
+            import_batch_size=2,
+            commit_each_batch=True,
+        )
+        database_resources = [database_resource("provider", database_url)]
+        file_resources = [file_resource("provider", str(data_file))]
+        with db_server_manager() as mngr_queue:
+            for r in database_resources:
+                r.metadata["db_server_manager_queue"] = mngr_queue
+            self.assertTrue(executable.execute(file_resources, database_resources, Lock()))
+        self.assertIsNone(executable._process)
+        with DatabaseMapping(database_url) as database_map:
+            class_list = database_map.query(database_map.entity_class_sq).all()
+            self.assertEqual(len(class_list), 1)
+            entity_list = database_map.query(database_map.entity_sq).filter_by(class_id=class_list[0].id).all()
+            self.assertEqual({entity.name for entity in entity_list}, {"entity_1", "entity_2", "entity_3"})
+
+    def test_execute_skips_unchanged_file(self):
+        data_file = Path(self._temp_dir.name, "data.dat")
+        self._write_simple_data(data_file)
+        mapping = self._simple_input_data_mapping()
+        database_path = Path(self._temp_dir.name, "database.sqlite")
+        database_url = "sqlite:///" + str(database_path)
+        create_new_spine_database(database_url)
+        logger = mock.MagicMock()
+        logger.__reduce__ = lambda _: (mock.MagicMock, ())
+        executable = ExecutableItem(
+            "name",
+            mapping,
+            [str(data_file)],
+            "",
+            True,
+            "merge",
+            self._temp_dir.name,
+            logger,
+            skip_unchanged=True,
+        )
+        database_resources = [database_resource("provider", database_url)]
+        file_resources = [file_resource("provider", str(data_file))]
+        with db_server_manager() as mngr_queue:
+            for r in database_resources:
+                r.metadata["db_server_manager_queue"] = mngr_queue
+            self.assertTrue(executable.execute(file_resources, database_resources, Lock()))
+            logger.msg.emit.reset_mock()
+            self.assertTrue(executable.execute(file_resources, database_resources, Lock()))
+        logger.msg.emit.assert_called_once_with("<b>name</b>: data.dat has not changed since last import. Skipping.")
+        with DatabaseMapping(database_url) as database_map:
+            class_list = database_map.query(database_map.entity_class_sq).all()
+            self.assertEqual(len(class_list), 1)
+            entity_list = database_map.query(database_map.entity_sq).filter_by(class_id=class_list[0].id).all()
+            self.assertEqual(len(entity_list), 1)
+
+    def test_execute_reimports_unchanged_file_into_recreated_database(self):
+        data_file = Path(self._temp_dir.name, "data.dat")
+        self._write_simple_data(data_file)
+        mapping = self._simple_input_data_mapping()
+        database_path = Path(self._temp_dir.name, "database.sqlite")
+        database_url = "sqlite:///" + str(database_path)
+        create_new_spine_database(database_url)
+        logger = mock.MagicMock()
+        logger.__reduce__ = lambda _: (mock.MagicMock, ())
+        executable = ExecutableItem(
+            "name",
+            mapping,
+            [str(data_file)],
+            "",
+            True,
+            "merge",
+            self._temp_dir.name,
+            logger,
+            skip_unchanged=True,
+        )
+        database_resources = [database_resource("provider", database_url)]
+        file_resources = [file_resource("provider", str(data_file))]
+        with db_server_manager() as mngr_queue:
+            for r in database_resources:
+                r.metadata["db_server_manager_queue"] = mngr_queue
+            self.assertTrue(executable.execute(file_resources, database_resources, Lock()))
+            database_path.unlink()
+            create_new_spine_database(database_url)
+            self.assertTrue(executable.execute(file_resources, database_resources, Lock()))
+        for call in logger.msg.emit.call_args_list:
+            self.assertNotIn("has not changed since last import", call.args[0])
+        with DatabaseMapping(database_url) as database_map:
+            class_list = database_map.query(database_map.entity_class_sq).all()
+            self.assertEqual(len(class_list), 1)
+
+    def test_execute_does_not_fingerprint_files_imported_with_errors(self):
+        data_file = Path(self._temp_dir.name, "data.dat")
+        self._write_simple_data(data_file)
+        mapping = self._simple_input_data_mapping()
+        database_path = Path(self._temp_dir.name, "database.sqlite")
+        database_url = "sqlite:///" + str(database_path)
+        create_new_spine_database(database_url)
+        logger = mock.MagicMock()
+        executable = ExecutableItem(
+            "name",
+            mapping,
+            [str(data_file)],
+            "",
+            False,
+            "merge",
+            self._temp_dir.name,
+            logger,
+            skip_unchanged=True,
+        )
+        database_resources = [database_resource("provider", database_url)]
+        file_resources = [file_resource("provider", str(data_file))]
+        with db_server_manager() as mngr_queue:
+            for r in database_resources:
+                r.metadata["db_server_manager_queue"] = mngr_queue
+            with mock.patch("spine_items.importer.executable_item.ReturningProcess") as process_class:
+                process_class.return_value.run_until_complete.return_value = (True, [])
+                self.assertTrue(executable.execute(file_resources, database_resources, Lock()))
+                self.assertTrue(executable.execute(file_resources, database_resources, Lock()))
+        self.assertEqual(process_class.return_value.run_until_complete.call_count, 2)
+        for call in logger.msg.emit.call_args_list:
+            self.assertNotIn("has not changed since last import", call.args[0])
+
     def test_execute_skip_deselected_file(self):
         data_file = Path(self._temp_dir.name, "data.dat")
         self._write_simple_data(data_file)
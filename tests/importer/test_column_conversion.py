@@ -0,0 +1,156 @@
+######################################################################################################################
+# Copyright (C) 2017-2022 Spine project consortium
+# Copyright Spine Items contributors
+# This file is part of Spine Items.
+# Spine Items is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+
+"""Unit tests for Importer's ``column_conversion`` module."""
+from datetime import datetime
+import unittest
+from spinedb_api.parameter_value import DateTime, ParameterValueFormatError
+from spinedb_api.import_mapping.type_conversion import (
+    BooleanConvertSpec,
+    DateTimeConvertSpec,
+    FloatConvertSpec,
+    StringConvertSpec,
+)
+from spine_items.importer.column_conversion import (
+    bulk_conversion_start_row,
+    convert_column_chunks,
+    convert_columns,
+    skip_converted_cells,
+)
+
+
+class TestConvertColumns(unittest.TestCase):
+    def test_float_column(self):
+        rows = [["header"], ["1.5"], [2], [None], ["1e3"], [0.25], [""]]
+        converted_columns = convert_columns(rows, {0: FloatConvertSpec()}, 1)
+        self.assertEqual(rows, [["header"], [1.5], [2.0], [None], [1000.0], [0.25], [None]])
+        self.assertIsInstance(rows[2][0], float)
+        self.assertEqual(converted_columns, {0})
+
+    def test_cells_that_fail_to_convert_are_left_untouched(self):
+        rows = [["1.0"], ["not a number"], ["3.0"]]
+        converted_columns = convert_columns(rows, {0: FloatConvertSpec()}, 0)
+        self.assertEqual(rows, [[1.0], ["not a number"], [3.0]])
+        self.assertEqual(converted_columns, set())
+
+    def test_string_column(self):
+        rows = [[1.5], [2], ["text"], [None], [True]]
+        converted_columns = convert_columns(rows, {0: StringConvertSpec()}, 0)
+        self.assertEqual(rows, [["1.5"], ["2"], ["text"], [None], ["True"]])
+        self.assertEqual(converted_columns, {0})
+
+    def test_datetime_column(self):
+        rows = [["2020-01-01"], ["2020-01-01T12:30"], ["2020-01-01"], [datetime(2020, 1, 2)]]
+        converted_columns = convert_columns(rows, {0: DateTimeConvertSpec()}, 0)
+        self.assertEqual(
+            rows,
+            [
+                [DateTime("2020-01-01")],
+                [DateTime("2020-01-01T12:30")],
+                [DateTime("2020-01-01")],
+                [DateTime("2020-01-02")],
+            ],
+        )
+        self.assertEqual(converted_columns, {0})
+
+    def test_converted_cells_give_same_result_as_per_cell_conversion(self):
+        values = ["1.5", "2020-01-01T06:00", 3, "x", "", "2020-02-30", "inf", 2.5, "1_000"]
+        for spec in (FloatConvertSpec(), StringConvertSpec(), DateTimeConvertSpec()):
+            rows = [[value] for value in values]
+            convert_columns(rows, {0: spec}, 0)
+            for value, row in zip(values, rows):
+                try:
+                    expected = spec(value)
+                except (ValueError, ParameterValueFormatError):
+                    self.assertEqual(row[0], value)
+                    continue
+                self.assertEqual(row[0], expected)
+
+    def test_other_types_and_short_rows_are_skipped(self):
+        rows = [["true", "1.0"], ["false"], None, ("yes", 2)]
+        converted_columns = convert_columns(rows, {0: BooleanConvertSpec(), 1: FloatConvertSpec()}, 0)
+        self.assertEqual(rows, [["true", 1.0], ["false"], None, ["yes", 2.0]])
+        self.assertEqual(converted_columns, {1})
+
+
+class TestConvertColumnChunks(unittest.TestCase):
+    def test_rows_are_converted_in_chunks_starting_from_first_row(self):
+        rows = iter([("header",), ("skip",), ("1.0",), ("2.0",), ("3.0",)])
+        converted_columns = set()
+        converted_rows = convert_column_chunks(rows, {0: FloatConvertSpec()}, 3, converted_columns, chunk_size=2)
+        self.assertEqual(list(converted_rows), [("header",), ("skip",), ("1.0",), [2.0], [3.0]])
+        self.assertEqual(converted_columns, {0})
+
+    def test_column_with_unconvertible_cell_in_any_chunk_is_not_fully_converted(self):
+        rows = [["1.0"], ["not a number"], ["3.0"]]
+        converted_columns = set()
+        converted_rows = convert_column_chunks(rows, {0: FloatConvertSpec()}, 0, converted_columns, chunk_size=1)
+        self.assertEqual(list(converted_rows), [[1.0], ["not a number"], [3.0]])
+        self.assertEqual(converted_columns, set())
+
+
+class TestSkipConvertedCells(unittest.TestCase):
+    def test_converted_cells_are_not_converted_again(self):
+        specs = skip_converted_cells({0: FloatConvertSpec(), 1: StringConvertSpec(), 2: BooleanConvertSpec()})
+        float_spec = specs[0]
+        self.assertEqual(float_spec.DISPLAY_NAME, FloatConvertSpec.DISPLAY_NAME)
+        self.assertEqual(float_spec(2.5), 2.5)
+        self.assertIsNone(float_spec(None))
+        self.assertEqual(float_spec("3.5"), 3.5)
+        with self.assertRaises(ValueError):
+            float_spec("not a number")
+        self.assertEqual(specs[1](23), "23")
+        self.assertIsInstance(specs[2], BooleanConvertSpec)
+
+
+class TestBulkConversionStartRow(unittest.TestCase):
+    def test_smallest_read_start_row_is_returned(self):
+        mappings = [
+            {"first": {"mapping": [{"map_type": "EntityClass", "position": 0}, {"map_type": "Entity", "position": 1}]}},
+            {
+                "second": {
+                    "mapping": [
+                        {"map_type": "EntityClass", "position": 0, "read_start_row": 2},
+                        {"map_type": "Entity", "position": 1},
+                    ]
+                }
+            },
+        ]
+        self.assertEqual(bulk_conversion_start_row(mappings), 0)
+        self.assertEqual(bulk_conversion_start_row(mappings[1:]), 2)
+
+    def test_pivoted_mapping_prevents_bulk_conversion(self):
+        mappings = [
+            {
+                "pivoted": {
+                    "mapping": [{"map_type": "EntityClass", "position": 0}, {"map_type": "Entity", "position": -1}]
+                }
+            }
+        ]
+        self.assertIsNone(bulk_conversion_start_row(mappings))
+
+    def test_filtered_mapping_prevents_bulk_conversion(self):
+        mappings = [
+            {
+                "filtered": {
+                    "mapping": [
+                        {"map_type": "EntityClass", "position": 0, "filter_re": "^a"},
+                        {"map_type": "Entity", "position": 1},
+                    ]
+                }
+            }
+        ]
+        self.assertIsNone(bulk_conversion_start_row(mappings))
+
+
+if __name__ == "__main__":
+    unittest.main()
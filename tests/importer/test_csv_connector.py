@@ -0,0 +1,52 @@
+######################################################################################################################
+# Copyright (C) 2017-2022 Spine project consortium
+# Copyright Spine Items contributors
+# This file is part of Spine Items.
+# Spine Items is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+
+"""Unit tests for the ``csv_connector`` module."""
+import gzip
+from pathlib import Path
+from tempfile import TemporaryDirectory
+import unittest
+from spine_items.importer.csv_connector import CSVConnector
+
+
+class TestCSVConnector(unittest.TestCase):
+    def setUp(self):
+        self._temp_dir = TemporaryDirectory()
+
+    def tearDown(self):
+        self._temp_dir.cleanup()
+
+    def test_reads_gzip_compressed_file(self):
+        path = Path(self._temp_dir.name, "data.csv.gz")
+        with gzip.open(path, "wt", newline="") as out_file:
+            out_file.write("class,entity\r\nunit,u1\r\nunit,u2\r\n")
+        connector = CSVConnector(None)
+        connector.connect_to_source(str(path))
+        options = connector.get_tables()["data"]["options"]
+        self.assertEqual(options["delimiter"], ",")
+        options["has_header"] = True
+        data_iterator, header = connector.get_data_iterator("data", options)
+        self.assertEqual(header, ["class", "entity"])
+        self.assertEqual(list(data_iterator), [["unit", "u1"], ["unit", "u2"]])
+
+    def test_reads_plain_file(self):
+        path = Path(self._temp_dir.name, "data.csv")
+        path.write_text("a,1\nb,2\n")
+        connector = CSVConnector(None)
+        connector.connect_to_source(str(path))
+        data_iterator, header = connector.get_data_iterator("data", {"has_header": False})
+        self.assertEqual(header, [])
+        self.assertEqual(list(data_iterator), [["a", "1"], ["b", "2"]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,242 @@
+######################################################################################################################
+# Copyright (C) 2017-2022 Spine project consortium
+# Copyright Spine Items contributors
+# This file is part of Spine Items.
+# Spine Items is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+
+"""Unit tests for Importer's ``do_work`` module."""
+from concurrent.futures import ThreadPoolExecutor
+from tempfile import TemporaryDirectory
+import unittest
+from unittest import mock
+from spinedb_api.import_mapping.type_conversion import FloatConvertSpec
+from spine_items.importer.do_work import (
+    _BatchWriter,
+    _column_converter,
+    _import_in_parallel,
+    _import_serially,
+    read_tables_once,
+)
+
+
+class _Connector:
+    def __init__(self, tables):
+        self._tables = tables
+        self.reads = []
+
+    def get_data_iterator(self, table, options, max_rows=-1):
+        self.reads.append(table)
+        return iter(self._tables[table]), ["header"]
+
+
+class TestReadTablesOnce(unittest.TestCase):
+    def test_shared_table_is_read_once_for_repeated_requests(self):
+        connector = _Connector({"table": [["a"], ["b"]]})
+        with read_tables_once(connector, {"table"}):
+            for _ in range(3):
+                rows, header = connector.get_data_iterator("table", {})
+                self.assertEqual(list(rows), [["a"], ["b"]])
+                self.assertEqual(header, ["header"])
+        self.assertEqual(connector.reads, ["table"])
+
+    def test_tables_that_are_not_shared_are_passed_through(self):
+        connector = _Connector({"table": [["a"], ["b"]]})
+        with read_tables_once(connector, set()):
+            for _ in range(2):
+                rows, header = connector.get_data_iterator("table", {})
+                self.assertEqual(list(rows), [["a"], ["b"]])
+        self.assertEqual(connector.reads, ["table", "table"])
+
+    def test_switching_tables_rereads_previous_table(self):
+        connector = _Connector({"table 1": [["a"]], "table 2": [["b"]]})
+        with read_tables_once(connector, {"table 1", "table 2"}):
+            connector.get_data_iterator("table 1", {})
+            connector.get_data_iterator("table 2", {})
+            connector.get_data_iterator("table 2", {})
+            connector.get_data_iterator("table 1", {})
+        self.assertEqual(connector.reads, ["table 1", "table 2", "table 1"])
+
+    def test_rows_are_converted_once_per_read(self):
+        connector = _Connector({"table": [["a"], ["b"]]})
+        convert_rows = mock.MagicMock(side_effect=lambda table, rows: ([row[0].upper()] for row in rows))
+        with read_tables_once(connector, {"table"}, convert_rows):
+            for _ in range(2):
+                rows, _ = connector.get_data_iterator("table", {})
+                self.assertEqual(list(rows), [["A"], ["B"]])
+        convert_rows.assert_called_once()
+
+    def test_connector_is_restored_after_context(self):
+        connector = _Connector({"table": [["a"]]})
+        with read_tables_once(connector, {"table"}):
+            connector.get_data_iterator("table", {})
+        connector.get_data_iterator("table", {})
+        self.assertEqual(connector.reads, ["table", "table"])
+
+
+class TestColumnConverter(unittest.TestCase):
+    def test_fully_converted_columns_are_removed_from_remaining_specs(self):
+        mappings = {
+            "table": [
+                {
+                    "mapping": {
+                        "mapping": [
+                            {"map_type": "EntityClass", "position": "hidden", "value": "class"},
+                            {"map_type": "Entity", "position": 0},
+                        ]
+                    }
+                }
+            ]
+        }
+        specs = {"table": {0: FloatConvertSpec(), 1: FloatConvertSpec()}}
+        remaining_specs = {"table": dict(specs["table"])}
+        convert = _column_converter(mappings, specs, remaining_specs)
+        rows = convert("table", iter([["1.0", "2.0"], ["3.0", "not a number"]]))
+        self.assertEqual(list(remaining_specs["table"]), [0, 1])
+        self.assertEqual(list(rows), [[1.0, 2.0], [3.0, "not a number"]])
+        self.assertEqual(list(remaining_specs["table"]), [1])
+        self.assertNotIsInstance(remaining_specs["table"][1], FloatConvertSpec)
+        self.assertEqual(remaining_specs["table"][1]("4.0"), 4.0)
+
+
+class TestBatchWriter(unittest.TestCase):
+    def setUp(self):
+        self._temp_dir = TemporaryDirectory()
+
+    def tearDown(self):
+        self._temp_dir.cleanup()
+
+    def _make_writer(self, client, batch_size, commit_each_batch):
+        return _BatchWriter(
+            mock.MagicMock(),
+            [client],
+            mock.MagicMock(),
+            True,
+            "merge",
+            self._temp_dir.name,
+            mock.MagicMock(),
+            batch_size,
+            commit_each_batch,
+            0,
+        )
+
+    @staticmethod
+    def _make_client():
+        client = mock.MagicMock()
+        client.import_data.side_effect = lambda data, _: {
+            "result": (sum(len(items) for key, items in data.items() if key != "on_conflict"), [])
+        }
+        client.get_db_url.return_value = "sqlite://"
+        return client
+
+    def test_data_is_split_into_batches_in_import_order(self):
+        client = self._make_client()
+        writer = self._make_writer(client, 2, False)
+        data = {"entities": [("c", "e1"), ("c", "e2")], "entity_classes": [("c",)]}
+        self.assertTrue(writer.add(data))
+        self.assertTrue(writer.finish())
+        batches = [call.args[0] for call in client.import_data.call_args_list]
+        self.assertEqual(
+            batches,
+            [
+                {"entity_classes": [("c",)], "entities": [("c", "e1")], "on_conflict": "merge"},
+                {"entities": [("c", "e2")], "on_conflict": "merge"},
+            ],
+        )
+        client.call_method.assert_called_once_with("commit_session", "Import data by Spine Toolbox Importer")
+
+    def test_commit_each_batch(self):
+        client = self._make_client()
+        writer = self._make_writer(client, 1, True)
+        self.assertTrue(writer.add({"entity_classes": [("c1",), ("c2",)]}))
+        self.assertTrue(writer.finish())
+        self.assertEqual(client.import_data.call_count, 2)
+        self.assertEqual(
+            client.call_method.call_args_list,
+            2 * [mock.call("commit_session", "Import data by Spine Toolbox Importer")],
+        )
+
+    def test_import_errors_roll_back_when_cancel_on_error_is_set(self):
+        client = mock.MagicMock()
+        client.import_data.return_value = {"result": (1, ["error"])}
+        writer = self._make_writer(client, 1, False)
+        self.assertFalse(writer.add({"entity_classes": [("c1",), ("c2",)]}))
+        self.assertEqual(client.import_data.call_count, 1)
+        client.call_method.assert_called_once_with("rollback_session")
+
+
+class TestImportSerially(unittest.TestCase):
+    def setUp(self):
+        self._temp_dir = TemporaryDirectory()
+
+    def tearDown(self):
+        self._temp_dir.cleanup()
+
+    def test_only_sources_without_read_or_import_errors_are_reported_as_imported(self):
+        read_errors = {"read_error.csv": ["read error"], "import_error.csv": [], "clean.csv": []}
+        resources = [mock.MagicMock(hasfilepath=True, path=path) for path in read_errors]
+
+        def read_resource(resource, connector, read_settings, cancel_on_error, logger, data_sink):
+            data_sink({"entity_classes": [(resource.path,)]})
+            return True, read_errors[resource.path]
+
+        client = mock.MagicMock()
+        client.import_data.side_effect = lambda data, _: {
+            "result": (0, ["import error"]) if data["entity_classes"] == [("import_error.csv",)] else (1, [])
+        }
+        client.get_db_url.return_value = "sqlite://"
+        all_errors = []
+        imported_sources = []
+        with mock.patch("spine_items.importer.do_work._read_resource", side_effect=read_resource):
+            successful = _import_serially(
+                mock.MagicMock(),
+                {"selected_tables": []},
+                False,
+                "merge",
+                self._temp_dir.name,
+                resources,
+                mock.MagicMock(),
+                [client],
+                mock.MagicMock(),
+                mock.MagicMock(),
+                all_errors,
+                imported_sources,
+            )
+        self.assertTrue(successful)
+        self.assertEqual(all_errors, ["read error"])
+        self.assertEqual(imported_sources, ["clean.csv"])
+
+
+class TestImportInParallel(unittest.TestCase):
+    def test_worker_failure_is_logged_and_stops_import(self):
+        resources = [mock.MagicMock(label="first.csv"), mock.MagicMock(label="second.csv")]
+        logger = mock.MagicMock()
+        with mock.patch("spine_items.importer.do_work.ProcessPoolExecutor", ThreadPoolExecutor), mock.patch(
+            "spine_items.importer.do_work._read_resource_in_worker", side_effect=RuntimeError("worker died")
+        ):
+            successful = _import_in_parallel(
+                mock.MagicMock(),
+                {"selected_tables": []},
+                False,
+                "merge",
+                "",
+                resources,
+                mock.MagicMock(),
+                [mock.MagicMock()],
+                mock.MagicMock(),
+                logger,
+                2,
+                [],
+                [],
+            )
+        self.assertFalse(successful)
+        logger.msg_error.emit.assert_called_once_with("Failed to read <b>first.csv</b>: worker died")
+
+
+if __name__ == "__main__":
+    unittest.main()
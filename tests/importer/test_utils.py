@@ -0,0 +1,63 @@
+######################################################################################################################
+# Copyright (C) 2017-2022 Spine project consortium
+# Copyright Spine Items contributors
+# This file is part of Spine Items.
+# Spine Items is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+
+"""Contains unit tests for Importer's ``utils`` module."""
+import os
+from pathlib import Path
+from tempfile import TemporaryDirectory
+import unittest
+from spine_items.importer.utils import is_unchanged, mapping_digest, source_fingerprint
+
+
+class TestSourceFingerprint(unittest.TestCase):
+    def setUp(self):
+        self._temp_dir = TemporaryDirectory()
+        self._path = Path(self._temp_dir.name, "data.csv")
+        self._path.write_text("a,b\n")
+
+    def tearDown(self):
+        self._temp_dir.cleanup()
+
+    def test_fingerprint_is_unchanged_when_nothing_changes(self):
+        digest = mapping_digest({"table_mappings": {}})
+        fingerprint = source_fingerprint(str(self._path), digest)
+        self.assertTrue(is_unchanged(source_fingerprint(str(self._path), digest, fingerprint), fingerprint))
+
+    def test_touching_file_does_not_change_fingerprint(self):
+        digest = mapping_digest({})
+        fingerprint = source_fingerprint(str(self._path), digest)
+        stat = os.stat(self._path)
+        os.utime(self._path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        new_fingerprint = source_fingerprint(str(self._path), digest, fingerprint)
+        self.assertNotEqual(new_fingerprint["mtime"], fingerprint["mtime"])
+        self.assertTrue(is_unchanged(new_fingerprint, fingerprint))
+
+    def test_content_change_changes_fingerprint(self):
+        digest = mapping_digest({})
+        fingerprint = source_fingerprint(str(self._path), digest)
+        self._path.write_text("c,d\n")
+        stat = os.stat(self._path)
+        os.utime(self._path, ns=(stat.st_atime_ns, fingerprint["mtime"] + 10**9))
+        self.assertFalse(is_unchanged(source_fingerprint(str(self._path), digest, fingerprint), fingerprint))
+
+    def test_specification_change_changes_fingerprint(self):
+        fingerprint = source_fingerprint(str(self._path), mapping_digest({"selected_tables": ["csv"]}))
+        new_fingerprint = source_fingerprint(str(self._path), mapping_digest({"selected_tables": []}), fingerprint)
+        self.assertFalse(is_unchanged(new_fingerprint, fingerprint))
+
+    def test_missing_previous_fingerprint_means_changed(self):
+        fingerprint = source_fingerprint(str(self._path), mapping_digest({}))
+        self.assertFalse(is_unchanged(fingerprint, None))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -11,10 +11,21 @@
 ######################################################################################################################
 
 """ Unit tests for the ``utils`` module. """
+from importlib.util import find_spec
+from pathlib import Path
 import sys
+from tempfile import TemporaryDirectory
 import unittest
 from unittest import mock
-from spine_items.utils import convert_to_sqlalchemy_url, convert_url_to_safe_string, database_label
+from spine_items.utils import (
+    compression_from_file_name,
+    convert_to_sqlalchemy_url,
+    convert_url_to_safe_string,
+    database_label,
+    open_file,
+    process_memory_usage,
+    strip_compression_suffix,
+)
 
 
 class TestDatabaseLabel(unittest.TestCase):
@@ -183,5 +194,41 @@ class TestConvertUrlToSafeString(unittest.TestCase):
         self.assertEqual(convert_url_to_safe_string(url), r"sqlite:///" + database_path)
 
 
+class TestCompressedFiles(unittest.TestCase):
+    def test_compression_from_file_name(self):
+        self.assertEqual(compression_from_file_name("data.csv.gz"), "gzip")
+        self.assertEqual(compression_from_file_name("data.csv.zst"), "zstd")
+        self.assertIsNone(compression_from_file_name("data.csv"))
+        self.assertIsNone(compression_from_file_name("data"))
+
+    def test_strip_compression_suffix(self):
+        self.assertEqual(strip_compression_suffix("data.csv.gz"), "data.csv")
+        self.assertEqual(strip_compression_suffix("data.csv"), "data.csv")
+
+    def test_open_file_round_trip(self):
+        suffixes = ["csv", "csv.gz"]
+        if find_spec("zstandard") is not None:
+            suffixes.append("csv.zst")
+        with TemporaryDirectory() as temp_dir:
+            for suffix in suffixes:
+                path = Path(temp_dir, "data." + suffix)
+                with open_file(path, "w", encoding="utf-8", newline="") as out_file:
+                    out_file.write("a,b\n")
+                with open_file(path, "a", encoding="utf-8", newline="") as out_file:
+                    out_file.write("c,ä\n")
+                with open_file(path, encoding="utf-8") as in_file:
+                    self.assertEqual(in_file.read(), "a,b\nc,ä\n")
+                with open_file(path, "rb") as in_file:
+                    self.assertEqual(in_file.read(), "a,b\nc,ä\n".encode("utf-8"))
+
+
+class TestProcessMemoryUsage(unittest.TestCase):
+    @unittest.skipIf(sys.platform == "win32", "memory usage is not available on Windows")
+    def test_returns_positive_byte_count(self):
+        usage = process_memory_usage()
+        self.assertIsInstance(usage, int)
+        self.assertGreater(usage, 1024 * 1024)
+
+
 if __name__ == "__main__":
     unittest.main()